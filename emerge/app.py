@@ -10,6 +10,21 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import plotly.express as px
 
+import datasets
+import downsample
+import ensemble
+import figures
+import instrument
+import jobs
+import longrun
+import phase
+import playground
+import power
+import simulation as sim
+import sobol
+import sweep
+import tracking
+
 # Page configuration
 st.set_page_config(
     page_title="E.M.E.R.G.E+ Dashboard",
@@ -18,6 +33,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Span timings for this rerun (toggled in the sidebar's profiling panel)
+instrument.begin_rerun(st.session_state.get("profile_reruns", instrument.ENABLED_BY_DEFAULT))
+instrument.section("setup", level=0)
+
 # Custom CSS for styling
 st.markdown("""
 <style>
@@ -64,30 +83,329 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Load data
-@st.cache_data
-def load_data():
-    routine_full = pd.read_csv('routine_timeseries_full.csv')
-    transformative_full = pd.read_csv('transformative_timeseries_full.csv')
-    table_demo1 = pd.read_csv('table_demo1_routine_timepoints.csv')
-    table_demo2 = pd.read_csv('table_demo2_transformative_timepoints.csv')
-    table_demo3 = pd.read_csv('table_demo3_culture.csv')
-    table_demo4 = pd.read_csv('table_demo4_parameter_sensitivity.csv')
-    transformative_meta = pd.read_csv('transformative_metadata.csv')
-    return routine_full, transformative_full, table_demo1, table_demo2, table_demo3, table_demo4, transformative_meta
-
-routine_full, transformative_full, table_demo1, table_demo2, table_demo3, table_demo4, transformative_meta = load_data()
-
 # Sidebar navigation
 st.sidebar.title("🧭 Navigation")
 page = st.sidebar.radio(
     "Select Page:",
-    ["🏠 Overview", "📊 Routine Process", "🔥 Transformative Process", "🌍 Cultural Modulation", "⚙️ Parameter Sensitivity", "🔮 Predictions & Validation", "📚 About"]
+    ["🏠 Overview", "📊 Routine Process", "🔥 Transformative Process", "🌍 Cultural Modulation", "⚙️ Parameter Sensitivity", "🌀 Phase Space", "🎛️ Playground", "🔮 Predictions & Validation", "📚 About"]
 )
 
+# Point budget for every time-series trace
+with st.sidebar.expander("📉 Chart Resolution"):
+    max_points = st.slider("Max points per trace", 200, 5000, downsample.DEFAULT_MAX_POINTS, step=100,
+                           help="Longer series are downsampled before plotting; peaks are always kept")
+    line_method = st.radio("Downsampling", downsample.METHODS, horizontal=True,
+                         help="lttb keeps line shape, minmax keeps the full noise envelope")
+
+profile_panel = st.sidebar.expander("⏱️ Rerun Profile")
+with profile_panel:
+    st.checkbox("Record span timings", value=instrument.ENABLED_BY_DEFAULT, key="profile_reruns",
+                help="Times data loading, each page section and each chart of the next reruns")
+
+# Static figures are built once per resolution setting and served as JSON
+@st.cache_resource(show_spinner="Precomputing figures…")
+def figure_cache(max_points, line_method):
+    cache = figures.default_cache()
+    cache.warm(max_points=max_points, line_method=line_method)
+    return cache
+
+
+def cached_figure(name):
+    return figure_cache(max_points, line_method).serve(name, max_points=max_points, line_method=line_method)
+
+
+def plotly_chart(fig, **kwargs):
+    with instrument.span("st.plotly_chart"):
+        st.plotly_chart(fig, **kwargs)
+
+
+def subheader(title):
+    """``st.subheader`` that also starts a profiling section."""
+    instrument.section(title)
+    st.subheader(title)
+
+
+# Monte Carlo ensembles (read-only results are shared by every session, not copied per rerun)
+@st.cache_resource(show_spinner="Running ensemble…")
+def ensemble_summary(model, members):
+    return ensemble.run_ensemble(model, members, seed=0 if model == "routine" else 2025)
+
+
+def band_figure(summary, variable, color, title, xaxis_title, max_points, method):
+    """Median line with a shaded 5–95% band."""
+    lo, med, hi = summary.band(variable)
+    fig = go.Figure()
+    fig.add_trace(downsample.scatter(summary.time, hi, max_points, method, mode='lines',
+                                     line=dict(width=0), showlegend=False, hoverinfo='skip'))
+    fig.add_trace(downsample.scatter(summary.time, lo, max_points, method, mode='lines',
+                                     line=dict(width=0), fill='tonexty', fillcolor=color,
+                                     opacity=0.25, name='5–95%'))
+    fig.add_trace(downsample.scatter(summary.time, med, max_points, method, mode='lines',
+                                     name=f'{variable} median', line=dict(color=color, width=3)))
+    if variable in summary.skeleton:
+        fig.add_trace(downsample.scatter(summary.time, summary.skeleton[variable], max_points, method,
+                                         mode='lines', name='noise-free (adaptive)',
+                                         line=dict(color='#374151', width=2, dash='dash')))
+    fig.update_layout(title=title, xaxis_title=xaxis_title, height=400, template="plotly_white")
+    return fig
+
+
+def ensemble_section(model, meaning, color, xaxis_title, time_unit):
+    subheader("🎲 Monte Carlo Ensemble")
+    members = st.select_slider("Ensemble members (seeds)", options=[100, 250, 500, 1000, 2000, 5000],
+                               value=500, key=f"{model}_members")
+    summary = ensemble_summary(model, members)
+    col1, col2 = st.columns(2)
+    with col1:
+        plotly_chart(band_figure(summary, "H_e", color, f"H_e across {members} seeds",
+                                 xaxis_title, max_points, line_method), use_container_width=True)
+    with col2:
+        plotly_chart(band_figure(summary, meaning, "#10B981", f"{meaning} across {members} seeds",
+                                 xaxis_title, max_points, line_method), use_container_width=True)
+    threshold = summary.scalars["threshold"][0]
+    col1, col2 = st.columns(2)
+    with col1:
+        if model == "transformative":
+            fig = px.histogram(x=summary.scalars["t_peak_H_e"], nbins=40,
+                               title="Distribution of t_peak (time of max H_e)")
+            fig.update_layout(xaxis_title=f"t_peak ({time_unit})", height=350, template="plotly_white")
+        else:
+            # routine H_e falls from the start, so its t_peak is always ~0; final meaning varies instead
+            fig = px.histogram(x=summary.scalars[f"{meaning}_final"], nbins=40,
+                               title=f"Distribution of final {meaning}")
+            fig.update_traces(marker_color="#10B981")
+            fig.update_layout(xaxis_title=meaning, height=350, template="plotly_white")
+        plotly_chart(fig, use_container_width=True)
+    with col2:
+        fig = px.histogram(x=summary.scalars[f"time_to_{meaning}_gt_threshold"], nbins=40,
+                           title=f"Distribution of time to {meaning} > {threshold:g}")
+        fig.update_traces(marker_color="#F59E0B")
+        fig.update_layout(xaxis_title=f"time ({time_unit})", height=350, template="plotly_white")
+        plotly_chart(fig, use_container_width=True)
+
+
+# Long-horizon dosing schedules, streamed to disk and read back one window at a time
+def longrun_section():
+    subheader("📆 Repeated Dosing Over Days")
+    col1, col2, col3, col4 = st.columns(4)
+    days = col1.slider("Horizon (days)", 1, 14, 3)
+    interval = col2.select_slider("Dose interval (h)", options=[6, 12, 24, 48, 72, 168], value=24)
+    n_doses = col3.number_input("Doses", 1, 56, 3)
+    amount = col4.slider("Dose size (× D_peak)", 0.25, 2.0, 1.0, step=0.25)
+    horizon = days * 24.0
+    schedule = longrun.repeated_doses(int(n_doses), interval, amount)
+    store = longrun.open_run(doses=schedule, duration=horizon)
+    if not store.complete:
+        bar = st.progress(store.progress, text="Integrating schedule…")
+        store = longrun.run_long(doses=schedule, duration=horizon,
+                                 on_chunk=lambda s: bar.progress(s.progress, text="Integrating schedule…"))
+        bar.empty()
+
+    lo, hi = st.slider("Visible window (h)", 0.0, horizon, (0.0, min(horizon, 48.0)), step=0.5)
+    frame = store.window(lo, hi, max_points=max_points)
+    fig = make_subplots(rows=3, cols=1, shared_xaxes=True, vertical_spacing=0.06,
+                        subplot_titles=("Perturbation D(t)", "Emotional entropy H_e", "Cumulative meaning M_t"))
+    for row, (column, color) in enumerate([("D", "#F59E0B"), ("H_e", "#7C3AED"), ("M_t", "#10B981")], start=1):
+        fig.add_trace(go.Scatter(x=frame["time_h"], y=frame[column], mode="lines", name=column,
+                                 line=dict(color=color, width=1.5)), row=row, col=1)
+    for t_dose, _ in schedule:
+        if lo <= t_dose <= hi:
+            fig.add_vline(x=t_dose, line_dash="dot", line_color="gray")
+    fig.update_layout(height=650, template="plotly_white", showlegend=False)
+    fig.update_xaxes(title_text="Time (hours)", row=3, col=1)
+    plotly_chart(fig, use_container_width=True)
+    exact = (hi - lo) / store.dt < max_points
+    st.caption(f"{len(frame):,} points read from {len(store):,} stored rows "
+               f"({'every row' if exact else 'per-block min/max envelope'}); M_t is normalized over the full "
+               f"{days}-day run.")
+
+# Background jobs run in worker processes, outside any script run
+JOB_POLL_S = 2
+
+
+@st.cache_resource
+def job_workers():
+    return jobs.WorkerPool()
+
+
+def submit_job(kind, spec, slot):
+    """Submit (or resume) the job behind a page section; the job this session last showed in ``slot`` is
+    cancelled when the settings change, so workers are not kept busy with superseded results."""
+    job_id = jobs.submit(kind, spec)
+    previous = st.session_state.get(f"job_{slot}")
+    if previous is not None and previous != job_id:
+        jobs.cancel(previous)
+    st.session_state[f"job_{slot}"] = job_id
+    if jobs.status(job_id)["status"] in ("queued", "running"):
+        job_workers().ensure()
+    return job_id
+
+
+def job_view(job_id, render):
+    """Render a job's partial results with ``render``, polling every JOB_POLL_S until it finishes."""
+    running = jobs.status(job_id)["status"] in ("queued", "running", "cancelled")
+
+    @st.fragment(run_every=JOB_POLL_S if running else None)
+    def view():
+        info = jobs.status(job_id)
+        if info["status"] == "cancelled":
+            # superseded in another session while still on screen here
+            jobs.retry(job_id)
+            job_workers().ensure()
+            info = jobs.status(job_id)
+        if info["status"] == "failed":
+            st.error(f"Job {job_id} failed: {info['error']}")
+            if st.button("Retry job", key=f"retry_{job_id}"):
+                jobs.retry(job_id)
+                job_workers().ensure()
+                st.rerun()
+        elif info["status"] != "done":
+            st.progress(info["progress"], text=f"Job {job_id}: {info['tasks_done']}/{info['tasks']} tasks done, "
+                                               f"{info['tasks_running']} running…")
+        render(jobs.result(job_id))
+        if running and info["status"] == "done":
+            st.rerun()
+
+    view()
+
+
+@st.cache_resource(show_spinner="Bootstrapping Sobol indices…")
+def sobol_indices(job_id, model, n):
+    """Indices of a finished Sobol job; its results never change, so one entry per job is shared."""
+    return sobol.from_store(jobs.result(job_id), list(sobol.BOUNDS[model]), n)
+
+
+# Phase space: skeleton analyses are keyed on the slider values and shared across sessions
+@st.cache_resource(show_spinner="Mapping the undershoot region…")
+def undershoot_region(params, resolution):
+    gammas = np.linspace(0.2, 2.0, resolution)
+    betas = np.linspace(0.05, 1.5, resolution)
+    return gammas, betas, phase.undershoot_map(gammas, betas, dict(params))
+
+
+@st.cache_resource(show_spinner="Continuing the undershoot boundary…")
+def undershoot_boundary(params, points):
+    return phase.continuation(np.linspace(0.2, 2.0, points), (0.05, 1.5), dict(params))
+
+
+@st.cache_resource(show_spinner=False)
+def bifurcation_diagram(name, params, points=120):
+    low, high = (0.2, 2.0) if name == "gamma" else (0.05, 1.5)
+    return phase.bifurcation(name, np.linspace(low, high, points), dict(params))
+
+
+def quiver_figure(X, Y, U, V, title, xaxis_title, yaxis_title, background=None):
+    """Direction field as one line trace (over an optional ``background`` trace): unit-length arrows in
+    grid-cell units, heads included."""
+    dx = (X[0, -1] - X[0, 0]) / (X.shape[1] - 1)
+    dy = (Y[-1, 0] - Y[0, 0]) / (Y.shape[0] - 1)
+    u, v = U / dx, V / dy
+    norm = np.hypot(u, v)
+    norm = np.where(norm > 0, norm, np.inf)
+    u, v = 0.8 * u / norm, 0.8 * v / norm
+    tail_x, tail_y = X - u * dx / 2, Y - v * dy / 2
+    tip_x, tip_y = X + u * dx / 2, Y + v * dy / 2
+    segments = [(tail_x, tail_y, tip_x, tip_y)]
+    for angle in (0.45, -0.45):
+        c, s_ = np.cos(angle), np.sin(angle)
+        hx, hy = -0.35 * (c * u - s_ * v), -0.35 * (s_ * u + c * v)
+        segments.append((tip_x, tip_y, tip_x + hx * dx, tip_y + hy * dy))
+    xs = np.concatenate([np.stack([a.ravel(), b.ravel(), np.full(a.size, np.nan)], 1).ravel()
+                         for a, _, b, _ in segments])
+    ys = np.concatenate([np.stack([a.ravel(), b.ravel(), np.full(a.size, np.nan)], 1).ravel()
+                         for _, a, _, b in segments])
+    fig = go.Figure([] if background is None else [background])
+    fig.add_trace(go.Scatter(x=xs, y=ys, mode="lines", line=dict(color="#6B7280", width=1),
+                             hoverinfo="skip", showlegend=False))
+    fig.update_layout(title=title, xaxis_title=xaxis_title, yaxis_title=yaxis_title, height=520,
+                      template="plotly_white")
+    return fig
+
+
+# Live tracking: one shared tracker per source; each viewer fetches only the estimates it has not seen
+LIVE_POLL_S = 1.0
+LIVE_WINDOW = 600
+DEMO_SPEED = 120.0
+
+
+@st.cache_resource
+def demo_participant(run):
+    return tracking.start_demo(f"demo_{run}", seed=run, speed=DEMO_SPEED)
+
+
+def live_view(source):
+    """Redraw the last LIVE_WINDOW estimates of ``source`` every LIVE_POLL_S while its tracker runs."""
+    try:
+        tracker = tracking.monitor(source)
+    except (PermissionError, RuntimeError) as exc:
+        st.error(str(exc))
+        return
+    running = tracker.running
+    key = f"live_{source}"
+
+    @st.fragment(run_every=LIVE_POLL_S if running else None)
+    def view():
+        cursor, rows = st.session_state.get(key, (0, []))
+        new, cursor = tracker.since(cursor)
+        rows = (rows + new)[-LIVE_WINDOW:]
+        st.session_state[key] = (cursor, rows)
+        if tracker.error:
+            st.error(f"Tracking stopped: {tracker.error}")
+            if st.button("Reconnect", key=f"reconnect_{source}"):
+                tracking.monitor(source, restart=True)
+                st.session_state.pop(key, None)
+                st.rerun()
+        if not rows:
+            st.info(f"Waiting for observations from {source}…")
+        else:
+            latest = rows[-1]
+            cols = st.columns(5)
+            cols[0].metric("Session time", f"{latest['time_h']:.2f} h")
+            cols[1].metric("H_e", f"{latest['H_e']:+.3f}", f"± {latest['H_e_sd']:.3f}", delta_color="off")
+            cols[2].metric("M (cumulative)", f"{latest['M']:.2f}")
+            cols[3].metric("γ", f"{latest['gamma']:.2f}", f"± {latest['gamma_sd']:.2f}", delta_color="off")
+            cols[4].metric("β_transform", f"{latest['beta_transform']:.2f}",
+                           f"± {latest['beta_transform_sd']:.2f}", delta_color="off")
+            frame = pd.DataFrame(rows).set_index("time_h")
+            st.caption("H_e: observed vs filtered estimate")
+            st.line_chart(frame[["observed", "H_e"]], height=280)
+            st.caption("Learned parameters")
+            st.line_chart(frame[list(tracking.LEARNED)], height=220)
+        if running and not tracker.running:
+            st.rerun()
+
+    view()
+
+
+# Power analysis
+@st.cache_resource(show_spinner="Simulating subject pool…")
+def power_pool():
+    return power.subject_pool()
+
+
+@st.cache_resource(show_spinner="Simulating replicate cohorts…")
+def power_curve(prediction, reps):
+    pool = power_pool()
+    if prediction == 1:
+        return power.power_correlation(pool, list(range(10, 151, 10)), [-0.3, -0.4, -0.5], reps=reps)
+    if prediction == 2:
+        return power.power_paired(pool, list(range(5, 61, 5)), [0.5, 0.8, 1.2], reps=reps)
+    return power.power_moderation(pool, list(range(20, 301, 20)), [0.1, 0.2, 0.3], reps=reps)
+
+
+def power_figure(curve, title, effect_label, stated_n):
+    fig = px.line(curve.assign(effect=curve["effect"].astype(str)), x="n", y="power", color="effect",
+                  markers=True, title=title, labels={"effect": effect_label, "n": "Sample size (n)"})
+    fig.add_hline(y=0.8, line_dash="dot", line_color="gray", annotation_text="80% power")
+    fig.add_vline(x=stated_n, line_dash="dash", line_color="red", annotation_text=f"n={stated_n}")
+    fig.update_layout(height=350, template="plotly_white", yaxis_range=[0, 1.02])
+    return fig
+
 # ============================================
 # OVERVIEW PAGE
 # ============================================
+instrument.section(page, level=0)
+
 if page == "🏠 Overview":
     st.markdown('<div class="main-header">E.M.E.R.G.E+ Framework</div>', unsafe_allow_html=True)
     st.markdown('<div class="sub-header">A Theoretical Model for Meaning Emergence Through Dual Entropy Dynamics</div>', unsafe_allow_html=True)
@@ -188,6 +506,8 @@ elif page == "📊 Routine Process":
     st.header("📊 Routine Meaning Emergence")
     st.markdown("Gradual entropy reduction during everyday coherent functioning")
 
+    table_demo1 = datasets.load("routine_timepoints")
+
     # Key metrics for routine
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -200,62 +520,24 @@ elif page == "📊 Routine Process":
                  delta=f"{table_demo1['M_r'].iloc[-1] - table_demo1['M_r'].iloc[0]:.3f}")
 
     # Entropy Trajectory
-    st.subheader("Entropy Trajectories")
-    fig1 = go.Figure()
-    fig1.add_trace(go.Scatter(
-        x=routine_full['time_s'], y=routine_full['H_e'],
-        mode='lines', name='H_e (Emotional Entropy)',
-        line=dict(color='#EF4444', width=2)
-    ))
-    fig1.add_trace(go.Scatter(
-        x=routine_full['time_s'], y=routine_full['H_c'],
-        mode='lines', name='H_c (Cognitive Entropy)',
-        line=dict(color='#3B82F6', width=2)
-    ))
-    fig1.update_layout(
-        title="Routine Entropy Trajectories",
-        xaxis_title="Time (seconds)",
-        yaxis_title="Arbitrary Units",
-        height=400,
-        template="plotly_white"
-    )
-    st.plotly_chart(fig1, use_container_width=True)
+    subheader("Entropy Trajectories")
+    plotly_chart(cached_figure("routine_entropy"), use_container_width=True)
 
     # Meaning Emergence
-    st.subheader("Meaning Emergence")
-    fig2 = go.Figure()
-    fig2.add_trace(go.Scatter(
-        x=routine_full['time_s'], y=routine_full['M_r'],
-        mode='lines', name='M_r (Routine Meaning)',
-        line=dict(color='#10B981', width=3),
-        fill='tozeroy'
-    ))
-    fig2.update_layout(
-        title="Routine Meaning Emergence",
-        xaxis_title="Time (seconds)",
-        yaxis_title="Meaning (0-1)",
-        height=400,
-        template="plotly_white"
-    )
-    st.plotly_chart(fig2, use_container_width=True)
+    subheader("Meaning Emergence")
+    plotly_chart(cached_figure("routine_meaning"), use_container_width=True)
 
     # Input Signals
-    st.subheader("Input Signals")
-    fig3 = make_subplots(rows=2, cols=1, shared_xaxes=True,
-                        subplot_titles=("Emotional Energy (E)", "Cognitive Structure (C)"))
-    fig3.add_trace(go.Scatter(x=routine_full['time_s'], y=routine_full['E'],
-                             mode='lines', name='E', line=dict(color='#F59E0B')),
-                  row=1, col=1)
-    fig3.add_trace(go.Scatter(x=routine_full['time_s'], y=routine_full['C'],
-                             mode='lines', name='C', line=dict(color='#8B5CF6')),
-                  row=2, col=1)
-    fig3.update_layout(height=500, template="plotly_white", showlegend=False)
-    st.plotly_chart(fig3, use_container_width=True)
+    subheader("Input Signals")
+    plotly_chart(cached_figure("routine_inputs"), use_container_width=True)
 
     # Data Table
-    st.subheader("📋 Key Timepoints")
+    subheader("📋 Key Timepoints")
     st.dataframe(table_demo1, use_container_width=True)
 
+    if st.toggle("Show Monte Carlo ensemble", help="Median and 5–95% band over many noise seeds"):
+        ensemble_section("routine", "M_r", "#EF4444", "Time (seconds)", "s")
+
 # ============================================
 # TRANSFORMATIVE PROCESS PAGE
 # ============================================
@@ -263,6 +545,9 @@ elif page == "🔥 Transformative Process":
     st.header("🔥 Transformative Meaning Emergence")
     st.markdown("Biphasic trajectory: transient entropy elevation followed by deep reduction")
 
+    table_demo2 = datasets.load("transformative_timepoints")
+    transformative_meta = datasets.load("transformative_meta")
+
     t_peak = transformative_meta['t_peak_h'].values[0]
 
     # Key metrics
@@ -279,89 +564,31 @@ elif page == "🔥 Transformative Process":
         st.metric("📊 Final M_t", "1.000", help="Normalized cumulative")
 
     # Drug Profile
-    st.subheader("Perturbation Profile (Psychedelic-like)")
-    fig1 = go.Figure()
-    fig1.add_trace(go.Scatter(
-        x=transformative_full['time_h'], y=transformative_full['D'],
-        mode='lines', name='D(t) Perturbation',
-        line=dict(color='#DC2626', width=2),
-        fill='tozeroy'
-    ))
-    fig1.add_vline(x=t_peak, line_dash="dash", line_color="gray",
-                  annotation_text=f"Peak at {t_peak}h")
-    fig1.update_layout(
-        title="Stylized Perturbation Profile (Gamma-shaped)",
-        xaxis_title="Time (hours)",
-        yaxis_title="Perturbation (arb.u.)",
-        height=350,
-        template="plotly_white"
-    )
-    st.plotly_chart(fig1, use_container_width=True)
+    subheader("Perturbation Profile (Psychedelic-like)")
+    plotly_chart(cached_figure("transform_profile"), use_container_width=True)
 
     # Biphasic Entropy
-    st.subheader("Biphasic Entropy Trajectory")
-    fig2 = go.Figure()
-    fig2.add_trace(go.Scatter(
-        x=transformative_full['time_h'], y=transformative_full['H_e'],
-        mode='lines', name='H_e (Emotional Entropy)',
-        line=dict(color='#7C3AED', width=3)
-    ))
-    fig2.add_hline(y=0, line_dash="dot", line_color="gray", annotation_text="Baseline")
-    fig2.add_vline(x=t_peak, line_dash="dash", line_color="red",
-                  annotation_text="Phase 1 → Phase 2")
-
-    # Add phase annotations
-    fig2.add_annotation(x=1, y=0.7, text="Phase 1:<br>Entropy Elevation",
-                       showarrow=False, bgcolor="#FEF3C7", bordercolor="#F59E0B")
-    fig2.add_annotation(x=5, y=-0.3, text="Phase 2:<br>Deep Reduction",
-                       showarrow=False, bgcolor="#DBEAFE", bordercolor="#3B82F6")
-
-    fig2.update_layout(
-        title="Biphasic Entropy Dynamics",
-        xaxis_title="Time (hours)",
-        yaxis_title="Arbitrary Units",
-        height=400,
-        template="plotly_white"
-    )
-    st.plotly_chart(fig2, use_container_width=True)
+    subheader("Biphasic Entropy Trajectory")
+    plotly_chart(cached_figure("transform_entropy"), use_container_width=True)
 
     # Cumulative Meaning
-    st.subheader("Cumulative Meaning Trajectory")
-    fig3 = go.Figure()
-    fig3.add_trace(go.Scatter(
-        x=transformative_full['time_h'], y=transformative_full['M_t'],
-        mode='lines', name='M_t (Cumulative Meaning)',
-        line=dict(color='#059669', width=3),
-        fill='tozeroy'
-    ))
-    fig3.add_vline(x=t_peak, line_dash="dash", line_color="red")
-    fig3.update_layout(
-        title="Transformative Meaning Accumulation",
-        xaxis_title="Time (hours)",
-        yaxis_title="Cumulative Meaning (0-1)",
-        height=400,
-        template="plotly_white"
-    )
-    st.plotly_chart(fig3, use_container_width=True)
+    subheader("Cumulative Meaning Trajectory")
+    plotly_chart(cached_figure("transform_meaning"), use_container_width=True)
 
     # Combined view
-    st.subheader("Combined Dynamics")
-    fig4 = make_subplots(rows=2, cols=1, shared_xaxes=True,
-                        subplot_titles=("Entropy (H_e)", "Meaning (M_t)"))
-    fig4.add_trace(go.Scatter(x=transformative_full['time_h'], y=transformative_full['H_e'],
-                             mode='lines', name='H_e', line=dict(color='#7C3AED')),
-                  row=1, col=1)
-    fig4.add_trace(go.Scatter(x=transformative_full['time_h'], y=transformative_full['M_t'],
-                             mode='lines', name='M_t', line=dict(color='#059669')),
-                  row=2, col=1)
-    fig4.add_vline(x=t_peak, line_dash="dash", line_color="red", row="all", col=1)
-    fig4.update_layout(height=600, template="plotly_white", showlegend=False)
-    st.plotly_chart(fig4, use_container_width=True)
+    subheader("Combined Dynamics")
+    plotly_chart(cached_figure("transform_combined"), use_container_width=True)
 
     # Data Table
-    st.subheader("📋 Key Timepoints")
+    subheader("📋 Key Timepoints")
     st.dataframe(table_demo2, use_container_width=True)
 
+    if st.toggle("Show Monte Carlo ensemble", help="Median and 5–95% band over many noise seeds"):
+        ensemble_section("transformative", "M_t", "#7C3AED", "Time (hours)", "h")
+
+    if st.toggle("Show repeated dosing over days", help="Multi-dose schedules integrated in chunks to disk"):
+        longrun_section()
+
 # ============================================
 # CULTURAL MODULATION PAGE
 # ============================================
@@ -369,6 +596,8 @@ elif page == "🌍 Cultural Modulation":
     st.header("🌍 Cultural Modulation of Meaning Emergence")
     st.markdown("How emotion regulation norms (Ψ) affect routine meaning dynamics")
 
+    table_demo3 = datasets.load("culture")
+
     col1, col2 = st.columns(2)
     with col1:
         st.markdown("""
@@ -385,37 +614,44 @@ elif page == "🌍 Cultural Modulation":
         - More open regulation
         """)
 
-    # Comparison chart
-    st.subheader("Cultural Comparison")
-
-    fig = go.Figure()
-    cultures = ['Restrained', 'Expressive']
-    colors = ['#3B82F6', '#EF4444']
-
-    metrics = ['M_r_final', 'time_to_M_gt_0p35_s']
-    metric_names = ['Final Meaning (M_r)', 'Time to M > 0.35 (s)']
-
-    for i, (metric, name) in enumerate(zip(metrics, metric_names)):
-        fig.add_trace(go.Bar(
-            name=name,
-            x=cultures,
-            y=table_demo3[metric],
-            marker_color=colors[i],
-            text=[f"{v:.3f}" if metric == 'M_r_final' else f"{v:.2f}s" for v in table_demo3[metric]],
-            textposition='auto'
-        ))
-
-    fig.update_layout(
-        title="Cultural Modulation Effects",
-        barmode='group',
-        height=450,
-        template="plotly_white"
-    )
-    st.plotly_chart(fig, use_container_width=True)
-
-    # Detailed table
-    st.subheader("📋 Detailed Results")
-    st.dataframe(table_demo3, use_container_width=True)
+    # Population simulation across a continuum of group norms
+    subheader("Cultural Comparison")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        n_groups = st.slider("Cultures (Ψ norms 0.2–0.8)", 3, 21, 9, step=2)
+    with col2:
+        n_agents = st.select_slider("Agents", options=[10000, 20000, 50000, 100000], value=20000)
+    with col3:
+        conformity = st.slider("Peer conformity", 0.0, 1.0, 0.5, 0.05)
+    with col4:
+        psi0 = st.slider("Initial Ψ", 0.0, 1.0, 0.5, 0.05)
+    pop_job = submit_job("population", {"n_groups": n_groups, "agents": n_agents, "conformity": conformity,
+                                        "psi0": psi0}, "population")
+
+    def population_results(result):
+        pop_summary, pop_time, psi_mean = result
+        if pop_summary.empty:
+            st.info("Waiting for the first culture to finish…")
+            return
+        fig = figures.build("cultural_comparison", {"culture": table_demo3, "population": pop_summary},
+                            agents=n_agents)
+        plotly_chart(fig, use_container_width=True)
+
+        # Ψ drifting toward each group norm
+        fig_psi = go.Figure()
+        for g, norm in enumerate(pop_summary["S_group"]):
+            fig_psi.add_trace(downsample.scatter(pop_time, psi_mean[:, g], max_points, line_method,
+                                                 name=f"S_group={norm:.2f}", line=dict(width=2)))
+        fig_psi.update_layout(title="Group Mean Ψ Over Time", xaxis_title="Time (s)", yaxis_title="Ψ",
+                              height=350, template="plotly_white")
+        plotly_chart(fig_psi, use_container_width=True)
+
+        # Detailed table
+        subheader("📋 Detailed Results")
+        st.dataframe(table_demo3, use_container_width=True)
+        st.dataframe(pop_summary, use_container_width=True)
+
+    job_view(pop_job, population_results)
 
     # Key findings
     st.info("""
@@ -431,32 +667,22 @@ elif page == "⚙️ Parameter Sensitivity":
     st.header("⚙️ Parameter Sensitivity Analysis")
     st.markdown("Effect of varying emotional regulation capacity (α_E)")
 
+    table_demo4 = datasets.load("sensitivity")
+
     # Sensitivity charts
     col1, col2 = st.columns(2)
 
     with col1:
-        fig1 = px.line(table_demo4, x='alpha_E', y='M_r_final',
-                      markers=True, title="Final Meaning vs α_E")
-        fig1.update_traces(line_color='#10B981', marker_size=10)
-        fig1.update_layout(height=350, template="plotly_white")
-        st.plotly_chart(fig1, use_container_width=True)
+        plotly_chart(cached_figure("sensitivity_meaning"), use_container_width=True)
 
     with col2:
-        fig2 = px.line(table_demo4, x='alpha_E', y='time_to_M_gt_0p40_s',
-                      markers=True, title="Time to Reach M > 0.40")
-        fig2.update_traces(line_color='#F59E0B', marker_size=10)
-        fig2.update_layout(height=350, template="plotly_white")
-        st.plotly_chart(fig2, use_container_width=True)
+        plotly_chart(cached_figure("sensitivity_time"), use_container_width=True)
 
     # H_e vs alpha_E
-    fig3 = px.line(table_demo4, x='alpha_E', y='H_e_final',
-                  markers=True, title="Final Entropy vs α_E")
-    fig3.update_traces(line_color='#EF4444', marker_size=10)
-    fig3.update_layout(height=350, template="plotly_white")
-    st.plotly_chart(fig3, use_container_width=True)
+    plotly_chart(cached_figure("sensitivity_entropy"), use_container_width=True)
 
     # Data table
-    st.subheader("📋 Sensitivity Results")
+    subheader("📋 Sensitivity Results")
     st.dataframe(table_demo4, use_container_width=True)
 
     st.success("""
@@ -466,14 +692,284 @@ elif page == "⚙️ Parameter Sensitivity":
     - Lower final entropy (better regulation)
     """)
 
+    # Dense two-parameter sweep
+    st.markdown("---")
+    subheader("🗺️ Dense Parameter Sweep")
+    st.markdown("Joint effect of two parameters on the routine outcomes, evaluated on a dense grid")
+
+    swept = [name for name in sweep.DEFAULT_BOUNDS if name in sweep.ROUTINE_PARAMETERS]
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        x_param = st.selectbox("X parameter", swept, index=0)
+    with col2:
+        y_options = [name for name in swept if name != x_param]
+        y_param = st.selectbox("Y parameter", y_options, index=min(1, len(y_options) - 1))
+    with col3:
+        resolution = st.select_slider("Grid resolution", options=[32, 64, 128, 256, 316], value=128)
+    metric = st.radio("Outcome", sweep.OUTPUTS["routine"], horizontal=True)
+
+    xs = np.linspace(*sweep.DEFAULT_BOUNDS[x_param], resolution)
+    ys = np.linspace(*sweep.DEFAULT_BOUNDS[y_param], resolution)
+    sweep_job = submit_job("sweep", {"axes": [[y_param, *sweep.DEFAULT_BOUNDS[y_param], resolution],
+                                              [x_param, *sweep.DEFAULT_BOUNDS[x_param], resolution]],
+                                     "model": "routine", "threshold": 0.40}, "sweep")
+
+    def sweep_heatmap(store):
+        z = np.asarray(store.column(metric)).reshape(len(ys), len(xs))
+        fig4 = go.Figure(go.Heatmap(z=z, x=xs, y=ys, colorscale="Viridis", colorbar=dict(title=metric)))
+        fig4.update_layout(
+            title=f"{metric} over {x_param} × {y_param} ({len(store):,} points)",
+            xaxis_title=x_param,
+            yaxis_title=y_param,
+            height=500,
+            template="plotly_white"
+        )
+        plotly_chart(fig4, use_container_width=True)
+
+    job_view(sweep_job, sweep_heatmap)
+
+    # Variance-based global sensitivity over every parameter at once
+    st.markdown("---")
+    subheader("🌐 Global Sensitivity (Sobol Indices)")
+    st.markdown("Share of each outcome's variance explained by each parameter on its own (first order, S1) "
+                "and including all its interactions (total order, ST), with all parameters varied together")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        sobol_model = st.selectbox("Model", list(sobol.BOUNDS), key="sobol_model")
+    with col2:
+        sobol_n = st.select_slider("Base samples N", options=[256, 512, 1024, 2048], value=1024)
+    sobol_output = st.radio("Outcome", sobol.OUTPUTS[sobol_model], horizontal=True, key="sobol_output")
+    n_params = len(sobol.BOUNDS[sobol_model])
+    sobol_spec = {"model": sobol_model, "n": sobol_n}
+    sobol_job = None
+    if jobs.find("sobol", sobol_spec) is None:
+        st.caption(f"{sobol_n * (n_params + 2):,} model runs = N × ({n_params} parameters + 2)")
+        if st.button("Run Sobol analysis", key="sobol_run"):
+            sobol_job = submit_job("sobol", sobol_spec, "sobol")
+    else:
+        sobol_job = submit_job("sobol", sobol_spec, "sobol")
+
+    def sobol_chart(store):
+        if store.progress < 1:
+            st.caption(f"{len(store):,} model runs = N × ({n_params} parameters + 2)")
+            return
+        table = sobol_indices(sobol_job, sobol_model, sobol_n)
+        rows = table[table["output"] == sobol_output].sort_values("ST")
+        fig5 = go.Figure()
+        for index, color in (("S1", "#667eea"), ("ST", "#f5576c")):
+            fig5.add_trace(go.Bar(
+                y=rows["parameter"], x=rows[index], orientation="h", name=index, marker_color=color,
+                error_x=dict(type="data", symmetric=False, array=rows[f"{index}_hi"] - rows[index],
+                             arrayminus=rows[index] - rows[f"{index}_lo"])
+            ))
+        fig5.update_layout(
+            title=f"Sobol indices of {sobol_output} ({len(store):,} runs, 95% bootstrap CI)",
+            xaxis_title="Index",
+            barmode="group",
+            height=120 + 28 * n_params,
+            template="plotly_white"
+        )
+        plotly_chart(fig5, use_container_width=True)
+        top = rows.nlargest(3, "interaction")
+        st.caption("Largest interaction shares (ST − S1): "
+                   + ", ".join(f"{p} {v:.2f}" for p, v in zip(top["parameter"], top["interaction"])))
+
+    if sobol_job is not None:
+        job_view(sobol_job, sobol_chart)
+
+# ============================================
+# PHASE SPACE PAGE
+# ============================================
+elif page == "🌀 Phase Space":
+    st.header("🌀 Phase Space & Bifurcation Analysis")
+    st.markdown("Vector fields, equilibria and parameter continuation of the noise-free model")
+
+    model = st.radio("Process", ["transformative", "routine"], horizontal=True,
+                     format_func=lambda m: f"{m.title()}: ({', '.join(phase.PLANES[m])}) plane")
+    density = st.select_slider("Arrow grid", options=[15, 20, 25, 30, 40, 50], value=25)
+
+    if model == "routine":
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            alpha_E = st.slider("α_E", 0.0, 1.0, sim.ROUTINE_DEFAULTS.alpha_E, 0.05, key="ps_r_alpha_E")
+        with col2:
+            alpha_C = st.slider("α_C", 0.0, 0.6, sim.ROUTINE_DEFAULTS.alpha_C, 0.05, key="ps_alpha_C")
+        with col3:
+            E_mean = st.slider("E mean", 0.2, 1.0, sim.ROUTINE_DEFAULTS.E_mean, 0.05, key="ps_E_mean")
+        with col4:
+            S_group = st.slider("S_group", 0.0, 1.0, sim.ROUTINE_DEFAULTS.S_group, 0.05, key="ps_S_group")
+        params = {"alpha_E": alpha_E, "alpha_C": alpha_C, "E_mean": E_mean, "S_group": S_group}
+        traj = phase.routine_skeleton(params)
+        H_e, H_c = traj["H_e"][0], traj["H_c"][0]
+        pad_e, pad_c = 0.15 * max(np.ptp(H_e), 0.2), 0.15 * max(np.ptp(H_c), 0.2)
+        xlim, ylim = (H_e.min() - pad_e, H_e.max() + pad_e), (H_c.min() - pad_c, H_c.max() + pad_c)
+        X, Y, U, V = phase.grid_field(model, xlim, ylim, density, params)
+
+        subheader("🧭 (H_e, H_c) Direction Field")
+        # Iso-meaning lines: at fixed inputs M_r is constant along H_e + H_c = const
+        h_e, h_c = np.linspace(*xlim, 120), np.linspace(*ylim, 120)
+        rp = sim._coerce(params, sim.ROUTINE_DEFAULTS)
+        M = sim.routine_meaning(rp.E_mean, rp.C_mean, h_e[None, :], h_c[:, None],
+                                {"kappa_M": rp.kappa_M, "theta_M": rp.theta_M})
+        meaning = go.Contour(x=h_e, y=h_c, z=M, colorscale="Greens", opacity=0.35, colorbar=dict(title="M_r"),
+                             contours=dict(showlabels=True), hoverinfo="skip")
+        fig = quiver_figure(X, Y, U, V, "Routine flow at mean inputs, Ψ = S_group", "H_e", "H_c", meaning)
+        fig.add_trace(go.Scatter(x=H_e, y=H_c, mode="lines", name="Skeleton trajectory",
+                                 line=dict(color="#667eea", width=3)))
+        plotly_chart(fig, use_container_width=True)
+    else:
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            gamma = st.slider("γ (perturbation gain)", 0.2, 2.0, sim.TRANSFORM_DEFAULTS.gamma, 0.05, key="ps_gamma")
+        with col2:
+            beta_transform = st.slider("β_transform", 0.05, 1.5, sim.TRANSFORM_DEFAULTS.beta_transform, 0.05,
+                                       key="ps_beta")
+        with col3:
+            alpha_E = st.slider("α_E", 0.0, 1.0, sim.TRANSFORM_DEFAULTS.alpha_E, 0.05, key="ps_t_alpha_E")
+        with col4:
+            H_e_star = st.slider("H_e*", -1.0, 0.0, sim.TRANSFORM_DEFAULTS.H_e_star, 0.05, key="ps_H_e_star")
+        base = {"alpha_E": alpha_E, "H_e_star": H_e_star}
+        params = {**base, "gamma": gamma, "beta_transform": beta_transform}
+        t_frozen = st.slider("Field frozen at t (h)", 0.0, 8.0, 3.0, 0.25)
+
+        traj = phase.transform_skeleton(params)
+        H_e, M = traj["H_e"][0], traj["M"][0]
+        pad = 0.15 * max(np.ptp(H_e), 0.2)
+        xlim, ylim = (H_e.min() - pad, H_e.max() + pad), (0.0, 1.1 * M.max())
+        X, Y, U, V = phase.grid_field(model, xlim, ylim, density, params, t_frozen)
+
+        subheader("🧭 (H_e, M) Direction Field")
+        fig = quiver_figure(X, Y, U, V, f"Transformative flow frozen at t = {t_frozen:g} h", "H_e",
+                            "M = ∫ exp(−H_e) dt")
+        now = min(int(round(t_frozen / 0.01)), len(traj.time) - 1)
+        fig.add_trace(go.Scatter(x=H_e, y=M, mode="lines", name="Skeleton trajectory",
+                                 line=dict(color="#f5576c", width=3)))
+        fig.add_trace(go.Scatter(x=[H_e[now]], y=[M[now]], mode="markers", name=f"State at t = {t_frozen:g} h",
+                                 marker=dict(size=12, color="#f5576c", line=dict(color="white", width=2))))
+        fig.add_vline(x=0, line_dash="dot", line_color="gray", annotation_text="baseline")
+        table = phase.equilibria(model, params, t_frozen)
+        H_eq = table.loc[table["state"] == "H_e", "value"].iloc[0]
+        if not np.isnan(H_eq):
+            fig.add_vline(x=H_eq, line_dash="dash", line_color="#11998e", annotation_text="H_e nullcline")
+        plotly_chart(fig, use_container_width=True)
+
+    subheader("⚖️ Equilibria & Stability")
+    st.dataframe(phase.equilibria(model, params, None if model == "routine" else t_frozen),
+                 use_container_width=True, hide_index=True)
+
+    if model == "transformative":
+        st.markdown("---")
+        subheader("🔀 Where the Entropy Detour Appears")
+        st.markdown("Undershoot margin = lowest H_e in Phase 2 within 8 h; below 0 the trajectory dips under "
+                    "baseline. The line is the continued boundary β_c(γ).")
+        resolution = st.select_slider("Map resolution", options=[32, 64, 96, 128, 192], value=96)
+        key = tuple(sorted(base.items()))
+        gammas, betas, region = undershoot_region(key, resolution)
+        boundary = undershoot_boundary(key, 60)
+        fig = go.Figure(go.Heatmap(x=gammas, y=betas, z=region["margin"], colorscale="RdBu", zmid=0,
+                                   colorbar=dict(title="margin")))
+        fig.add_trace(go.Scatter(x=boundary["gamma"], y=boundary["beta_critical"], mode="lines",
+                                 name="β_c(γ)", line=dict(color="black", width=3)))
+        fig.add_trace(go.Scatter(x=[gamma], y=[beta_transform], mode="markers", name="Current (γ, β)",
+                                 marker=dict(size=12, color="gold", line=dict(color="black", width=1))))
+        fig.update_layout(title="Undershoot margin over γ × β_transform", xaxis_title="γ",
+                          yaxis_title="β_transform", height=500, template="plotly_white")
+        plotly_chart(fig, use_container_width=True)
+
+        subheader("📈 Bifurcation Diagram")
+        name = st.radio("Continuation parameter", ["gamma", "beta_transform"], horizontal=True)
+        fixed = {**base, "beta_transform" if name == "gamma" else "gamma":
+                 beta_transform if name == "gamma" else gamma}
+        diagram = bifurcation_diagram(name, tuple(sorted(fixed.items())))
+        fig = go.Figure()
+        for column, label, color in [("H_e_peak", "Peak H_e", "#f5576c"), ("margin", "Phase 2 minimum", "#667eea"),
+                                     ("H_e_final", "H_e at 8 h", "#11998e"), ("H_e_inf", "H_e^∞", "gray")]:
+            fig.add_trace(go.Scatter(x=diagram[name], y=diagram[column], mode="lines", name=label,
+                                     line=dict(color=color, dash="dash" if column == "H_e_inf" else None)))
+        fig.add_hline(y=0, line_dash="dot", line_color="gray", annotation_text="baseline")
+        fig.add_vline(x=gamma if name == "gamma" else beta_transform, line_dash="dash", line_color="gold")
+        fig.update_layout(title=f"Skeleton outcomes along {name}", xaxis_title=name, yaxis_title="H_e",
+                          height=420, template="plotly_white")
+        plotly_chart(fig, use_container_width=True)
+
+# ============================================
+# PLAYGROUND PAGE
+# ============================================
+elif page == "🎛️ Playground":
+    st.header("🎛️ Live Parameter Playground")
+    st.markdown("Adjust the equation parameters and both processes are re-simulated on release")
+
+    if "pg_routine" not in st.session_state:
+        st.session_state.pg_routine = playground.RoutineSession()
+        st.session_state.pg_transform = playground.TransformSession()
+
+    # Only this fragment reruns on slider changes; charts keep their keys and zoom (uirevision)
+    @st.fragment
+    def live_playground():
+        col1, col2 = st.columns(2)
+        with col1:
+            subheader("📊 Routine")
+            routine_params = sim.RoutineParams(
+                alpha_E=st.slider("α_E (regulation)", 0.0, 1.0, sim.ROUTINE_DEFAULTS.alpha_E, 0.05, key="r_alpha_E"),
+                beta_E=st.slider("β_E (synergy)", 0.0, 0.3, sim.ROUTINE_DEFAULTS.beta_E, 0.01),
+                chi_E=st.slider("χ_E (culture)", 0.0, 0.2, sim.ROUTINE_DEFAULTS.chi_E, 0.01),
+                alpha_C=st.slider("α_C (cognitive structure)", 0.0, 0.6, sim.ROUTINE_DEFAULTS.alpha_C, 0.05),
+                S_group=st.slider("S_group (group norm for Ψ)", 0.0, 1.0, sim.ROUTINE_DEFAULTS.S_group, 0.05),
+            )
+        with col2:
+            subheader("🔥 Transformative")
+            transform_params = sim.TransformParams(
+                gamma=st.slider("γ (perturbation gain)", 0.0, 2.0, sim.TRANSFORM_DEFAULTS.gamma, 0.05),
+                alpha_E=st.slider("α_E (regulation)", 0.0, 1.0, sim.TRANSFORM_DEFAULTS.alpha_E, 0.05, key="t_alpha_E"),
+                t_peak=st.slider("t_peak (h)", 0.5, 6.0, sim.TRANSFORM_DEFAULTS.t_peak, 0.25),
+                beta_transform=st.slider("β_transform (Phase 2)", 0.0, 2.0, sim.TRANSFORM_DEFAULTS.beta_transform, 0.05),
+                H_e_star=st.slider("H_e* (Phase 2 set point)", -1.0, 0.5, sim.TRANSFORM_DEFAULTS.H_e_star, 0.05),
+            )
+
+        routine_session = st.session_state.pg_routine
+        transform_session = st.session_state.pg_transform
+        routine = routine_session.update(routine_params)
+        transform = transform_session.update(transform_params)
+        st.caption(f"⏱️ Routine: {routine_session.last_ms:.0f} ms ({routine_session.last_kind}) · "
+                   f"Transformative: {transform_session.last_ms:.0f} ms ({transform_session.last_kind})")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            fig1 = make_subplots(rows=2, cols=1, shared_xaxes=True,
+                                subplot_titles=("Entropy (H_e, H_c)", "Meaning (M_r)"))
+            for name, color, row in [("H_e", "#EF4444", 1), ("H_c", "#3B82F6", 1), ("M_r", "#10B981", 2)]:
+                fig1.add_trace(downsample.scatter(routine.time, routine[name][0], max_points, line_method,
+                                                  mode='lines', name=name, line=dict(color=color)),
+                              row=row, col=1)
+            fig1.update_layout(height=500, template="plotly_white", uirevision="pg_routine")
+            fig1.update_xaxes(title_text="Time (seconds)", row=2, col=1)
+            plotly_chart(fig1, use_container_width=True, key="pg_routine_chart")
+        with col2:
+            fig2 = make_subplots(rows=2, cols=1, shared_xaxes=True,
+                                subplot_titles=("Entropy (H_e)", "Meaning (M_t)"))
+            for name, color, row in [("H_e", "#7C3AED", 1), ("M_t", "#059669", 2)]:
+                fig2.add_trace(downsample.scatter(transform.time, transform[name][0], max_points, line_method,
+                                                  mode='lines', name=name, line=dict(color=color)),
+                              row=row, col=1)
+            fig2.add_vline(x=transform_params.t_peak, line_dash="dash", line_color="red", row="all", col=1)
+            fig2.update_layout(height=500, template="plotly_white", uirevision="pg_transform")
+            fig2.update_xaxes(title_text="Time (hours)", row=2, col=1)
+            plotly_chart(fig2, use_container_width=True, key="pg_transform_chart")
+
+    live_playground()
+
 # ============================================
 # PREDICTIONS & VALIDATION PAGE
 # ============================================
 elif page == "🔮 Predictions & Validation":
     st.header("🔮 Falsifiable Predictions")
+    st.markdown("Power curves are simulated live from the model: replicate cohorts are drawn from a "
+                "pool of simulated subjects and the stated test is run on every replicate")
+    reps = st.select_slider("Replicate cohorts per point", options=[500, 1000, 2000, 5000], value=1000)
 
     # Prediction 1
-    st.subheader("Prediction 1: Routine Entropy-Meaning Correlation")
+    subheader("Prediction 1: Routine Entropy-Meaning Correlation")
     st.markdown("""
     **Hypothesis:** In routine contexts, H_e negatively correlates with self-reported meaning.
 
@@ -483,9 +979,12 @@ elif page == "🔮 Predictions & Validation":
     | Falsification | If \|r\| < 0.2 or positive |
     | Sample | n=50 (power=0.80) |
     """)
+    curve1 = power_curve(1, reps)
+    plotly_chart(power_figure(curve1, "Simulated power: r(H_e, MLQ) < -0.3", "population ρ", 50),
+                 use_container_width=True)
 
     # Prediction 2
-    st.subheader("Prediction 2: Biphasic Psychedelic Trajectory")
+    subheader("Prediction 2: Biphasic Psychedelic Trajectory")
     st.markdown("""
     **Hypothesis:** During psilocybin sessions, entropy shows a biphasic pattern:
     - **Phase 1 (0-3h):** H_e increases
@@ -497,9 +996,40 @@ elif page == "🔮 Predictions & Validation":
     | Falsification | If H_e(8h) ≥ H_e(0h) in >80% of participants |
     | Sample | n=20 (pilot) |
     """)
+    curve2 = power_curve(2, reps)
+    plotly_chart(power_figure(curve2, "Simulated power: paired H_e(8h) < H_e(0h)", "effect d_z", 20),
+                 use_container_width=True)
+
+    if st.toggle("📡 Track a session live", help="Filter streaming H_e observations of a running session"):
+        st.markdown("An ensemble Kalman filter on the transformative equations updates H_e, cumulative "
+                    "meaning M and the participant's γ, β_transform and H_e* with every observation "
+                    "(lines of `time_h,H_e` appended to a file, or sent to a TCP address)")
+        kind = st.radio("Source", ["Simulated participant", "Session file"], horizontal=True)
+        if kind == "Simulated participant":
+            if "demo_run" not in st.session_state:
+                st.session_state.demo_run = 0
+            if st.button("New participant"):
+                st.session_state.demo_run += 1
+            source = demo_participant(st.session_state.demo_run)
+            st.caption(f"8-hour session replayed at {DEMO_SPEED:g}× real time into `{source}`")
+        else:
+            label = "File in the stream directory" + (" or tcp://host:port" if tracking.ALLOW_TCP else "")
+            source = st.text_input(label, placeholder="p07_session.csv", help=f"Relative to {tracking.STREAM_DIR}")
+        if source:
+            live_view(source)
+        monitored = tracking.trackers()
+        if monitored:
+            with st.expander(f"Monitored sessions ({len(monitored)})"):
+                rows = []
+                for name, tracker in monitored.items():
+                    latest, _ = tracker.since(max(0, tracker.seq - 1))
+                    rows.append({"source": name, "observations": tracker.seq, "running": tracker.running,
+                                 **({k: latest[-1][k] for k in ("time_h", "H_e", "M", *tracking.LEARNED)}
+                                    if latest else {})})
+                st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
 
     # Prediction 3
-    st.subheader("Prediction 3: Cultural Moderation")
+    subheader("Prediction 3: Cultural Moderation")
     st.markdown("""
     **Hypothesis:** Ψ moderates the H_e → meaning relationship.
 
@@ -510,6 +1040,16 @@ elif page == "🔮 Predictions & Validation":
     | Falsification | If β₃ ≈ 0 |
     | Sample | n=100 (50 per culture) |
     """)
+    curve3 = power_curve(3, reps)
+    plotly_chart(power_figure(curve3, "Simulated power: β₃ > 0.10 in MLQ ~ H_e × Ψ", "population β₃", 100),
+                 use_container_width=True)
+
+    col1, col2, col3 = st.columns(3)
+    for col, curve, effect, label in [(col1, curve1, -0.4, "P1 (ρ = -0.4)"), (col2, curve2, 0.8, "P2 (d_z = 0.8)"),
+                                      (col3, curve3, 0.2, "P3 (β₃ = 0.2)")]:
+        with col:
+            n80 = power.required_n(curve, effect)
+            st.metric(f"n for 80% power, {label}", n80 if n80 else "> max n")
 
     st.markdown("---")
 
@@ -534,8 +1074,8 @@ elif page == "🔮 Predictions & Validation":
         ]
     }
 
-    for phase, items in phases.items():
-        with st.expander(phase):
+    for stage, items in phases.items():
+        with st.expander(stage):
             for item in items:
                 st.markdown(f"- {item}")
 
@@ -611,3 +1151,17 @@ st.markdown("""
     E.M.E.R.G.E+ Framework Dashboard | December 2025 | Amir Lotfifar
 </div>
 """, unsafe_allow_html=True)
+
+# Span tree of this rerun
+tree = instrument.end_rerun()
+with profile_panel:
+    if tree is not None:
+        rows = instrument.flatten(tree)
+        st.caption(f"Last rerun: {tree.ms:.0f} ms")
+        st.dataframe(pd.DataFrame({
+            "span": ["\u2003" * depth + name for depth, name, _, _ in rows],
+            "ms": [ms for _, _, ms, _ in rows],
+            "self ms": [self_ms for _, _, _, self_ms in rows],
+        }).round(1), hide_index=True, use_container_width=True)
+        st.download_button("Export span stats (JSON)", instrument.export(), file_name="emerge_spans.json",
+                           mime="application/json")
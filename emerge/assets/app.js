@@ -491,15 +491,123 @@
     container.appendChild(table);
   }
 
+  // Data: time series arrive as base64 float32 (see site_data.py). A preview
+  // is inlined in data.js for first paint; full resolution is loaded per series.
+  function decode(b64){
+    const bin = atob(b64);
+    const bytes = new Uint8Array(bin.length);
+    for(let i=0;i<bin.length;i++) bytes[i] = bin.charCodeAt(i);
+    return new Float32Array(bytes.buffer);
+  }
+
+  function decodeColumns(cols){
+    const out = {};
+    for(const c of Object.keys(cols)) out[c] = decode(cols[c]);
+    return out;
+  }
+
+  // <script> injection instead of fetch so the page also works from file://
+  function loadScript(src){
+    return new Promise((resolve, reject) => {
+      const s = document.createElement('script');
+      s.src = src;
+      s.async = true;
+      s.onload = resolve;
+      s.onerror = reject;
+      document.head.appendChild(s);
+    });
+  }
+
+  function loadFullSeries(D){
+    const full = {};
+    window.EMERGE_CHUNK = (key, col, b64) => {
+      (full[key] = full[key] || {})[col] = decode(b64);
+    };
+    const jobs = [];
+    for(const key of Object.keys(D.series)){
+      for(const src of Object.values(D.series[key].chunks)) jobs.push(loadScript(src));
+    }
+    return Promise.all(jobs).then(() => full);
+  }
+
+  function tableRows(t){
+    const cols = Object.keys(t);
+    const n = cols.length ? t[cols[0]].length : 0;
+    return {columns: cols, rows: Array.from({length:n}, (_,i) => cols.map(c => t[c][i]))};
+  }
+
+  // Chart id → series, built from either the preview or the full data
+  function chartSeries(routine, transform, T){
+    const rt = routine.time_s;
+    const th = transform.time_h;
+    const cx = T.culture.psi0;
+    const ax = T.sensitivity.alpha_E;
+    return {
+      'routine-inputs-chart': [
+        {name:'E (Input)', x:rt, y:routine.E, color:PALETTE[0]},
+        {name:'C (Context)', x:rt, y:routine.C, color:PALETTE[1]},
+      ],
+      'routine-meaning-chart': [
+        {name:'M_r (Meaning)', x:rt, y:routine.M_r, color:PALETTE[0]},
+        {name:'Psi', x:rt, y:routine.Psi, color:PALETTE[2]},
+      ],
+      'routine-entropy-chart': [
+        {name:'H_e', x:rt, y:routine.H_e, color:PALETTE[3]},
+        {name:'H_c', x:rt, y:routine.H_c, color:PALETTE[4]},
+      ],
+      'transform-meaning-chart': [
+        {name:'M_t (Transform)', x:th, y:transform.M_t, color:PALETTE[1]},
+      ],
+      'transform-drug-chart': [
+        {name:'D (Drug level)', x:th, y:transform.D, color:PALETTE[0]},
+      ],
+      'transform-entropy-chart': [
+        {name:'H_e', x:th, y:transform.H_e, color:PALETTE[3]},
+        {name:'E', x:th, y:transform.E, color:PALETTE[0]},
+        {name:'C', x:th, y:transform.C, color:PALETTE[2]},
+      ],
+      // Cultural: show outcomes vs psi0 (2 points but still interactive)
+      'cultural-chart': [
+        {name:'M_r_final', x:cx, y:T.culture.M_r_final, color:PALETTE[0]},
+        {name:'H_e_final', x:cx, y:T.culture.H_e_final, color:PALETTE[3]},
+        {name:'time_to_M>0.35 (s)', x:cx, y:T.culture.time_to_M_gt_0p35_s, color:PALETTE[1]},
+      ],
+      'sens-meaning-chart': [
+        {name:'M_r_final', x:ax, y:T.sensitivity.M_r_final, color:PALETTE[0]},
+      ],
+      'sens-time-chart': [
+        {name:'time_to_M>0.40 (s)', x:ax, y:T.sensitivity.time_to_M_gt_0p40_s, color:PALETTE[1]},
+      ],
+      'sens-entropy-chart': [
+        {name:'H_e_final', x:ax, y:T.sensitivity.H_e_final, color:PALETTE[3]},
+      ],
+    };
+  }
+
+  const CHART_OPTS = {
+    'routine-inputs-chart': {xLabel:'time (s)', yLabel:'value', yLog:false},
+    'routine-meaning-chart': {xLabel:'time (s)', yLabel:'value', yLog:false},
+    'routine-entropy-chart': {xLabel:'time (s)', yLabel:'entropy', yLog:false},
+    'transform-meaning-chart': {xLabel:'time (h)', yLabel:'value', yLog:false},
+    // drug is often better log-scaled
+    'transform-drug-chart': {xLabel:'time (h)', yLabel:'D', yLog:true},
+    'transform-entropy-chart': {xLabel:'time (h)', yLabel:'value', yLog:false},
+    'cultural-chart': {xLabel:'psi0', yLabel:'outcome', yLog:false},
+    'sens-meaning-chart': {xLabel:'alpha_E', yLabel:'M_r_final', yLog:false},
+    'sens-time-chart': {xLabel:'alpha_E', yLabel:'time (s)', yLog:false},
+    'sens-entropy-chart': {xLabel:'alpha_E', yLabel:'H_e_final', yLog:false},
+  };
+
   function initCharts(){
     const D = window.EMERGE_DATA;
     if(!D){
       console.error('EMERGE_DATA not found');
       return;
     }
+    const T = D.tables;
 
     // Summary pills
-    const meta = D.meta;
+    const meta = T.meta;
     const pill = $('#metaPill');
     if(pill){
       const tPeak = meta.t_peak_h && meta.t_peak_h[0];
@@ -508,55 +616,6 @@
       pill.textContent = `t_peak=${fmt(tPeak)}h · dt=${fmt(dt)}h · duration=${fmt(dur)}h`;
     }
 
-    // Routine
-    const rt = D.routine.time_s;
-    const routineInputs = [
-      {name:'E (Input)', x:rt, y:D.routine.E, color:PALETTE[0]},
-      {name:'C (Context)', x:rt, y:D.routine.C, color:PALETTE[1]},
-    ];
-    const routineMeaning = [
-      {name:'M_r (Meaning)', x:rt, y:D.routine.M_r, color:PALETTE[0]},
-      {name:'Psi', x:rt, y:D.routine.Psi, color:PALETTE[2]},
-    ];
-    const routineEntropy = [
-      {name:'H_e', x:rt, y:D.routine.H_e, color:PALETTE[3]},
-      {name:'H_c', x:rt, y:D.routine.H_c, color:PALETTE[4]},
-    ];
-
-    // Transformative
-    const th = D.transform.time_h;
-    const transformDrug = [
-      {name:'D (Drug level)', x:th, y:D.transform.D, color:PALETTE[0]},
-    ];
-    const transformMeaning = [
-      {name:'M_t (Transform)', x:th, y:D.transform.M_t, color:PALETTE[1]},
-    ];
-    const transformEntropy = [
-      {name:'H_e', x:th, y:D.transform.H_e, color:PALETTE[3]},
-      {name:'E', x:th, y:D.transform.E, color:PALETTE[0]},
-      {name:'C', x:th, y:D.transform.C, color:PALETTE[2]},
-    ];
-
-    // Cultural: show outcomes vs psi0 (2 points but still interactive)
-    const cx = D.culture.psi0;
-    const culturalSeries = [
-      {name:'M_r_final', x:cx, y:D.culture.M_r_final, color:PALETTE[0]},
-      {name:'H_e_final', x:cx, y:D.culture.H_e_final, color:PALETTE[3]},
-      {name:'time_to_M>0.35 (s)', x:cx, y:D.culture.time_to_M_gt_0p35_s, color:PALETTE[1]},
-    ];
-
-    // Sensitivity
-    const ax = D.sensitivity.alpha_E;
-    const sensMeaning = [
-      {name:'M_r_final', x:ax, y:D.sensitivity.M_r_final, color:PALETTE[0]},
-    ];
-    const sensTime = [
-      {name:'time_to_M>0.40 (s)', x:ax, y:D.sensitivity.time_to_M_gt_0p40_s, color:PALETTE[1]},
-    ];
-    const sensEntropy = [
-      {name:'H_e_final', x:ax, y:D.sensitivity.H_e_final, color:PALETTE[3]},
-    ];
-
     const charts = [];
 
     function mount(id, series, opts){
@@ -572,30 +631,27 @@
       }
     }
 
-    mount('routine-inputs-chart', routineInputs, {xLabel:'time (s)', yLabel:'value', yLog:false});
-    mount('routine-meaning-chart', routineMeaning, {xLabel:'time (s)', yLabel:'value', yLog:false});
-    mount('routine-entropy-chart', routineEntropy, {xLabel:'time (s)', yLabel:'entropy', yLog:false});
-
-    mount('transform-meaning-chart', transformMeaning, {xLabel:'time (h)', yLabel:'value', yLog:false});
-    // drug is often better log-scaled
-    mount('transform-drug-chart', transformDrug, {xLabel:'time (h)', yLabel:'D', yLog:true});
-    mount('transform-entropy-chart', transformEntropy, {xLabel:'time (h)', yLabel:'value', yLog:false});
+    const preview = chartSeries(decodeColumns(D.series.routine.preview),
+                                decodeColumns(D.series.transform.preview), T);
+    for(const id of Object.keys(CHART_OPTS)) mount(id, preview[id], CHART_OPTS[id]);
 
-    mount('cultural-chart', culturalSeries, {xLabel:'psi0', yLabel:'outcome', yLog:false});
-
-    mount('sens-meaning-chart', sensMeaning, {xLabel:'alpha_E', yLabel:'M_r_final', yLog:false});
-    mount('sens-time-chart', sensTime, {xLabel:'alpha_E', yLabel:'time (s)', yLog:false});
-    mount('sens-entropy-chart', sensEntropy, {xLabel:'alpha_E', yLabel:'H_e_final', yLog:false});
+    // Swap in full resolution once every chunk has arrived
+    loadFullSeries(D).then((full) => {
+      const series = chartSeries(full.routine, full.transform, T);
+      for(const {id, chart} of charts){
+        chart.series = series[id];
+        chart.draw();
+      }
+    }).catch((err) => console.warn('Full-resolution data unavailable, keeping preview', err));
 
     // Tables
     const cultureTbl = $('#cultureTable');
     if(cultureTbl){
-      renderTable(cultureTbl, {columns:Object.keys(D.culture), rows: [0,1].map(i => Object.keys(D.culture).map(c => D.culture[c][i]))});
+      renderTable(cultureTbl, tableRows(T.culture));
     }
     const sensTbl = $('#sensTable');
     if(sensTbl){
-      const n = D.sensitivity.alpha_E.length;
-      renderTable(sensTbl, {columns:Object.keys(D.sensitivity), rows: Array.from({length:n}, (_,i)=>Object.keys(D.sensitivity).map(c=>D.sensitivity[c][i]))});
+      renderTable(sensTbl, tableRows(T.sensitivity));
     }
 
     // global export all (optional)
@@ -1 +1 @@
-window.EMERGE_DATA = {"routine": {"time_s": [0.0, 0.01, 0.02, 0.03, 0.04, 0.05, 0.06, 0.07, 0.08, 0.09, 0.1, 0.11, 0.12, 0.13, 0.14, 0.15, 0.16, 0.17, 0.18, 0.19, 0.2, 0.21, 0.22, 0.23, 0.24, 0.25, 0.26, 0.27, 0.28, 0.29, 0.3, 0.31, 0.32, 0.33, 0.34, 0.35, 0.36, 0.37, 0.38, 0.39, 0.4, 0.41, 0.42, 0.43, 0.44, 0.45, 0.46, 0.47, 0.48, 0.49, 0.5, 0.51, 0.52, 0.53, 0.54, 0.55, 0.56, 0.57, 0.58, 0.59, 0.6, 0.61, 0.62, 0.63, 0.64, 0.65, 0.66, 0.67, 0.68, 0.69, 0.7, 0.71, 0.72, 0.73, 0.74, 0.75, 0.76, 0.77, 0.78, 0.79, 0.8, 0.81, 0.82, 0.83, 0.84, 0.85, 0.86, 0.87, 0.88, 0.89, 0.9, 0.91, 0.92, 0.93, 0.94, 0.95, 0.96, 0.97, 0.98, 0.99, 1.0, 1.01, 1.02, 1.03, 1.04, 1.05, 1.06, 1.07, 1.08, 1.09, 1.1, 1.11, 1.12, 1.13, 1.14, 1.15, 1.16, 1.17, 1.18, 1.19, 1.2, 1.21, 1.22, 1.23, 1.24, 1.25, 1.26, 1.27, 1.28, 1.29, 1.3, 1.31, 1.32, 1.33, 1.34, 1.35, 1.36, 1.37, 1.38, 1.39, 1.4, 1.41, 1.42, 1.43, 1.44, 1.45, 1.46, 1.47, 1.48, 1.49, 1.5, 1.51, 1.52, 1.53, 1.54, 1.55, 1.56, 1.57, 1.58, 1.59, 1.6, 1.61, 1.62, 1.63, 1.64, 1.65, 1.66, 1.67, 1.68, 1.69, 1.7, 1.71, 1.72, 1.73, 1.74, 1.75, 1.76, 1.77, 1.78, 1.79, 1.8, 1.81, 1.82, 1.83, 1.84, 1.85, 1.86, 1.87, 1.88, 1.89, 1.9, 1.91, 1.92, 1.93, 1.94, 1.95, 1.96, 1.97, 1.98, 1.99, 2.0, 2.01, 2.02, 2.03, 2.04, 2.05, 2.06, 2.07, 2.08, 2.09, 2.1, 2.11, 2.12, 2.13, 2.14, 2.15, 2.16, 2.17, 2.18, 2.19, 2.2, 2.21, 2.22, 2.23, 2.24, 2.25, 2.26, 2.27, 2.28, 2.29, 2.3, 2.31, 2.32, 2.33, 2.34, 2.35, 2.36, 2.37, 2.38, 2.39, 2.4, 2.41, 2.42, 2.43, 2.44, 2.45, 2.46, 2.47, 2.48, 2.49, 2.5, 2.51, 2.52, 2.53, 2.54, 2.55, 2.56, 2.57, 2.58, 2.59, 2.6, 2.61, 2.62, 2.63, 2.64, 2.65, 2.66, 2.67, 2.68, 2.69, 2.7, 2.71, 2.72, 2.73, 2.74, 2.75, 2.76, 2.77, 2.78, 2.79, 2.8, 2.81, 2.82, 2.83, 2.84, 2.85, 2.86, 2.87, 2.88, 2.89, 2.9, 2.91, 2.92, 2.93, 2.94, 2.95, 2.96, 2.97, 2.98, 2.99, 3.0, 3.01, 3.02, 3.03, 3.04, 3.05, 3.06, 3.07, 3.08, 3.09, 3.1, 3.11, 3.12, 3.13, 3.14, 3.15, 3.16, 3.17, 3.18, 3.19, 3.2, 3.21, 3.22, 3.23, 3.24, 3.25, 3.26, 3.27, 3.28, 3.29, 3.3, 3.31, 3.32, 3.33, 3.34, 3.35, 3.36, 3.37, 3.38, 3.39, 3.4, 3.41, 3.42, 3.43, 3.44, 3.45, 3.46, 3.47, 3.48, 3.49, 3.5, 3.51, 3.52, 3.53, 3.54, 3.55, 3.56, 3.57, 3.58, 3.59, 3.6, 3.61, 3.62, 3.63, 3.64, 3.65, 3.66, 3.67, 3.68, 3.69, 3.7, 3.71, 3.72, 3.73, 3.74, 3.75, 3.76, 3.77, 3.78, 3.79, 3.8, 3.81, 3.82, 3.83, 3.84, 3.85, 3.86, 3.87, 3.88, 3.89, 3.9, 3.91, 3.92, 3.93, 3.94, 3.95, 3.96, 3.97, 3.98, 3.99, 4.0, 4.01, 4.02, 4.03, 4.04, 4.05, 4.06, 4.07, 4.08, 4.09, 4.1, 4.11, 4.12, 4.13, 4.14, 4.15, 4.16, 4.17, 4.18, 4.19, 4.2, 4.21, 4.22, 4.23, 4.24, 4.25, 4.26, 4.27, 4.28, 4.29, 4.3, 4.31, 4.32, 4.33, 4.34, 4.35, 4.36, 4.37, 4.38, 4.39, 4.4, 4.41, 4.42, 4.43, 4.44, 4.45, 4.46, 4.47, 4.48, 4.49, 4.5, 4.51, 4.52, 4.53, 4.54, 4.55, 4.56, 4.57, 4.58, 4.59, 4.6, 4.61, 4.62, 4.63, 4.64, 4.65, 4.66, 4.67, 4.68, 4.69, 4.7, 4.71, 4.72, 4.73, 4.74, 4.75, 4.76, 4.77, 4.78, 4.79, 4.8, 4.81, 4.82, 4.83, 4.84, 4.85, 4.86, 4.87, 4.88, 4.89, 4.9, 4.91, 4.92, 4.93, 4.94, 4.95, 4.96, 4.97, 4.98, 4.99, 5.0, 5.01, 5.02, 5.03, 5.04, 5.05, 5.06, 5.07, 5.08, 5.09, 5.1, 5.11, 5.12, 5.13, 5.14, 5.15, 5.16, 5.17, 5.18, 5.19, 5.2, 5.21, 5.22, 5.23, 5.24, 5.25, 5.26, 5.27, 5.28, 5.29, 5.3, 5.31, 5.32, 5.33, 5.34, 5.35, 5.36, 5.37, 5.38, 5.39, 5.4, 5.41, 5.42, 5.43, 5.44, 5.45, 5.46, 5.47, 5.48, 5.49, 5.5, 5.51, 5.52, 5.53, 5.54, 5.55, 5.56, 5.57, 5.58, 5.59, 5.6, 5.61, 5.62, 5.63, 5.64, 5.65, 5.66, 5.67, 5.68, 5.69, 5.7, 5.71, 5.72, 5.73, 5.74, 5.75, 5.76, 5.77, 5.78, 5.79, 5.8, 5.81, 5.82, 5.83, 5.84, 5.85, 5.86, 5.87, 5.88, 5.89, 5.9, 5.91, 5.92, 5.93, 5.94, 5.95, 5.96, 5.97, 5.98, 5.99, 6.0, 6.01, 6.02, 6.03, 6.04, 6.05, 6.06, 6.07, 6.08, 6.09, 6.1, 6.11, 6.12, 6.13, 6.14, 6.15, 6.16, 6.17, 6.18, 6.19, 6.2, 6.21, 6.22, 6.23, 6.24, 6.25, 6.26, 6.27, 6.28, 6.29, 6.3, 6.31, 6.32, 6.33, 6.34, 6.35, 6.36, 6.37, 6.38, 6.39, 6.4, 6.41, 6.42, 6.43, 6.44, 6.45, 6.46, 6.47, 6.48, 6.49, 6.5, 6.51, 6.52, 6.53, 6.54, 6.55, 6.56, 6.57, 6.58, 6.59, 6.6, 6.61, 6.62, 6.63, 6.64, 6.65, 6.66, 6.67, 6.68, 6.69, 6.7, 6.71, 6.72, 6.73, 6.74, 6.75, 6.76, 6.77, 6.78, 6.79, 6.8, 6.81, 6.82, 6.83, 6.84, 6.85, 6.86, 6.87, 6.88, 6.89, 6.9, 6.91, 6.92, 6.93, 6.94, 6.95, 6.96, 6.97, 6.98, 6.99, 7.0, 7.01, 7.02, 7.03, 7.04, 7.05, 7.06, 7.07, 7.08, 7.09, 7.1, 7.11, 7.12, 7.13, 7.14, 7.15, 7.16, 7.17, 7.18, 7.19, 7.2, 7.21, 7.22, 7.23, 7.24, 7.25, 7.26, 7.27, 7.28, 7.29, 7.3, 7.31, 7.32, 7.33, 7.34, 7.35, 7.36, 7.37, 7.38, 7.39, 7.4, 7.41, 7.42, 7.43, 7.44, 7.45, 7.46, 7.47, 7.48, 7.49, 7.5, 7.51, 7.52, 7.53, 7.54, 7.55, 7.56, 7.57, 7.58, 7.59, 7.6, 7.61, 7.62, 7.63, 7.64, 7.65, 7.66, 7.67, 7.68, 7.69, 7.7, 7.71, 7.72, 7.73, 7.74, 7.75, 7.76, 7.77, 7.78, 7.79, 7.8, 7.81, 7.82, 7.83, 7.84, 7.85, 7.86, 7.87, 7.88, 7.89, 7.9, 7.91, 7.92, 7.93, 7.94, 7.95, 7.96, 7.97, 7.98, 7.99, 8.0, 8.01, 8.02, 8.03, 8.04, 8.05, 8.06, 8.07, 8.08, 8.09, 8.1, 8.11, 8.12, 8.13, 8.14, 8.15, 8.16, 8.17, 8.18, 8.19, 8.2, 8.21, 8.22, 8.23, 8.24, 8.25, 8.26, 8.27, 8.28, 8.29, 8.3, 8.31, 8.32, 8.33, 8.34, 8.35, 8.36, 8.37, 8.38, 8.39, 8.4, 8.41, 8.42, 8.43, 8.44, 8.45, 8.46, 8.47, 8.48, 8.49, 8.5, 8.51, 8.52, 8.53, 8.54, 8.55, 8.56, 8.57, 8.58, 8.59, 8.6, 8.61, 8.62, 8.63, 8.64, 8.65, 8.66, 8.67, 8.68, 8.69, 8.7, 8.71, 8.72, 8.73, 8.74, 8.75, 8.76, 8.77, 8.78, 8.79, 8.8, 8.81, 8.82, 8.83, 8.84, 8.85, 8.86, 8.87, 8.88, 8.89, 8.9, 8.91, 8.92, 8.93, 8.94, 8.95, 8.96, 8.97, 8.98, 8.99, 9.0, 9.01, 9.02, 9.03, 9.04, 9.05, 9.06, 9.07, 9.08, 9.09, 9.1, 9.11, 9.12, 9.13, 9.14, 9.15, 9.16, 9.17, 9.18, 9.19, 9.2, 9.21, 9.22, 9.23, 9.24, 9.25, 9.26, 9.27, 9.28, 9.29, 9.3, 9.31, 9.32, 9.33, 9.34, 9.35, 9.36, 9.37, 9.38, 9.39, 9.4, 9.41, 9.42, 9.43, 9.44, 9.45, 9.46, 9.47, 9.48, 9.49, 9.5, 9.51, 9.52, 9.53, 9.54, 9.55, 9.56, 9.57, 9.58, 9.59, 9.6, 9.61, 9.62, 9.63, 9.64, 9.65, 9.66, 9.67, 9.68, 9.69, 9.7, 9.71, 9.72, 9.73, 9.74, 9.75, 9.76, 9.77, 9.78, 9.79, 9.8, 9.81, 9.82, 9.83, 9.84, 9.85, 9.86, 9.87, 9.88, 9.89, 9.9, 9.91, 9.92, 9.93, 9.94, 9.95, 9.96, 9.97, 9.98, 9.99, 10.0], "E": [0.533362, 0.600906, 0.584082, 0.566501, 0.527247, 0.62359, 0.577963, 0.608889, 0.622058, 0.609894, 0.595313, 0.621144, 0.617105, 0.619602, 0.55221, 0.590109, 0.581688, 0.690213, 0.582318, 0.640106, 0.552073, 0.590644, 0.559774, 0.608668, 0.657405, 0.576377, 0.626939, 0.626609, 0.622709, 0.596835, 0.599094, 0.607944, 0.610208, 0.608816, 0.62761, 0.60057, 0.620886, 0.613739, 0.571078, 0.577381, 0.621995, 0.619628, 0.637689, 0.538289, 0.623871, 0.533205, 0.604015, 0.531402, 0.646389, 0.580296, 0.671418, 0.612606, 0.631717, 0.623743, 0.660584, 0.605886, 0.572641, 0.571434, 0.579613, 0.608825, 0.617882, 0.599696, 0.612253, 0.654301, 0.554763, 0.591401, 0.638846, 0.576191, 0.63942, 0.595658, 0.590968, 0.602822, 0.613926, 0.598616, 0.654563, 0.598268, 0.645096, 0.642295, 0.603375, 0.651439, 0.665053, 0.629525, 0.636565, 0.557971, 0.628357, 0.644143, 0.666133, 0.597796, 0.617784, 0.647619, 0.59087, 0.630827, 0.524, 0.629903, 0.562857, 0.561918, 0.601973, 0.596606, 0.611534, 0.535842, 0.579436, 0.666662, 0.611854, 0.580231, 0.633652, 0.605306, 0.635979, 0.602163, 0.669747, 0.61853, 0.623232, 0.558232, 0.584529, 0.644531, 0.587739, 0.641799, 0.561142, 0.609763, 0.63909, 0.616271, 0.601999, 0.64023, 0.667411, 0.628172, 0.660991, 0.643928, 0.597523, 0.62227, 0.659453, 0.578463, 0.579806, 0.597505, 0.544731, 0.609776, 0.638107, 0.617192, 0.566775, 0.547555, 0.621752, 0.636334, 0.650756, 0.607156, 0.562747, 0.621355, 0.588805, 0.563087, 0.650803, 0.562733, 0.643114, 0.583221, 0.62745, 0.635207, 0.63638, 0.600025, 0.638122, 0.563404, 0.553505, 0.585525, 0.634128, 0.627844, 0.624638, 0.626662, 0.586054, 0.634937, 0.58567, 0.575545, 0.623935, 0.590985, 0.572598, 0.610436, 0.633538, 0.607608, 0.5875, 0.615433, 0.655583, 0.590301, 0.62838, 0.593391, 0.60706, 0.636579, 0.606494, 0.6281, 0.615992, 0.619026, 0.635342, 0.664178, 0.576452, 0.591181, 0.62809, 0.710332, 0.637524, 0.672513, 0.576121, 0.612016, 0.673853, 0.667749, 0.621249, 0.626237, 0.628022, 0.650317, 0.640638, 0.628142, 0.650281, 0.716109, 0.591112, 0.603991, 0.604163, 0.618971, 0.605195, 0.552614, 0.635025, 0.600269, 0.565855, 0.58111, 0.583867, 0.578569, 0.605844, 0.654881, 0.630588, 0.607757, 0.665078, 0.601887, 0.60541, 0.59433, 0.612991, 0.636687, 0.573858, 0.597205, 0.685649, 0.588456, 0.629178, 0.614311, 0.61966, 0.613197, 0.599341, 0.625428, 0.624654, 0.64759, 0.692892, 0.610502, 0.667928, 0.66957, 0.62738, 0.585758, 0.625204, 0.575085, 0.61495, 0.595318, 0.643146, 0.624713, 0.560399, 0.633862, 0.647599, 0.557855, 0.645133, 0.553634, 0.600774, 0.617324, 0.625478, 0.615809, 0.658881, 0.644868, 0.623495, 0.637242, 0.587246, 0.618518, 0.60976, 0.662257, 0.612745, 0.640562, 0.6077, 0.579413, 0.635191, 0.635503, 0.611671, 0.543148, 0.590174, 0.658619, 0.643215, 0.641935, 0.637731, 0.622545, 0.625198, 0.658261, 0.590764, 0.658346, 0.636135, 0.587077, 0.625939, 0.634794, 0.617409, 0.600102, 0.57967, 0.587595, 0.607789, 0.592564, 0.651863, 0.624483, 0.569757, 0.63424, 0.629463, 0.622945, 0.631754, 0.642015, 0.6406, 0.647179, 0.643933, 0.640417, 0.634038, 0.607846, 0.629316, 0.628189, 0.573403, 0.588196, 0.573982, 0.595657, 0.641232, 0.626523, 0.59355, 0.616872, 0.616948, 0.604855, 0.59358, 0.61212, 0.63416, 0.619015, 0.63501, 0.666057, 0.643265, 0.646719, 0.598366, 0.666689, 0.618247, 0.626554, 0.546129, 0.59683, 0.6224, 0.590615, 0.604701, 0.599937, 0.662131, 0.602427, 0.58769, 0.628328, 0.589993, 0.648565, 0.586074, 0.623764, 0.591857, 0.620903, 0.642951, 0.601989, 0.660067, 0.661322, 0.613347, 0.624442, 0.592532, 0.67089, 0.673081, 0.636797, 0.659613, 0.624677, 0.606198, 0.649687, 0.562643, 0.594706, 0.613318, 0.555377, 0.636215, 0.636426, 0.607325, 0.610618, 0.59238, 0.614703, 0.600028, 0.636159, 0.608146, 0.640718, 0.534651, 0.57645, 0.608856, 0.704624, 0.57343, 0.678116, 0.626843, 0.653311, 0.59702, 0.627524, 0.615875, 0.596681, 0.600083, 0.613023, 0.628162, 0.625762, 0.585498, 0.623515, 0.608585, 0.559457, 0.655452, 0.623095, 0.625084, 0.633486, 0.606104, 0.586962, 0.614411, 0.597706, 0.634754, 0.590289, 0.641859, 0.565166, 0.627644, 0.609413, 0.63326, 0.635692, 0.60823, 0.630909, 0.618561, 0.671735, 0.597529, 0.607871, 0.629, 0.636597, 0.576482, 0.565038, 0.646488, 0.595068, 0.590782, 0.604851, 0.584175, 0.57866, 0.62961, 0.593254, 0.609492, 0.567874, 0.595627, 0.621709, 0.568186, 0.599147, 0.601771, 0.626392, 0.609114, 0.585729, 0.638919, 0.591527, 0.558211, 0.606912, 0.596945, 0.620146, 0.600599, 0.617502, 0.559633, 0.594065, 0.614717, 0.585159, 0.63278, 0.559843, 0.613097, 0.594484, 0.589014, 0.615256, 0.598041, 0.595622, 0.644274, 0.650586, 0.578874, 0.598484, 0.573911, 0.569998, 0.621002, 0.604569, 0.622843, 0.577843, 0.627753, 0.604623, 0.573126, 0.586525, 0.657425, 0.615885, 0.633938, 0.600192, 0.564639, 0.638417, 0.619164, 0.61811, 0.608386, 0.613494, 0.617088, 0.549797, 0.652951, 0.629542, 0.581672, 0.603308, 0.554295, 0.601996, 0.612646, 0.633897, 0.602009, 0.594364, 0.591134, 0.60126, 0.591465, 0.617338, 0.609595, 0.606596, 0.604124, 0.656772, 0.566988, 0.629377, 0.560832, 0.695333, 0.586866, 0.598759, 0.606388, 0.615252, 0.568007, 0.648499, 0.594533, 0.612901, 0.656165, 0.575083, 0.637215, 0.650605, 0.616059, 0.583986, 0.664499, 0.637876, 0.585087, 0.599073, 0.626377, 0.617496, 0.579687, 0.590978, 0.635331, 0.61852, 0.531535, 0.675569, 0.607389, 0.589362, 0.594651, 0.618543, 0.572965, 0.596373, 0.623568, 0.624715, 0.578399, 0.604548, 0.621358, 0.591911, 0.65565, 0.632349, 0.57429, 0.5869, 0.570565, 0.603401, 0.602565, 0.598511, 0.598432, 0.603313, 0.560922, 0.659045, 0.577889, 0.605731, 0.556469, 0.617179, 0.582238, 0.595447, 0.617893, 0.589452, 0.628377, 0.617874, 0.61794, 0.60779, 0.636159, 0.582068, 0.621524, 0.548717, 0.636685, 0.621606, 0.564443, 0.600792, 0.614278, 0.605595, 0.58213, 0.588775, 0.61597, 0.584583, 0.595889, 0.611745, 0.570173, 0.580325, 0.524479, 0.563996, 0.52544, 0.602943, 0.627023, 0.569197, 0.573944, 0.522703, 0.601832, 0.569633, 0.570992, 0.59108, 0.570853, 0.599755, 0.591627, 0.586481, 0.614373, 0.58841, 0.546681, 0.622324, 0.608445, 0.596725, 0.558134, 0.564451, 0.589039, 0.604702, 0.543076, 0.652861, 0.567908, 0.602111, 0.593279, 0.63447, 0.565796, 0.559292, 0.57057, 0.541813, 0.631757, 0.614447, 0.583806, 0.56889, 0.626409, 0.621429, 0.560979, 0.605597, 0.590194, 0.55752, 0.585508, 0.588664, 0.615408, 0.599358, 0.542226, 0.564487, 0.590538, 0.544114, 0.616656, 0.560947, 0.559199, 0.574899, 0.553518, 0.557451, 0.641258, 0.596207, 0.605638, 0.564641, 0.563225, 0.54558, 0.57248, 0.605311, 0.623715, 0.537455, 0.516186, 0.609632, 0.56286, 0.59509, 0.603088, 0.617451, 0.57605, 0.587213, 0.554143, 0.555553, 0.575058, 0.535516, 0.526314, 0.570784, 0.61097, 0.596851, 0.630754, 0.568448, 0.587536, 0.610786, 0.612836, 0.55896, 0.583252, 0.58417, 0.560517, 0.575368, 0.565548, 0.554297, 0.583482, 0.569839, 0.606473, 0.592308, 0.588927, 0.587618, 0.560427, 0.596983, 0.644264, 0.551832, 0.583975, 0.624557, 0.627573, 0.601742, 0.642762, 0.574551, 0.559459, 0.613694, 0.596771, 0.584103, 0.542594, 0.597608, 0.613451, 0.532192, 0.602359, 0.576868, 0.606286, 0.604579, 0.551072, 0.615411, 0.561902, 0.59636, 0.577761, 0.597761, 0.575371, 0.543777, 0.55799, 0.61034, 0.545629, 0.532725, 0.560963, 0.574226, 0.642572, 0.541795, 0.555563, 0.594829, 0.601129, 0.555857, 0.589301, 0.596439, 0.563686, 0.558522, 0.5957, 0.558087, 0.54588, 0.555945, 0.569124, 0.592616, 0.582272, 0.589999, 0.64136, 0.635273, 0.577407, 0.583923, 0.614072, 0.545341, 0.592691, 0.636607, 0.585978, 0.542904, 0.529048, 0.546854, 0.580533, 0.557045, 0.561428, 0.555325, 0.56227, 0.595916, 0.538224, 0.545, 0.562718, 0.583395, 0.601226, 0.555506, 0.550707, 0.584605, 0.584633, 0.571459, 0.588527, 0.599194, 0.576124, 0.566681, 0.56164, 0.587757, 0.565499, 0.604197, 0.577426, 0.567002, 0.547465, 0.547752, 0.577072, 0.579922, 0.590879, 0.572191, 0.599727, 0.538839, 0.582985, 0.624134, 0.618792, 0.636501, 0.627367, 0.607768, 0.578927, 0.594191, 0.575274, 0.618757, 0.584231, 0.544847, 0.602243, 0.601978, 0.573837, 0.565105, 0.60434, 0.642415, 0.511837, 0.605078, 0.584986, 0.586355, 0.57447, 0.568084, 0.616391, 0.597989, 0.605836, 0.580654, 0.614752, 0.534668, 0.618819, 0.538241, 0.601873, 0.579107, 0.597786, 0.618527, 0.570523, 0.548366, 0.566475, 0.576293, 0.570492, 0.550107, 0.582498, 0.587103, 0.557413, 0.612914, 0.611956, 0.584904, 0.567955, 0.597526, 0.592375, 0.55463, 0.554938, 0.57095, 0.59131, 0.555143, 0.600476, 0.606852, 0.584704, 0.578018, 0.614045, 0.605022, 0.549047, 0.586807, 0.579017, 0.602049, 0.608723, 0.536998, 0.646511, 0.512796, 0.561956, 0.652059, 0.59619, 0.631859, 0.568763, 0.56579, 0.597205, 0.539628, 0.567345, 0.599359, 0.56816, 0.604718, 0.563418, 0.606462, 0.620418, 0.543464, 0.578408, 0.55885, 0.586192, 0.548197, 0.607069, 0.585965, 0.570964, 0.579478, 0.59197, 0.515484, 0.563699, 0.543284, 0.579938, 0.589052, 0.633596, 0.580022, 0.541029, 0.617138, 0.571685, 0.591061, 0.628926, 0.558983, 0.550855, 0.596065, 0.600376, 0.567341, 0.538412, 0.565467, 0.632447, 0.568999, 0.576462, 0.556184, 0.612078, 0.554186, 0.561443, 0.619902, 0.535146, 0.593631, 0.601762, 0.629324, 0.569112, 0.564725, 0.581997, 0.627583, 0.617762, 0.567119, 0.584282, 0.556161, 0.541828, 0.654957, 0.569568, 0.601241, 0.597862, 0.626243, 0.609209, 0.643198, 0.555182, 0.559751, 0.543047, 0.559328, 0.567033, 0.528798, 0.535818, 0.596066, 0.580565, 0.617783, 0.53915, 0.592462, 0.556204, 0.599226, 0.521962, 0.639308, 0.581766, 0.65173, 0.608244, 0.626999, 0.624857, 0.60409, 0.595253, 0.574746, 0.617507, 0.552334, 0.559438, 0.600228, 0.583157, 0.576775, 0.584178, 0.610531, 0.5643, 0.625621, 0.580097, 0.600626, 0.625845, 0.582502, 0.619215, 0.604188, 0.576285, 0.61159, 0.618348, 0.613354, 0.66327, 0.639459, 0.605806, 0.572319, 0.56816, 0.586657, 0.558587, 0.570928, 0.581846, 0.576397, 0.609242, 0.588832, 0.580124, 0.636951, 0.632019, 0.563179, 0.594355, 0.566867, 0.536788, 0.601583, 0.584601], "C": [0.737164, 0.692227, 0.710047, 0.699496, 0.685874, 0.6942, 0.688443, 0.686812, 0.700376, 0.703339, 0.688439, 0.65614, 0.69717, 0.684426, 0.692265, 0.750895, 0.687513, 0.68008, 0.717751, 0.723724, 0.707455, 0.702138, 0.72826, 0.695309, 0.686868, 0.734199, 0.644386, 0.674615, 0.693141, 0.680513, 0.650993, 0.679397, 0.717815, 0.645139, 0.58462, 0.695385, 0.688505, 0.664061, 0.641579, 0.677347, 0.672927, 0.72564, 0.674311, 0.682365, 0.687617, 0.697938, 0.695231, 0.702294, 0.692946, 0.712734, 0.717504, 0.699965, 0.667297, 0.694968, 0.67389, 0.753776, 0.645396, 0.731788, 0.721356, 0.686787, 0.733175, 0.742077, 0.700122, 0.763394, 0.720148, 0.63695, 0.656587, 0.706072, 0.686718, 0.709331, 0.684573, 0.671149, 0.713169, 0.712258, 0.705077, 0.688404, 0.731725, 0.702213, 0.699875, 0.795243, 0.617691, 0.650147, 0.617272, 0.695689, 0.629619, 0.686685, 0.739838, 0.726823, 0.676078, 0.672842, 0.691746, 0.722523, 0.6991, 0.715758, 0.728713, 0.666822, 0.71434, 0.719179, 0.682944, 0.734428, 0.694035, 0.706501, 0.694581, 0.710912, 0.674874, 0.660024, 0.687457, 0.672793, 0.676102, 0.702242, 0.720779, 0.703743, 0.655809, 0.694081, 0.72453, 0.702462, 0.692679, 0.68404, 0.722693, 0.677042, 0.677837, 0.70804, 0.731882, 0.651843, 0.703467, 0.72743, 0.664176, 0.673576, 0.703133, 0.682781, 0.65372, 0.650855, 0.675326, 0.687216, 0.694275, 0.672383, 0.64682, 0.66306, 0.711007, 0.688007, 0.649472, 0.700451, 0.666771, 0.698176, 0.682792, 0.667943, 0.7194, 0.703293, 0.737708, 0.678795, 0.674491, 0.717598, 0.695678, 0.685438, 0.706665, 0.659898, 0.718002, 0.751486, 0.672754, 0.648018, 0.652594, 0.709864, 0.658437, 0.731302, 0.684927, 0.725479, 0.669522, 0.694044, 0.718835, 0.698846, 0.71398, 0.672666, 0.743155, 0.64285, 0.731836, 0.673311, 0.728427, 0.751199, 0.670766, 0.676592, 0.687586, 0.645222, 0.644023, 0.71821, 0.66189, 0.692931, 0.70316, 0.673516, 0.684776, 0.681619, 0.677017, 0.669654, 0.697913, 0.706029, 0.705831, 0.66819, 0.658448, 0.664303, 0.696993, 0.683791, 0.674545, 0.688903, 0.705018, 0.691542, 0.671243, 0.674776, 0.693859, 0.726674, 0.693114, 0.658329, 0.642666, 0.671787, 0.712385, 0.616726, 0.721781, 0.69492, 0.715388, 0.671339, 0.679223, 0.690412, 0.653221, 0.718331, 0.675667, 0.729964, 0.732785, 0.655231, 0.676315, 0.675548, 0.693764, 0.659693, 0.666696, 0.681881, 0.654894, 0.676346, 0.718412, 0.673912, 0.657037, 0.735184, 0.682632, 0.68869, 0.702358, 0.688946, 0.651046, 0.648129, 0.704065, 0.741978, 0.649231, 0.741505, 0.672284, 0.7202, 0.674195, 0.681168, 0.651693, 0.670858, 0.713328, 0.711215, 0.6816, 0.667949, 0.651753, 0.705628, 0.70251, 0.704835, 0.679857, 0.72763, 0.658893, 0.660997, 0.639636, 0.687239, 0.691427, 0.674541, 0.688327, 0.735227, 0.733888, 0.708529, 0.64225, 0.677813, 0.672808, 0.694642, 0.696456, 0.682941, 0.673042, 0.637557, 0.67427, 0.705117, 0.687066, 0.72646, 0.683896, 0.670917, 0.670683, 0.646832, 0.705984, 0.649339, 0.739698, 0.667401, 0.673861, 0.673718, 0.704187, 0.717575, 0.710224, 0.742384, 0.665355, 0.71876, 0.727315, 0.677309, 0.702755, 0.71307, 0.618848, 0.686206, 0.693064, 0.672819, 0.651068, 0.659862, 0.700844, 0.69555, 0.705345, 0.684754, 0.684302, 0.689099, 0.718814, 0.693494, 0.729083, 0.632415, 0.683338, 0.768751, 0.668818, 0.646622, 0.668193, 0.674066, 0.69557, 0.705078, 0.646774, 0.667186, 0.720149, 0.677076, 0.633361, 0.713504, 0.666025, 0.707384, 0.701615, 0.671688, 0.664688, 0.662833, 0.684044, 0.627205, 0.673122, 0.676418, 0.69066, 0.690477, 0.676631, 0.714999, 0.725644, 0.693582, 0.694296, 0.666489, 0.701687, 0.69684, 0.74574, 0.675352, 0.692157, 0.682145, 0.66464, 0.693906, 0.689311, 0.753579, 0.616317, 0.751147, 0.680077, 0.688379, 0.655962, 0.673471, 0.658323, 0.724419, 0.720701, 0.697378, 0.698974, 0.684021, 0.689171, 0.691815, 0.736923, 0.697789, 0.717091, 0.705704, 0.677346, 0.69762, 0.676334, 0.659127, 0.697609, 0.702756, 0.687931, 0.644556, 0.746076, 0.65637, 0.652953, 0.667883, 0.667678, 0.713024, 0.742791, 0.69402, 0.688608, 0.725196, 0.682386, 0.700761, 0.696796, 0.658132, 0.677246, 0.740564, 0.635862, 0.708481, 0.72635, 0.71421, 0.666672, 0.723913, 0.724562, 0.688201, 0.680253, 0.710863, 0.680513, 0.672845, 0.711272, 0.704681, 0.666373, 0.677536, 0.706674, 0.652056, 0.69064, 0.682676, 0.686291, 0.737572, 0.715647, 0.693714, 0.675251, 0.699213, 0.716852, 0.721548, 0.708264, 0.656089, 0.711773, 0.734086, 0.742947, 0.72986, 0.703607, 0.692764, 0.695525, 0.754736, 0.674477, 0.683805, 0.676415, 0.668168, 0.683607, 0.696585, 0.657946, 0.68965, 0.700293, 0.658457, 0.70422, 0.703286, 0.729067, 0.702493, 0.686287, 0.690045, 0.717788, 0.725954, 0.697078, 0.684118, 0.699618, 0.647644, 0.666897, 0.712566, 0.748648, 0.716669, 0.72744, 0.761796, 0.723249, 0.741488, 0.70561, 0.721561, 0.706989, 0.698146, 0.67434, 0.757039, 0.772258, 0.697437, 0.638583, 0.679308, 0.704853, 0.746209, 0.700062, 0.703871, 0.732248, 0.682871, 0.704106, 0.702867, 0.746966, 0.711119, 0.719166, 0.681821, 0.687081, 0.678093, 0.674411, 0.716875, 0.721362, 0.655974, 0.740771, 0.661143, 0.719873, 0.699314, 0.719091, 0.680719, 0.724725, 0.71708, 0.715094, 0.69804, 0.698202, 0.680963, 0.639267, 0.675289, 0.734071, 0.733006, 0.674133, 0.665335, 0.664668, 0.703606, 0.63817, 0.743312, 0.681558, 0.687748, 0.705498, 0.767474, 0.736477, 0.709277, 0.730966, 0.750669, 0.676976, 0.716164, 0.713773, 0.72076, 0.704279, 0.692656, 0.655421, 0.695989, 0.712515, 0.682987, 0.727405, 0.723872, 0.710876, 0.682028, 0.679885, 0.732851, 0.661185, 0.709333, 0.695013, 0.689903, 0.718691, 0.729358, 0.6558, 0.645702, 0.720224, 0.717406, 0.69075, 0.632055, 0.717143, 0.722779, 0.685074, 0.75646, 0.708139, 0.65801, 0.749831, 0.648831, 0.696607, 0.696823, 0.691079, 0.769162, 0.693987, 0.763512, 0.719925, 0.637477, 0.683201, 0.723992, 0.668486, 0.652346, 0.747116, 0.716278, 0.651271, 0.665552, 0.75995, 0.686825, 0.702664, 0.677797, 0.695667, 0.694506, 0.68764, 0.695951, 0.754628, 0.728625, 0.712705, 0.705217, 0.827295, 0.726829, 0.731752, 0.720807, 0.728702, 0.748914, 0.719585, 0.684464, 0.666028, 0.719396, 0.729036, 0.647671, 0.714857, 0.708234, 0.713459, 0.662955, 0.74756, 0.713981, 0.711114, 0.704793, 0.695282, 0.684927, 0.768966, 0.752711, 0.784993, 0.757065, 0.700851, 0.71634, 0.726023, 0.761577, 0.6955, 0.676195, 0.675744, 0.693629, 0.697035, 0.708719, 0.673395, 0.678562, 0.729564, 0.731691, 0.690577, 0.701713, 0.739982, 0.68797, 0.683712, 0.734397, 0.699446, 0.693301, 0.662173, 0.723972, 0.693658, 0.730183, 0.64316, 0.684732, 0.732778, 0.693622, 0.672211, 0.729701, 0.696148, 0.700157, 0.6449, 0.734815, 0.679094, 0.661221, 0.653317, 0.687486, 0.74093, 0.681266, 0.634117, 0.647432, 0.695973, 0.704305, 0.693442, 0.680301, 0.712814, 0.676491, 0.709838, 0.706231, 0.683065, 0.742508, 0.676428, 0.674824, 0.750491, 0.749857, 0.77032, 0.699151, 0.715782, 0.686896, 0.739353, 0.713554, 0.654066, 0.733314, 0.699637, 0.691324, 0.696301, 0.667102, 0.681982, 0.706339, 0.74139, 0.728786, 0.734185, 0.74189, 0.715313, 0.700611, 0.754885, 0.677855, 0.725168, 0.725594, 0.709958, 0.793245, 0.719303, 0.789394, 0.742272, 0.737157, 0.672448, 0.681741, 0.738044, 0.695135, 0.64197, 0.743132, 0.679428, 0.695985, 0.703504, 0.697325, 0.702935, 0.763527, 0.666797, 0.696763, 0.69083, 0.731192, 0.690321, 0.701028, 0.65736, 0.718109, 0.715927, 0.732586, 0.707021, 0.690353, 0.686085, 0.724113, 0.706395, 0.778736, 0.659449, 0.707135, 0.706992, 0.731789, 0.734708, 0.709805, 0.704654, 0.685488, 0.742306, 0.73358, 0.682064, 0.711673, 0.708542, 0.728539, 0.717873, 0.710253, 0.705728, 0.698277, 0.72788, 0.66731, 0.691037, 0.675536, 0.69674, 0.768172, 0.729311, 0.719851, 0.673565, 0.681461, 0.681264, 0.726104, 0.695168, 0.703411, 0.653358, 0.713434, 0.727556, 0.704953, 0.747464, 0.68329, 0.703602, 0.743504, 0.704712, 0.68346, 0.749604, 0.712733, 0.735584, 0.746926, 0.687478, 0.69461, 0.719915, 0.674731, 0.718167, 0.701125, 0.686678, 0.668692, 0.714463, 0.688341, 0.726735, 0.724656, 0.671427, 0.703866, 0.670186, 0.73772, 0.700242, 0.690195, 0.733863, 0.707617, 0.75977, 0.718037, 0.746109, 0.698141, 0.712186, 0.752313, 0.702753, 0.76958, 0.693045, 0.746179, 0.716992, 0.737762, 0.681017, 0.71765, 0.721321, 0.672362, 0.688598, 0.733165, 0.725547, 0.760911, 0.731498, 0.698702, 0.657794, 0.694067, 0.700277, 0.748595, 0.762611, 0.727484, 0.748327, 0.739166, 0.673922, 0.724171, 0.660992, 0.748746, 0.687812, 0.672763, 0.659907, 0.697029, 0.725635, 0.741494, 0.674618, 0.71345, 0.729673, 0.731903, 0.719743, 0.709886, 0.706245, 0.675565, 0.710602, 0.725198, 0.667417, 0.751727, 0.711282, 0.734817, 0.702656, 0.744013, 0.683018, 0.715937, 0.621736, 0.746036, 0.735213, 0.733975, 0.68628, 0.715602, 0.713992, 0.705896, 0.660943, 0.741942, 0.665734, 0.61606, 0.695252, 0.72482, 0.693009, 0.758811, 0.739241, 0.712844, 0.765283, 0.717878, 0.714074, 0.696962, 0.668486, 0.749278, 0.664341, 0.723484, 0.661488, 0.72846, 0.694234, 0.68184, 0.699574, 0.713127, 0.711332, 0.726831, 0.710851, 0.745082, 0.725361, 0.707766, 0.701518, 0.66085, 0.765791, 0.743938, 0.676286, 0.767226, 0.69233, 0.676564, 0.746357, 0.734921, 0.694445, 0.729338, 0.736301, 0.678627, 0.66387, 0.701788, 0.723537, 0.696391, 0.746424, 0.692891, 0.734514, 0.701622, 0.679046, 0.74182, 0.746312, 0.705063, 0.678953, 0.772711, 0.70672, 0.716601, 0.723746, 0.79594, 0.685534, 0.694082, 0.712883, 0.671578, 0.661918, 0.700394, 0.669973, 0.649022, 0.729576, 0.740758, 0.682353, 0.699948, 0.660721, 0.709663, 0.662057, 0.691813, 0.69919, 0.66338, 0.694356, 0.746203, 0.705416, 0.659881, 0.761599, 0.706664, 0.632498, 0.648507, 0.734116, 0.726489, 0.700283, 0.734637, 0.65883, 0.702537, 0.691185, 0.713194, 0.670815, 0.731254, 0.677198, 0.648229, 0.712646, 0.754332, 0.672375, 0.664572, 0.697145, 0.67348, 0.695417, 0.719057, 0.649366, 0.683778, 0.658574, 0.714744, 0.71313, 0.748888, 0.683915, 0.717174, 0.682637, 0.66213, 0.689758, 0.707737, 0.745825, 0.693954, 0.663748, 0.718855, 0.671484, 0.625745, 0.703214, 0.731144, 0.721416, 0.700526, 0.666395], "Psi": [0.5, 0.50025, 0.500499, 0.500748, 0.500996, 0.501244, 0.501491, 0.501737, 0.501983, 0.502228, 0.502472, 0.502716, 0.502959, 0.503202, 0.503444, 0.503685, 0.503926, 0.504166, 0.504406, 0.504645, 0.504883, 0.505121, 0.505358, 0.505595, 0.505831, 0.506066, 0.506301, 0.506535, 0.506769, 0.507002, 0.507234, 0.507466, 0.507698, 0.507928, 0.508159, 0.508388, 0.508617, 0.508846, 0.509074, 0.509301, 0.509528, 0.509754, 0.509979, 0.510204, 0.510429, 0.510653, 0.510876, 0.511099, 0.511321, 0.511543, 0.511764, 0.511985, 0.512205, 0.512424, 0.512643, 0.512862, 0.513079, 0.513297, 0.513513, 0.51373, 0.513945, 0.514161, 0.514375, 0.514589, 0.514803, 0.515016, 0.515228, 0.51544, 0.515651, 0.515862, 0.516073, 0.516283, 0.516492, 0.516701, 0.516909, 0.517117, 0.517324, 0.51753, 0.517737, 0.517942, 0.518147, 0.518352, 0.518556, 0.51876, 0.518963, 0.519165, 0.519368, 0.519569, 0.51977, 0.519971, 0.520171, 0.52037, 0.52057, 0.520768, 0.520966, 0.521164, 0.521361, 0.521557, 0.521754, 0.521949, 0.522144, 0.522339, 0.522533, 0.522727, 0.52292, 0.523113, 0.523305, 0.523497, 0.523688, 0.523879, 0.524069, 0.524259, 0.524448, 0.524637, 0.524825, 0.525013, 0.525201, 0.525388, 0.525574, 0.52576, 0.525946, 0.526131, 0.526316, 0.5265, 0.526684, 0.526867, 0.52705, 0.527232, 0.527414, 0.527596, 0.527777, 0.527957, 0.528137, 0.528317, 0.528496, 0.528675, 0.528853, 0.529031, 0.529209, 0.529386, 0.529562, 0.529738, 0.529914, 0.530089, 0.530264, 0.530438, 0.530612, 0.530786, 0.530959, 0.531131, 0.531303, 0.531475, 0.531646, 0.531817, 0.531988, 0.532158, 0.532327, 0.532497, 0.532665, 0.532834, 0.533002, 0.533169, 0.533336, 0.533503, 0.533669, 0.533835, 0.534, 0.534165, 0.53433, 0.534494, 0.534658, 0.534821, 0.534984, 0.535147, 0.535309, 0.535471, 0.535632, 0.535793, 0.535953, 0.536113, 0.536273, 0.536432, 0.536591, 0.53675, 0.536908, 0.537066, 0.537223, 0.53738, 0.537537, 0.537693, 0.537848, 0.538004, 0.538159, 0.538313, 0.538468, 0.538621, 0.538775, 0.538928, 0.539081, 0.539233, 0.539385, 0.539536, 0.539688, 0.539838, 0.539989, 0.540139, 0.540288, 0.540438, 0.540587, 0.540735, 0.540883, 0.541031, 0.541179, 0.541326, 0.541472, 0.541619, 0.541765, 0.54191, 0.542055, 0.5422, 0.542345, 0.542489, 0.542633, 0.542776, 0.542919, 0.543062, 0.543204, 0.543346, 0.543488, 0.543629, 0.54377, 0.543911, 0.544051, 0.544191, 0.54433, 0.544469, 0.544608, 0.544747, 0.544885, 0.545023, 0.54516, 0.545297, 0.545434, 0.54557, 0.545706, 0.545842, 0.545978, 0.546113, 0.546247, 0.546382, 0.546516, 0.546649, 0.546783, 0.546916, 0.547049, 0.547181, 0.547313, 0.547445, 0.547576, 0.547707, 0.547838, 0.547968, 0.548098, 0.548228, 0.548358, 0.548487, 0.548615, 0.548744, 0.548872, 0.549, 0.549127, 0.549255, 0.549381, 0.549508, 0.549634, 0.54976, 0.549886, 0.550011, 0.550136, 0.550261, 0.550385, 0.550509, 0.550633, 0.550756, 0.550879, 0.551002, 0.551125, 0.551247, 0.551369, 0.55149, 0.551611, 0.551732, 0.551853, 0.551973, 0.552094, 0.552213, 0.552333, 0.552452, 0.552571, 0.552689, 0.552808, 0.552926, 0.553043, 0.553161, 0.553278, 0.553395, 0.553511, 0.553627, 0.553743, 0.553859, 0.553974, 0.554089, 0.554204, 0.554319, 0.554433, 0.554547, 0.55466, 0.554774, 0.554887, 0.555, 0.555112, 0.555224, 0.555336, 0.555448, 0.555559, 0.55567, 0.555781, 0.555892, 0.556002, 0.556112, 0.556222, 0.556331, 0.55644, 0.556549, 0.556658, 0.556766, 0.556874, 0.556982, 0.55709, 0.557197, 0.557304, 0.557411, 0.557517, 0.557623, 0.557729, 0.557835, 0.55794, 0.558046, 0.55815, 0.558255, 0.558359, 0.558464, 0.558567, 0.558671, 0.558774, 0.558877, 0.55898, 0.559083, 0.559185, 0.559287, 0.559389, 0.55949, 0.559592, 0.559693, 0.559793, 0.559894, 0.559994, 0.560094, 0.560194, 0.560293, 0.560393, 0.560492, 0.560591, 0.560689, 0.560787, 0.560885, 0.560983, 0.561081, 0.561178, 0.561275, 0.561372, 0.561468, 0.561565, 0.561661, 0.561757, 0.561852, 0.561948, 0.562043, 0.562138, 0.562232, 0.562327, 0.562421, 0.562515, 0.562609, 0.562702, 0.562795, 0.562888, 0.562981, 0.563074, 0.563166, 0.563258, 0.56335, 0.563442, 0.563533, 0.563624, 0.563715, 0.563806, 0.563896, 0.563987, 0.564077, 0.564166, 0.564256, 0.564345, 0.564434, 0.564523, 0.564612, 0.564701, 0.564789, 0.564877, 0.564965, 0.565052, 0.56514, 0.565227, 0.565314, 0.5654, 0.565487, 0.565573, 0.565659, 0.565745, 0.565831, 0.565916, 0.566001, 0.566086, 0.566171, 0.566256, 0.56634, 0.566424, 0.566508, 0.566592, 0.566675, 0.566759, 0.566842, 0.566925, 0.567007, 0.56709, 0.567172, 0.567254, 0.567336, 0.567418, 0.567499, 0.56758, 0.567662, 0.567742, 0.567823, 0.567903, 0.567984, 0.568064, 0.568144, 0.568223, 0.568303, 0.568382, 0.568461, 0.56854, 0.568618, 0.568697, 0.568775, 0.568853, 0.568931, 0.569009, 0.569086, 0.569164, 0.569241, 0.569317, 0.569394, 0.569471, 0.569547, 0.569623, 0.569699, 0.569775, 0.56985, 0.569926, 0.570001, 0.570076, 0.570151, 0.570225, 0.5703, 0.570374, 0.570448, 0.570522, 0.570596, 0.570669, 0.570743, 0.570816, 0.570889, 0.570961, 0.571034, 0.571106, 0.571179, 0.571251, 0.571323, 0.571394, 0.571466, 0.571537, 0.571608, 0.571679, 0.57175, 0.571821, 0.571891, 0.571961, 0.572032, 0.572101, 0.572171, 0.572241, 0.57231, 0.572379, 0.572448, 0.572517, 0.572586, 0.572655, 0.572723, 0.572791, 0.572859, 0.572927, 0.572995, 0.573062, 0.57313, 0.573197, 0.573264, 0.573331, 0.573397, 0.573464, 0.57353, 0.573596, 0.573662, 0.573728, 0.573794, 0.573859, 0.573925, 0.57399, 0.574055, 0.57412, 0.574184, 0.574249, 0.574313, 0.574378, 0.574442, 0.574506, 0.574569, 0.574633, 0.574696, 0.57476, 0.574823, 0.574886, 0.574948, 0.575011, 0.575073, 0.575136, 0.575198, 0.57526, 0.575322, 0.575383, 0.575445, 0.575506, 0.575568, 0.575629, 0.57569, 0.57575, 0.575811, 0.575872, 0.575932, 0.575992, 0.576052, 0.576112, 0.576172, 0.576231, 0.576291, 0.57635, 0.576409, 0.576468, 0.576527, 0.576586, 0.576644, 0.576702, 0.576761, 0.576819, 0.576877, 0.576935, 0.576992, 0.57705, 0.577107, 0.577164, 0.577221, 0.577278, 0.577335, 0.577392, 0.577448, 0.577505, 0.577561, 0.577617, 0.577673, 0.577729, 0.577785, 0.57784, 0.577895, 0.577951, 0.578006, 0.578061, 0.578116, 0.57817, 0.578225, 0.578279, 0.578334, 0.578388, 0.578442, 0.578496, 0.57855, 0.578603, 0.578657, 0.57871, 0.578763, 0.578816, 0.578869, 0.578922, 0.578975, 0.579027, 0.57908, 0.579132, 0.579184, 0.579236, 0.579288, 0.57934, 0.579392, 0.579443, 0.579495, 0.579546, 0.579597, 0.579648, 0.579699, 0.57975, 0.5798, 0.579851, 0.579901, 0.579951, 0.580001, 0.580051, 0.580101, 0.580151, 0.580201, 0.58025, 0.5803, 0.580349, 0.580398, 0.580447, 0.580496, 0.580545, 0.580593, 0.580642, 0.58069, 0.580738, 0.580787, 0.580835, 0.580883, 0.58093, 0.580978, 0.581026, 0.581073, 0.58112, 0.581168, 0.581215, 0.581262, 0.581308, 0.581355, 0.581402, 0.581448, 0.581495, 0.581541, 0.581587, 0.581633, 0.581679, 0.581725, 0.58177, 0.581816, 0.581862, 0.581907, 0.581952, 0.581997, 0.582042, 0.582087, 0.582132, 0.582177, 0.582221, 0.582266, 0.58231, 0.582354, 0.582398, 0.582442, 0.582486, 0.58253, 0.582574, 0.582617, 0.582661, 0.582704, 0.582747, 0.58279, 0.582833, 0.582876, 0.582919, 0.582962, 0.583004, 0.583047, 0.583089, 0.583132, 0.583174, 0.583216, 0.583258, 0.5833, 0.583341, 0.583383, 0.583425, 0.583466, 0.583507, 0.583549, 0.58359, 0.583631, 0.583672, 0.583712, 0.583753, 0.583794, 0.583834, 0.583875, 0.583915, 0.583955, 0.583995, 0.584035, 0.584075, 0.584115, 0.584155, 0.584194, 0.584234, 0.584273, 0.584313, 0.584352, 0.584391, 0.58443, 0.584469, 0.584508, 0.584547, 0.584585, 0.584624, 0.584662, 0.5847, 0.584739, 0.584777, 0.584815, 0.584853, 0.584891, 0.584929, 0.584966, 0.585004, 0.585041, 0.585079, 0.585116, 0.585153, 0.58519, 0.585227, 0.585264, 0.585301, 0.585338, 0.585375, 0.585411, 0.585448, 0.585484, 0.58552, 0.585556, 0.585593, 0.585629, 0.585664, 0.5857, 0.585736, 0.585772, 0.585807, 0.585843, 0.585878, 0.585913, 0.585949, 0.585984, 0.586019, 0.586054, 0.586089, 0.586123, 0.586158, 0.586193, 0.586227, 0.586262, 0.586296, 0.58633, 0.586364, 0.586399, 0.586433, 0.586466, 0.5865, 0.586534, 0.586568, 0.586601, 0.586635, 0.586668, 0.586702, 0.586735, 0.586768, 0.586801, 0.586834, 0.586867, 0.5869, 0.586933, 0.586965, 0.586998, 0.58703, 0.587063, 0.587095, 0.587127, 0.58716, 0.587192, 0.587224, 0.587256, 0.587287, 0.587319, 0.587351, 0.587383, 0.587414, 0.587446, 0.587477, 0.587508, 0.587539, 0.587571, 0.587602, 0.587633, 0.587664, 0.587694, 0.587725, 0.587756, 0.587787, 0.587817, 0.587848, 0.587878, 0.587908, 0.587938, 0.587969, 0.587999, 0.588029, 0.588059, 0.588088, 0.588118, 0.588148, 0.588178, 0.588207, 0.588237, 0.588266, 0.588295, 0.588325, 0.588354, 0.588383, 0.588412, 0.588441, 0.58847, 0.588499, 0.588527, 0.588556, 0.588585, 0.588613, 0.588642, 0.58867, 0.588698, 0.588727, 0.588755, 0.588783, 0.588811, 0.588839, 0.588867, 0.588895, 0.588922, 0.58895, 0.588978, 0.589005, 0.589033, 0.58906, 0.589088, 0.589115, 0.589142, 0.589169, 0.589196, 0.589223, 0.58925, 0.589277, 0.589304, 0.589331, 0.589357, 0.589384, 0.589411, 0.589437, 0.589463, 0.58949, 0.589516, 0.589542, 0.589568, 0.589594, 0.58962, 0.589646, 0.589672, 0.589698, 0.589724, 0.58975, 0.589775, 0.589801, 0.589826, 0.589852, 0.589877, 0.589902, 0.589928, 0.589953, 0.589978, 0.590003, 0.590028, 0.590053, 0.590078, 0.590103, 0.590127, 0.590152, 0.590177, 0.590201, 0.590226, 0.59025, 0.590274, 0.590299, 0.590323, 0.590347, 0.590371, 0.590395, 0.590419, 0.590443, 0.590467, 0.590491, 0.590515, 0.590539, 0.590562, 0.590586, 0.590609, 0.590633, 0.590656, 0.59068, 0.590703, 0.590726, 0.590749, 0.590772, 0.590796, 0.590819, 0.590842, 0.590864, 0.590887, 0.59091, 0.590933, 0.590955, 0.590978, 0.591001, 0.591023, 0.591046, 0.591068, 0.59109, 0.591113, 0.591135, 0.591157, 0.591179, 0.591201, 0.591223, 0.591245, 0.591267, 0.591289, 0.591311, 0.591332, 0.591354, 0.591376, 0.591397, 0.591419, 0.59144, 0.591461, 0.591483, 0.591504, 0.591525, 0.591546, 0.591568, 0.591589, 0.59161, 0.591631, 0.591652, 0.591673, 0.591693, 0.591714, 0.591735, 0.591755, 0.591776, 0.591797, 0.591817], "H_e": [0.0, 0.000398, 0.000606, -0.001331, -0.000866, -0.001365, -0.003121, -0.002927, -0.003459, -0.003841, -0.002563, -0.004215, -0.004303, -0.005005, -0.005418, -0.006831, -0.009398, -0.01232, -0.013701, -0.015702, -0.019126, -0.020021, -0.021504, -0.022301, -0.023882, -0.025431, -0.02678, -0.028068, -0.030723, -0.031779, -0.033468, -0.035567, -0.037124, -0.037226, -0.038258, -0.039017, -0.0395, -0.03909, -0.03953, -0.038392, -0.039072, -0.037669, -0.037946, -0.03816, -0.037627, -0.03833, -0.038162, -0.03811, -0.038416, -0.038277, -0.03881, -0.040175, -0.041564, -0.041667, -0.041949, -0.044098, -0.045704, -0.047308, -0.046818, -0.046169, -0.046795, -0.048363, -0.048803, -0.048149, -0.049211, -0.049283, -0.050862, -0.053058, -0.053603, -0.054514, -0.055045, -0.058193, -0.058018, -0.058022, -0.057206, -0.057998, -0.057803, -0.061589, -0.062723, -0.063603, -0.066354, -0.067426, -0.068324, -0.069238, -0.068569, -0.070261, -0.072304, -0.074023, -0.075277, -0.07625, -0.076928, -0.078336, -0.077994, -0.077945, -0.077664, -0.076497, -0.077173, -0.077656, -0.07826, -0.080075, -0.080957, -0.08124, -0.081408, -0.082913, -0.082859, -0.083948, -0.084443, -0.08593, -0.086157, -0.086816, -0.086115, -0.085101, -0.086639, -0.088103, -0.091106, -0.090986, -0.091446, -0.090791, -0.094017, -0.094771, -0.095924, -0.096057, -0.09664, -0.096479, -0.098747, -0.099926, -0.101019, -0.100844, -0.101766, -0.101455, -0.102022, -0.102466, -0.102396, -0.103298, -0.103618, -0.104962, -0.106007, -0.108458, -0.108816, -0.109969, -0.109992, -0.109279, -0.109851, -0.109887, -0.110963, -0.111939, -0.112791, -0.113772, -0.113808, -0.112988, -0.112536, -0.113289, -0.113945, -0.116965, -0.116071, -0.114852, -0.11525, -0.11562, -0.118205, -0.119453, -0.121146, -0.122815, -0.124125, -0.124889, -0.124722, -0.124619, -0.125355, -0.126592, -0.127693, -0.127563, -0.128527, -0.131092, -0.13416, -0.134375, -0.134757, -0.136507, -0.136575, -0.136891, -0.137182, -0.137632, -0.137559, -0.138825, -0.137952, -0.13875, -0.137911, -0.138077, -0.139076, -0.137553, -0.138737, -0.140947, -0.141613, -0.142889, -0.144229, -0.145434, -0.145312, -0.145822, -0.146873, -0.149721, -0.149463, -0.150081, -0.152632, -0.154231, -0.15598, -0.156515, -0.158951, -0.159412, -0.160157, -0.162715, -0.164625, -0.16482, -0.164985, -0.165262, -0.166364, -0.166102, -0.167976, -0.169396, -0.168627, -0.169509, -0.171291, -0.173462, -0.174134, -0.174138, -0.17679, -0.177255, -0.177549, -0.177542, -0.178329, -0.178519, -0.178756, -0.17863, -0.178481, -0.179487, -0.181139, -0.183934, -0.184002, -0.186627, -0.187862, -0.187988, -0.189318, -0.19117, -0.192017, -0.192814, -0.194058, -0.195412, -0.194333, -0.194523, -0.196732, -0.198053, -0.200736, -0.201238, -0.2028, -0.203791, -0.204986, -0.206038, -0.205136, -0.205014, -0.206017, -0.208718, -0.207692, -0.208599, -0.208912, -0.209964, -0.210689, -0.209954, -0.209595, -0.211091, -0.211265, -0.211871, -0.21227, -0.214021, -0.216877, -0.216994, -0.218206, -0.219625, -0.22023, -0.221909, -0.223699, -0.224348, -0.225338, -0.225669, -0.227201, -0.228062, -0.229638, -0.230085, -0.230692, -0.230262, -0.230911, -0.232011, -0.231518, -0.232906, -0.233905, -0.235471, -0.236098, -0.238353, -0.239982, -0.241223, -0.241299, -0.241803, -0.243451, -0.244445, -0.245724, -0.246122, -0.247092, -0.248607, -0.249937, -0.24707, -0.248742, -0.249286, -0.250728, -0.250702, -0.251159, -0.252341, -0.252111, -0.253545, -0.254554, -0.253369, -0.25509, -0.25539, -0.257395, -0.257373, -0.257945, -0.259374, -0.260727, -0.262706, -0.264329, -0.264264, -0.265659, -0.266257, -0.267945, -0.269844, -0.271708, -0.271663, -0.271862, -0.273751, -0.274581, -0.276848, -0.2765, -0.276571, -0.277751, -0.276667, -0.278716, -0.280421, -0.280683, -0.283855, -0.285063, -0.286925, -0.28742, -0.288529, -0.289879, -0.291748, -0.29496, -0.29542, -0.294306, -0.297946, -0.298762, -0.299177, -0.300238, -0.300601, -0.301877, -0.302602, -0.303786, -0.303937, -0.305013, -0.30435, -0.304808, -0.306927, -0.307703, -0.309145, -0.310695, -0.313695, -0.314266, -0.315427, -0.315278, -0.316597, -0.319558, -0.322137, -0.322931, -0.324464, -0.327161, -0.327435, -0.329543, -0.330764, -0.331009, -0.331519, -0.331856, -0.332308, -0.332611, -0.332699, -0.333998, -0.335757, -0.335933, -0.336383, -0.337376, -0.337107, -0.335626, -0.337326, -0.339297, -0.337734, -0.339912, -0.341453, -0.341446, -0.344378, -0.345288, -0.34632, -0.345371, -0.346102, -0.349903, -0.351467, -0.35282, -0.353489, -0.355908, -0.356195, -0.356936, -0.357275, -0.357914, -0.358327, -0.35823, -0.359305, -0.360158, -0.362614, -0.363479, -0.363259, -0.363106, -0.364061, -0.363684, -0.364454, -0.368074, -0.368696, -0.37142, -0.371903, -0.373128, -0.375488, -0.374285, -0.375024, -0.376342, -0.378634, -0.378731, -0.37848, -0.380171, -0.381021, -0.382572, -0.382265, -0.382709, -0.383506, -0.383012, -0.381866, -0.381684, -0.381188, -0.382474, -0.382762, -0.383795, -0.3826, -0.385063, -0.386161, -0.38704, -0.385909, -0.386539, -0.386537, -0.387359, -0.387808, -0.38993, -0.389902, -0.389672, -0.390678, -0.392489, -0.392427, -0.393408, -0.393898, -0.393336, -0.39372, -0.395266, -0.393957, -0.396435, -0.397127, -0.396775, -0.399527, -0.399259, -0.399404, -0.402065, -0.403227, -0.404734, -0.406242, -0.407202, -0.408081, -0.407512, -0.409399, -0.409452, -0.409661, -0.41097, -0.412209, -0.413454, -0.413013, -0.413646, -0.414286, -0.414172, -0.414418, -0.414389, -0.415754, -0.416215, -0.417848, -0.415972, -0.415434, -0.414512, -0.416998, -0.418843, -0.418773, -0.41886, -0.420144, -0.42136, -0.423125, -0.423545, -0.423246, -0.423688, -0.424173, -0.42919, -0.429704, -0.433252, -0.432955, -0.433818, -0.43486, -0.436998, -0.438066, -0.438245, -0.43968, -0.441364, -0.441618, -0.443894, -0.445396, -0.445077, -0.445886, -0.447925, -0.449341, -0.449504, -0.450539, -0.451929, -0.453128, -0.454411, -0.454887, -0.457346, -0.456366, -0.456143, -0.456438, -0.456525, -0.459276, -0.460238, -0.460406, -0.461251, -0.461022, -0.461929, -0.462219, -0.462707, -0.462635, -0.46258, -0.463077, -0.46416, -0.46505, -0.464267, -0.466151, -0.467928, -0.469818, -0.47127, -0.471372, -0.473038, -0.472472, -0.472611, -0.471537, -0.472622, -0.473022, -0.473631, -0.473523, -0.47621, -0.4774, -0.478817, -0.479666, -0.479623, -0.481125, -0.482259, -0.483067, -0.483458, -0.484875, -0.483077, -0.485236, -0.485873, -0.487736, -0.489891, -0.489804, -0.490563, -0.492038, -0.492688, -0.490842, -0.490718, -0.490014, -0.488973, -0.48792, -0.489439, -0.489876, -0.492094, -0.492356, -0.492923, -0.493962, -0.493991, -0.495616, -0.496816, -0.497241, -0.498171, -0.499999, -0.501989, -0.503203, -0.504156, -0.504298, -0.506404, -0.506634, -0.509879, -0.511079, -0.512618, -0.514504, -0.514014, -0.516489, -0.516727, -0.516616, -0.517936, -0.519444, -0.519421, -0.519226, -0.518572, -0.518215, -0.517963, -0.52115, -0.520695, -0.522291, -0.522918, -0.524793, -0.525414, -0.525385, -0.526429, -0.525527, -0.5248, -0.525153, -0.526723, -0.52601, -0.526881, -0.52779, -0.528114, -0.531013, -0.531119, -0.531392, -0.532174, -0.533084, -0.533505, -0.533739, -0.53338, -0.534552, -0.536405, -0.536513, -0.535385, -0.535191, -0.53592, -0.53761, -0.538654, -0.538946, -0.539629, -0.539903, -0.540202, -0.540712, -0.540307, -0.541412, -0.541404, -0.541707, -0.542017, -0.542933, -0.544187, -0.547772, -0.547885, -0.54644, -0.547749, -0.548712, -0.550673, -0.551065, -0.550033, -0.549921, -0.550067, -0.549084, -0.549522, -0.550038, -0.549192, -0.549549, -0.548834, -0.547486, -0.54767, -0.5489, -0.549894, -0.55046, -0.549989, -0.552012, -0.552105, -0.550353, -0.551464, -0.552109, -0.554873, -0.555939, -0.557304, -0.557586, -0.558983, -0.559663, -0.560155, -0.560876, -0.561187, -0.562731, -0.561754, -0.564023, -0.564308, -0.564918, -0.56223, -0.562644, -0.562008, -0.564592, -0.565686, -0.56582, -0.566411, -0.566373, -0.566442, -0.567768, -0.568021, -0.567784, -0.567066, -0.566858, -0.566263, -0.565424, -0.566774, -0.564967, -0.564925, -0.566132, -0.567842, -0.56801, -0.569574, -0.570881, -0.572382, -0.572805, -0.571769, -0.573106, -0.572217, -0.571357, -0.572114, -0.571973, -0.570529, -0.571596, -0.573264, -0.575335, -0.57484, -0.574856, -0.575454, -0.57693, -0.577854, -0.579851, -0.581074, -0.582123, -0.584143, -0.584533, -0.584457, -0.583513, -0.583627, -0.581371, -0.583003, -0.582684, -0.583316, -0.583954, -0.585409, -0.586876, -0.587839, -0.58833, -0.59023, -0.591026, -0.590202, -0.59157, -0.591658, -0.593398, -0.594899, -0.59644, -0.595946, -0.596739, -0.597721, -0.597469, -0.599466, -0.600042, -0.601335, -0.602386, -0.602888, -0.604775, -0.604526, -0.606013, -0.6057, -0.607116, -0.607504, -0.607228, -0.6076, -0.60941, -0.609994, -0.611517, -0.612666, -0.612904, -0.61476, -0.61358, -0.613321, -0.613976, -0.611003, -0.611611, -0.611762, -0.612499, -0.612738, -0.612328, -0.611598, -0.61098, -0.611466, -0.611106, -0.611269, -0.612494, -0.611783, -0.612025, -0.61329, -0.614355, -0.615521, -0.617026, -0.619093, -0.62173, -0.621961, -0.622747, -0.624973, -0.626117, -0.627643, -0.629063, -0.630382, -0.630433, -0.629747, -0.629348, -0.63154, -0.631854, -0.633354, -0.635057, -0.634946, -0.634759, -0.636017, -0.636643, -0.635018, -0.635231, -0.636798, -0.638654, -0.639224, -0.639619, -0.640674, -0.640508, -0.640358, -0.641339, -0.641463, -0.642426, -0.64165, -0.641833, -0.642445, -0.644861, -0.644544, -0.645073, -0.644741, -0.645381, -0.64454, -0.645186, -0.645307, -0.647464, -0.648048, -0.647711, -0.647612, -0.646668, -0.648098, -0.649114, -0.649156, -0.649915, -0.651403, -0.653381, -0.654938, -0.654505, -0.65391, -0.654983, -0.654909, -0.657483, -0.657507, -0.657528, -0.658703, -0.658689, -0.658334, -0.657173, -0.657229, -0.658499, -0.657455, -0.655948, -0.65927, -0.658708, -0.659923, -0.660196, -0.659385, -0.659927, -0.661409, -0.662353, -0.662765, -0.662542, -0.662147, -0.662154, -0.661603, -0.663885, -0.665528, -0.66635, -0.666863, -0.66675, -0.66787, -0.666879, -0.666849, -0.669497, -0.669882, -0.670555, -0.670834, -0.671873, -0.671035, -0.671864, -0.673269, -0.673406, -0.675002, -0.674762, -0.675162, -0.674951, -0.674338, -0.674083, -0.675446, -0.675608, -0.674861, -0.673187, -0.671474, -0.67249, -0.672169, -0.672265, -0.670899, -0.67132, -0.673993, -0.673107, -0.672407, -0.675146, -0.67595, -0.675201, -0.675005, -0.676542, -0.677011, -0.67756, -0.679375, -0.680129, -0.679804, -0.68114, -0.681857, -0.684054, -0.685236, -0.685493, -0.686087, -0.68757, -0.689068, -0.689656, -0.690989, -0.691165, -0.690604, -0.690856, -0.690135, -0.691408, -0.692845, -0.694716, -0.697264, -0.698073, -0.697098, -0.697571, -0.69859, -0.700104, -0.700005, -0.701112, -0.702543, -0.703714, -0.704945, -0.706866, -0.706012, -0.707215, -0.707967, -0.707663, -0.708119, -0.709199, -0.710334, -0.710313, -0.710202, -0.710308, -0.711106, -0.710746, -0.711797, -0.710986, -0.710728, -0.712991, -0.713351, -0.712759, -0.712095, -0.71315, -0.71362], "H_c": [0.0, -0.002555, -0.00413, -0.00593, -0.006415, -0.007632, -0.010084, -0.010678, -0.010343, -0.011755, -0.012977, -0.014823, -0.016763, -0.018498, -0.021377, -0.023046, -0.02663, -0.029003, -0.029763, -0.030225, -0.032734, -0.034688, -0.038093, -0.040681, -0.042846, -0.044629, -0.047077, -0.048501, -0.051075, -0.054379, -0.05645, -0.057925, -0.060552, -0.062602, -0.063704, -0.066463, -0.069178, -0.071183, -0.075511, -0.077349, -0.079831, -0.082484, -0.083391, -0.086264, -0.087902, -0.090925, -0.092165, -0.094947, -0.095862, -0.098236, -0.10152, -0.103634, -0.10625, -0.107815, -0.108575, -0.108852, -0.111111, -0.112649, -0.113957, -0.116697, -0.117753, -0.121229, -0.121973, -0.124199, -0.127053, -0.130269, -0.132884, -0.136952, -0.140242, -0.142934, -0.145228, -0.148872, -0.151605, -0.15242, -0.154107, -0.15687, -0.159823, -0.162161, -0.163863, -0.164261, -0.165507, -0.168219, -0.170734, -0.17071, -0.172644, -0.174577, -0.17872, -0.18228, -0.185068, -0.188527, -0.19055, -0.193555, -0.196152, -0.198452, -0.201192, -0.20437, -0.207461, -0.209481, -0.210704, -0.213481, -0.215171, -0.216759, -0.218189, -0.220847, -0.222726, -0.22442, -0.224849, -0.227357, -0.228519, -0.229268, -0.23178, -0.235114, -0.237812, -0.239353, -0.241975, -0.245452, -0.248291, -0.252146, -0.253488, -0.256485, -0.259628, -0.262294, -0.264305, -0.265708, -0.265778, -0.267689, -0.271529, -0.274908, -0.277796, -0.279799, -0.282469, -0.283717, -0.286462, -0.29217, -0.295408, -0.297158, -0.298077, -0.300795, -0.301869, -0.304406, -0.308504, -0.310802, -0.31391, -0.316504, -0.319046, -0.322605, -0.323354, -0.325956, -0.329508, -0.331858, -0.332827, -0.33573, -0.337334, -0.33882, -0.341453, -0.344226, -0.345392, -0.347339, -0.34916, -0.352578, -0.354054, -0.354195, -0.356892, -0.359698, -0.363991, -0.36583, -0.369373, -0.370905, -0.373087, -0.376478, -0.378568, -0.381347, -0.38424, -0.386364, -0.388553, -0.390474, -0.392044, -0.396377, -0.39819, -0.400966, -0.402688, -0.404197, -0.407162, -0.407521, -0.411255, -0.412765, -0.415633, -0.4169, -0.420224, -0.422456, -0.424782, -0.426841, -0.429675, -0.432951, -0.436201, -0.439528, -0.442539, -0.444714, -0.448083, -0.45255, -0.456924, -0.459555, -0.461666, -0.46557, -0.468873, -0.472174, -0.473505, -0.476642, -0.478278, -0.481361, -0.483969, -0.486356, -0.490584, -0.493013, -0.49531, -0.497632, -0.500602, -0.504087, -0.50791, -0.510361, -0.512193, -0.51465, -0.517904, -0.521848, -0.523938, -0.527242, -0.530251, -0.533125, -0.535788, -0.537398, -0.539738, -0.541346, -0.543996, -0.545369, -0.549077, -0.551536, -0.552991, -0.554826, -0.557765, -0.560913, -0.562382, -0.566544, -0.569638, -0.568974, -0.57059, -0.572896, -0.574807, -0.576874, -0.579515, -0.584023, -0.586015, -0.588087, -0.593886, -0.595116, -0.597711, -0.600344, -0.602816, -0.604986, -0.606665, -0.60896, -0.612604, -0.612971, -0.613402, -0.615925, -0.618642, -0.620932, -0.622561, -0.624231, -0.625422, -0.63035, -0.633629, -0.635605, -0.639329, -0.644187, -0.64725, -0.648763, -0.649543, -0.650927, -0.654036, -0.657436, -0.659226, -0.662193, -0.66479, -0.666537, -0.66824, -0.670994, -0.673752, -0.675754, -0.677416, -0.680668, -0.683584, -0.68723, -0.690865, -0.692906, -0.694658, -0.697571, -0.699835, -0.701384, -0.702246, -0.70422, -0.705232, -0.709525, -0.711713, -0.713058, -0.71475, -0.716212, -0.718386, -0.721653, -0.724124, -0.725776, -0.727818, -0.730261, -0.731827, -0.734264, -0.735808, -0.737815, -0.7392, -0.739834, -0.741955, -0.743565, -0.746906, -0.749885, -0.753285, -0.754523, -0.757939, -0.758525, -0.759295, -0.763964, -0.767557, -0.769319, -0.773344, -0.776254, -0.777661, -0.778576, -0.78167, -0.783881, -0.786702, -0.789285, -0.791244, -0.793032, -0.797236, -0.800937, -0.803238, -0.805691, -0.808509, -0.810559, -0.812884, -0.81431, -0.816875, -0.819226, -0.821675, -0.823407, -0.825413, -0.82763, -0.828195, -0.830033, -0.833004, -0.837273, -0.839366, -0.841915, -0.842657, -0.846276, -0.847989, -0.851258, -0.853553, -0.855843, -0.857425, -0.858193, -0.859882, -0.862989, -0.866088, -0.868309, -0.871643, -0.873436, -0.875373, -0.8763, -0.877837, -0.879166, -0.881386, -0.885138, -0.887626, -0.88949, -0.892203, -0.894315, -0.895496, -0.896795, -0.898214, -0.901129, -0.904991, -0.907177, -0.90772, -0.911134, -0.91437, -0.917067, -0.920274, -0.923742, -0.928351, -0.930863, -0.931869, -0.933931, -0.937141, -0.940048, -0.942625, -0.945883, -0.948861, -0.952309, -0.954957, -0.956969, -0.957266, -0.96077, -0.963818, -0.966875, -0.9692, -0.972654, -0.976468, -0.978853, -0.981011, -0.982555, -0.985306, -0.987412, -0.990903, -0.994647, -0.996704, -0.998465, -1.000972, -1.002853, -1.003802, -1.006364, -1.008863, -1.012282, -1.015603, -1.018202, -1.021725, -1.023849, -1.026208, -1.028533, -1.03002, -1.032884, -1.03543, -1.039079, -1.040364, -1.042336, -1.044746, -1.047413, -1.051016, -1.052874, -1.054683, -1.057279, -1.059652, -1.062334, -1.064508, -1.066587, -1.069698, -1.072727, -1.074382, -1.075862, -1.076878, -1.079561, -1.082354, -1.08472, -1.087247, -1.088785, -1.090394, -1.092706, -1.093178, -1.096103, -1.098674, -1.103174, -1.106897, -1.110009, -1.113896, -1.116344, -1.1178, -1.12084, -1.121825, -1.125107, -1.127504, -1.130553, -1.133062, -1.135923, -1.138315, -1.140139, -1.141522, -1.143153, -1.14412, -1.146271, -1.148764, -1.152322, -1.15425, -1.156491, -1.157787, -1.161812, -1.164453, -1.166431, -1.168739, -1.171894, -1.173297, -1.176456, -1.179445, -1.1823, -1.183234, -1.186454, -1.189553, -1.19477, -1.19685, -1.200194, -1.203147, -1.204634, -1.208266, -1.209881, -1.212491, -1.214708, -1.21739, -1.220958, -1.223858, -1.226713, -1.229071, -1.231786, -1.234129, -1.235101, -1.238336, -1.24015, -1.24223, -1.244122, -1.245967, -1.247514, -1.251098, -1.252908, -1.25702, -1.259224, -1.260526, -1.263773, -1.266462, -1.268482, -1.270157, -1.269966, -1.27263, -1.274435, -1.276324, -1.277788, -1.279987, -1.282508, -1.2846, -1.287098, -1.289757, -1.291696, -1.293538, -1.295585, -1.296605, -1.301647, -1.305251, -1.307771, -1.310963, -1.313387, -1.315848, -1.316411, -1.320246, -1.323318, -1.326211, -1.329358, -1.331106, -1.332873, -1.334204, -1.336642, -1.339375, -1.341449, -1.343606, -1.346326, -1.348071, -1.350897, -1.354383, -1.357628, -1.363542, -1.366955, -1.369237, -1.370705, -1.373075, -1.376501, -1.378772, -1.382091, -1.385341, -1.388049, -1.389927, -1.391087, -1.39146, -1.393405, -1.39504, -1.398403, -1.400037, -1.402895, -1.406407, -1.409791, -1.411309, -1.411018, -1.413393, -1.415727, -1.41864, -1.423303, -1.424429, -1.428696, -1.431188, -1.432619, -1.434571, -1.435691, -1.438243, -1.439912, -1.443649, -1.445944, -1.449584, -1.452764, -1.453844, -1.457471, -1.458798, -1.461602, -1.464198, -1.467512, -1.4706, -1.47361, -1.475593, -1.479311, -1.483412, -1.487212, -1.491137, -1.495078, -1.49602, -1.498347, -1.500796, -1.503127, -1.506619, -1.509378, -1.510596, -1.513371, -1.517052, -1.519997, -1.521272, -1.522809, -1.524576, -1.526574, -1.529293, -1.531711, -1.53393, -1.536644, -1.538454, -1.540431, -1.54243, -1.545209, -1.547537, -1.551927, -1.555063, -1.55706, -1.561156, -1.564753, -1.568617, -1.571344, -1.574575, -1.575879, -1.577836, -1.579971, -1.58108, -1.582315, -1.584064, -1.585555, -1.588853, -1.591645, -1.594769, -1.597474, -1.6025, -1.604002, -1.606721, -1.608769, -1.611167, -1.614691, -1.616129, -1.619567, -1.620359, -1.623625, -1.627229, -1.629303, -1.631794, -1.632822, -1.635214, -1.636916, -1.639413, -1.642002, -1.643801, -1.645556, -1.646835, -1.648147, -1.651553, -1.653067, -1.654819, -1.657781, -1.659581, -1.661541, -1.66283, -1.665246, -1.669268, -1.673394, -1.676562, -1.679874, -1.682301, -1.685152, -1.687698, -1.689092, -1.691029, -1.694768, -1.695773, -1.696463, -1.700625, -1.702593, -1.70409, -1.705191, -1.709265, -1.711865, -1.714553, -1.716796, -1.720168, -1.724653, -1.727749, -1.73152, -1.734159, -1.736702, -1.73968, -1.742799, -1.744864, -1.747365, -1.751041, -1.752444, -1.754863, -1.75604, -1.759049, -1.759755, -1.762658, -1.765732, -1.767403, -1.770699, -1.773019, -1.774201, -1.777961, -1.777642, -1.779212, -1.782221, -1.786084, -1.788563, -1.791471, -1.793374, -1.795658, -1.796894, -1.797876, -1.800859, -1.803054, -1.805937, -1.807554, -1.809795, -1.812421, -1.815299, -1.817478, -1.820726, -1.822453, -1.824494, -1.828535, -1.831129, -1.832385, -1.835475, -1.83683, -1.839782, -1.84147, -1.844097, -1.846163, -1.848518, -1.851466, -1.853816, -1.856501, -1.85838, -1.862722, -1.866563, -1.869374, -1.871632, -1.873581, -1.874788, -1.878586, -1.879597, -1.883215, -1.885967, -1.887813, -1.888007, -1.890617, -1.893188, -1.895146, -1.89685, -1.899852, -1.901067, -1.904934, -1.906883, -1.908998, -1.91132, -1.912203, -1.914188, -1.916614, -1.917755, -1.918844, -1.921016, -1.923285, -1.926621, -1.928861, -1.930701, -1.93308, -1.937006, -1.94013, -1.943799, -1.945625, -1.947588, -1.951445, -1.952482, -1.954598, -1.957078, -1.960915, -1.963201, -1.964558, -1.966373, -1.971098, -1.973731, -1.976032, -1.979356, -1.982432, -1.984319, -1.98527, -1.986681, -1.987489, -1.98993, -1.992326, -1.996527, -1.998611, -2.000731, -2.002892, -2.005395, -2.008379, -2.01062, -2.011946, -2.015658, -2.017925, -2.019096, -2.022128, -2.024393, -2.026601, -2.030572, -2.031856, -2.0326, -2.032695, -2.03622, -2.038605, -2.040756, -2.042779, -2.046271, -2.050178, -2.052643, -2.05597, -2.058115, -2.060892, -2.063061, -2.064154, -2.066751, -2.068973, -2.071142, -2.074348, -2.075286, -2.078036, -2.082271, -2.085283, -2.08823, -2.092343, -2.096052, -2.098838, -2.098608, -2.099445, -2.10184, -2.104873, -2.108485, -2.10982, -2.112257, -2.115347, -2.117755, -2.119974, -2.120712, -2.123544, -2.127282, -2.129121, -2.132016, -2.134716, -2.135802, -2.137665, -2.140738, -2.142755, -2.146017, -2.148301, -2.151285, -2.154211, -2.157496, -2.161398, -2.163997, -2.165946, -2.167568, -2.167045, -2.170934, -2.174863, -2.177998, -2.180953, -2.18431, -2.187279, -2.189443, -2.191072, -2.193048, -2.194975, -2.197212, -2.200122, -2.20195, -2.205355, -2.20854, -2.211022, -2.212777, -2.215678, -2.219575, -2.22009, -2.221767, -2.223793, -2.226802, -2.227832, -2.228963, -2.231221, -2.233382, -2.23477, -2.236225, -2.238663, -2.241587, -2.244782, -2.245536, -2.247362, -2.249159, -2.252284, -2.253042, -2.254285, -2.256631, -2.261594, -2.262661, -2.266172, -2.268508, -2.272188, -2.275074, -2.278402, -2.281016, -2.283946, -2.284771, -2.285216, -2.288623, -2.290456, -2.29132, -2.293761, -2.294754, -2.298034, -2.300946, -2.303868, -2.306139, -2.307898, -2.310814, -2.313064, -2.316588, -2.320684, -2.3229, -2.326945, -2.329732, -2.332059, -2.334068, -2.337803, -2.339826, -2.341451, -2.344104, -2.345219, -2.349785, -2.353308, -2.355836, -2.358783, -2.361834, -2.363488, -2.365209, -2.366797, -2.37018, -2.372109, -2.375935, -2.378703, -2.381292, -2.38365, -2.386519, -2.388242, -2.389799, -2.392435, -2.395975, -2.39929, -2.402358, -2.404176, -2.40689, -2.410381], "M_r": [0.210332, 0.212685, 0.212877, 0.212104, 0.209248, 0.215575, 0.213497, 0.215308, 0.21685, 0.216666, 0.215057, 0.215594, 0.217952, 0.217947, 0.215093, 0.220929, 0.218512, 0.225632, 0.221634, 0.226103, 0.221051, 0.22375, 0.224177, 0.226264, 0.229569, 0.227792, 0.226928, 0.22917, 0.231092, 0.229782, 0.229172, 0.231997, 0.235152, 0.231588, 0.229768, 0.235065, 0.236666, 0.235235, 0.232592, 0.234975, 0.238161, 0.241287, 0.239774, 0.234792, 0.240641, 0.236312, 0.240906, 0.237272, 0.24439, 0.241747, 0.248924, 0.244799, 0.245037, 0.246535, 0.247874, 0.249517, 0.24232, 0.24753, 0.247727, 0.248218, 0.251887, 0.252295, 0.251041, 0.258141, 0.249583, 0.248207, 0.253189, 0.253437, 0.257401, 0.256663, 0.255618, 0.257195, 0.260995, 0.260101, 0.26372, 0.259766, 0.26626, 0.265664, 0.26355, 0.273273, 0.263704, 0.264459, 0.263686, 0.263451, 0.26449, 0.269933, 0.276441, 0.271917, 0.271233, 0.2741, 0.272082, 0.277848, 0.269514, 0.278478, 0.275016, 0.271992, 0.27843, 0.278958, 0.278271, 0.276978, 0.278481, 0.285928, 0.281661, 0.281428, 0.283426, 0.281273, 0.285344, 0.283076, 0.288302, 0.286776, 0.288763, 0.283595, 0.283681, 0.290993, 0.290185, 0.293621, 0.288048, 0.291782, 0.297593, 0.293903, 0.294039, 0.299481, 0.30386, 0.295899, 0.302326, 0.30349, 0.297235, 0.300394, 0.306085, 0.29928, 0.298444, 0.299922, 0.298411, 0.305495, 0.308974, 0.306797, 0.302192, 0.303146, 0.311943, 0.312455, 0.311909, 0.312619, 0.308225, 0.315206, 0.312737, 0.311142, 0.321533, 0.31463, 0.324134, 0.316006, 0.31912, 0.323652, 0.32283, 0.320599, 0.32541, 0.317205, 0.320414, 0.325698, 0.325406, 0.324486, 0.325425, 0.33002, 0.324606, 0.334235, 0.328351, 0.330642, 0.331819, 0.331735, 0.332787, 0.335344, 0.339056, 0.335633, 0.340372, 0.336432, 0.346605, 0.338347, 0.345588, 0.345514, 0.341753, 0.345295, 0.344214, 0.343657, 0.343278, 0.349028, 0.347104, 0.352092, 0.346926, 0.346062, 0.350933, 0.358359, 0.353176, 0.356255, 0.351898, 0.356579, 0.362472, 0.360155, 0.357025, 0.359227, 0.36261, 0.364844, 0.365335, 0.366599, 0.370689, 0.376254, 0.366389, 0.368709, 0.370664, 0.375857, 0.37332, 0.367763, 0.373725, 0.373922, 0.37542, 0.370816, 0.379394, 0.37819, 0.382524, 0.384517, 0.384785, 0.385084, 0.387573, 0.388043, 0.386978, 0.391198, 0.393727, 0.390871, 0.388515, 0.39123, 0.400718, 0.390702, 0.395075, 0.395772, 0.39546, 0.397741, 0.400744, 0.401135, 0.400598, 0.409094, 0.409973, 0.405096, 0.411664, 0.412174, 0.40706, 0.403804, 0.411284, 0.410394, 0.408286, 0.414395, 0.414863, 0.418472, 0.410774, 0.418228, 0.419103, 0.413977, 0.424952, 0.417604, 0.420551, 0.42234, 0.421976, 0.426212, 0.430861, 0.430271, 0.426876, 0.432292, 0.423607, 0.427411, 0.425655, 0.434318, 0.430941, 0.433957, 0.434088, 0.435667, 0.442086, 0.442, 0.436029, 0.433951, 0.438281, 0.446351, 0.446404, 0.446344, 0.44621, 0.44337, 0.447666, 0.453606, 0.447097, 0.456765, 0.452437, 0.448278, 0.451849, 0.452103, 0.456416, 0.452254, 0.458387, 0.455138, 0.458318, 0.458287, 0.466433, 0.465703, 0.461063, 0.470199, 0.464422, 0.469439, 0.471859, 0.469659, 0.472489, 0.473491, 0.46681, 0.473066, 0.474247, 0.470952, 0.471808, 0.473503, 0.472341, 0.474417, 0.474664, 0.475301, 0.480102, 0.479514, 0.48013, 0.480763, 0.484697, 0.477633, 0.481952, 0.491044, 0.486768, 0.483957, 0.487622, 0.492296, 0.493703, 0.495883, 0.489043, 0.497139, 0.497688, 0.495917, 0.487319, 0.498667, 0.498009, 0.499226, 0.50099, 0.498553, 0.505084, 0.501619, 0.502739, 0.50345, 0.505052, 0.511432, 0.508053, 0.512064, 0.509474, 0.516184, 0.520715, 0.515264, 0.520632, 0.520213, 0.519344, 0.520625, 0.522686, 0.525483, 0.528098, 0.525165, 0.526255, 0.52678, 0.525682, 0.535405, 0.518442, 0.532234, 0.529264, 0.525601, 0.530947, 0.534187, 0.531712, 0.538024, 0.53707, 0.538229, 0.538549, 0.541561, 0.540277, 0.544139, 0.539501, 0.541736, 0.547377, 0.555806, 0.543224, 0.554496, 0.548885, 0.550241, 0.549016, 0.552951, 0.552353, 0.548701, 0.556727, 0.552284, 0.554513, 0.556204, 0.553391, 0.561551, 0.564424, 0.556861, 0.56558, 0.566716, 0.564562, 0.568427, 0.566816, 0.563664, 0.567935, 0.572427, 0.569554, 0.572403, 0.578761, 0.572354, 0.575776, 0.579539, 0.582597, 0.581117, 0.57954, 0.584593, 0.581856, 0.5864, 0.584187, 0.585933, 0.586095, 0.588606, 0.58627, 0.582342, 0.59243, 0.588343, 0.589585, 0.595428, 0.593567, 0.5927, 0.596883, 0.597082, 0.600416, 0.59799, 0.600514, 0.600178, 0.600227, 0.605227, 0.607317, 0.609815, 0.607229, 0.604994, 0.610423, 0.611665, 0.604229, 0.609037, 0.608175, 0.610044, 0.610648, 0.613826, 0.607388, 0.612585, 0.616641, 0.612472, 0.620331, 0.614311, 0.621075, 0.618382, 0.617835, 0.621036, 0.622912, 0.623714, 0.62607, 0.626539, 0.622491, 0.621263, 0.621703, 0.625866, 0.633608, 0.630915, 0.63474, 0.633571, 0.636277, 0.636662, 0.631753, 0.635626, 0.641024, 0.637903, 0.639057, 0.643268, 0.642248, 0.644231, 0.639153, 0.642674, 0.643817, 0.648246, 0.646007, 0.641892, 0.653186, 0.648664, 0.647049, 0.649689, 0.649453, 0.651772, 0.653794, 0.653777, 0.652054, 0.652092, 0.652544, 0.657425, 0.656687, 0.654972, 0.660813, 0.657222, 0.662086, 0.665693, 0.660756, 0.663824, 0.662676, 0.673799, 0.665881, 0.666211, 0.667654, 0.66825, 0.66416, 0.67335, 0.67475, 0.676799, 0.676892, 0.670868, 0.676789, 0.68128, 0.674827, 0.680178, 0.683145, 0.682083, 0.680803, 0.686751, 0.687901, 0.686177, 0.685513, 0.688862, 0.688153, 0.690322, 0.684289, 0.69605, 0.690777, 0.689279, 0.688424, 0.692908, 0.691049, 0.691677, 0.697149, 0.698339, 0.694927, 0.695591, 0.697351, 0.699011, 0.699475, 0.702399, 0.698252, 0.699483, 0.700821, 0.704697, 0.700899, 0.700359, 0.70578, 0.707208, 0.703665, 0.707947, 0.708528, 0.711403, 0.706313, 0.715581, 0.710711, 0.708853, 0.716973, 0.709476, 0.715721, 0.71566, 0.716815, 0.721978, 0.721139, 0.722466, 0.723314, 0.714171, 0.723633, 0.726153, 0.719515, 0.722134, 0.729157, 0.72783, 0.722994, 0.724997, 0.733132, 0.727015, 0.729292, 0.730041, 0.728813, 0.729689, 0.726303, 0.730098, 0.73061, 0.734493, 0.736144, 0.732362, 0.740685, 0.732632, 0.738911, 0.737267, 0.738389, 0.741657, 0.739325, 0.739661, 0.738885, 0.742373, 0.74616, 0.740596, 0.742588, 0.74809, 0.748189, 0.745429, 0.748516, 0.748086, 0.750513, 0.752367, 0.748405, 0.756119, 0.75565, 0.757971, 0.760309, 0.762797, 0.756003, 0.757213, 0.75853, 0.75882, 0.761743, 0.760779, 0.759536, 0.760502, 0.764712, 0.766059, 0.761342, 0.764977, 0.767241, 0.765353, 0.765259, 0.766553, 0.771231, 0.767781, 0.764723, 0.76942, 0.769745, 0.767605, 0.770819, 0.771273, 0.770328, 0.774255, 0.769394, 0.772143, 0.780581, 0.776715, 0.777351, 0.778367, 0.777085, 0.776444, 0.775897, 0.783185, 0.781823, 0.776274, 0.775208, 0.782626, 0.783188, 0.782877, 0.781479, 0.783735, 0.784856, 0.786291, 0.784437, 0.784508, 0.787935, 0.785373, 0.786643, 0.78951, 0.79111, 0.794072, 0.793818, 0.790766, 0.795758, 0.797322, 0.798951, 0.792489, 0.795252, 0.794542, 0.795803, 0.795904, 0.792698, 0.795683, 0.796528, 0.795907, 0.798734, 0.797231, 0.798017, 0.799866, 0.80017, 0.801861, 0.805826, 0.801716, 0.803507, 0.805896, 0.809416, 0.804879, 0.810142, 0.80672, 0.805639, 0.813377, 0.809217, 0.812074, 0.808179, 0.811871, 0.810055, 0.806526, 0.81308, 0.810307, 0.809783, 0.815243, 0.810366, 0.815312, 0.813489, 0.815721, 0.815481, 0.819924, 0.815078, 0.815243, 0.815985, 0.820914, 0.816297, 0.816161, 0.81649, 0.819625, 0.823644, 0.819356, 0.819873, 0.82176, 0.822461, 0.822546, 0.824217, 0.827958, 0.821734, 0.82361, 0.825626, 0.825081, 0.825354, 0.825297, 0.826015, 0.826901, 0.829428, 0.830033, 0.830445, 0.831981, 0.829432, 0.831319, 0.832824, 0.829789, 0.832611, 0.835085, 0.834541, 0.830676, 0.831189, 0.831645, 0.834776, 0.836443, 0.835656, 0.835449, 0.834331, 0.836806, 0.83462, 0.837288, 0.837477, 0.839242, 0.838845, 0.839593, 0.840188, 0.841478, 0.843834, 0.841642, 0.843894, 0.846548, 0.844197, 0.843283, 0.846247, 0.846232, 0.846918, 0.849707, 0.846697, 0.84669, 0.847195, 0.846299, 0.849458, 0.849449, 0.849809, 0.848735, 0.852302, 0.848901, 0.852632, 0.855037, 0.852964, 0.855516, 0.854342, 0.856275, 0.854054, 0.854498, 0.855547, 0.857102, 0.857366, 0.854483, 0.858431, 0.857343, 0.85713, 0.858612, 0.858747, 0.863114, 0.855301, 0.861285, 0.859691, 0.861018, 0.858981, 0.860342, 0.86292, 0.860801, 0.862546, 0.863639, 0.865444, 0.86399, 0.867121, 0.863027, 0.864644, 0.865356, 0.86665, 0.869723, 0.868644, 0.867158, 0.868783, 0.869138, 0.867363, 0.868549, 0.868403, 0.872021, 0.86902, 0.871136, 0.871135, 0.871595, 0.872033, 0.874078, 0.872176, 0.872737, 0.873496, 0.874362, 0.874938, 0.873651, 0.875592, 0.875233, 0.875817, 0.876598, 0.8765, 0.879254, 0.876315, 0.879086, 0.878104, 0.880628, 0.879026, 0.87777, 0.878884, 0.878211, 0.880261, 0.884049, 0.880865, 0.883586, 0.881563, 0.881466, 0.881917, 0.882801, 0.881978, 0.881605, 0.883233, 0.885979, 0.884107, 0.888013, 0.888026, 0.884866, 0.888012, 0.886538, 0.88768, 0.88594, 0.887617, 0.889704, 0.886919, 0.889112, 0.888072, 0.887555, 0.888441, 0.88759, 0.889968, 0.890985, 0.892867, 0.891846, 0.890298, 0.894354, 0.892824, 0.893405, 0.894758, 0.891493, 0.8939, 0.89536, 0.89398, 0.895967, 0.893544, 0.894486, 0.899015, 0.896772, 0.896252, 0.89661, 0.898887, 0.895995, 0.896208, 0.899344, 0.897566, 0.899225, 0.901012, 0.900704, 0.900361, 0.899817, 0.9, 0.903274, 0.903332, 0.900928, 0.900833, 0.902394, 0.900702, 0.904742, 0.902321, 0.905184, 0.902272, 0.903774, 0.904058, 0.904046, 0.901263, 0.902586, 0.901957, 0.901908, 0.904185, 0.903761, 0.903228, 0.905493, 0.904391, 0.907128, 0.904073, 0.906693, 0.906328, 0.907036, 0.905814, 0.910803, 0.908175, 0.909548, 0.911198, 0.910489, 0.908823, 0.908927, 0.911247, 0.910801, 0.911816, 0.910977, 0.909577, 0.912044, 0.911443, 0.91224, 0.911992, 0.914543, 0.91263, 0.9139, 0.914336, 0.916107, 0.915303, 0.914322, 0.916193, 0.915587, 0.915587, 0.917605, 0.916586, 0.917671, 0.918516, 0.919648, 0.918935, 0.918935, 0.917618, 0.919225, 0.918027, 0.918248, 0.919356, 0.91984, 0.92181, 0.920366, 0.919745, 0.922457, 0.921458, 0.919332, 0.922048, 0.922137, 0.921255, 0.92281, 0.922011]}, "transform": {"time_h": [0.0, 0.01, 0.02, 0.03, 0.04, 0.05, 0.06, 0.07, 0.08, 0.09, 0.1, 0.11, 0.12, 0.13, 0.14, 0.15, 0.16, 0.17, 0.18, 0.19, 0.2, 0.21, 0.22, 0.23, 0.24, 0.25, 0.26, 0.27, 0.28, 0.29, 0.3, 0.31, 0.32, 0.33, 0.34, 0.35, 0.36, 0.37, 0.38, 0.39, 0.4, 0.41, 0.42, 0.43, 0.44, 0.45, 0.46, 0.47, 0.48, 0.49, 0.5, 0.51, 0.52, 0.53, 0.54, 0.55, 0.56, 0.57, 0.58, 0.59, 0.6, 0.61, 0.62, 0.63, 0.64, 0.65, 0.66, 0.67, 0.68, 0.69, 0.7, 0.71, 0.72, 0.73, 0.74, 0.75, 0.76, 0.77, 0.78, 0.79, 0.8, 0.81, 0.82, 0.83, 0.84, 0.85, 0.86, 0.87, 0.88, 0.89, 0.9, 0.91, 0.92, 0.93, 0.94, 0.95, 0.96, 0.97, 0.98, 0.99, 1.0, 1.01, 1.02, 1.03, 1.04, 1.05, 1.06, 1.07, 1.08, 1.09, 1.1, 1.11, 1.12, 1.13, 1.14, 1.15, 1.16, 1.17, 1.18, 1.19, 1.2, 1.21, 1.22, 1.23, 1.24, 1.25, 1.26, 1.27, 1.28, 1.29, 1.3, 1.31, 1.32, 1.33, 1.34, 1.35, 1.36, 1.37, 1.38, 1.39, 1.4, 1.41, 1.42, 1.43, 1.44, 1.45, 1.46, 1.47, 1.48, 1.49, 1.5, 1.51, 1.52, 1.53, 1.54, 1.55, 1.56, 1.57, 1.58, 1.59, 1.6, 1.61, 1.62, 1.63, 1.64, 1.65, 1.66, 1.67, 1.68, 1.69, 1.7, 1.71, 1.72, 1.73, 1.74, 1.75, 1.76, 1.77, 1.78, 1.79, 1.8, 1.81, 1.82, 1.83, 1.84, 1.85, 1.86, 1.87, 1.88, 1.89, 1.9, 1.91, 1.92, 1.93, 1.94, 1.95, 1.96, 1.97, 1.98, 1.99, 2.0, 2.01, 2.02, 2.03, 2.04, 2.05, 2.06, 2.07, 2.08, 2.09, 2.1, 2.11, 2.12, 2.13, 2.14, 2.15, 2.16, 2.17, 2.18, 2.19, 2.2, 2.21, 2.22, 2.23, 2.24, 2.25, 2.26, 2.27, 2.28, 2.29, 2.3, 2.31, 2.32, 2.33, 2.34, 2.35, 2.36, 2.37, 2.38, 2.39, 2.4, 2.41, 2.42, 2.43, 2.44, 2.45, 2.46, 2.47, 2.48, 2.49, 2.5, 2.51, 2.52, 2.53, 2.54, 2.55, 2.56, 2.57, 2.58, 2.59, 2.6, 2.61, 2.62, 2.63, 2.64, 2.65, 2.66, 2.67, 2.68, 2.69, 2.7, 2.71, 2.72, 2.73, 2.74, 2.75, 2.76, 2.77, 2.78, 2.79, 2.8, 2.81, 2.82, 2.83, 2.84, 2.85, 2.86, 2.87, 2.88, 2.89, 2.9, 2.91, 2.92, 2.93, 2.94, 2.95, 2.96, 2.97, 2.98, 2.99, 3.0, 3.01, 3.02, 3.03, 3.04, 3.05, 3.06, 3.07, 3.08, 3.09, 3.1, 3.11, 3.12, 3.13, 3.14, 3.15, 3.16, 3.17, 3.18, 3.19, 3.2, 3.21, 3.22, 3.23, 3.24, 3.25, 3.26, 3.27, 3.28, 3.29, 3.3, 3.31, 3.32, 3.33, 3.34, 3.35, 3.36, 3.37, 3.38, 3.39, 3.4, 3.41, 3.42, 3.43, 3.44, 3.45, 3.46, 3.47, 3.48, 3.49, 3.5, 3.51, 3.52, 3.53, 3.54, 3.55, 3.56, 3.57, 3.58, 3.59, 3.6, 3.61, 3.62, 3.63, 3.64, 3.65, 3.66, 3.67, 3.68, 3.69, 3.7, 3.71, 3.72, 3.73, 3.74, 3.75, 3.76, 3.77, 3.78, 3.79, 3.8, 3.81, 3.82, 3.83, 3.84, 3.85, 3.86, 3.87, 3.88, 3.89, 3.9, 3.91, 3.92, 3.93, 3.94, 3.95, 3.96, 3.97, 3.98, 3.99, 4.0, 4.01, 4.02, 4.03, 4.04, 4.05, 4.06, 4.07, 4.08, 4.09, 4.1, 4.11, 4.12, 4.13, 4.14, 4.15, 4.16, 4.17, 4.18, 4.19, 4.2, 4.21, 4.22, 4.23, 4.24, 4.25, 4.26, 4.27, 4.28, 4.29, 4.3, 4.31, 4.32, 4.33, 4.34, 4.35, 4.36, 4.37, 4.38, 4.39, 4.4, 4.41, 4.42, 4.43, 4.44, 4.45, 4.46, 4.47, 4.48, 4.49, 4.5, 4.51, 4.52, 4.53, 4.54, 4.55, 4.56, 4.57, 4.58, 4.59, 4.6, 4.61, 4.62, 4.63, 4.64, 4.65, 4.66, 4.67, 4.68, 4.69, 4.7, 4.71, 4.72, 4.73, 4.74, 4.75, 4.76, 4.77, 4.78, 4.79, 4.8, 4.81, 4.82, 4.83, 4.84, 4.85, 4.86, 4.87, 4.88, 4.89, 4.9, 4.91, 4.92, 4.93, 4.94, 4.95, 4.96, 4.97, 4.98, 4.99, 5.0, 5.01, 5.02, 5.03, 5.04, 5.05, 5.06, 5.07, 5.08, 5.09, 5.1, 5.11, 5.12, 5.13, 5.14, 5.15, 5.16, 5.17, 5.18, 5.19, 5.2, 5.21, 5.22, 5.23, 5.24, 5.25, 5.26, 5.27, 5.28, 5.29, 5.3, 5.31, 5.32, 5.33, 5.34, 5.35, 5.36, 5.37, 5.38, 5.39, 5.4, 5.41, 5.42, 5.43, 5.44, 5.45, 5.46, 5.47, 5.48, 5.49, 5.5, 5.51, 5.52, 5.53, 5.54, 5.55, 5.56, 5.57, 5.58, 5.59, 5.6, 5.61, 5.62, 5.63, 5.64, 5.65, 5.66, 5.67, 5.68, 5.69, 5.7, 5.71, 5.72, 5.73, 5.74, 5.75, 5.76, 5.77, 5.78, 5.79, 5.8, 5.81, 5.82, 5.83, 5.84, 5.85, 5.86, 5.87, 5.88, 5.89, 5.9, 5.91, 5.92, 5.93, 5.94, 5.95, 5.96, 5.97, 5.98, 5.99, 6.0, 6.01, 6.02, 6.03, 6.04, 6.05, 6.06, 6.07, 6.08, 6.09, 6.1, 6.11, 6.12, 6.13, 6.14, 6.15, 6.16, 6.17, 6.18, 6.19, 6.2, 6.21, 6.22, 6.23, 6.24, 6.25, 6.26, 6.27, 6.28, 6.29, 6.3, 6.31, 6.32, 6.33, 6.34, 6.35, 6.36, 6.37, 6.38, 6.39, 6.4, 6.41, 6.42, 6.43, 6.44, 6.45, 6.46, 6.47, 6.48, 6.49, 6.5, 6.51, 6.52, 6.53, 6.54, 6.55, 6.56, 6.57, 6.58, 6.59, 6.6, 6.61, 6.62, 6.63, 6.64, 6.65, 6.66, 6.67, 6.68, 6.69, 6.7, 6.71, 6.72, 6.73, 6.74, 6.75, 6.76, 6.77, 6.78, 6.79, 6.8, 6.81, 6.82, 6.83, 6.84, 6.85, 6.86, 6.87, 6.88, 6.89, 6.9, 6.91, 6.92, 6.93, 6.94, 6.95, 6.96, 6.97, 6.98, 6.99, 7.0, 7.01, 7.02, 7.03, 7.04, 7.05, 7.06, 7.07, 7.08, 7.09, 7.1, 7.11, 7.12, 7.13, 7.14, 7.15, 7.16, 7.17, 7.18, 7.19, 7.2, 7.21, 7.22, 7.23, 7.24, 7.25, 7.26, 7.27, 7.28, 7.29, 7.3, 7.31, 7.32, 7.33, 7.34, 7.35, 7.36, 7.37, 7.38, 7.39, 7.4, 7.41, 7.42, 7.43, 7.44, 7.45, 7.46, 7.47, 7.48, 7.49, 7.5, 7.51, 7.52, 7.53, 7.54, 7.55, 7.56, 7.57, 7.58, 7.59, 7.6, 7.61, 7.62, 7.63, 7.64, 7.65, 7.66, 7.67, 7.68, 7.69, 7.7, 7.71, 7.72, 7.73, 7.74, 7.75, 7.76, 7.77, 7.78, 7.79, 7.8, 7.81, 7.82, 7.83, 7.84, 7.85, 7.86, 7.87, 7.88, 7.89, 7.9, 7.91, 7.92, 7.93, 7.94, 7.95, 7.96, 7.97, 7.98, 7.99, 8.0], "D": [0.0, 2.968e-06, 2.33903e-05, 7.7767e-05, 0.0001815921, 0.0003493917, 0.0005947603, 0.0009303961, 0.0013681362, 0.001918989, 0.0025931673, 0.0034001194, 0.0043485597, 0.0054464979, 0.0067012678, 0.0081195549, 0.0097074235, 0.0114703422, 0.0134132096, 0.0155403781, 0.0178556781, 0.0203624404, 0.0230635188, 0.0259613108, 0.029057779, 0.0323544707, 0.0358525377, 0.0395527544, 0.0434555365, 0.0475609585, 0.0518687703, 0.0563784137, 0.0610890383, 0.0659995168, 0.0711084595, 0.0764142289, 0.0819149531, 0.0876085393, 0.0934926866, 0.0995648982, 0.1058224933, 0.1122626187, 0.1188822599, 0.1256782517, 0.1326472883, 0.1397859334, 0.1470906297, 0.154557708, 0.162183396, 0.1699638267, 0.1778950469, 0.1859730246, 0.1941936568, 0.2025527764, 0.2110461597, 0.2196695325, 0.2284185767, 0.2372889364, 0.246276224, 0.2553760253, 0.2645839052, 0.2738954129, 0.2833060866, 0.2928114584, 0.3024070587, 0.3120884202, 0.3218510826, 0.3316905959, 0.3416025243, 0.35158245, 0.361625976, 0.3717287298, 0.381886366, 0.3920945696, 0.4023490582, 0.412645585, 0.4229799409, 0.4333479572, 0.4437455072, 0.4541685086, 0.4646129253, 0.475074769, 0.4855501014, 0.4960350351, 0.5065257354, 0.5170184216, 0.5275093682, 0.5379949062, 0.5484714238, 0.5589353678, 0.5693832441, 0.5798116188, 0.5902171189, 0.6005964325, 0.61094631, 0.6212635642, 0.631545071, 0.6417877693, 0.651988662, 0.6621448155, 0.6722533606, 0.682311492, 0.6923164688, 0.7022656146, 0.7121563169, 0.7219860278, 0.7317522632, 0.7414526033, 0.7510846918, 0.7606462362, 0.7701350072, 0.7795488384, 0.7888856263, 0.7981433295, 0.8073199687, 0.8164136261, 0.8254224447, 0.8343446284, 0.8431784411, 0.8519222063, 0.8605743064, 0.8691331824, 0.8775973333, 0.8859653152, 0.8942357411, 0.90240728, 0.9104786561, 0.9184486489, 0.9263160915, 0.9340798707, 0.941738926, 0.9492922489, 0.9567388822, 0.9640779196, 0.9713085043, 0.978429829, 0.9854411346, 0.9923417099, 0.9991308905, 1.0058080583, 1.0123726406, 1.0188241093, 1.0251619806, 1.0313858135, 1.0374952096, 1.0434898122, 1.0493693055, 1.0551334138, 1.0607819008, 1.0663145689, 1.0717312584, 1.0770318467, 1.0822162477, 1.0872844107, 1.0922363202, 1.0970719948, 1.1017914863, 1.1063948794, 1.1108822909, 1.1152538686, 1.119509791, 1.1236502663, 1.1276755321, 1.1315858541, 1.1353815259, 1.1390628681, 1.1426302278, 1.1460839775, 1.149424515, 1.1526522623, 1.1557676651, 1.1587711923, 1.1616633351, 1.1644446064, 1.1671155405, 1.1696766919, 1.1721286354, 1.1744719647, 1.1767072927, 1.1788352499, 1.1808564849, 1.1827716628, 1.1845814653, 1.1862865901, 1.18788775, 1.1893856727, 1.1907810999, 1.1920747873, 1.1932675036, 1.1943600302, 1.1953531606, 1.1962477002, 1.1970444654, 1.1977442833, 1.1983479912, 1.1988564365, 1.1992704755, 1.1995909736, 1.1998188046, 1.1999548503, 1.2, 1.1999551503, 1.1998212044, 1.199599072, 1.1992896686, 1.1988939154, 1.1984127387, 1.1978470698, 1.1971978442, 1.1964660016, 1.1956524855, 1.1947582427, 1.1937842233, 1.19273138, 1.1916006677, 1.1903930438, 1.1891094673, 1.1877508988, 1.1863182998, 1.1848126331, 1.1832348621, 1.1815859502, 1.1798668614, 1.1780785591, 1.1762220065, 1.1742981662, 1.1723079997, 1.1702524674, 1.1681325283, 1.1659491401, 1.1637032581, 1.1613958361, 1.1590278254, 1.1566001748, 1.1541138306, 1.1515697361, 1.1489688319, 1.146312055, 1.1436003393, 1.140834615, 1.1380158086, 1.1351448428, 1.1322226363, 1.1292501035, 1.1262281544, 1.1231576949, 1.1200396259, 1.1168748438, 1.1136642399, 1.1104087009, 1.107109108, 1.1037663374, 1.1003812599, 1.096954741, 1.0934876403, 1.0899808122, 1.0864351052, 1.0828513618, 1.0792304188, 1.0755731069, 1.0718802509, 1.0681526693, 1.0643911744, 1.0605965721, 1.0567696622, 1.0529112379, 1.049022086, 1.0451029866, 1.0411547135, 1.0371780337, 1.0331737074, 1.0291424882, 1.0250851231, 1.0210023519, 1.0168949079, 1.0127635173, 1.0086088996, 1.0044317671, 1.0002328253, 0.9960127728, 0.991772301, 0.9875120943, 0.9832328303, 0.9789351792, 0.9746198043, 0.9702873618, 0.965938501, 0.9615738637, 0.957194085, 0.9527997927, 0.9483916075, 0.9439701432, 0.9395360062, 0.935089796, 0.9306321051, 0.9261635187, 0.9216846152, 0.9171959658, 0.9126981346, 0.9081916788, 0.9036771486, 0.8991550872, 0.8946260308, 0.8900905086, 0.8855490431, 0.8810021497, 0.8764503368, 0.8718941064, 0.8673339532, 0.8627703653, 0.8582038242, 0.8536348043, 0.8490637735, 0.8444911932, 0.8399175177, 0.8353431952, 0.8307686669, 0.8261943676, 0.8216207258, 0.8170481633, 0.8124770954, 0.8079079312, 0.8033410734, 0.7987769184, 0.7942158562, 0.7896582707, 0.7851045395, 0.7805550341, 0.77601012, 0.7714701564, 0.7669354966, 0.762406488, 0.7578834719, 0.7533667839, 0.7488567536, 0.7443537049, 0.7398579557, 0.7353698186, 0.7308896002, 0.7264176016, 0.7219541184, 0.7174994406, 0.7130538527, 0.7086176339, 0.7041910578, 0.6997743929, 0.6953679023, 0.6909718438, 0.6865864703, 0.6822120292, 0.677848763, 0.6734969091, 0.6691567, 0.6648283632, 0.6605121213, 0.6562081921, 0.6519167884, 0.6476381186, 0.6433723862, 0.63911979, 0.6348805243, 0.6306547788, 0.6264427388, 0.622244585, 0.6180604938, 0.6138906371, 0.6097351828, 0.6055942942, 0.6014681305, 0.5973568469, 0.5932605942, 0.5891795194, 0.5851137653, 0.5810634709, 0.577028771, 0.5730097969, 0.5690066756, 0.5650195309, 0.5610484823, 0.557093646, 0.5531551343, 0.549233056, 0.5453275165, 0.5414386175, 0.5375664573, 0.5337111308, 0.5298727294, 0.5260513414, 0.5222470517, 0.5184599419, 0.5146900905, 0.5109375728, 0.5072024611, 0.5034848245, 0.4997847292, 0.4961022382, 0.4924374118, 0.4887903074, 0.4851609793, 0.4815494793, 0.4779558563, 0.4743801564, 0.4708224231, 0.4672826973, 0.463761017, 0.4602574181, 0.4567719335, 0.453304594, 0.4498554277, 0.4464244604, 0.4430117154, 0.4396172138, 0.4362409744, 0.4328830136, 0.4295433457, 0.4262219828, 0.4229189347, 0.4196342093, 0.4163678123, 0.4131197473, 0.409890016, 0.406678618, 0.4034855511, 0.4003108112, 0.397154392, 0.3940162858, 0.3908964828, 0.3877949714, 0.3847117386, 0.3816467692, 0.3786000467, 0.3755715528, 0.3725612675, 0.3695691694, 0.3665952353, 0.3636394408, 0.3607017596, 0.3577821642, 0.3548806257, 0.3519971135, 0.3491315959, 0.3462840398, 0.3434544105, 0.3406426724, 0.3378487883, 0.3350727199, 0.3323144277, 0.329573871, 0.3268510078, 0.3241457951, 0.3214581887, 0.3187881433, 0.3161356127, 0.3135005494, 0.3108829051, 0.3082826303, 0.3056996747, 0.3031339869, 0.3005855148, 0.2980542051, 0.2955400039, 0.2930428562, 0.2905627063, 0.2880994976, 0.2856531729, 0.283223674, 0.280810942, 0.2784149173, 0.2760355395, 0.2736727478, 0.2713264803, 0.2689966748, 0.2666832682, 0.264386197, 0.2621053969, 0.2598408032, 0.2575923506, 0.2553599731, 0.2531436043, 0.2509431773, 0.2487586248, 0.2465898787, 0.2444368708, 0.2422995322, 0.2401777937, 0.2380715858, 0.2359808382, 0.2339054808, 0.2318454425, 0.2298006524, 0.227771039, 0.2257565304, 0.2237570546, 0.2217725392, 0.2198029114, 0.2178480985, 0.215908027, 0.2139826238, 0.212071815, 0.2101755268, 0.2082936851, 0.2064262157, 0.204573044, 0.2027340956, 0.2009092956, 0.1990985691, 0.197301841, 0.1955190363, 0.1937500796, 0.1919948955, 0.1902534087, 0.1885255435, 0.1868112243, 0.1851103755, 0.1834229214, 0.1817487862, 0.1800878942, 0.1784401694, 0.1768055362, 0.1751839186, 0.173575241, 0.1719794274, 0.1703964021, 0.1688260894, 0.1672684136, 0.165723299, 0.16419067, 0.1626704511, 0.1611625668, 0.1596669418, 0.1581835007, 0.1567121683, 0.1552528696, 0.1538055294, 0.1523700731, 0.1509464256, 0.1495345125, 0.1481342593, 0.1467455914, 0.1453684347, 0.1440027152, 0.1426483588, 0.1413052919, 0.1399734408, 0.1386527321, 0.1373430925, 0.136044449, 0.1347567287, 0.1334798589, 0.1322137671, 0.130958381, 0.1297136286, 0.1284794379, 0.1272557372, 0.1260424552, 0.1248395206, 0.1236468624, 0.1224644098, 0.1212920924, 0.1201298397, 0.1189775818, 0.1178352489, 0.1167027713, 0.1155800797, 0.1144671052, 0.1133637788, 0.1122700321, 0.1111857968, 0.1101110049, 0.1090455886, 0.1079894804, 0.1069426132, 0.10590492, 0.1048763342, 0.1038567894, 0.1028462196, 0.1018445589, 0.1008517418, 0.0998677032, 0.0988923781, 0.0979257019, 0.0969676101, 0.0960180389, 0.0950769245, 0.0941442033, 0.0932198123, 0.0923036887, 0.0913957698, 0.0904959936, 0.089604298, 0.0887206214, 0.0878449025, 0.0869770804, 0.0861170944, 0.0852648841, 0.0844203894, 0.0835835506, 0.0827543082, 0.0819326033, 0.0811183769, 0.0803115705, 0.0795121261, 0.0787199858, 0.077935092, 0.0771573876, 0.0763868156, 0.0756233195, 0.074866843, 0.0741173303, 0.0733747257, 0.0726389738, 0.0719100199, 0.0711878091, 0.0704722873, 0.0697634003, 0.0690610944, 0.0683653165, 0.0676760133, 0.0669931321, 0.0663166206, 0.0656464267, 0.0649824986, 0.0643247849, 0.0636732344, 0.0630277964, 0.0623884203, 0.0617550559, 0.0611276535, 0.0605061635, 0.0598905366, 0.059280724, 0.0586766771, 0.0580783475, 0.0574856874, 0.0568986491, 0.0563171853, 0.0557412488, 0.0551707931, 0.0546057717, 0.0540461385, 0.0534918478, 0.0529428541, 0.0523991121, 0.0518605771, 0.0513272045, 0.0507989501, 0.0502757698, 0.0497576201, 0.0492444576, 0.0487362393, 0.0482329224, 0.0477344645, 0.0472408234, 0.0467519574, 0.0462678248, 0.0457883844, 0.0453135952, 0.0448434166, 0.0443778082, 0.0439167299, 0.043460142, 0.0430080048, 0.0425602791, 0.0421169262, 0.0416779072, 0.0412431838, 0.040812718, 0.0403864719, 0.0399644079, 0.039546489, 0.039132678, 0.0387229384, 0.0383172336, 0.0379155275, 0.0375177843, 0.0371239684, 0.0367340444, 0.0363479772, 0.0359657321, 0.0355872746, 0.0352125703, 0.0348415853, 0.0344742859, 0.0341106385, 0.0337506099, 0.0333941672, 0.0330412777, 0.0326919089, 0.0323460286, 0.0320036049, 0.0316646061, 0.0313290007, 0.0309967575, 0.0306678457, 0.0303422344, 0.0300198933, 0.0297007921, 0.0293849009, 0.0290721899, 0.0287626296, 0.0284561908, 0.0281528445, 0.0278525618, 0.0275553142, 0.0272610735, 0.0269698114, 0.0266815002, 0.0263961122, 0.02611362, 0.0258339964, 0.0255572145, 0.0252832476, 0.025012069, 0.0247436526, 0.0244779723, 0.0242150021, 0.0239547165, 0.0236970901, 0.0234420975, 0.0231897138, 0.0229399142, 0.0226926742, 0.0224479692, 0.0222057753, 0.0219660683, 0.0217288246, 0.0214940205, 0.0212616327, 0.0210316381, 0.0208040137, 0.0205787366, 0.0203557844, 0.0201351346, 0.019916765, 0.0197006538, 0.019486779, 0.019275119, 0.0190656524, 0.018858358, 0.0186532147, 0.0184502016, 0.018249298, 0.0180504834, 0.0178537375, 0.0176590401, 0.0174663713, 0.0172757112, 0.0170870402, 0.0169003388, 0.0167155878, 0.0165327681, 0.0163518606, 0.0161728467, 0.0159957077, 0.0158204252, 0.0156469809, 0.0154753566, 0.0153055345, 0.0151374967, 0.0149712256, 0.0148067038, 0.0146439138, 0.0144828386, 0.0143234611, 0.0141657645, 0.0140097321, 0.0138553473, 0.0137025938, 0.0135514552, 0.0134019155, 0.0132539587, 0.0131075691, 0.0129627309, 0.0128194286, 0.0126776469, 0.0125373705, 0.0123985843, 0.0122612733, 0.0121254228, 0.0119910181, 0.0118580445, 0.0117264877, 0.0115963334, 0.0114675674, 0.0113401758, 0.0112141446, 0.0110894601, 0.0109661086, 0.0108440767, 0.010723351, 0.0106039182, 0.0104857652, 0.010368879, 0.0102532466, 0.0101388555, 0.0100256928, 0.0099137461, 0.0098030031, 0.0096934512, 0.0095850786, 0.009477873], "E": [0.405575, 0.450521, 0.439227, 0.427439, 0.401216, 0.46541, 0.434979, 0.455611, 0.464435, 0.456402, 0.446794, 0.464167, 0.461667, 0.463569, 0.418923, 0.444519, 0.439285, 0.512066, 0.44062, 0.479682, 0.421586, 0.447948, 0.428072, 0.461431, 0.494742, 0.441602, 0.476248, 0.477025, 0.47548, 0.459346, 0.462026, 0.469159, 0.47196, 0.472382, 0.48632, 0.469759, 0.484826, 0.48164, 0.454834, 0.460726, 0.492212, 0.492432, 0.506322, 0.441957, 0.500963, 0.442521, 0.491778, 0.445467, 0.524269, 0.482397, 0.545378, 0.508446, 0.523505, 0.520548, 0.547507, 0.513478, 0.493788, 0.495492, 0.503487, 0.525538, 0.534183, 0.524697, 0.535736, 0.566463, 0.502826, 0.529997, 0.564398, 0.525422, 0.570389, 0.544049, 0.543776, 0.55455, 0.564839, 0.557535, 0.597749, 0.563147, 0.597305, 0.598388, 0.5754, 0.610408, 0.622457, 0.60175, 0.609426, 0.560015, 0.609927, 0.623439, 0.641086, 0.598515, 0.614824, 0.637695, 0.602839, 0.632448, 0.564195, 0.637754, 0.596006, 0.598319, 0.627952, 0.627293, 0.640152, 0.592584, 0.624527, 0.685544, 0.651856, 0.633609, 0.672041, 0.655944, 0.679175, 0.659395, 0.707195, 0.675774, 0.681612, 0.64096, 0.661151, 0.703788, 0.66854, 0.707169, 0.655963, 0.690917, 0.712983, 0.700258, 0.693206, 0.721129, 0.741658, 0.717879, 0.742111, 0.733059, 0.704418, 0.723182, 0.750207, 0.69842, 0.701492, 0.715437, 0.682369, 0.727817, 0.748757, 0.736835, 0.705214, 0.694358, 0.745749, 0.757363, 0.768839, 0.741601, 0.713791, 0.754626, 0.734656, 0.719207, 0.779348, 0.722266, 0.77745, 0.739085, 0.770102, 0.77677, 0.779015, 0.756208, 0.783003, 0.734554, 0.729284, 0.751927, 0.785592, 0.782633, 0.781691, 0.784204, 0.758262, 0.791947, 0.760166, 0.754447, 0.787705, 0.766703, 0.755378, 0.781504, 0.797773, 0.781322, 0.768721, 0.788115, 0.815622, 0.772809, 0.798873, 0.776193, 0.785921, 0.806184, 0.786682, 0.801609, 0.79403, 0.796515, 0.807825, 0.827453, 0.769343, 0.779507, 0.804428, 0.859544, 0.811264, 0.83482, 0.770761, 0.794866, 0.836237, 0.832287, 0.80138, 0.804771, 0.806001, 0.820877, 0.814411, 0.806042, 0.820737, 0.864533, 0.781087, 0.789534, 0.789485, 0.79917, 0.789775, 0.754485, 0.809167, 0.785716, 0.762469, 0.772312, 0.773801, 0.769899, 0.787689, 0.819967, 0.803336, 0.78766, 0.825398, 0.782775, 0.784607, 0.776684, 0.788569, 0.803792, 0.761313, 0.776266, 0.834599, 0.769155, 0.795637, 0.785043, 0.787908, 0.782882, 0.772911, 0.789552, 0.78827, 0.802779, 0.832183, 0.776443, 0.813899, 0.814152, 0.785168, 0.756549, 0.781962, 0.747651, 0.773315, 0.759303, 0.79025, 0.777011, 0.733173, 0.781173, 0.789345, 0.728518, 0.785693, 0.723674, 0.754069, 0.764061, 0.768444, 0.760936, 0.788579, 0.778155, 0.762815, 0.77088, 0.73644, 0.75617, 0.749206, 0.783069, 0.748919, 0.766313, 0.743248, 0.723224, 0.759237, 0.758266, 0.741193, 0.694319, 0.724471, 0.768897, 0.757417, 0.755348, 0.751324, 0.739973, 0.74051, 0.761316, 0.715077, 0.758885, 0.742828, 0.708869, 0.733519, 0.738161, 0.725306, 0.712499, 0.697606, 0.701615, 0.7138, 0.702369, 0.74062, 0.721081, 0.68331, 0.725009, 0.720534, 0.714895, 0.719474, 0.725019, 0.722779, 0.725866, 0.722403, 0.71876, 0.713207, 0.694445, 0.707456, 0.705404, 0.667578, 0.676138, 0.665361, 0.67851, 0.707593, 0.696486, 0.673204, 0.687454, 0.686207, 0.676848, 0.668036, 0.679102, 0.692502, 0.681114, 0.690487, 0.709897, 0.693415, 0.694434, 0.660916, 0.705184, 0.671612, 0.675874, 0.620983, 0.653513, 0.669291, 0.646836, 0.654964, 0.650527, 0.690733, 0.649676, 0.638601, 0.664444, 0.637643, 0.67545, 0.632551, 0.656443, 0.633941, 0.652078, 0.665553, 0.637025, 0.674528, 0.674152, 0.640961, 0.647154, 0.62468, 0.675723, 0.675991, 0.650614, 0.664642, 0.640172, 0.626678, 0.654501, 0.595306, 0.615521, 0.626772, 0.586993, 0.639738, 0.638737, 0.618198, 0.619261, 0.605974, 0.619733, 0.608832, 0.631806, 0.612022, 0.632634, 0.560824, 0.587597, 0.608114, 0.670876, 0.582336, 0.651055, 0.615806, 0.632389, 0.593805, 0.61309, 0.604278, 0.590442, 0.591674, 0.599271, 0.60834, 0.605721, 0.577864, 0.602201, 0.591245, 0.557496, 0.620501, 0.597944, 0.598289, 0.602915, 0.583691, 0.569966, 0.587307, 0.575218, 0.598969, 0.568384, 0.601829, 0.549769, 0.590497, 0.577423, 0.592408, 0.593122, 0.573911, 0.588133, 0.57901, 0.613574, 0.563223, 0.569244, 0.582461, 0.586663, 0.545728, 0.537247, 0.590701, 0.55558, 0.551888, 0.560437, 0.545829, 0.541334, 0.574488, 0.549443, 0.559467, 0.530925, 0.548636, 0.565239, 0.528777, 0.548643, 0.549624, 0.565274, 0.552998, 0.536655, 0.571368, 0.539032, 0.516085, 0.547821, 0.540451, 0.555198, 0.541452, 0.55201, 0.512727, 0.534983, 0.548057, 0.527663, 0.558727, 0.509425, 0.544254, 0.531178, 0.526869, 0.543706, 0.531577, 0.529318, 0.56111, 0.564681, 0.516241, 0.528687, 0.511683, 0.508458, 0.541849, 0.530287, 0.541867, 0.51127, 0.543951, 0.527944, 0.506363, 0.514718, 0.561412, 0.53315, 0.544622, 0.521565, 0.497309, 0.545945, 0.532566, 0.531322, 0.524304, 0.527178, 0.529048, 0.483666, 0.551918, 0.535799, 0.503377, 0.517298, 0.484123, 0.515428, 0.522038, 0.535718, 0.513977, 0.508403, 0.505776, 0.512057, 0.505062, 0.52185, 0.516232, 0.513779, 0.511683, 0.546337, 0.486041, 0.527197, 0.481068, 0.570307, 0.497572, 0.50508, 0.50975, 0.515246, 0.483341, 0.536598, 0.500219, 0.512067, 0.540516, 0.486072, 0.527107, 0.535652, 0.512242, 0.490485, 0.543789, 0.525672, 0.490115, 0.499079, 0.516924, 0.51065, 0.485093, 0.492274, 0.521499, 0.509952, 0.451625, 0.547314, 0.501531, 0.489185, 0.492388, 0.507996, 0.477293, 0.492585, 0.510404, 0.510861, 0.479679, 0.49681, 0.507718, 0.487792, 0.529992, 0.514169, 0.475176, 0.483299, 0.472129, 0.493742, 0.49291, 0.489935, 0.489613, 0.492601, 0.464077, 0.529231, 0.474869, 0.493175, 0.460082, 0.500305, 0.476763, 0.485324, 0.500046, 0.480846, 0.506559, 0.499322, 0.499134, 0.492138, 0.510823, 0.474538, 0.500619, 0.451862, 0.510289, 0.500021, 0.461699, 0.485721, 0.494504, 0.488509, 0.472662, 0.47689, 0.49482, 0.473698, 0.48104, 0.491418, 0.463513, 0.470091, 0.432674, 0.458834, 0.432947, 0.484435, 0.500309, 0.461582, 0.464571, 0.430238, 0.482819, 0.461184, 0.461923, 0.475149, 0.461501, 0.480607, 0.475028, 0.471439, 0.489877, 0.472414, 0.444441, 0.494718, 0.485315, 0.477353, 0.45148, 0.455546, 0.471795, 0.482095, 0.44087, 0.513922, 0.457149, 0.479816, 0.473794, 0.501121, 0.455207, 0.450742, 0.458132, 0.438834, 0.49867, 0.487006, 0.466456, 0.45639, 0.494616, 0.491177, 0.450759, 0.480388, 0.470004, 0.448107, 0.466653, 0.468646, 0.486364, 0.475555, 0.437359, 0.452093, 0.469354, 0.438301, 0.486558, 0.449316, 0.44805, 0.458416, 0.444063, 0.446586, 0.50236, 0.472229, 0.478422, 0.450996, 0.449959, 0.438103, 0.455944, 0.477741, 0.489921, 0.432325, 0.418057, 0.480268, 0.449, 0.470401, 0.475648, 0.48514, 0.457456, 0.464815, 0.442687, 0.443547, 0.456469, 0.430029, 0.423816, 0.453384, 0.480098, 0.470609, 0.493135, 0.451522, 0.464173, 0.479599, 0.480892, 0.444902, 0.461024, 0.461565, 0.445725, 0.455556, 0.448939, 0.441369, 0.460756, 0.451593, 0.475948, 0.466437, 0.464116, 0.463178, 0.444984, 0.46929, 0.500746, 0.439059, 0.460424, 0.487415, 0.489363, 0.472079, 0.499363, 0.453827, 0.443704, 0.479799, 0.468457, 0.45995, 0.432217, 0.468833, 0.479336, 0.425104, 0.471823, 0.45477, 0.474324, 0.473128, 0.437398, 0.480233, 0.444503, 0.467418, 0.454962, 0.468239, 0.453255, 0.432137, 0.441556, 0.4764, 0.433204, 0.424546, 0.443316, 0.452102, 0.497612, 0.430372, 0.439497, 0.465619, 0.469765, 0.439529, 0.461771, 0.466475, 0.444587, 0.44109, 0.465822, 0.440693, 0.432501, 0.439158, 0.44789, 0.463499, 0.456549, 0.461648, 0.495835, 0.491724, 0.453093, 0.457385, 0.47743, 0.431557, 0.463071, 0.492295, 0.45849, 0.429721, 0.42043, 0.432248, 0.454648, 0.438936, 0.441805, 0.437683, 0.44226, 0.464637, 0.426123, 0.430587, 0.442346, 0.456078, 0.467911, 0.437378, 0.434125, 0.45667, 0.456635, 0.447799, 0.459123, 0.466181, 0.450747, 0.444397, 0.440983, 0.458339, 0.443446, 0.469191, 0.451288, 0.444285, 0.431204, 0.431341, 0.450833, 0.452677, 0.459926, 0.447412, 0.465714, 0.425066, 0.454441, 0.481817, 0.4782, 0.489949, 0.483803, 0.470681, 0.451397], "C": [0.758782, 0.746268, 0.775349, 0.752413, 0.726223, 0.764535, 0.764382, 0.74562, 0.739765, 0.765855, 0.791136, 0.703942, 0.765919, 0.752297, 0.752936, 0.74469, 0.74006, 0.771842, 0.759097, 0.763798, 0.746423, 0.768513, 0.714424, 0.769767, 0.715232, 0.756779, 0.740667, 0.752127, 0.764901, 0.731786, 0.715842, 0.726684, 0.731939, 0.726722, 0.711725, 0.731853, 0.7334, 0.712028, 0.747393, 0.745064, 0.725283, 0.712185, 0.730048, 0.72471, 0.697592, 0.695793, 0.704415, 0.715887, 0.689628, 0.717657, 0.719669, 0.702623, 0.695843, 0.717497, 0.709078, 0.66932, 0.692015, 0.684306, 0.697112, 0.698979, 0.648548, 0.718912, 0.627095, 0.657165, 0.714506, 0.674505, 0.695506, 0.650641, 0.645836, 0.663936, 0.62269, 0.638288, 0.656735, 0.633025, 0.654472, 0.624001, 0.649748, 0.656093, 0.601822, 0.622142, 0.606121, 0.62136, 0.593039, 0.629291, 0.612224, 0.599225, 0.601903, 0.607234, 0.553249, 0.582401, 0.565804, 0.587258, 0.590358, 0.617086, 0.578411, 0.549465, 0.597264, 0.564032, 0.574032, 0.596371, 0.546851, 0.538555, 0.565833, 0.565862, 0.541009, 0.518912, 0.534156, 0.576035, 0.530982, 0.533222, 0.51699, 0.551561, 0.510296, 0.512488, 0.548837, 0.489734, 0.526148, 0.529019, 0.544869, 0.502229, 0.496832, 0.505902, 0.533875, 0.524938, 0.488814, 0.497923, 0.476871, 0.465041, 0.538215, 0.479074, 0.498005, 0.493598, 0.510395, 0.496947, 0.517546, 0.456839, 0.457888, 0.444787, 0.453708, 0.456945, 0.429587, 0.432432, 0.470795, 0.458693, 0.481769, 0.427645, 0.461517, 0.43571, 0.462789, 0.409711, 0.486408, 0.446545, 0.491721, 0.461297, 0.472401, 0.469607, 0.454429, 0.44724, 0.432304, 0.45958, 0.414934, 0.418505, 0.444569, 0.43209, 0.426773, 0.430677, 0.447248, 0.415463, 0.455412, 0.424164, 0.436984, 0.452964, 0.423267, 0.446974, 0.436219, 0.416913, 0.439776, 0.44364, 0.439701, 0.472399, 0.455978, 0.433025, 0.410215, 0.406986, 0.418892, 0.399784, 0.407645, 0.414588, 0.410649, 0.432269, 0.418413, 0.412389, 0.450082, 0.446632, 0.400604, 0.421281, 0.402875, 0.382771, 0.425942, 0.414622, 0.449776, 0.419998, 0.432084, 0.425282, 0.416457, 0.422291, 0.41876, 0.418004, 0.427403, 0.429759, 0.420229, 0.399124, 0.426928, 0.418906, 0.424629, 0.464234, 0.422521, 0.418128, 0.443827, 0.448414, 0.438196, 0.435298, 0.453381, 0.432101, 0.427182, 0.459464, 0.400335, 0.421254, 0.434389, 0.426773, 0.407915, 0.42769, 0.454158, 0.406581, 0.367127, 0.441878, 0.438216, 0.42286, 0.408829, 0.433647, 0.431688, 0.467833, 0.434631, 0.441033, 0.445581, 0.453523, 0.452793, 0.458589, 0.453459, 0.467765, 0.472073, 0.46152, 0.440893, 0.460504, 0.447628, 0.502073, 0.431018, 0.489822, 0.484088, 0.462272, 0.494439, 0.501625, 0.474915, 0.518367, 0.490817, 0.43664, 0.451029, 0.485326, 0.473738, 0.490136, 0.474962, 0.467351, 0.496711, 0.497457, 0.494029, 0.484281, 0.514536, 0.496242, 0.49607, 0.561042, 0.444072, 0.467114, 0.446606, 0.5003, 0.457673, 0.497142, 0.534006, 0.526764, 0.494372, 0.493656, 0.507705, 0.529673, 0.515511, 0.528074, 0.53817, 0.498373, 0.531517, 0.536212, 0.513526, 0.549322, 0.52387, 0.533658, 0.527191, 0.539559, 0.517017, 0.508601, 0.528376, 0.520086, 0.52378, 0.542695, 0.556543, 0.546675, 0.516209, 0.543215, 0.565005, 0.551783, 0.546752, 0.542483, 0.569741, 0.540797, 0.542816, 0.564439, 0.581821, 0.529948, 0.565849, 0.583309, 0.542622, 0.55037, 0.571555, 0.559465, 0.541567, 0.541132, 0.558918, 0.568315, 0.57449, 0.561361, 0.545783, 0.558071, 0.591495, 0.577618, 0.553381, 0.588818, 0.567813, 0.590195, 0.581381, 0.572921, 0.608661, 0.599355, 0.623728, 0.585879, 0.584432, 0.614589, 0.60139, 0.595975, 0.611534, 0.58176, 0.621896, 0.645615, 0.594519, 0.579417, 0.583852, 0.623411, 0.590502, 0.64045, 0.610901, 0.639298, 0.603351, 0.621053, 0.63893, 0.626948, 0.638377, 0.612171, 0.660494, 0.594949, 0.655595, 0.617895, 0.65595, 0.672438, 0.620118, 0.625298, 0.633919, 0.606963, 0.607445, 0.65818, 0.621905, 0.643865, 0.651946, 0.633438, 0.642196, 0.641336, 0.639508, 0.635835, 0.655904, 0.662539, 0.663625, 0.639744, 0.634458, 0.639564, 0.662554, 0.654944, 0.649966, 0.660719, 0.672638, 0.664823, 0.652455, 0.655969, 0.669844, 0.692869, 0.671637, 0.649584, 0.640273, 0.660812, 0.688997, 0.626339, 0.697484, 0.68068, 0.695422, 0.667149, 0.67349, 0.68203, 0.658311, 0.702788, 0.675408, 0.712665, 0.715598, 0.664942, 0.680039, 0.680564, 0.693738, 0.672048, 0.677737, 0.688873, 0.67189, 0.687193, 0.716234, 0.687558, 0.677294, 0.730373, 0.696312, 0.70132, 0.711395, 0.703412, 0.679098, 0.678101, 0.716333, 0.742544, 0.681644, 0.744085, 0.698857, 0.731716, 0.701955, 0.707507, 0.688755, 0.702425, 0.731626, 0.731099, 0.712233, 0.704004, 0.694073, 0.73085, 0.729628, 0.732028, 0.716221, 0.74891, 0.703921, 0.706153, 0.692737, 0.725292, 0.728898, 0.71845, 0.728445, 0.760511, 0.760413, 0.744296, 0.700893, 0.725381, 0.722819, 0.738144, 0.740117, 0.731867, 0.726022, 0.703115, 0.728335, 0.749639, 0.738341, 0.765333, 0.737683, 0.729751, 0.730311, 0.715122, 0.755264, 0.718202, 0.779138, 0.731634, 0.736629, 0.737216, 0.758209, 0.767808, 0.763578, 0.785683, 0.734991, 0.771252, 0.777607, 0.744917, 0.762525, 0.77004, 0.70786, 0.753396, 0.758594, 0.74572, 0.731836, 0.738313, 0.766243, 0.763319, 0.77045, 0.757319, 0.757611, 0.761397, 0.781791, 0.765493, 0.789795, 0.725922, 0.760439, 0.817946, 0.751885, 0.737644, 0.752577, 0.757042, 0.771923, 0.778803, 0.740471, 0.754613, 0.790452, 0.762263, 0.733642, 0.78759, 0.756452, 0.784537, 0.781199, 0.761753, 0.757587, 0.756847, 0.771482, 0.73408, 0.765178, 0.767859, 0.777834, 0.778188, 0.769431, 0.79548, 0.803043, 0.782132, 0.783068, 0.764987, 0.788906, 0.786125, 0.819172, 0.77269, 0.784334, 0.778097, 0.766861, 0.786803, 0.784168, 0.827439, 0.736354, 0.826659, 0.779695, 0.785643, 0.764442, 0.776523, 0.766828, 0.811294, 0.809214, 0.794061, 0.795518, 0.785939, 0.789761, 0.791908, 0.822362, 0.796652, 0.809896, 0.802679, 0.784145, 0.798029, 0.784204, 0.773096, 0.799111, 0.802901, 0.793373, 0.76481, 0.83284, 0.773384, 0.771452, 0.781748, 0.781952, 0.812521, 0.832702, 0.800521, 0.797245, 0.821965, 0.793752, 0.806326, 0.804005, 0.778548, 0.791608, 0.834135, 0.764647, 0.81337, 0.825592, 0.817805, 0.786417, 0.82488, 0.825613, 0.80167, 0.796667, 0.817367, 0.797426, 0.792604, 0.81851, 0.814402, 0.789147, 0.796871, 0.816576, 0.780442, 0.806441, 0.801405, 0.804088, 0.838546, 0.824198, 0.809843, 0.797799, 0.814037, 0.826058, 0.829448, 0.82085, 0.786323, 0.8237, 0.838828, 0.844987, 0.836511, 0.819257, 0.812275, 0.81436, 0.854077, 0.800812, 0.807271, 0.802581, 0.79732, 0.807848, 0.816734, 0.791206, 0.812573, 0.819897, 0.792234, 0.822969, 0.82257, 0.839981, 0.822487, 0.811903, 0.814628, 0.83334, 0.839001, 0.819966, 0.811539, 0.822084, 0.787646, 0.800691, 0.831345, 0.855607, 0.834494, 0.841879, 0.864986, 0.839491, 0.851851, 0.828131, 0.838964, 0.829447, 0.823748, 0.808072, 0.863398, 0.873737, 0.824048, 0.785003, 0.812342, 0.82956, 0.857319, 0.82674, 0.829464, 0.848566, 0.815832, 0.830171, 0.829525, 0.859105, 0.835386, 0.840929, 0.816209, 0.819892, 0.814076, 0.811795, 0.840278, 0.843441, 0.800021, 0.856723, 0.803808, 0.84313, 0.829592, 0.842944, 0.817529, 0.847032, 0.8421, 0.84094, 0.829734, 0.830004, 0.818673, 0.791036, 0.815211, 0.854558, 0.854007, 0.814916, 0.809207, 0.808919, 0.835033, 0.791564, 0.861813, 0.820797, 0.825077, 0.837062, 0.878531, 0.858017, 0.840034, 0.854643, 0.867927, 0.818946, 0.845219, 0.843773, 0.848577, 0.837736, 0.830132, 0.805454, 0.832643, 0.843804, 0.824262, 0.854016, 0.851803, 0.84328, 0.82419, 0.822901, 0.858352, 0.810714, 0.842951, 0.833543, 0.830275, 0.849604, 0.856852, 0.80795, 0.801354, 0.851172, 0.849428, 0.831792, 0.792797, 0.849656, 0.853547, 0.828543, 0.876267, 0.844185, 0.810898, 0.872243, 0.805042, 0.837023, 0.837298, 0.833599, 0.885783, 0.835797, 0.882275, 0.853346, 0.79851, 0.829121, 0.856442, 0.819566, 0.808934, 0.87224, 0.851809, 0.808597, 0.818244, 0.881301, 0.832677, 0.843362, 0.826909, 0.838947, 0.838298, 0.833845, 0.83951, 0.878752, 0.86154, 0.851051, 0.846182, 0.92769, 0.860835, 0.86424, 0.857066, 0.862452], "H_e": [0.0, 0.000806, 0.00114, 0.001168, 0.001057, 0.001585, 0.001955, 0.001634, 0.001905, 0.002077, 0.002337, 0.002136, 0.002717, 0.00298, 0.003215, 0.003574, 0.003747, 0.003849, 0.004515, 0.005318, 0.006306, 0.007263, 0.007573, 0.008138, 0.00869, 0.009489, 0.009865, 0.009937, 0.010031, 0.01034, 0.010781, 0.011361, 0.011596, 0.011908, 0.012768, 0.013633, 0.014196, 0.014853, 0.015951, 0.016683, 0.017396, 0.01854, 0.019385, 0.020166, 0.020946, 0.022164, 0.02337, 0.024801, 0.025607, 0.026574, 0.028251, 0.029348, 0.030442, 0.032117, 0.033534, 0.034952, 0.036021, 0.038138, 0.039762, 0.041246, 0.042636, 0.044406, 0.046822, 0.048673, 0.050005, 0.051802, 0.054052, 0.056326, 0.058725, 0.060892, 0.063569, 0.065964, 0.06873, 0.0715, 0.074149, 0.077314, 0.080038, 0.082692, 0.086182, 0.089839, 0.093645, 0.096775, 0.100237, 0.103463, 0.107494, 0.111152, 0.114245, 0.118146, 0.121961, 0.125712, 0.129506, 0.133229, 0.137067, 0.141502, 0.146079, 0.150778, 0.155604, 0.160471, 0.165158, 0.169728, 0.175109, 0.179675, 0.184556, 0.189652, 0.194743, 0.200595, 0.205849, 0.211791, 0.217417, 0.222883, 0.2279, 0.233063, 0.239022, 0.244548, 0.249452, 0.255576, 0.260987, 0.266834, 0.272691, 0.278472, 0.284428, 0.291086, 0.296739, 0.30268, 0.30872, 0.315137, 0.321245, 0.327633, 0.333577, 0.340089, 0.346838, 0.353804, 0.36052, 0.367257, 0.373835, 0.380772, 0.387634, 0.395395, 0.402061, 0.409062, 0.416071, 0.423338, 0.430788, 0.438145, 0.445346, 0.452479, 0.460287, 0.467828, 0.475115, 0.482536, 0.490114, 0.497818, 0.505433, 0.513006, 0.520658, 0.528176, 0.53621, 0.543696, 0.551371, 0.558801, 0.56649, 0.57493, 0.583005, 0.591115, 0.598668, 0.606448, 0.614277, 0.62246, 0.630439, 0.638569, 0.646128, 0.654252, 0.662602, 0.670796, 0.679366, 0.687215, 0.695445, 0.703997, 0.712264, 0.7203, 0.728941, 0.737301, 0.74585, 0.754554, 0.762669, 0.770827, 0.779179, 0.787303, 0.795834, 0.804113, 0.812059, 0.820005, 0.828332, 0.836638, 0.845245, 0.853686, 0.861613, 0.86998, 0.878, 0.886693, 0.894959, 0.903148, 0.893786, 0.884164, 0.874966, 0.865707, 0.856753, 0.847373, 0.838155, 0.829429, 0.82039, 0.811872, 0.802726, 0.794253, 0.785502, 0.777006, 0.768009, 0.759366, 0.750694, 0.741645, 0.732871, 0.724458, 0.716175, 0.708288, 0.700185, 0.691758, 0.682918, 0.67465, 0.666439, 0.658548, 0.651084, 0.643216, 0.635642, 0.628013, 0.619795, 0.612167, 0.603891, 0.596547, 0.588586, 0.580415, 0.572369, 0.564605, 0.557173, 0.550051, 0.542409, 0.535108, 0.528141, 0.521142, 0.514116, 0.50692, 0.499779, 0.49254, 0.485514, 0.478647, 0.471472, 0.464968, 0.458333, 0.451858, 0.445063, 0.438707, 0.431807, 0.425175, 0.417681, 0.411531, 0.405281, 0.399186, 0.392576, 0.386326, 0.379971, 0.373701, 0.366955, 0.361146, 0.354686, 0.347632, 0.341417, 0.3356, 0.329678, 0.324335, 0.318662, 0.312802, 0.30751, 0.301791, 0.296111, 0.290293, 0.284148, 0.279022, 0.272913, 0.267492, 0.261614, 0.256347, 0.250753, 0.245117, 0.239742, 0.234592, 0.229441, 0.224428, 0.219331, 0.214461, 0.209498, 0.204534, 0.199378, 0.193864, 0.189455, 0.184836, 0.179548, 0.17521, 0.170138, 0.164952, 0.16051, 0.156002, 0.151189, 0.146704, 0.142324, 0.13754, 0.132605, 0.128121, 0.12383, 0.119183, 0.115107, 0.11061, 0.106503, 0.102096, 0.097527, 0.093647, 0.089794, 0.085499, 0.081014, 0.077458, 0.07319, 0.069109, 0.065121, 0.06201, 0.057642, 0.053517, 0.049588, 0.045485, 0.041182, 0.03723, 0.033085, 0.028725, 0.025214, 0.02168, 0.017743, 0.01405, 0.009887, 0.006343, 0.002198, -0.001457, -0.005109, -0.009009, -0.012646, -0.015794, -0.01922, -0.023226, -0.026189, -0.029553, -0.033662, -0.037498, -0.040654, -0.043867, -0.047224, -0.050271, -0.053962, -0.05714, -0.060521, -0.063428, -0.06682, -0.069632, -0.072809, -0.076465, -0.07945, -0.081918, -0.085195, -0.088478, -0.091468, -0.094634, -0.097651, -0.100335, -0.103781, -0.106576, -0.109713, -0.11235, -0.115233, -0.117392, -0.120458, -0.123034, -0.126005, -0.12901, -0.131796, -0.134351, -0.136453, -0.139066, -0.141995, -0.144391, -0.147235, -0.150408, -0.152883, -0.15502, -0.157107, -0.159639, -0.162408, -0.164666, -0.166902, -0.16971, -0.171744, -0.174171, -0.176795, -0.178964, -0.181176, -0.183444, -0.185005, -0.187612, -0.189649, -0.191919, -0.194086, -0.196543, -0.199342, -0.202202, -0.204587, -0.20707, -0.209917, -0.212146, -0.214507, -0.216521, -0.218665, -0.220938, -0.223093, -0.22514, -0.227617, -0.229544, -0.231661, -0.234016, -0.236083, -0.237737, -0.239546, -0.24131, -0.243077, -0.244395, -0.246046, -0.247269, -0.249085, -0.250162, -0.251673, -0.253271, -0.254625, -0.256148, -0.257637, -0.259037, -0.260683, -0.261992, -0.263616, -0.265212, -0.266962, -0.268345, -0.269699, -0.271684, -0.27336, -0.275206, -0.276363, -0.277438, -0.278921, -0.280618, -0.281978, -0.283114, -0.28472, -0.285945, -0.287622, -0.289348, -0.29063, -0.292071, -0.293395, -0.295549, -0.296556, -0.297727, -0.2986, -0.299795, -0.300788, -0.303098, -0.304487, -0.305884, -0.307683, -0.308852, -0.310198, -0.311477, -0.312364, -0.313842, -0.315407, -0.316846, -0.318036, -0.319383, -0.320533, -0.321833, -0.322608, -0.323464, -0.324243, -0.32486, -0.326084, -0.327107, -0.328145, -0.329512, -0.330709, -0.331639, -0.332491, -0.333781, -0.334624, -0.335732, -0.336828, -0.337935, -0.338863, -0.339649, -0.340438, -0.340832, -0.342098, -0.343323, -0.344951, -0.345574, -0.346514, -0.347066, -0.348768, -0.349796, -0.350747, -0.351568, -0.352506, -0.353088, -0.354353, -0.355457, -0.356475, -0.35702, -0.357897, -0.358424, -0.359284, -0.36, -0.360565, -0.3616, -0.362331, -0.363097, -0.364176, -0.365549, -0.366261, -0.367131, -0.367702, -0.367907, -0.368609, -0.369272, -0.370174, -0.370956, -0.371796, -0.372609, -0.373159, -0.373521, -0.374, -0.374629, -0.375247, -0.376523, -0.376747, -0.376823, -0.377462, -0.378102, -0.379376, -0.38007, -0.381159, -0.382021, -0.38284, -0.383407, -0.383793, -0.384161, -0.384826, -0.385638, -0.386368, -0.386849, -0.387582, -0.388762, -0.390088, -0.39065, -0.391079, -0.391972, -0.392238, -0.392764, -0.39328, -0.393672, -0.393964, -0.394727, -0.394794, -0.395313, -0.39535, -0.395739, -0.396257, -0.396148, -0.396878, -0.397754, -0.39809, -0.398541, -0.399069, -0.399566, -0.399825, -0.400261, -0.400707, -0.401756, -0.401723, -0.402161, -0.403063, -0.403687, -0.40442, -0.404703, -0.405551, -0.405927, -0.406357, -0.407402, -0.40816, -0.408304, -0.408704, -0.408999, -0.40955, -0.409628, -0.410346, -0.410985, -0.411014, -0.41134, -0.412167, -0.412907, -0.413311, -0.413419, -0.414504, -0.41474, -0.414919, -0.415014, -0.415241, -0.415603, -0.415903, -0.415903, -0.415971, -0.41649, -0.417203, -0.418087, -0.418274, -0.419202, -0.419588, -0.419715, -0.420181, -0.420817, -0.421201, -0.421346, -0.42168, -0.422162, -0.421839, -0.422044, -0.422766, -0.423165, -0.424035, -0.424132, -0.424577, -0.42515, -0.425573, -0.425958, -0.425753, -0.425674, -0.425998, -0.426844, -0.426634, -0.427045, -0.427056, -0.42718, -0.427468, -0.427217, -0.427148, -0.427718, -0.427889, -0.428088, -0.42819, -0.428668, -0.429443, -0.429483, -0.429781, -0.430048, -0.430186, -0.43078, -0.431451, -0.43181, -0.43202, -0.432099, -0.4326, -0.432907, -0.4333, -0.433413, -0.433535, -0.433363, -0.433474, -0.433718, -0.433513, -0.433903, -0.434128, -0.434639, -0.434848, -0.435561, -0.43607, -0.436363, -0.436422, -0.436662, -0.43703, -0.437351, -0.437787, -0.437968, -0.438259, -0.438809, -0.439106, -0.438102, -0.438602, -0.438717, -0.439071, -0.438879, -0.439011, -0.439375, -0.439098, -0.439576, -0.439839, -0.439538, -0.440081, -0.439997, -0.440614, -0.440516, -0.44066, -0.441011, -0.441404, -0.441938, -0.442255, -0.442075, -0.442491, -0.442473, -0.44271, -0.443109, -0.443525, -0.443606, -0.443409, -0.443814, -0.443992, -0.444716, -0.444471, -0.444411, -0.444741, -0.444287, -0.444767, -0.445165, -0.445099, -0.445892, -0.446069, -0.446522, -0.446554, -0.446818, -0.447127, -0.447766, -0.448753, -0.448727, -0.448294, -0.449301, -0.449268, -0.449298, -0.449624, -0.449643, -0.449727, -0.449604, -0.449707, -0.449562, -0.449673, -0.449296, -0.449189, -0.449705, -0.449866, -0.450051, -0.450357, -0.451045, -0.451055, -0.451324, -0.451072, -0.451273, -0.452028, -0.452682, -0.452717, -0.453053, -0.453725, -0.453734, -0.454219, -0.454383, -0.454206, -0.454207, -0.454133, -0.454082, -0.453926, -0.453722, -0.453847, -0.4542, -0.454107, -0.454123, -0.454236, -0.454024, -0.453291, -0.453682, -0.454217, -0.453691, -0.454399, -0.454771, -0.454662], "M_t": [0.001072, 0.002158, 0.003246, 0.004324, 0.005386, 0.006481, 0.007564, 0.00865, 0.009739, 0.01083, 0.011923, 0.013002, 0.014095, 0.015185, 0.016257, 0.017337, 0.018413, 0.019526, 0.020607, 0.021703, 0.022771, 0.023853, 0.024915, 0.026002, 0.027088, 0.028162, 0.029245, 0.030332, 0.031421, 0.032495, 0.033566, 0.034642, 0.035719, 0.036795, 0.037872, 0.038946, 0.040026, 0.041098, 0.042168, 0.043238, 0.044315, 0.045387, 0.046467, 0.047522, 0.04859, 0.049636, 0.0507, 0.051748, 0.052817, 0.053877, 0.054959, 0.056021, 0.057085, 0.058153, 0.059226, 0.060275, 0.061321, 0.062364, 0.06341, 0.064464, 0.065505, 0.066559, 0.06759, 0.068637, 0.069676, 0.070712, 0.071763, 0.072785, 0.073818, 0.074845, 0.075858, 0.076876, 0.077898, 0.078909, 0.079936, 0.080939, 0.081957, 0.082974, 0.083965, 0.084968, 0.085965, 0.086957, 0.087939, 0.088913, 0.089892, 0.090868, 0.091846, 0.092809, 0.093757, 0.094715, 0.095655, 0.096605, 0.097533, 0.098485, 0.099408, 0.10032, 0.101247, 0.10216, 0.103073, 0.103976, 0.104867, 0.105767, 0.10666, 0.107544, 0.108425, 0.10929, 0.110159, 0.11103, 0.111893, 0.112744, 0.113586, 0.114424, 0.115249, 0.116078, 0.116905, 0.117718, 0.118525, 0.119335, 0.120148, 0.120941, 0.121726, 0.122512, 0.123306, 0.124086, 0.124855, 0.125619, 0.126366, 0.127107, 0.12787, 0.1286, 0.129329, 0.130054, 0.130771, 0.131487, 0.132207, 0.132902, 0.133586, 0.134259, 0.134937, 0.135612, 0.136276, 0.13693, 0.137584, 0.138235, 0.138883, 0.13951, 0.140148, 0.140766, 0.141392, 0.141995, 0.142615, 0.14322, 0.143831, 0.144425, 0.145021, 0.145603, 0.146175, 0.146743, 0.147306, 0.147871, 0.148419, 0.148963, 0.149504, 0.150041, 0.150568, 0.15109, 0.151614, 0.152124, 0.152635, 0.153138, 0.15364, 0.154139, 0.154625, 0.155113, 0.155597, 0.156067, 0.156539, 0.157005, 0.157466, 0.157931, 0.158386, 0.158833, 0.15927, 0.159701, 0.160132, 0.160556, 0.160972, 0.161385, 0.161796, 0.162211, 0.162615, 0.163016, 0.163414, 0.163809, 0.164195, 0.16458, 0.164955, 0.165324, 0.165695, 0.166062, 0.16643, 0.166789, 0.167155, 0.167529, 0.167899, 0.168274, 0.168654, 0.169039, 0.169429, 0.16982, 0.17022, 0.170619, 0.171025, 0.171435, 0.17185, 0.172277, 0.172703, 0.173137, 0.173578, 0.174024, 0.174477, 0.17493, 0.175392, 0.175852, 0.176319, 0.176798, 0.177266, 0.177745, 0.178239, 0.178728, 0.179221, 0.179722, 0.180234, 0.180739, 0.181241, 0.181766, 0.182295, 0.182828, 0.183366, 0.183908, 0.184461, 0.185028, 0.185588, 0.186151, 0.186723, 0.187298, 0.187882, 0.18847, 0.189067, 0.18967, 0.190274, 0.190887, 0.191502, 0.192118, 0.192745, 0.19338, 0.194009, 0.194658, 0.195313, 0.195966, 0.196637, 0.197315, 0.197988, 0.19868, 0.199364, 0.200041, 0.200727, 0.201433, 0.202136, 0.202852, 0.203565, 0.204277, 0.20501, 0.20575, 0.20649, 0.207225, 0.207978, 0.20874, 0.209505, 0.210295, 0.211054, 0.211822, 0.21259, 0.213384, 0.214162, 0.214965, 0.215781, 0.216594, 0.217407, 0.218227, 0.219053, 0.219889, 0.220723, 0.221566, 0.222421, 0.223266, 0.224135, 0.225006, 0.225866, 0.226752, 0.227634, 0.228524, 0.229418, 0.230321, 0.231223, 0.232126, 0.233041, 0.233958, 0.23488, 0.235807, 0.236748, 0.23769, 0.238618, 0.239561, 0.240514, 0.241471, 0.242439, 0.243408, 0.244384, 0.245359, 0.24634, 0.247329, 0.248328, 0.249317, 0.250325, 0.251342, 0.252352, 0.253375, 0.254405, 0.255436, 0.256456, 0.257492, 0.25853, 0.259577, 0.260616, 0.261664, 0.262716, 0.263771, 0.264844, 0.265917, 0.266997, 0.268081, 0.26916, 0.270259, 0.271352, 0.272458, 0.273568, 0.274687, 0.275811, 0.276933, 0.278064, 0.279199, 0.280347, 0.281498, 0.282647, 0.283792, 0.284949, 0.286137, 0.28731, 0.288473, 0.289647, 0.290831, 0.292004, 0.293208, 0.294386, 0.295584, 0.296777, 0.297967, 0.299186, 0.300405, 0.301625, 0.302839, 0.30407, 0.305287, 0.306525, 0.307763, 0.309011, 0.310276, 0.311501, 0.312742, 0.313997, 0.315268, 0.316512, 0.317803, 0.319071, 0.320356, 0.321635, 0.322918, 0.324204, 0.325489, 0.326776, 0.328068, 0.329376, 0.330688, 0.331993, 0.333303, 0.334612, 0.335912, 0.337247, 0.338575, 0.339904, 0.341243, 0.342581, 0.343915, 0.345255, 0.346594, 0.347951, 0.349308, 0.350673, 0.352013, 0.353368, 0.354729, 0.35611, 0.357471, 0.358853, 0.360238, 0.361629, 0.363028, 0.364412, 0.365805, 0.367199, 0.368615, 0.370007, 0.37141, 0.372842, 0.374243, 0.375652, 0.377067, 0.378484, 0.379895, 0.381325, 0.382751, 0.384179, 0.385602, 0.387046, 0.38849, 0.389916, 0.391372, 0.392819, 0.394277, 0.395735, 0.397185, 0.398644, 0.40009, 0.401542, 0.403019, 0.404474, 0.40596, 0.407426, 0.408911, 0.410369, 0.411842, 0.413317, 0.414789, 0.416289, 0.417767, 0.419258, 0.420743, 0.422225, 0.423729, 0.425228, 0.42673, 0.428244, 0.429773, 0.431265, 0.432766, 0.434257, 0.435761, 0.437283, 0.438798, 0.440324, 0.44185, 0.443394, 0.444926, 0.446434, 0.447956, 0.449501, 0.451042, 0.452591, 0.454128, 0.455654, 0.457197, 0.458744, 0.460301, 0.461852, 0.463416, 0.464973, 0.466508, 0.468078, 0.469637, 0.471196, 0.47275, 0.47431, 0.475872, 0.477439, 0.479014, 0.480588, 0.482164, 0.483738, 0.485326, 0.486895, 0.488486, 0.490077, 0.491658, 0.493246, 0.494856, 0.496416, 0.498013, 0.49959, 0.50121, 0.502789, 0.504374, 0.505974, 0.507577, 0.509169, 0.510785, 0.512383, 0.51399, 0.515622, 0.517221, 0.518852, 0.520465, 0.522081, 0.523705, 0.525336, 0.526955, 0.528563, 0.530177, 0.531808, 0.533438, 0.535044, 0.536659, 0.538302, 0.539932, 0.541523, 0.543184, 0.544811, 0.546443, 0.548077, 0.549714, 0.551334, 0.552963, 0.554607, 0.556239, 0.557867, 0.559506, 0.561156, 0.562797, 0.564458, 0.56612, 0.567764, 0.569407, 0.571045, 0.572691, 0.574345, 0.575996, 0.577659, 0.579309, 0.58095, 0.582625, 0.584269, 0.58593, 0.587575, 0.589257, 0.590895, 0.59257, 0.594237, 0.595898, 0.597566, 0.599235, 0.600902, 0.602582, 0.604275, 0.605942, 0.607626, 0.609281, 0.610969, 0.612654, 0.614328, 0.616008, 0.617697, 0.619383, 0.621053, 0.622731, 0.624414, 0.626083, 0.627765, 0.629454, 0.631126, 0.632793, 0.634461, 0.636127, 0.637778, 0.639462, 0.641155, 0.642837, 0.644528, 0.646191, 0.647883, 0.649571, 0.651252, 0.652945, 0.654632, 0.65632, 0.658012, 0.659716, 0.661408, 0.663108, 0.664797, 0.666514, 0.668214, 0.669924, 0.671619, 0.67331, 0.675009, 0.676722, 0.678406, 0.680129, 0.68183, 0.683543, 0.685246, 0.686967, 0.68867, 0.69036, 0.692062, 0.693752, 0.695477, 0.697207, 0.698922, 0.700626, 0.702347, 0.704074, 0.705782, 0.707509, 0.709229, 0.710926, 0.712646, 0.714373, 0.716113, 0.717845, 0.71955, 0.721261, 0.722983, 0.724701, 0.726429, 0.728138, 0.729846, 0.731559, 0.733269, 0.734983, 0.73672, 0.73845, 0.740185, 0.741897, 0.743618, 0.745331, 0.747061, 0.7488, 0.750541, 0.752251, 0.753958, 0.755704, 0.757426, 0.759157, 0.760895, 0.762627, 0.764349, 0.766084, 0.767815, 0.76954, 0.771277, 0.773005, 0.774722, 0.776461, 0.778208, 0.779954, 0.781712, 0.783444, 0.785178, 0.78694, 0.788708, 0.790438, 0.792165, 0.793901, 0.795634, 0.797382, 0.799116, 0.800847, 0.802595, 0.804327, 0.806079, 0.807827, 0.809582, 0.811331, 0.813071, 0.814819, 0.816586, 0.818315, 0.820057, 0.821824, 0.823595, 0.825341, 0.827124, 0.828862, 0.830607, 0.832368, 0.834128, 0.835874, 0.837613, 0.839373, 0.841139, 0.84287, 0.844627, 0.846372, 0.84812, 0.849874, 0.851621, 0.853393, 0.855133, 0.856884, 0.858627, 0.860388, 0.862126, 0.863875, 0.865617, 0.867381, 0.869124, 0.870874, 0.87263, 0.874386, 0.876175, 0.877928, 0.87967, 0.881437, 0.883207, 0.884961, 0.886724, 0.888488, 0.890231, 0.89198, 0.893749, 0.895496, 0.897248, 0.899005, 0.900765, 0.902528, 0.904287, 0.906061, 0.90784, 0.909628, 0.911392, 0.913158, 0.914941, 0.9167, 0.918463, 0.92024, 0.922014, 0.92377, 0.925516, 0.927257, 0.929028, 0.930792, 0.932549, 0.934318, 0.936079, 0.937844, 0.939606, 0.94135, 0.943111, 0.944882, 0.946659, 0.948434, 0.950191, 0.951978, 0.953756, 0.955512, 0.957285, 0.959071, 0.960838, 0.962597, 0.964375, 0.966158, 0.967917, 0.969695, 0.971482, 0.97325, 0.975012, 0.97677, 0.978542, 0.980317, 0.982094, 0.983865, 0.985661, 0.987426, 0.989204, 0.990998, 0.992819, 0.994623, 0.996425, 0.998218, 1.0]}, "culture": {"psi0": [0.32, 0.68], "S_group": [0.32, 0.68], "Psi_final": [0.32, 0.68], "H_e_final": [-0.726301, -0.708164], "M_r_final": [0.910594, 0.921417], "time_to_M_gt_0p35_s": [1.99, 1.6]}, "sensitivity": {"alpha_E": [0.2, 0.4, 0.6], "time_to_M_gt_0p40_s": [2.47, 2.28, 2.23], "M_r_final": [0.904087, 0.922011, 0.936819], "H_e_final": [-0.514785, -0.71362, -0.912454]}, "meta": {"t_peak_h": [2.0], "dt_h": [0.01], "duration_h": [8.0], "seed": [2025]}};
\ No newline at end of file
+window.EMERGE_DATA = {"version": "6e5f9e682583", "encoding": "float32-le-base64", "series": {"routine": {"rows": 1001, "preview_rows": 169, "preview": {"time_s": "AAAAAK5H4T0pXA8+exQuPlyPQj4AAIA+CtejPnsUrj5mZuY+AAAAPxSuBz+uRyE/ZmYmP+xROD9xPUo/zcxMP+F6VD/D9Wg/pHB9P2Zmhj8fhYs/exSOP4XrkT/2KJw/w/WoP4XrsT8zM7M/mpm5P0jhuj/D9cg/pHDdP1K43j8K1+M/KVzvP4Xr8T/hegRAuB4FQI/CBUBmZgZA7FEIQFK4DkCF6xFAMzMTQOF6FEBI4RpAexQeQLgeJUDD9ShApHAtQClcL0AAADBApHA9QClcP0AK10NAmplJQPYoTEBSuE5Aj8JVQOxRWEDD9VhA9ihcQOxRaEDD9WhAzcxsQArXc0A9CndAw/V4QJqZeUB7FH5Aw/WAQOF6hEApXIdAFK6HQIXriUAzM4tA4XqMQJqZkUDhepRAuB6VQKRwlUBSuJZAmpmZQPYonEAUrp9A7FGgQEjhokD2KKRAzcykQNejqEBxPapASOGqQDMzq0D2KKxAPQqvQClcr0CambFAheuxQEjhskDherRAmpm5QEjhukDNzLxAj8K9QFK4vkCamcFApHDFQFK4xkApXMdAw/XIQK5H0UAzM9NA4XrUQOxR2ECamdlA9ijcQI/C3UB7FN5AUrjeQEjh4kAfheNA4XrkQAAA6EDsUehAexTuQClc70AUru9AcT3yQB+F80DsUfhA4Xr8QLge/UCPwv1AZmb+QAAAAEHD9QBBj8IBQYXrAUFSuAJBH4UDQXsUBkEUrgdB16MIQYXrCUF7FApBZmYKQR+FC0EUrgtB4XoMQc3MDEHD9QxBj8INQdejEEHD9RBBrkcRQUjhEkEpXBNBw/UUQZqZFUFxPRZBZmYWQVyPFkH2KBhBKVwbQQAAHEH2KBxB16McQc3MHEHD9RxBAAAgQQ==", "E": "cIoIP1EDHz+cXQ0/xbEwP/rdIz92jRM/ljYcPxCrID8mgAg/BuIrP52tHz9BgCc/BmYXP0AqHT+vxCY/5EAqPyvXDj/nfSE/6ywJP1H1Gj/4Vx4/TugOPxd2Fj962yo/f3MLP8jmIj/2lyY/dCYQPwibJj/25BU/B40dP0fUJz9MaBs/pFcXP1PYNT/qdB4/Fu4aPx54DT/5kCI/ncMUP/0lGD+1hi8/1REhPwKiHj/0myA/wGYYP00fID+6VRY/ZVQUP36WHD/GCws/eeAmP4ldIj/H2CQ//XwYP1PrHT/rsxw/Gs8LP7LNGj93lRk/zgkXP99RJj9iCRA/qXkbPzdiND9O1hg/HsAYPwmfGT+VOA8/HkMWP/K0Gz9SphA/P4AlP4DfFz9RKB8/M1sgP+dRDz8VMRQ/zesSP2PrET9+7RM/LowQP9InJz8r7Bk/3gkeP1gBMj8kgR0/CgQmP9hcGT8JpSI/tRIIPxTyLD8JOxg/fYcXP6rYJz8GOBk/1DIZPyq3KD+GDRU/T0EdPziwHT9DRAY/dVoaP/7tEj+gIxY/5iEnP5hsIj/GLQ8/UHQVP4YvED++JAQ/+mMaPxR5IT/Q4hw/DF8VPyhuFj8meA8/g+4kP9H8GD/APQg/iTUbPz8/HD9frgs/F7IRPzAwJD9DoSI/w/sKP3iaDj+uqRY/wXUUPxd7Ej9X8Qk/O8cfP5M0FD+cLBo/TnUkP7oHAz/wbRE/aWAdP5myDj8eYBc/DzIdP8CBJT+ZRgM/Wu0mP4U9ET+Vbxk/utMeP4kSFD/SEA8/uSoSP0KyGT9b1Qk/EOghPxUNGj/KkRA/9uoZP6GoJD8aMA8/EykRP0dfBz+2qSM/nMIZPxasGj9whxM/xQQdPw/MKT+WsyM/aKgVPw==", "C": "x7Y8P8n4Jz9KODE/thkuP/ZFOT979Ds/tsI3P6upFT8SrDI/Wq43P2vpMT/FbUM/IQ8jP0WSNj8NlUs/ASEeP7AYMj9G9zg/cwM8P033KD8gxjM/hSg0P9J6OT+XXDs/MeIsP0AhMD/JQyY/Vf4qP58qOD9gYUA/yZEkP5VZOz9Rtys/iWssP5R+Lj9SBzo/7m8xP0aIKD/DhSQ/vOEdP+zeOj9/mjE/m6wqPyGnJz/6qiY/QdM9P0LZJj85rSg/2Tc8P3lqJD8lhS0/oUU0P+YMPj/KbB4/CEwvP9mIMT/gzEQ/7iMiPw+dMz/F8ys/t1EsP4fqQD/5xh0/4ocoPw2pND98ljI/pwElP9b+Pj9LqzE/WXsoPxMlLj8d7SY/y80wP6L/Mj9s9Sc/HNg6P4gKND8sGjM/ybkqP7JqNj8LBUM/tbJFP5R0Oz8lhTc/5+0nP42SNz+UUy4/wN8sPzN5RD9FTi0/07k2P7yDOD+qySc/Ipw7P3BDKT+0TCU/oGA4P1vOIT+SSDU//UI/Pw+MQj8mCTA/M4c6P6HJUz9aKjg/YFcvPwHPQT8OYjc/lP0sP8k2Mj/KPyc/flUiP2IqLT+zM0U/cBszP6TSND+7yz0/hfM7P1q2PD+Vhi4/K1gkP2gvOz/euDA/MGQ0P7ibLj86MDY/0tQqP+amRD9CHzQ/7XwzP14vKz8mNzA/DoM5Pw9DMz/+AD8/LANFP2RrMT/xtzc/e705P2oUMD8aQTg/3dsqPxgqHz8+/D4/xuU7P5JtKj8dth0/6j49P5jpQz/Txjc/QBIqPxMhLT+RPDE/RBE/P6YVPz95nTM/tcJLP4LsKz9LJiY/hcU6P1CiPT8uBz8/7RtBPzVpLD/TBjI/GgwvP0+YKD95+TY/2pgqPw==", "Psi": "AAAAP/2xAD+w4QA/BxEBP2QwAT+LjQE/ePgBP64WAj8lugI/+QIDPzwuAz8evAM/EdgDP884BD/elwQ/T6UEP3HNBD//NgU/dp4FP7bqBT/pHAY/0zUGP/VaBj+ivAY/AjQHP8+FBz9hkQc/y8oHPzHWBz+yUQg/X/8IP/8JCT88NAk/vJEJPzumCT8hWgo/42MKP59tCj9Vdwo/UZQKP1/zCj8EIgs/gzQLP+pGCz+OoQs/Cc4LP/MtDD8pYQw/8psMP9S0DD8UvQw/r2UNPw59DT/osg0/x/YNP3QUDj/WMQ4/IoEOP26dDj92pA4/WccOPwRIDz+fTg8/5nUPP2W8Dz/O2w8/du4PP6b0Dz+IHxA/skMQP5qEED9luBA/FL4QP3flED+p+xA/oxERP2FnET8elhE/XaARP3elET/AuRE/qOYRP7wNEj8zQhI/lksSP6lwEj/sghI//IsSP2rBEj811xI/2d8SPyfkEj8A8RI/+RYTPyQbEz8EOBM/GTwTP0pIEz9oXBM/HJsTP2WqEz8LwRM/PcwTP1rXEz8x+BM/2CIUP8gwFD+yNxQ/1UgUP5OeFD+UsRQ/GL4UP+TiFD/p7hQ/mQYVPykVFT8NGBU/0B0VP5BCFT8cSBU/YVAVPy5uFT/ZcBU/wp8VP+apFT9rrBU/WMAVPynKFT8b7hU/MAwWP7oQFj8/FRY/vhkWP+MkFj8TMhY/6jwWPxE/Fj++SRY/SlQWPyl1Fj8MiRY/vpQWPxCkFj/1pRY/u6kWP8q2Fj+juBY/zsEWP3DFFj9AxxY/PNAWP6nvFj8R8xY/dPYWPyUHFz8SDBc/OhwXP5QiFz/dKBc/bSoXP/wrFz9aOxc/9FgXP7NeFz8gYBc/Y2QXP8xlFz81Zxc/VIEXPw==", "H_e": "AAAAADEhirvMjLG71dhJvEqigLwrVNC8iw8YvQO0HL24/xy9jvcevTyrKr2tN0W9utxJvYikbb0OQoK9t+SHvbfMjb3PbqC9Uf6jve/sq72jzLG9ZEmuvcqVur1R68W9BbXRvVA34b2EQ+G9C0DlvcL+5r1Ayuy9uZkJvqr9Cb5zeQy+odoMvkxUEL7Unia+epMovqjGKL7H8Si+lxYqvkuCNb7vCze+mcM2vmJ8Ob40t0a+Y85KviCtVL72n1a+njNevgWEYb78O2O+Bxd3vtBPer47tn6+j7mBvm/Gg75tgYa+4pWMvnI1jr5Gp42+y/ORvrzTm77OD5y+aeegvvdZqb70S6q+XOirvmL/q75/66y+5VCxvoFAt745Zrq+yTS6vu0/wL5C3MG+ORXDvtCVxb5U9Mi+wWzJvg2tyb6ztMm+RjnPvqVq0r478NW+zbPUvsej2L43Ldm+HALcvuwK5L5xJea+SWPnvl0A6L41Keq+HwvsvuiB7L4CG+6+drTtvvyL8L4Z+vG+3VX3vgvT+r5yP/u+p9D5vrfz+77t//++lzgEv0b6BL8E7AS/TUwFvwAPCb8ZJQq/iVEKv+j4DL8w0Qy/FDQMv61QDb++Vg2/xiwNv9NjEL90nhC/vt8Pv5UdEb+V9hC/MA4Sv68oE7/KKRO/8KMVv7nUFL9KSxi/qCMbv/drG79Ecxu/RAIcv+hgHb9snBy/LWkcvwiJHL+trRy/2nwev9qLIr80AyS/J0Mkv48AJb/kKiW/MsAlvx8vJr/VYCa/pmYnvxaoJ7/KUCi/k4gov8xeKb8RYCq/i7cqv/DIK79TZCy/AVYsv4sZLL+5UCy/5SIsv2LWLL8tXy6//5Myvwt8M7/f2TO/NPU0vzm9NL8FDDW/xq82vw==", "H_c": "AAAAAIbacrxlH6+8vpjtvLmZ97wUzTa9XAV4vQd3gr22Nrq90enPvSTO3L1JXP69OmUFvm8+G74ENCi+v3opvnnOLr46M0a+yZpavkDOZb5OxWq+08FwvlDId74JU4e+NauSvh7bm7479J2+dSylvrSOpb5j1rG+itHFvnLwxr6U38u+6nPVviFM2L5wCvS+2eD0vvx09r7Ayve+Omz8vtqXBb9fKQm/QiwKv1FDC7/Q0xG/Cq4Tv2pOG79NXx6/CrcivyuyJb9bFSa/XCgzv8NHNL8k6De/euE8v0haPr9qKEG/fxtIv/qOSr8pBEu/dfpOvw/sWb9sglq/7bddv521Y79b8WW/wTxov1VgaL8CTW6/XCVyv875eb9lm3+/2h+Av3BUgr/2poO/jwCFv9a1ib9F7Yu/VqGMv9A0jb9g5I6/TbSRv3a+k7+ZVZe/t92Xv2Xdmr9YSJy/7wSdv0pfoL9rG6K/f5Sivz+Oor+SXqO/vtWlvyf3pb8lgKi/0/2ov2Qoqr+lcKu/3lKxv10bsr8nBbS/O5y0v/2Vtb8JT7i/P5+8v/Vcvr+4Xr+/6NjAv66Lyb+ewsq/ZyHMvwdJ0L+yTtG/GWbTv2Gt1L+Z19S/l6rVv5Hu2b+0Q9q/d3bbv6ap378gIuC/7U7lv8wg5r+Kgua/jA3pv2ti6r+kR++/+svyvyxW87+7FPS/IKb0v7Cc9b8sb/e/jUr5v/HI+b8vSvu/nO78v7jDAMCsFwLAHTYDwAxqBMCYjQTAfNEEwFtTBsCaTwbATAcHwNhhB8BNiQfAhUMIwPUwC8C9lAvAYvwLwGKBDcCFDQ7ATx4PwNu2D8DXMRDANUYQwKZsEMCvORLAYGEVwMwFFsATGBbABsYWwEv2FsBIKBfAsEMawA==", "M_r": "VmFXPrHEXD46QVw+HgxnPpmHZz5nQmk+xMtwPkdIaz61+3E+3uV+PphzfD4GK4Q+Fyp+PjOhhT556os+MgSHPhLjhj4KQo4+ENCNPgEDkD5a1JI+YTORPiuTlD55k5s+TMmYPhL6nz58sp8+Ak6fPuqfpD7vwaY+0UCsPjd2sT5J+q4+Ei+xPs56tz5lcMA+zSO/PnJLvD7SWL8+ldu9PhNLyD7eKs0+QkfKPrN5yj4tatA+iivUPj0N2D4G49g+xw/fPiQ/3z7ULt4+XdDuPvi98D7BAe8+m1rzPocm9j4Xavs+6oH5PulAAD9OQv8+FUsBP1UQCT+cuAQ/QB4IP0VJDj9NjAw/qHcMP6eFDj9xjg4/T0wQP7RcFD9bFBU/gqkXP2DaGD9BpRk/2xwcP3pDHT+LWx8/6ycfP744ID+8MSI/WGokPzY3Jz8HTSg/OqwnPw9+LD90Eis/pmAsP+POLz/IKjA/ki0vP1kwMj+HPDA/ZvIyP8gQMz+4SjM//a00Pww8NT8l8TU/Dqo6P42uOz8F7zk/wQc8P4edPT8vDD4//JBBP69GQz++2EE/8HBCPwXvRj8BdEY/Aw9IP6Q3Sz8NiEw/ROlLPwjETD/u10w/o0pOP8/WTz9+eE4/6k1PP2QnUj/b+FA/sHVTPwiYVD+x/FQ/K6dUPyUhVj9xCVg/eXVZP7RGWT+MUVk/vONaP0mjWj8iwls/CPVcP/r0Wj9hP1w/w41dPxN4Xj/r+18/UGJgP4n+YD9z0mA/EVFiP07JYT/YsGE/p1VjP8BUYz8n9GI/IA1jP+LbZD9Vv2Q/0yVmP7WoZj9lWmY/HrpnP5FvZz9042Y/p3hnP+hcZz9nKmk//oVqP+tjaj/hY2o/gOxqP9Yjaz8Vbms/5QhsPw=="}, "chunks": {"time_s": "./assets/data/routine/time_s.js?v=6e5f9e682583", "E": "./assets/data/routine/E.js?v=6e5f9e682583", "C": "./assets/data/routine/C.js?v=6e5f9e682583", "Psi": "./assets/data/routine/Psi.js?v=6e5f9e682583", "H_e": "./assets/data/routine/H_e.js?v=6e5f9e682583", "H_c": "./assets/data/routine/H_c.js?v=6e5f9e682583", "M_r": "./assets/data/routine/M_r.js?v=6e5f9e682583"}}, "transform": {"rows": 801, "preview_rows": 174, "preview": {"time_h": "AAAAAK5H4T17FC4+7FE4PlyPQj6uR2E+H4VrPjMzsz6kcL0+PQrXPtej8D4Urgc/KVwPP/YoHD97FC4/MzMzP7geRT/NzEw/KVxPPx+Faz97FG4/16NwP6RwfT+uR4E/cT2KPzMzkz/hepQ/PQqXP0jhmj8K16M/w/WoP3sUrj8zM7M/pHC9P1K4vj8fhcs/zczMP7ge5T9mZuY/hevxP4/C9T/2KPw/AAAAQNejAEBmZgZAmpkJQM3MDECkcA1ArkcRQIXrEUCPwhVAmpkZQEjhGkCkcB1AAAAgQDMzI0BmZiZAFK4nQHE9KkAAADBAMzMzQGZmNkDsUThApHA9QHsUPkApXD9AMzNDQOF6REB7FE5AUrhOQNejUEDhelRAj8JVQJqZWUCkcF1AKVxfQK5HYUDhemRAj8JlQEjhakD2KGxAexRuQIXrcUAK13NAuB51QOxReECamXlASOF6QEjhgkAfhYNACteDQPYohEBmZoZAFK6HQHE9ikBcj4pAj8KNQHsUjkDD9ZBAcT2SQPYolEBSuJZAFK6XQAAAmECamZlACtebQOF6nEC4Hp1AexSeQGZmnkBI4aJA4XqkQM3MpEApXKdAAACoQEjhqkAfhatA4XqsQClcr0CF67FAcT2yQFyPskCPwrVAZma2QAAAuEDD9bhAzcy8QHsUvkBSuL5AFK6/QAAAwEC4HsVAZmbGQD0Kx0ApXMdAAADIQLgezUCPws1AFK7PQAAA0EDsUdBAw/XQQDMz00AK19NA4XrUQD0K10DsUdhAmpnZQHE92kBcj9pA4XrcQClc30DsUeBArkfhQB+F40DNzORAAADoQNej6ECamelA9ijsQKRw7UBSuO5AAADwQOF69ECkcPVAj8L1QGZm9kBSuPZArkf5QIXr+UBcj/pAuB79QD0K/0AAAABB", "D": "d7NuE4rUXjsa7js8FMNbPBKdfjy077w80azUPBB/nD0bbLM9i3jzPWBEHj7/aU8+j+ZpPgU8jD6H5q4+Cie5Psnf3T6/4e0+AD3zPngYFz+wwBk/+mYcP1OCKT/3qy4/FkdAP3wAUT/jTlM/i9pXP4N/Xj8NI20/1+x0P99FfD9tlYE/tMeHP/98iD+kwI4/GUyPPxPklj9OJpc/yuCYP8E4mT8yjJk/mpmZPyGYmT8kC5k/zV6YPz10lz81Ppc/1cqVP16FlT8BupM/gaqRP6zskD91XY8/wLWNP36Eiz9fM4k/+D2IP1tGhj88ooE/yuR9P8FkeD+sCnU/hvNrP1vNaj9Af2g/W4lhP3Q0Xz/Dp00/pXxMP5z8SD+nBEI/FLU/P/zROD+hAzI/c6UuP9pNKz+dyyU/W50jPzoIGz9h7Bg/BMoVP+CgDz+Kmgw/uZsKP/yxBT+7wgM/BdgBP7+R5D6CFeE++lrfPtii3T4b3dE+0lfLPlrAvj4sOL0+t2iuPoT6rD4lg6A+YTSbPseBkz7vuYk+rjKGPtsJhT6Vun4+64RvPt1Qaz64LGc+BBRhPpITXz5PmkQ+ONM7PlscOj6/4Cw+XrMpPucGHD6THxk+d9sUPvKuCD6ROv09n876Pf1n+D3hgeE9lyndPQqh0j1wh8w9KLO1PVufrj3aLas9ZCGmPWV6pD0dA4w9onGGPba8gz0dZ4I9AIt/PZvaWD3Ca1Q9p59HPeOPRT03hUM9+34/PUMDMj2wUy49dLYqPYjyHD1wdhY9DjsQPek0DT2Ztws9NhYDPc0o7jzLoOY8nVLfPNAezzyKXsY8pgCyPOAsrjy9lKg82HyaPJvekzzLhY08um+HPIYXaDzYgGA87AZePCInWTwhwVY8+nVEPHQgQDx34js8fcwrPMacIDwVSRs8", "E": "hKfPPlCn7T69FgM/5pjhPt2Y9T5FLNs+rEDsPkWE8D55mfY+U54BPzsU5D6iQgU/wdH8Po9SBj8JBRI/4TQLP/MvGT9aWR8/SQwaPxFvED/cQyM/05MYP5izFz/Xfy8/uQo1PwkJNT8p7Sc/BoY2P+SbOD+PDUA/wq8uP+WIND+o0kQ/9AZHP6k0PT+fWkg/7BxIPxhiTj/2Y0k/EAtcP5hQRT+BBU4/PH1QP8FYTj+WJU8/FRhFP05NUz/sY0g/YblGP0KoVT9/3UU/t1tQP8kAST8A+EU/NbE7P6tCOT9N4Ek/2EdDP/HLPz/mvjE/w1ZAP05GQj/rxzs/Ppk9P8aYOD83mjk/YdI5P6MAOD9iBCs/mtktP8PDMD/A7is/xvgeP+PTMD/b7iE/mO4mP9ytLD8q/Cw/q44mPy1FFj8/hCM/GiEbPzGSDz+Ivis/hqsmP/mxGj/3dxc/KLwbP669DD8D0hM/C6gXP9HWFz8xHBU/LzgXPzk5Dz+56gc/+v0JPyIeBD/vFAc/RvsHP/eOED+S4gI//6ABP4rEAz9Zn/4+GaP3PiIqCT+dbQQ/QaQFP9YkCT+r/xE/c3j3PnZeCT/nIPs+eZIGP2Q75z5PZAA/CQwCP4+tBz+drvo+Pzb8Pnyb7T7YrQE/fY7/Pmpa5z7WY+w+b4fdPkIUAD9P3O0+RyDsPh+B7D7DueE+FJXyPu4Q6T6ex+Y+z67gPr145z70aOA+86bkPq2aAD8QyPE+8ujmPpwL1j5W4+U+MIjzPmv+2D4gfPw+eDf2PmML7D44Uuw+MzfnPrG86z5gtPE+Ny3jPkCn2T7HPfI+uOrzPhZe2T4Ax/4+3aDjPtBw3T7MwOk+0fvnPu1v4j7yddw+MXviPgmS7z4A8N8+CIjjPnar6j7GOfA+NhPlPp7a+j51Hec+", "C": "jD9CP401ND9rl0U/KVRCPz+IQz935DY/bw9FP79aOz9wRzY/Z+Q6P2BENz/jrTc/4ScxP6AKOD+CVSU/nmgfP7H1Jz+9Khs/eREfP7whFz9e+R0/uhIUP7+rGD+63gk/aO4HP1q++j6msQY/jHwLP8yCAT96yAk/QqkCP1Zw6j7J8ts+sPLsPqvF0T4PTus+K3LUPkze8T7idek+UlLdPjVx5j6D+sM+CknmPvEJ1z5FKNc+HbDtPjBb4D5i394+k67XPjFo3j4R+Ls+LQbdPgOI3j5z1Oc+hLPxPtWHAD8aJ/0+HyjzPlbt5j658/c+bV3jPl2J/j5LHv0+gBEIPy5FCT9goAw/rzMCP2AkBT838hQ/rqoHP0vpCj9GFQ8/xxETP2eqDT840Rs/KPwVP7b0GT8GRyU/qlQUP1T9Hj+sfyA/HBYpPwXAHj/1YRs/eH4oP+5mJD/StiM/TOknPyVLJj/7Kik/H2IwP7lXID8Whyg/bDE3P/YALD/l6y8/AZgtP5NhNz8e0jM/nTk0P5i4Pz/csEI/v20zP5ayOT+W3Dk/+NA6PzgSNz8T3Dc/sJM8Pza6PD9/5z4/NTxFP63fQT/lZFE/OtY8P/fPOz/fpkE/OQJDP3D5RD8/tVE/Cs9FPyDKSD97skM/305EP1MzST9NhlI/ADVVPwAuSD/uK1U/UmxSP1AzSz8eJEw/hwVKPyILUT8Hy0c/5yhNPz3xTz/DpFo/dhVRP3+MSj/IBFA/2c9KP8xVVT9D6VE/IXRSP9roVj+fVlQ/P61fP+/1SD+t9U8/XdpQP87RTz8vzkw/X9dXP3JpVD+rsVA/NzhTP2nnYD/cyVo/NDJOP8ugWj+kqVI/EWNVP4AcWD80F04/IEdWP7lmVT+ywmI/RxZPPyMQWj9veFE/GupWP7VfXD+kyVw/", "H_e": "AAAAAM79CzsNQnw7w/CTO2VGrjtlKPg7RVcFPNFdXzxoWnM8B86ePNEryzwOjQM90IoTPajiNT2JiXA9rzCCPY5aqT0Ryb89OjLGPVRbDD7z5RA+2JUVPhnNLT69/Dc+faJePuXagj4boIU+Jp6LPkgJlT6hyqo+HZa4Pu53xj5QB9U+VELzPv0O9z6dDQ8/eAURP5llOD/fmzo/XdpNP5MNVD/7tl4/CRxlP7o0Zz8XBVI/4+lGP2+dOz8Pdjk/5LUsP8SbKj/kqh4/xIYSP+SiDj87NAc/FeP/PlkQ7j7HFd0+PNrVPrT/yD6206s+7XGdPgPcjj5J8oU+UJhgPrubWz51cVE+QmozPkjpKD76u8c9E8q/PerqpT1LGmw9dRxLPbyMzjwJChA7oJkTvPJynby7lxm9QK4zvRmbjr17mZy92nquvQKL1L3iF+a9PWvwvZz1Br5vugu+PGcRvrfYO75mHUC+TzNCvnSGRL6B9Fa+vulfvr2/cb5ccXO+rayBvkVegr53ZIm+0OeMvkz0kL4sUpe+F+KYvst+mb6ciJ2+mjmivi2Go75Mx6S+NAOmvg5Upr5y5q2+dp2wvgPvsL7tx7S+df61vnSDub5Mdbq+qPi7vrUOv77CQsG+kJbBvp89wr740cW+InHGvo+wyL4JXMm+atLLvty1zL5qKc2+F+jNvkxezr5fcNK+jJ3Tvug51L7JWNS+tnzUvqy6176kJdi+0yfZvjNi2b5Rrdm+GxfavhWn2r4Z3dq+L7Pavj4M3L4X59y+zX3dvnrZ3b5I6N2+lSjevl3C375nPeC+idLgvsn14L4dC+G+plfivs2L4r7CFeO+IrXjvgjk477EouS+6MLlviP85b4Xbea+JJXmvqbw5r7mE+e+00/ovtak6L7Xjei+wYLovkBK6L6Ayei+", "M_t": "zYSMOtAHVTz99Z8848+oPLDKsTxNG8w8mQLVPBGGHz2mVig9blQ+PWv1Uz2WMW493Ct7PTlQiD0aLpc9gFubPWnuqT1PDrA9ZRayPX+/xz1Pssk9mZbLPUzx1D0fnNg9AijlPTAW8T1CvfI9WBD2PY3n+j1O8AI+t+gFPt7KCD7niws+K8kQPhNnET53axc+RPsXPsS4IT7yLyI+vhomPvJVJz6TSik+uWwqPsHKKj4/Ti4+dGkwPjaqMj7lIDM+2QI2PjWENj5Alzk+SOM8PrUKPj4rZEA+HddCPogFRj5SW0k+bb1KPmKLTT6tMlQ+eh5YPq8fXD4HoF4+koNlPtpnZj6tMWg+ibJtPrmSbz6kSX4+00x/Pko0gT4UXoQ+Zm+FPsyziD4VEYw+M8qNPqyJjz6IgJI+y7KTPi6PmD68zpk+Cq+bPhp9nz7JaqE+BLeiPhX+pT4vT6c+7aOoPhk7tD4an7U+BFS2PmYGtz6NAbw+IeW+PhazxD6kbcU+n9jMPtyWzT5FX9Q+sGvXPi8L3D4wOuI++5LkPnxa5T5wS+k+HdruPj108D5ZDPI+4XL0Pl1B9T5FTwA/41gCP8fCAj+IEQY/i+YGPz+hCj+4eAs/DLoMP0+AED954RM/n00UPya5FD8Q+hg/tNQZP9L5Gz+ZRB0/D2wiP7kiJD/N/yQ/SkomP3K4Jj/9qy0/S2wvP65MMD9ouzA/tpkxP4+kOD/+hTk/0Cc8P7WZPD8HCz0/+Ow9P2oDQT+y5kE/BcpCPyxURj9GHkg/wOhJP03LSj8bPUs/ZuhNPz3vUT+SSVM/r6JUP03GVz9ZkVk/sQxeP5zxXj8KTWA/MeZjPxGyZT9Xf2c/AlFpP+iibz9R/HA/v29xPz1Ycj+VzHI/xWx2Px9Wdz/sPXg/m957P5effj8AAIA/"}, "chunks": {"time_h": "./assets/data/transform/time_h.js?v=6e5f9e682583", "D": "./assets/data/transform/D.js?v=6e5f9e682583", "E": "./assets/data/transform/E.js?v=6e5f9e682583", "C": "./assets/data/transform/C.js?v=6e5f9e682583", "H_e": "./assets/data/transform/H_e.js?v=6e5f9e682583", "M_t": "./assets/data/transform/M_t.js?v=6e5f9e682583"}}}, "tables": {"culture": {"psi0": [0.32, 0.68], "S_group": [0.32, 0.68], "Psi_final": [0.32, 0.68], "H_e_final": [-0.726301, -0.708164], "M_r_final": [0.910594, 0.921417], "time_to_M_gt_0p35_s": [1.99, 1.6]}, "sensitivity": {"alpha_E": [0.2, 0.4, 0.6], "time_to_M_gt_0p40_s": [2.47, 2.28, 2.23], "M_r_final": [0.904087, 0.922011, 0.936819], "H_e_final": [-0.514785, -0.71362, -0.912454]}, "meta": {"t_peak_h": [2.0], "dt_h": [0.01], "duration_h": [8.0], "seed": [2025]}}};
\ No newline at end of file
@@ -0,0 +1 @@
+window.EMERGE_CHUNK("routine","C","x7Y8P8Q1MT+oxTU/LRIzP2yVLz8etzE/0z0wP+vSLz/dSzM/Bg40P4U9MD/J+Cc/vHkyP4w2Lz9KODE/ozpAP90AMD+2GS4/jr43P/ZFOT/NGzU/TL8zPz5vOj/B/zE/jdYvP3v0Oz999iQ/lrMsP6xxMT8VNi4/gqcmP/XsLT+2wjc/zSclP6upFT+6BDI/2EEwP+H/KT+CPiQ/mGYtP+tELD+Rwzk/qJ8sP3ivLj+mBzA/EqwyP636MT+MyTM/5mQxP7R1Nj9arjc/5DAzP/nTKj9r6TE/EYQsP3L3QD+nOCU/b1Y7P8iqOD8+0S8/WLE7P8b4PT8rOzM/xW1DP51bOD8hDyM/GxYoPyTBND+/zC8/vJY1PzJALz9n0Cs/RZI2P5BWNj/rfzQ/ODswP0xSOz8+xDM//SozPw2VSz8BIR4/CnAmP4cFHj+wGDI/uC4hP57KLz8LZj0/GxE6P3cTLT9bPyw/RxYxP0b3OD87+DI/7js3P/eMOj/btCo/+t42PyEcOD9r1S4/cwM8P0ysMT9G3TQ/C9AxP1D+NT+PxCw/TfcoPzP9Lz8mPCw/BxUtPyDGMz/6hDg/hSg0PxXjJz9PrzE/0no5P4vUMz9pUzE/OB0vP2ICOT+aUi0/u4YtPxhCNT+XXDs/Ld8mP2cWND/hODo/dAcqP4FvLD+IADQ/wMouPzJaJz9xniY/MeIsP2jtLz8JvDE/TCEsP/6VJT9Mvik/kQQ2P0AhMD/JQyY/xVAzP4KxKj+muzI/dcsuP1X+Kj+fKjg/Ags0P2faPD+LxS0/cassP4a0Nz/1FzI/4HgvPwToND8U7yg/9M43P2BhQD+hOSw/h+QlP2sQJz+suTU/T48oP5g2Oz9jVy8/Ark5P8hlKz/arDE/lwU4P4znMj9fxzY/3TMsP2U/Pj/JkSQ/lVk7PyNeLD8vejo/m05AP1G3Kz8lNS0/oQUwP0otJT+t3iQ/ltw3P6VxKT/mYzE/UwI0P4lrLD91TS8/lH4uP/dQLT96bis/cKoyP1m+ND9SsTQ/gg4rPwmQKD/GDyo/KG4yP+oMLz/3riw/81swPxB8ND/hCDE/l9YrPxi+LD+9oDE/Ugc6P+5vMT9GiCg/w4UkPzn6Kz/cXjY/vOEdP6TGOD9N5jE/rSM3P+jcKz+H4S0/1L4wP3w5Jz+S5Dc/e/gsP+zeOj/Mlzs/O70nP/YiLT+28Cw/f5oxP53hKD+brCo/vI8uPyGnJz//JC0/0+k3P3yFLD+YMyg/DDU8P/fALj/9TTA/uc0zP8leMD/6qiY/zeslP5k9ND8+8j0/CDQmP0HTPT/IGiw/CV84Pw6YLD8DYS4/V9UmP1u9Kz+nnDY/MRI2P1h9Lj+8/io/QtkmPwOkND+z1zM/D3A0PxcLLj/2RTo/Oa0oPxk3KT8pvyM/5e4vP18BMT+3riw/MjYwP9k3PD8a4Ds/KGI1P3lqJD8lhS0/KT0sPxXUMT/tSjI/O9UuP35MLD/zNiM/9pwsP4iCND+U4y8/Rvk5P9UTLz81wSs/3bErP8KWJT9muzQ/DzsmP9FcPT/T2io/LYIsP8J4LD+hRTQ//7I3Pz/RNT/mDD4/sFQqP6wAOD9QMTo/HGQtP8jnMz/CizY/ymwePy6rLz+hbDE/5D0sP12sJj+z7Cg/fWozP4oPMj9/kTQ/CEwvP20uLz/GaDA/KwQ4P9mIMT8tpTo/+eUhPz7vLj/gzEQ/rTcrPweJJT+tDis/lI8sP+QQMj/6fzQ/AJMlP7nMKj+yWzg/3VQtP+4jIj84qDY/moAqPyQXNT8PnTM/xfMrP/koKj9nryk/iB0vP36QID+3USw/tSktPyDPMD8VwzA/rDctPycKNz/Mwzk/lo4xP2S9MT8Nnyo/yKEzPyBkMj/X6D4/5eMsPzIxMT8PoS4/0iUqP8yjMT+pdjA/h+pAP/nGHT8sS0A/gxkuP5w5MD8a7Sc/nmgsP+KHKD+Dczk/5H84P2GHMj/47zI//BsvP4htMD/GGjE/AKc8P1WiMj9Mkzc/Dak0P5RmLT9BlzI/NSQtP4+8KD98ljI/0OczPzwcMD+nASU/1v4+P9oHKD/wJyc/afoqP+zsKj+2iDY/iic+P0urMT+kSDA/daY5P9qwLj8VZTM/PmEyP1l7KD/7Xy0/lZU9P9XHIj8DXzU/GvI5P2/WNj8Gqyo/W1I5P+F8OT/wLTA/EyUuPxb7NT8VNi4/jz8sP+sVNj8CZjQ/bJcqPwJzLT+b6DQ/He0mP8vNMD/Uwy4/xbAvP4TRPD+pNDc/P5cxPzrdLD+i/zI/ooM3P1q3OD/IUDU/bPUnP7o2Nj8R7Ts/zDE+PxzYOj+fHzQ/AlkxP/MNMj9hNkE/hqosP98NLz+BKS0/EQ0rP+EALz9rUzI/KW8oP+2MMD9mRjM/pZAoP8pHND+ICjQ/IaQ6P5vWMz98sC8/xaYwP+3ANz8m2Dk/u3MyP1kiLz8sGjM/+MslP8m5Kj+yajY/X6c/P6V3Nz+KOTo/CwVDP98mOT8q0j0/1KI0PzW4OD88/TQ/tbkyP5ShLD9KzUE/tbJFPzaLMj8seiM/KectPzpxND+UBz8/PzczP+EwND+UdDs/qtAuP1JAND8U7zM/KTk/P90LNj9BGzg/zosuP4vkLz+Ily0/NKYsPyWFNz8qqzg/5+0nPy+jPT+vQCk/m0k4P0QGMz9RFjg/k0MuP5CHOT+Nkjc/aBA3P8iyMj9bvTI/lFMuPwCnIz/A3yw/Duw7P0qmOz8DlCw/YVMqP6knKj+JHzQ/GV8jP7pJPj+aei4/QRAwP4abND8zeUQ/uYk8PzCTNT+VIDs/2itAP0VOLT+BVjc/07k2P7yDOD+gSzQ/6VExP6rJJz9PLDI/XWc2Pz/YLj8vNzo/sk85P/P7NT9qmS4/7gwuPyKcOz9wQyk/0pY1P1nsMT99nTA/Kfw3Pza3Oj+E4ic/tEwlP6BgOD/zpzc/+NQwP1vOIT+0ljc/Ewg5P/1gLz9Yp0E/kkg1P1tzKD/r9D8/zRkmP9FUMj8EYzI/lOowP8fnRD8nqTE/fnVDPwFNOD+uMSM/ReYuP4lXOT/qISs/LgAnP/1CPz8GXjc/rrkmP6NhKj8PjEI/wNMvP8zhMz8WhC0/PhcyPx/LMT8mCTA/0ikyP1MvQT8zhzo/23M2PxqJND+hyVM/chE6PxpUOz/Whjg/OYw6P9q4Pz/ANjg/EDkvP9aAKj9aKjg/E6I6P7zNJT/aADc/1E41P0elNj9otyk/HGA/P3LHNj+SCzY/TW00PwP+MT9gVy8//NpEP6+xQD9L9Ug/Ac9BP/tqMz8OYjc/n9w5P7b2Qj9NDDI/GRstP5T9LD+okTE/4nAyP5tuNT+VYyw/O7YtP6/EOj8bUDs/o8kwP3qjMz9zbz0/zB4wP8IHLz9uATw/5Q4zPy18MT8xhCk/PlY5P5iTMT9G7To/GqYkP55KLz9Zlzs/OZExPwYWLD+rzTo/yTYyP4A9Mz8sGCU/2xw8PxvZLT/PRSk/yj8nPw//Lz+YrT0/a2cuP35VIj8UviU/SCsyP1pNND9uhTE/NCguPwJ7Nj+HLi0/+Lc1P4rLND9d3S4/BBU+P2IqLT9CwSw/JyBAP572Pz+zM0U/jPsyP4A9Nz9l2C8/Q0Y9P4CrNj/bcCc/fLo7P3AbMz+Y+jA/ykAyPzDHKj9hli4/pNI0P7vLPT+5kTo/hfM7P33sPT+/Hjc/QVszPytAQT/jhy0/lqQ5P4/AOT/IvzU/GBJLP0QkOD+1FUo/iwU+P1q2PD+PJSw/lYYuP23wPD9i9DE/K1gkP+49Pj8F7y0/DCwyP90YND/sgzI/k/MzP352Qz8wsyo/D18yPznaMD9oLzs/3rgwP5h2Mz+3SCg/+9U3PwFHNz/Jijs/Tf80PwG7MD9Boy8/gF85P0/WND82W0c/qNEoP9IGNT9q/TQ/gVY7P9kVPD/HtTU/MGQ0PyZ8Lz/GBz4/7ss7P7ibLj86MDY/+2I1P4iBOj+Exjc/HtM1P5eqND9LwjI/X1Y6P9LUKj/F5zA/9e8sP4ddMj/mpkQ/HLQ6PyVIOD/Hbiw/NnQuP1ZnLj/74Tk/ifYxP70SND9wQic/oqM2PyFBOj/VdzQ/ylk/PxbsLj9CHzQ/RVY+P/lnND879y4/BuY/P6l1Nj89Tzw/iDY/P5D+Lz/z0TE/YUw4Py+7LD/O2Tc/7XwzPxrKLz9eLys/Bec2PyY3MD9GCzo/DoM5P6fiKz+OMDQ/V5ErPzrbPD8PQzM/p7AwP23eOz9gJjU/RoBCP0fRNz/+AD8/WbkyP85RNj+Ql0A/m+czPywDRT9kazE/lAU/P8aMNz/z3Tw/G1cuP/G3Nz94qDg/8h8sP/NHMD+ysDs/e705PwrLQj91Qzs/HN4yPyhlKD9YrjE/YUUzP+WjPz91OkM/Xzw6P2KSPz8BOj0/KoYsPz9jOT/BNik/z60/P2oUMD8rOiw/o+8oP3ZwMj84wzk/jtI9P8OzLD+wpDY/2Ms6PwJeOz8aQTg/FLs1P3nMND/b8Sw/B+o1P5amOT/d2yo/JnFAP5MWNj/yHDw/POEzP5t3Pj9I2i4/oUc3PxgqHz8+/D4/4zY8P8blOz8JsC8/rTE3Py/INj+ftTQ/ijMpP/DvPT+SbSo/HbYdPwH8MT/MjTk/DWkxP3RBQj/qPj0/+nw2P5jpQz/Txjc/j802PxVsMj/hISs/sdA/P0ASKj8/Njk/QlcpP1l8Oj9YuTE/D40uP0MXMz92jzY/4xk2P5UROj9T+jU/tL0+P0qxOT8mMDU/rpYzP38tKT/pCkQ/v3I+PxMhLT/uaEQ/kTwxP0YzLT9EET8/0CM8PyHHMT/qtTo/OH48P4G6LT9j8yk/Y6gzP7Y5OT+pRjI/phU/P0dhMT8hCTw/eZ0zP/bVLT/x5z0/Sg4/P/p+ND/azy0/X9BFP5/rND8oczc/Y0c5P7XCSz8sfy8/Vq8xP4V/Nj+C7Cs/b3MpPwpNMz9Wgys/SyYmP4XFOj9Qoj0/s64uP9IvMz8DJSk/fKw1P498KT+wGjE/H/4yP0HTKT9LwTE/Lgc/PyuWND/y7Sg/IPhCP+jnND9d6yE/igQmPwDvOz8u+zk/ukUzPy0RPD8bqSg/fNkzP3/xMD/ckzY/jrorP3ozOz/eXC0/UPIlP/pvNj/tG0E/vyAsP2khKj8VeDI/NWksP9MGMj8iFDg/2jwmPxoMLz9PmCg/efk2P6+PNj8jtz8/EhUvP7CYNz9LwS4/YYEpPwCUMD85LjU/YO4+P/SmMT9j6yk/5QY4P1nmKz/OMCA/0QU0Pz0sOz/Arjg/qVUzP9qYKj8=");
\ No newline at end of file
@@ -0,0 +1 @@
+window.EMERGE_CHUNK("routine","E","cIoIP/TUGT9qhhU/OQYRP6L5Bj+Xox8/WvUTPyrgGz83Px8/BCIcP29mGD9RAx8/nPodPz+eHj+cXQ0/YREXP33pFD/FsTA/0BIVP/rdIz+vVA0/czQXP1RNDz+z0Rs/tksoP3aNEz8WfyA/e2kgP9xpHz81yhg/Pl4ZPziiGz+WNhw/V9sbPxCrID/6vhk/Z/IeP/gdHT8kMhI/OM8TPwo7Hz/wnx4/lj8jP03NCT//tR8/JoAIP7SgGj/2CQg/xXklP06OFD8G4is/u9McPzu4IT+drR8/CBwpP1IbGz+hmBI/g0kSP4VhFD/12xs/fC0eP6uFGT+WvBw/QYAnP+4EDj8GZhc/aIsjP0OBEz8OsSM/Bn0YP6hJFz+PUho/QCodP+w+GT9ykSc/EygZP/8kJT91bSQ/0HYaP6/EJj/kQCo/iSghP/D1Ij8r1w4/CdwgP5DmJD+yhyo/MQkZPxEnHj9byiU/P0MXP+d9IT/dJAY/WEEhP2UXED/V2Q8/4hoaPzC7GD+GjRw/6ywJP+ZVFD9kqio/faIcPwyKFD8BNyI/UfUaP37PIj9TJxo/gnQrP/hXHj8cjB8/TugOP7mjFT///yQ/F3YWP/BMJD/7pg8/bBkcP2WbIz/pwx0/nhwaPxXmIz962yo/4s8gP7g2KT9w2CQ/P/cYPxNNHz/t0Sg/JRYUPy5uFD8c9hg/f3MLP0gaHD/4WiM/QwAePzAYET+LLAw/KCsfP8jmIj/2lyY/mW4bPzQQED8cER8/8LsWP3QmED8ImyY/Sw8QPx6jJD/zTRU/lKAgP/KcIj/U6SI/N5sZP/RbIz9DOxA/fbINP/bkFT8wViI/arogP0foHz/ybCA/pAcWP0OLIj+A7hU/5lYTPzi6Hz/IShc/yJUSP49FHD+ILyI/LYwbP2pmFj8HjR0/R9QnP/MdFz+E3SA/fugXP0xoGz/S9iI/M0MbPyvLID+osR0/eXgeP8OlIj+XByo/YZITP6RXFz95yiA/U9g1P8w0Iz/LKSw/rHwTPxqtHD+fgSw/lvEqPysKHz8ZUSA/EsYgPyZ7Jj/SACQ/6M0gP9d4Jj/oUjc/IVMXPymfGj9mqho/6nQePxbuGj8eeA0/+ZAiPz+rGT/d2xA/ncMUP1B4FT8hHRQ/lBgbP0emJz8vbiE/8pUbP41CKj9GFRo/JvwaP/0lGD/17Bw/5f0iP1foEj9z4hg/tYYvPwmlFj/VESE/eEMdPwKiHj94+hw/Zm4ZPwccID9N6R8/fcglP2FhMT/gSRw/Uv0qP+1oKz/0myA/O/QVP2cNID/MOBM/VW0dP8BmGD8ypSQ/Lu0fP0x2Dz/ERCI/B8klP57PDj9wJyU/8roNP03MGT/xCB4/TR8gP66lHT9vrCg/CxYlP1adHz9QIiM/ulUWPzJXHj9BGRw/qokpP9ncHD/k+yM/QZIbP2VUFD/ZmyI/TLAiP36WHD/GCws/pxUXP0KbKD+4qSQ/4VUkP1pCIz8kXx8/8gwgP82DKD9WPBc/VokoP7zZIj+wShY/iz0gP9yBIj+ADh4/SqAZP0RlFD+ibBY/E5gbPz+yFz954CY/Gd4fP5bbET+JXSI/fiQhP0t5Hz+auiE/EVskP2T+Iz+CrSU/x9gkP13yIz9WUCI/0psbP9YaIT8B0SA/j8oSPwOUFj+B8BI//XwYP88nJD/KYyA/4fIXP1PrHT9L8B0/v9caP9n0Fz/rsxw/SlgiP8x3Hj8GkCI/voIqP/2sJD9djyU/gS4ZPxysKj91RR4/3WUgPxrPCz/eyRg/mFUfP40yFz+yzRo/d5UZP3GBKT+iOBo/4nIWPxjaID/OCRc/XQgmP+sIFj/4rh8/6oMXP4XzHj93mCQ/+BsaPyn6KD9kTCk/TQQdP3bbHz8tsBc/dr8rPwVPLD8eBSM/YtwoP9DqHz/ILxs/31EmP2IJED+pPhg/ZAIdPy4tDj8A3yI/2ewiP6l5Gz94URw/MqYXPyZdHT9xmxk/WdsiP3WvGz8bBiQ/5N4IPzKSEz/73Rs/N2I0P1HMEj8KmS0/zHggP1s/Jz9O1hg/bKUgPwCqHT8ewBg/CZ8ZPxrvHD9BzyA/7zEgPyzjFT+0nh8/QswbP5U4Dz+uyyc/J4MfP30FID8eLCI/nSkbPx5DFj8ISh0/PwMZPzl/Ij8qHRc/4FAkP7KuED9HrSA/dwIcP1EdIj+8vCI/8rQbPz2DIT8EWh4/2fYrP6f3GD9tnRs/KgYhPw74Ij9MlBM/UqYQPz+AJT9nVhg/ez0XP4PXGj+AjBU/ESMUPxsuIT+A3xc/sAccPzhgET/+ehg/USgfP6t0ET+0YRk/sg0aPzNbID/t7hs/WPIVPy6QIz9Pbhc/7uYOP5JeGz9m0Rg/4cEeP+HAGT+UFB4/FkQPP6oUGD8cXh0/+swVP9b9IT/nUQ8/7/McPxYwGD+YyRY/aYEdPzsZGT+2ehg/Ke8kP9aMJj8VMRQ/NzYZP83rEj9j6xE/BfoePwjFGj+gch8/fu0TP260ID+ZyBo/YbgSP38mFj8GTSg/oaodP8BJIj8qphk/LowQP0tvIz+NgR4/cDwePzC/Gz/qDR0/d/kdP4e/DD/SJyc/rCkhP3XoFD9pcho/SuYNP28cGj9l1hw/FUciP0EdGj82KBg/jFQXPyvsGT8/ahc/3gkeP3AOHD/hSRs/3qcaPy8iKD8gJhE/3R4hP62SDz9YATI/1DwWPz1IGT9APBs/JIEdP+NoET8KBCY/VzMYPxjnHD9t+ic/qjgTP4kgIz8TjiY/BbYdPyOAFT+jHCo/2UsjPzvIFT/YXBk/PVogPzsUHj9fZhQ/XUoXPwmlIj9VVx4/tRIIPxTyLD/bfRs/ZuAWPwk7GD/eWB4/2K0SP+OrGD8soh8/TO0fP/kRFD+jwxo/ShEfP32HFz+q2Cc/nOEhP6gEEz8RPxY/hRASP354Gj+sQRo/BjgZP9QyGT+8cho/kpgPPyq3KD+J8BM/MREbP8h0Dj91/x0/hg0VPy9vGD9BLh4/VeYWP1XdID8ALR4/UTEePx6YGz9T2yI/ZgIVPzMcHz/AeAw/xf0iP5QhHz9PfxA/fM0ZP09BHT8/CBs/gAYVP/25Fj84sB0/NqcVPy2MGD9Kmxw/4/YRPyeQFD9DRAY/EGIQPzmDBj91Who/kIQgP+W2ET/+7RI/2M8FP6ERGj9w0xE/hiwSPwBRFz9mIxI/j4kZP+V0Fz+gIxY/i0cdPxCiFj9K8ws/o1AfPw7DGz/xwhg/5+EOP95/ED87yxY/xc0aP/8GCz/mISc/amIRP/YjGj8l4Rc/mGwiP/7XED/GLQ8/6BASP0m0Cj/PuiE/a0wdP1B0FT/MohE/W1wgPwAWHz9YnA8/YggbP/kWFz+luQ4/3uMVP7WyFj9cix0/g28ZP1bPCj84ghA/eS0XPxNLCz8m3R0/OJoPP6cnDz+WLBM/YrMNPx21Dj97KSQ//aAYPxoLGz9PjBA/hi8QPyarCz8FjhI/ovUaP82rHz+rlgk/viQEP9QQHD+ZFxA/0lcYP/pjGj89ER4//ncTP5BTFj9P3A0/wDgOP/k2Ez+ZFwk/i7wGP+UeEj+FaBw/Q8sYPxR5IT/NhRE/yWgWP3RcHD/Q4hw/+xcPPwBQFT8pjBU/C34PP1hLEz/CxxA/b+YNPwxfFT/44BE/0kEbP4GhFz/pwxY/KG4WPyZ4Dz/o0xg/g+4kP9hEDT9ifxU/8OIfP6KoID/LCxo/FYwkP8gVEz+6OA8/CRsdP//FGD/ChxU/a+cKP9H8GD8oCx0/wD0IPyw0Gj+ZrRM/iTUbP7DFGj8HEw0/k4sdP8jYDz8Tqxg/KOgTP98GGT+CSxM/+jQLP2zYDj8/Pxw/X64LP7JgCD9Bmw8/dwATP6F/JD8Rswo/aTkOP79GGD+U4xk/q0wOP3bcFj80sBg/vk0QP037Dj/Pfxg/xt4OP82+Cz9sUg4/F7IRP7W1Fz/DDxU/MQoXPzAwJD9DoSI/6tATPwF8FT/LMx0/fJsLP5a6Fz+o+CI/qAIWP8P7Cj+ybwc/nf4LP9SdFD94mg4/xbkPP8IpDj/v8A8/7I0YPwzJCT8hhQs/TQ4QP2ZZFT/t6Rk/pzUOPyf7DD+oqBU/iqoVPylLEj+uqRY/wmQZP+B8Ez//ERE/pscPPz13Fj+JxBA/sKwaPzHSEz8TJxE/oyYMP305DD8EuxM/wXUUP9NDFz8XexI/sYcZP1fxCT+IPhU/O8cfPyBpHj+28SI/IZsgP7aWGz+TNBQ/7BwYPydFEz/eZh4/KJAVPxB7Cz+cLBo/NBsaPwHnEj+5qhA/AbYaP051JD+6BwM/ZOYaP6bBFT9hGxY/cxATP/BtET/Qyx0/xxUZPxkYGz+/pRQ/aWAdP/7fCD/qah4/LsoJP1cUGj9WQBQ/hAgZP8NXHj/MDRI/t2EMP4QEET/uhxM/xAsSP9XTDD+dHhU/W0wWP5myDj/q5xw/JakcPz28FT99ZRE/dfcYP+ulFz83/A0/ZRAOP84pEj8eYBc/2h0OP9G4GT+gWhs/Ja8VPwT5Ez8PMh0/veIaP1yODD8DORY/cDoUP+QfGj8+1Rs/sXgJP8CBJT+ZRgM/UdwPP1rtJj/mnxg/e8EhP3GaET+d1xA/ZeIYPxclCj+FPRE/lW8ZP+9yET/Tzho/MjwQPx5BGz+60x4/ciALP4kSFD/SEA8/qBAWP6xWDD/iaBs/0AEWP7kqEj+oWBQ/X4sXP8P2Az+YThA/rxQLP852FD8czBY/VDMiP1J8FD/hgAo/x/wdP/FZEj/JTxc/TQEhP4cZDz/NBA0/s5cYP0KyGT8/PRE/W9UJP3LCED8Q6CE/8qkRP/ySEz8bYg4/K7EcPx3fDT+6ug8/5bEeP1n/CD8y+Bc/FQ0aP2cbIT9NsRE/ypEQP8b9FD9BqSA/qCUeP7suET+BkxU/imAOPz21Cj9Fqyc/O88RP/bqGT97DRk/dlEgPyH1Gz+hqCQ/YSAOP9xLDz8oBQs/GjAPPxMpET9HXwc/YisJP8GXGD/wnxQ/CSceP8AFCj+Xqxc/ZWMOP99mGT9GnwU/tqkjP5vuFD/M1yY/4rUbPwiDID+l9h8/pKUaP4NiGD+PIhM/8xQeP8BlDT9QNw8/i6gZP8BJFT+OpxM/sIwVP8ZLHD/2dRA/ryggPzuBFD+cwhk/XDcgP9ceFT/nhB4/FqwaP3CHEz8mkRw/E0weP8UEHT8PzCk/lrMjPx4WGz+EgxI/6XIRPygvFj+U/w4/UygSP9nzFD++jhM/TPcbP669Fj8JgxQ/PQ8jPwfMIT+FLBA/rScYPzMeET/zagk/WwEaP2ioFT8=");
\ No newline at end of file
@@ -0,0 +1 @@
+window.EMERGE_CHUNK("routine","H_c","AAAAACxzJ7uMVoe7NFLCu7sy0rvVF/q7vTUlvLvyLrwBdim8zJdAvH2fVLyG2nK89lGJvOWJl7xlH6+8w8q8vEwm2ry+mO28ztHzvLmZ97xnFAa9+hQOvWQHHL0toSa9HX8vvRTNNr0p1EC9gqhGvVc0Ub3LvF69pDdnvcRCbb1cBXi9izWAvQd3gr2hHYi9aa2NvZPIkb1mpZq9SGmevYB+o71/7ai95MiqvS+rsL2/BbS9tja6veTAvL1+c8K9TlPEvScwyb3R6c+9Tj7UvdmZ2b0kzty9dlzevQTu3r0rjuO9T7TmvUxi6b3F/u69TCjxvdVG+L0fzfm9SVz+vSwaAr46ZQW+rRIIvgs9DL6Nmw++UV0Svp+2FL7zcRi+bz4bvhwUHL5azh2+f6Igvo+oI751DSa+mssnvgQ0KL6/eim+hkEsvuLULr55zi6+q8kwvnHEMr57Aje+kKc6vnuCPb5SDUG+kR9DvjozRr4L3Ei+/DZLvlsFTr5ARlG+sHBUvkSCVr7Awle+yZpavuNVXL4K9l2+2GxfvrQlYr5fEmS+QM5lvto+Zr4n0Gi+AAFqvk7Far6mV22+08Fwvh2Fc74FGXW+UMh3vrlXe74FQH6+SBmBvjDJgb74UYO+5u2EvmFLhr4JU4e+2QqIvgQUiL56Dom+3gWLvq7AjL5AO46+4EGPvr+fkL5rQ5G+NauSvkGXlb63P5e+GSWYvpCdmL7HAZq+go6avh7bm7479J2+fCGfvtq4oL7aDKK+BVqjvnUspb60jqW+u+OmvlG1qL476am+WGiqvtfkq74Zt6y+23mtvvvSrr5rPrC+OdewvmPWsb4PxbK+J4W0vqFGtb78WLW+jbq2vlEquL4KXbq+EU67vn4evb44572+UAW/vsrBwL6j08G+2z/Dvhu7xL6K0cW+cvDGvi/sx776uci+5PHKvpTfy75bS82+Ki3OvuPyzr6Wd9C+jqbQvv2P0r7iVdO+4M3Uvupz1b6TJ9e+IUzYvvp82b7pitq+Tf7bvsyr3b6wVd++xgnhvm2U4r6VseO+LmvlvpK057788em+0UrrvnNf7L4+X+6+KRDwvsPA8b4/b/K+cAr0vtng9L78dPa+wMr3vqMD+b7KLfu+Omz8vkWZ/b6Yyf6+cScAv9cLAb9lBgK/BKcCvxQfA78hwAO/WZUEv9qXBb/LIAa/VPkGv4++B7/cegi/XykJv+2SCb9CLAq/ppUKv1FDC79KnQu/SJAMv30xDb/WkA2/DQkOv6jJDr/6lw+/S/gPvwAJEb/Q0xG/RKgRvzcSEr9NqRK/lSYTvwquE78cWxS/i4IVvxoFFr/mjBa/7AgYv4tZGL+SAxm/KLAZvyFSGr9a4Bq/ak4bv8fkG7+Z0xy/puscv/EHHb9FrR2/TV8ev2H1Hr8hYB+/ks0fv6MbIL+dXiG/gjUivwq3Ir8OqyO/b+kkvyuyJb9bFSa/a0gmvx+jJr/vbie/vU0ovwrDKL+AhSm/ri8qvySiKr/OESu/S8Yrvwh7LL83/iy/G2stvzxALr9k/y6/Ue4vv4jcML9FYjG/HdUxvwOUMr9cKDO/4I0zv17GM7/DRzS/Foo0v26jNb/VMja/8oo2v9r5Nr+wWTe/JOg3v0a+OL8qYDm/d8w5v0FSOr9g8jq/C1k7v7r4O7/sXTy/euE8vzM8Pb/BZT2/xvA9v0haPr84NT+/f/g/v0HXQL9qKEG/TghCv64uQr8vYUK/J5NDv6F+RL8e8kS/5/lFv5i4Rr/SFEe/v1BHv38bSL9rrEi/UGVJv5QOSr/6jkq/KQRLv68XTL8xCk2//aBNv8hBTr91+k6/zYBPvy4ZUL+bdlC/sx5Rv864Ub9GWVK/yMpSv0lOU7+N31O/nARUvwN9VL/EP1W/iVdWv7fgVr+6h1e/ZbhXv4elWL/WFVm/D+xZv2yCWr+HGFu/MYBbv4SyW79BIVy/2+xcv+23Xb9+SV6/AyRfv4GZX79uGGC/MlVgv+e5YL8OEWG/g6Jhv2GYYr99O2O/nbVjv2dnZL/c8WS/Mz9lv12UZb9b8WW/XrBmv4CtZ7/BPGi/VWBovxVAab8oFGq/5MRqvxOXa79eemy/YqhtvwJNbr/9jm6/GxZvv3Tob78Ep3C/5k9xv1wlcr+N6HK/jspzvxR4dL/l+3S/Xg91vw31db/DvHa/G4V3v4UdeL/T/3i/zvl5vySWer+JI3u/uIh7vwY9fL8Gx3y/zKt9vy+hfr//J3+/ZZt/v9ofgL97XYC/lXyAv4bQgL9pIoG/cpKBv0T/gb9wVIK/4MeCv4ANg7/GWoO/9qaDv7DXg7+LNYS/+YiEv48Ahb+lKoW/RmuFvzy6hb+iEYa/tIeGv5bEhr/d/4a/6VSHv6uih7+Q+oe/y0GIv+2FiL/b64i/Ik+Jv1yFib/WtYm/H9eJvw8vir+Pioq/GdiKv+kqi79RXYu/B5KLv8rdi79F7Yu/HE2Mv1ahjL/QNI2/y66Nv8oUjr8nlI6/YOSOvxMUj7+sd4+/85ePv4IDkL8PUpC/9bWQvyoIkb/uZZG/TbSRvxPwkb9mHZK/1VKSv4lykr8EuZK/rwqTv0d/k792vpO/4weUv1wylL9CtpS/zgyVv55Nlb9AmZW/ngCWv5sulr8elpa/DPiWv5lVl783dJe/t92Xv0dDmL867pi/YTKZv/Sfmb+1AJq/dTGav3Komr9l3Zq/6TKbv4t7m79u05u/WEicv2GnnL/vBJ2/NVKdvyirnb/y952/yheev8qBnr84vZ6/aAGfv2Q/n7/be5+/i66fv/4joL9KX6C/Ceagvz8uob/sWKG/UsOhv2sbor+gXaK/f5Sivz+Oor+L5aK/riCjv5Jeo7+MjqO/ntajvz0ppL/KbaS/ob+kv8QWpb9KVqW/p5Klv77Vpb8n96W/XJymv3kSp78KZae/oc2nvxAdqL+0bai/JYCov9P9qL99Yqm/R8Gpv2Qoqr+wYaq/lpuqvzPHqr8VF6u/pXCrv5q0q79E+6u/bFSsv5eNrL8y6qy/aVytv7/Grb+KiK6/YviuvytDr78/c6+/68CvvzAxsL+ce7C/XOiwv95Ssb+Vq7G/HemxvyMPsr9dG7K/GFuyv6iQsr/i/rK/aDSzvxSSs78nBbS/CHS0v8WltL87nLS/Deq0v4s2tb/9lbW/yy62v7RTtr+H37a/LzG3vxFgt78IoLe/t8S3v1gYuL8JT7i/fcm4v7MUub/7i7m/MPS5v5MXur9njrq/47m6v8kVu7/Waru/bNe7v588vL8/n7y/OeC8vxJavb9u4L2/9Vy+v5bdvr+4Xr+/kn2/v9LJv78XGsC/e2bAv+jYwL9KM8G/N1vBvyK2wb/ELsK/Ro/Cvw65wr9l68K/TyXDv8Zmw7/gv8O/HA/Ev85XxL/CsMS/E+zEv9Usxb9bbsW/aMnFv7UVxr+Opca/SwzHv8FNx7/308e/1EnIv3HIyL/OIcm/rovJv2e2yb+M9sm/ezzKv9Vgyr9Oicq/nsLKv3vzyr+GX8u/BrvLv2chzL8Fesy/uh7Nv+1Pzb8Kqc2/JezNv7o6zr8yrs6/VN3Ov/tNz7/uZ8+/8tLPvwdJ0L8BjdC/od7Qv00A0b+yTtG/dYbRv0fY0b8iLdK/FWjSv5Gh0r96y9K/d/bSvxlm07+0l9O/HdHTvywy1L8ibdS/Ya3Uv5nX1L/MJtW/l6rVv8gx1r+Ymda/GgbXv6dV178Ms9e/fgbYvyo02L+jc9i/Ku7YvxgP2b+xJdm/Fq7Zv5Hu2b+iH9q/tEPavy7J2r9lHtu/d3bbv/q/2797Lty/bsHcv+Am3b9wot2/7Pjdvz1M3r/ard6/BhTfv7hX37+mqd+/ICLgvxNQ4L9an+C/6sXgv4Eo4b+rP+G/yp7hv4QD4r9GOuK/SKbiv0ry4r8DGeO/N5Tjv8KJ4783veO/zh/kv2qe5L+m7+S/7U7lv0mN5b8g2OW/oADmv8wg5r+Kgua/esrmv/Eo57/tXee/W6fnv2z957+1W+i/GqPov4wN6b8lRum/CYnpv20N6r9rYuq/lovqv9Xw6r87Heu//X3rv0u1679bC+y/FU/sv0Cc7L/a/Oy/20ntv9Wh7b9m3+2/r23uv43r7r+kR++/pZHvv4TR778O+e+/gnXwv6SW8L8zDfG/Ymfxv92j8b82qvG/v//xv/9T8r8mlPK/+svyv1su878sVvO/5NTzv7sU9L8IWvS/IKb0vxLD9L8eBPW/nFP1v/149b+wnPW/2OP1vzIu9r+Fm/a/5+T2vzgh978sb/e/zu/3vy5W+L9rzvi/Owr5v41K+b/xyPm/7ur5v0Iw+r+Kgfq/Rf/6vy9K+7+mdvu/G7L7v/FM/L86o/y/nO78v4pb/b9ZwP2/LP79v1Ad/r+NS/6/DGb+vwW2/r+OBP+/No7/v3vS/7/8CwDAYi8AwGZYAMBHiQDA/q0AwLjDAMCKAAHAsCUBwN84AcCMagHApo8BwNOzAcDm9AHA7gkCwCAWAsCsFwLAbVECwIB4AsDAmwLA5LwCwB32AsAdNgPAgl4DwAKVA8ApuAPAp+UDwDEJBMAbGwTApkUEwAxqBMCYjQTAIMIEwHzRBMCJ/gTA7kMFwEd1BcCRpQXA9OgFwLclBsBbUwbAmk8GwFBdBsCKhAbAPLYGwGrxBsBMBwfAOC8HwNhhB8BNiQfAqK0HwL25B8Ak6AfAYiUIwIVDCMDxcgjALp8IwPqwCMCAzwjA2gEJwOQiCcBYWAnAxH0JwKauCcCW3gnAaxQKwFdUCsDvfgrA254KwG65CsDcsArAlPAKwPUwC8BQZAvAvZQLwL3LC8Bi/AvA1R8MwIQ6DMDkWgzAd3oMwCGfDMDOzgzAv+wMwIokDcC3WA3AYoENwCKeDcCszQ3AhQ0OwPMVDsBuMQ7AolIOwOuDDsDNlA7AU6cOwFTMDsC77w7AeQYPwE8eD8BARg/AK3YPwIGqD8Dbtg/AyNQPwDjyD8BtJRDA1zEQwDVGEMCmbBDA9b0QwG/PEMD4CBHAOi8RwIdrEcDPmhHAVtERwCv8EcAtLBLArzkSwPtAEsDLeBLA1pYSwPykEsD6zBLAQd0SwP0SE8C0QhPAlXITwMqXE8CYtBPAYuQTwD0JFMD7QhTAFoYUwGSqFMCq7BTAVhoVwHVAFcBgYRXAj54VwLW/FcBX2hXAzAUWwBMYFsDhYhbAm5wWwAbGFsBL9hbASCgXwGNDF8CYXxfAm3kXwAaxF8Ck0BfAUg8YwKw8GMAXZxjAuY0YwLu8GMD22BjAePIYwKcdGcCnVxnA+Y0ZwD3AGcAE3hnAfgoawLBDGsA=");
\ No newline at end of file
@@ -0,0 +1 @@
+window.EMERGE_CHUNK("routine","H_e","AAAAAIXi0DnE1R46Un6uujAaY7qS7bK6ro1Mu1vXP7s/sGK7UL17u4b5J7sxIYq78P6Mu2oCpLvMjLG7NNXfu034GbzV2Em84XlgvEqigLzHrZy8hgOkvHkpsLyesLa8gqTDvCtU0LxkYdu8V+/lvE6u+7wYKwK9ERYJvVSuEb2LDxi90HoYvQO0HL2/0B+9t8ohvRIdIL0F6iG9ckAdvQQKIL0qSxq9+mwbvQ5OHL3JHhq9uP8cvUxPHL1RGRy9X1odvRHIHL2O9x69So4kvY8+Kr08qyq9p9IrvUygNL2eNDu9OMZBvYTEP715Gz29Haw/vdcXRr2P5Ue9rTdFvaKRSb263Em9ZFRQvfRSWb2tjlu9hkpfvcR2Yb3/W269iKRtvYGobb2EUGq9Yo9tvdPCbL3eRHy9vHSAvQ5Cgr235Ie9lxaKvZrti723zI297G2Mverkj70fFJS9WJmXvesqmr0vKZy9Zoydvc9uoL1wu5+9haGfvSQOn713qpy9Hw2evScKn721RqC9Uf6jvfvMpb0bYaa9FLmmvS7Oqb30sam97+yrvZDwrL0o/K+9SnOwvaPMsb31XLC9ZEmuve1vsb2Pb7S9ypW6vedWur3yR7u9i/C5vTSMwL0mF8K903PEvZC5xL1R68W9/JbFvaE7yr3Kpcy9zeLOvV6Hzr3XatC9lsfPvRnx0L2S2dG9BbXRvSOO072GNdS9afbWvXUa2b0eH969uNrevVA34b2EQ+G9fM3fvVH54L1tDOG9uEDjvQtA5b3C/ua9jAHpvSQU6b1iZue9SnnmvRgE6L0FXOm9gYvvvbG27b1rN+u9VAjsvUDK7L1+FfK98aP0vZ8b+L1thvu9UDX+vfPF/71Abv+9/Df/vRVdAL49oQG+DcICvs6fAr6CnAO+7zwGvllhCb65mQm+qv0JvpvIC75u2gu+Di0MvnN5DL507wy+QdwMvgooDr5YQw2+jxQOvoc4Db70Yw2+AGoOvqHaDL4wEQ6+TFQQvv4CEb6TURK+17ATvpXsFL6izBS+YlIVvtllFr6JUBm+4gwZvr2uGb6VSxy+mu4dvju5H76MRSC+9cMivgc9I75CACS+1J4mvnqTKL6oxii+x/Eovm46Kb4+Wyq+lxYqvgECLL4Vdi2+b6wsvraTLb7XZi+++Z8xvlBQMr4eUTK+cgg1vkuCNb5hzzW+dc01vt2bNr6fzTa+7ws3vrbqNr6Zwza+f8s3vmJ8Ob5MWTy+Fms8vjEbP77vXkC+B4BAvoHcQb4GwkO+DKBEvuxwRb40t0a+FRpIvhr/Rr4JMUe+EnRJvmPOSr6wjU2+VxFOvrWqT76IrlC+6OdRvqb7Ur4jD1K+Le9RvgL2Ur4UulW+IK1UvhCbVb4d7VW+tgBXvum+V74s/la+9p9WvlkoWL7tVVi+m/RYvjpdWb5nKFu+7RRevp4zXr5OcV++cOVgvgWEYb78O2O+bBFlvpu7Zb4Av2a+wRVnvl+naL4XiWm+NyZrvl2ba76iOmy+yclrvttzbL4vlG2+GBNtvu5+br7NhG++Xh9xvqvDcb7jEnS+xr11vgsDd74HF3e+OZt3viBLeb7QT3q+CZ97vmkHfL6QBX2+vJJ+vpXvf77x/3y+O7Z+vrlEf75oX4C++FuAvvSXgL7fMoG+phSBvqfQgb73VIK+j7mBvh2bgr5swoK+UMmDvm/Gg75YEYS+rcyEvvt9hb5tgYa+F1aHvq1Nh75+BIi+ylKIvhgwib7zKIq+XR2LvmMXi75xMYu+GymMvuKVjL4Jv42+YJGNvsCajb5yNY6+RqeNvs6zjr5Nk4++sLWPvoFVkb7L85G+zueSvsEok74aupO+DmuUvgpglb76BJe+TkGXvjmvlr5njJi+Y/eYvsctmb7GuJm+WOiZvpePmr6q7pq+yImbvpedm76vKpy+vNObvs4PnL6IJZ2+MoudvjZInr5zE5++kZygvmnnoL6rf6G+FmyhvhAZor4fnaO+G++kvidXpb4zIKa+sYGnvp+lp77auai+91mpvgh6qb7hvKm++uipvk8kqr70S6q+g1eqvsMBq75c6Ku+Yv+rvls6rL6FvKy+S5msvijXq77ztay+U7itvn/rrL7+CK6+9dKuvhDSrr5AUrC+mMmwvuVQsb561LC+PjSxvoIms75t87O+w6S0voj8tL6TOba+MF+2vk7Atr7Q7La+gUC3vqh2t777abe+0Pa3vqlmuL6PqLm+9hm6vgj9ub4Y6bm+OWa6vsk0ur6wmbq+N3S8vsnFvL7KKr6+BWq+vpkKv77tP8C+PaK/viADwL7vr8C+QtzBvgfpwb4VyMG+uaXCvjkVw75+4MO+NLjDvnryw77rWsS+LRrEvuuDw74gbMO+DyvDvqbTw75U+cO+uIDEvizkw77+JsW+17bFvhgqxr7QlcW+cejFviDoxb7kU8a+tY7Gvuekx75Boce+I4PHvvMGyL5U9Mi+MOzIvsFsyb4Nrcm+TmPJvqeVyb5UYMq+s7TJvnj5yr46VMu+CibLvtCOzL6qa8y+vn7MvnXbzb7Uc86+RjnPvvX+z764fNC+/e/Qvm6l0L7NnNG+p6PRvhK/0b6latK+EA3TvkKw075udtO+bMnTvj0d1L5gDtS+ii7UvtUq1L6l3dS+GhrVvjvw1b5Q+tS+zbPUvt461L7KgNW+h3LWvltp1r7QdNa+Ex3XvnW8177Ho9i+2trYvqaz2L6W7di+Ny3Zvta+274cAty+RtPdvjus3b5jHd6+/6XevkK+374sSuC+smHgvrQd4b51+uG+0hvivhZG477sCuS+FuHjviNL5L5kVuW+EBDmvnEl5r4area+SWPnvl0A6L6TqOi+9ObovjUp6r7aqOm+jIvpvi+y6b6mvem+NCbrvlSk675Wuuu+Jinsvh8L7L7ogey+7Kfsvt7n7L6C3uy+SdfsvmkY7b5Ypu2+Ahvuvna07b5oq+6+TZTvvvyL8L5USvG+oVfxvgoy8r7S5/G+GfrxvkVt8b6R+/G+4i/yvsV/8r6pcfK+1NHzvspt9L6QJ/W+0Zb1viSR9b4LVva+q+r2vo9U977Eh/e+kEH4vt1V977UcPi+VMT4vn+4+b4L0/q+p8f6viIr+75X7Pu+o0H8vrBP+75yP/u+KuP6vq5a+r6n0Pm+zZf6vgLR+r638/u+Exb8vnBg/L6a6Py+buz8vlnB/b6wXv6+YJb+vj4Q/77t//++XYIAv+rRAL9eEAG/rhkBv6mjAb/KsgG/dYcCvw7WAr/oOgO/kbYDv2mWA7+XOAS/P0gEv+pABL9zlwS/RvoEv874BL8E7AS/HsEEv8GpBL81mQS/FmoFv01MBb/XtAW/8d0Fv9pYBr+JgQa/on8GvxDEBr/yiAa/RFkGv29wBr9R1wa/oKgGv63hBr8+HQe/fTIHv3HwB79o9we/UgkIv4Y8CL8qeAi/wpMIvyWjCL+Yiwi/Z9gIv91RCb/uWAm/AA8Jv0ECCb8QMgm/06AJv0PlCb9i+Am/GSUKvw43Cr+ySgq/FmwKv4lRCr/6mQq/cJkKv0mtCr+owQq/pv0Kv9tPC7/LOgy/LkIMv3jjC79AOQy/ZXgMv+j4DL+bEg2//c4Mv5rHDL8w0Qy/xJAMv3WtDL9Nzwy/2pcMvzmvDL9hgAy/CCgMvxQ0DL+8hAy/1MUMv/DqDL8QzAy/rVANv75WDb/y4wy/xiwNvwJXDb8vDA6/A1IOv3yrDr/yvQ6/hBkPvxJGD79NZg+/i5UPv/ypD78kDxC/G88Pv9NjEL98dhC/dJ4Qv0juD79tCRC/vt8PvxaJEL/P0BC/kdkQv0kAEb/a/RC/XQIRvz5ZEb/XaRG/TFoRvzYrEb+VHRG/lfYQv56/EL8cGBG/q6EQv+meEL8N7hC/Gl4RvxVpEb+bzxG/RSUSv6OHEr9hoxK/bV8SvxG3Er/LfBK/cEQSvxR2Er/abBK/MA4SvxVUEr9owRK/JUkTv68oE7/KKRO/8lATv6exE7877hO/HXEUvz/BFL8GBhW/Y4oVv/CjFb/2nhW/GGEVv5toFb+51BS/rD8Vv80qFb8yVBW/+30Vv1bdFb9/PRa/pXwWv8ycFr9VGRe/gk0Xv3kXF78lcRe/6nYXv/boF79KSxi/SLAYv/KPGL/ewxi/NwQZv7nzGL+Vdhm/VJwZvxXxGb/wNRq/4FYav4bSGr82whq/qCMbvyoPG7/3axu/aIUbv0RzG7+tixu/RAIcv4koHL9gjBy/sNccv0HnHL/oYB2/lxMdv58CHb+NLR2/uGocv4SSHL9snBy/wswcv2TcHL+DwRy/qJEcvy1pHL8IiRy/a3EcvyF8HL9lzBy/0p0cv62tHL+LAB2/Z0Ydv8mSHb9m9R2/2nwev7UpH7/YOB+/XGwfvzT+H781SSC/OK0gv0QKIb+/YCG/EmQhvxI3Ib/1HCG/mKwhvyzBIb96IyK/IJMiv9qLIr+WfyK/B9Iivw/7Ir+FkCK/g54ivysFI7/TfiO/MaQjvw6+I780AyS/XPgjv4HuI7/RLiS/6jYkvwZ2JL8nQyS/LU8kv053JL+hFSW/0AAlv30jJb+6DSW/tjclv48AJb/kKiW/3TIlvzLAJb965iW/XtAlv+nJJb8QjCW/wOklv1UsJr8fLya/1WAmv1PCJr/0Qye/CKonv5+NJ7+mZie/9qwnvxaoJ7/KUCi/Z1Iov7pTKL/GoCi/1J8ov5OIKL95PCi/KEAov2qTKL8BTyi/Luwnv+/FKL8YoSi/u/Aov5cCKb92zSi//fAovxVSKb/6jym//aopv2KcKb98gim/8oIpv8xeKb9b9Cm/EWAqv+uVKr+Ltyq/ILAqv4T5Kr+XuCq/nrYqvyJkK79efSu/hKkrv827K7/f/yu/8Mgrv0b/K79iWyy/U2Qsv/PMLL85vSy/bdcsv5rJLL9koSy/spAsvwjqLL+r9Cy/rcMsvwFWLL+05Su/Uygsv0oTLL+LGSy/BMArv5zbK7/Qiiy/uVAsv+UiLL9i1iy/Ewstv/LZLL8azSy/4jEtv5BQLb+VdC2/jOstv+4cLr+cBy6/LV8uvyeOLr8jHi+/m2svv358L79toy+/nQQwv8JmML9FjTC/q+QwvyjwML9ryzC/99swv7asML8lADG/Q14xv+7YMb/tfzK/67Qyv/50Mr//kzK/ytYyvwk6M7+PMzO/C3wzv9/ZM7+gJjS/QXc0vzT1NL85vTS/BQw1v049Nb9vKTW/SEc1vxiONb962DW/Gtc1v8XPNb+81jW/EAs2v3LzNb9UODa/MgM2v0PyNb+Qhja/M542v1p3Nr/fSza//pA2v8avNr8=");
\ No newline at end of file
@@ -0,0 +1 @@
+window.EMERGE_CHUNK("routine","M_r","VmFXPg3KWT5v/Fk+tzFZPh5FVj6Tv1w++p5aPr95XD7VDV4+ut1dPt83XD6xxFw+4C5fPn8tXz46QVw+JjtiPq/BXz4eDGc+5/NiPpmHZz4YW2I+zR5lPsiOZT6wsWc+FRRrPmdCaT7qX2g+pqtqPk2jbD7wS2s+L6xqPoqQbT7Ey3A+UiVtPkdIaz7utHA+flhyPpPhcD6zLG4+T51wPprgcz7qE3c+Yod1PmttcD56anY+tftxPiWwdj5393I+V0F6Pn2Mdz7e5X4+kKx6Punqej6Yc3w+ytJ9PmuBfz6sIng+bXh9PjKsfT67LH4+UPeAPsMsgT54iIA+BiuEPqySfz4XKn4+CaKBPoHCgT4MyoM+ZmmDPm3ggj4Ir4M+M6GFPugrhT5NBoc+AACFPjJTiD4oBYg+C/CGPnnqiz4yBIc+KmeHPt8Bhz4S44Y+OGuHPrI0ij62iY0+uTiLPgTfij7OVow+Sk6LPgpCjj7N/Yk+tZSOPuPOjD6CQos+XY6OPp/Tjj56eY4+ENCNPgSVjj4hZZI+2DWQPlAXkD4uHZE+AQOQPqYYkj5Z75A+RZyTPlrUkj7K2JM+YTORPp8+kT4F/ZQ+K5OUPo1Vlj4Ue5M+hGSVPiNemD5oepY+RIyWPo9VmT55k5s+HICXPmvKmj4AY5s+MC+YPkzNmT4ft5w+SDuZPqbNmD5mj5k+TMmYPsxpnD7MMZ4+iBSdPt+4mj7uNZs+/bafPhL6nz58sp8+lw+gPrDPnT65YqE+HR+gPgJOnz7qn6Q+MBehPuT0pT6Oy6E+r2OjPrW1pT4DSqU+jSWkPiScpj6/aKI+Vw2kPu/Bpj6tm6Y+FiOmPhGepj5t+Kg+yDKmPukgqz6uHag+5UmpPjbkqT4o2ak+BWOqPiayqz7HmK0+FtirPjpFrj7RQKw+N3axPsY7rT728LA+N+ewPkn6rj6ByrA+2DywPt3zrz4Uwq8+vrOyPo23sT5zRbQ+RKCxPhIvsT6ErbM+znq3PoTTtD4AZ7Y+/Cu0PpCRtj72lbk+S2a4PvjLtj6l7Lc+FKi5PuXMuj4zDbs+1LK7Pu3KvT5TpMA+Xpe7PmrHvD6fx70+ZXDAPs0jvz5yS7w+0li/PrByvz4bN8A+ldu9Pvk/wj4SosE+MdrDPnPfxD5/AsU+xCnFPvxvxj6drcY+6iHGPhNLyD6Ulsk+QiDIPm7rxj5DT8g+3irNPgwKyD5CR8o+oaLKPrN5yj66pMs+Vy7NPolhzT42G80+wnTRPgjo0T6uaM8+osXSPnYI0z4tatA+Y7/OPtuT0j4iH9I+7QrRPoor1D7kaNQ+/UHWPvdQ0j4KItY+s5TWPtT00z5bk9k+QdDVPm5S1z71PNg+PQ3YPoQ42j7Ymdw+ikzcPnmP2j5tVd0+BuPYPqPV2j5379k+917ePlak3D6mL94+u0DePscP3z4bWeI+403iPiQ/3z7ULt4+XGbgPiqI5D4fj+Q+N4fkPpx15D5gAeM+eDTlPgM/6D7y6eQ+IN3pPtal5z6whOU+uVjnPhh65z5or+k+y43nPqmx6j7OB+k+tajqPomk6j5d0O4+lHDuPnkQ7D74vfA+usjtPj5a8D6Gl/E+JnfwPhTq8T55bfI+wQHvPqQ18j580PI+myDxPsmQ8T4Mb/I+n9bxPsbm8j4cB/M+m1rzPuDP9T7mgvU+mdP1Pocm9j4uKvg+Soz0PnPC9j4Xavs+nDn5PjDJ9z6hqfk+QA78Pp3G/D5x5P0+5GP6PguJ/j7w0P4+1uj9PuqB+T49Uf8+/vr+PoKa/z7pQAA/TkL/PjRNAT8dagA/fLMAPx3iAD8VSwE/Oe0CP7sPAj+fFgM/62wCP58kBD+PTQU/XugDPydIBT+yLAU/tvMEP69HBT/AzgU/FYYGP3ExBz86cQY/prgGPwrbBj8QkwY/VRAJP5y4BD99QAg/2H0HP9CNBj8e7Ac/gMAIP0AeCD/suwk/bn0JP1jJCT9T3gk/vaMKP5xPCj+qTAs/txwKPzevCj/uIAw/RUkOP8IQCz938w0/toMMP57cDD9NjAw/MY4NPwdnDT+odww/p4UOP39iDT+M9A0/X2MOPwerDT/KwQ8/E34QP3GODj/SyRA/TxQRPxuHED9shBE/1BoRP09MED82ZBE/jooSP0nOET8EiRI/tikUP8mFEj8VZhM/qVwUPxAlFT8dxBQ/tFwUP96nFT+G9BQ/SR4WP02NFT+8/xU/WgoWP9quFj/KFRY/WxQVP4KpFz+jnRY/DO8WP/dtGD8F9Bc/K7sXP1bNGD9g2hg/5bQZP9sVGT9Guxk/QaUZP3qoGT8j8Bo/HXkbP9scHD9ecxs/3+AaP6hEHD8clhw/wa4aP97pGz9dsRs/2CscP2dTHD+2Ix0/xn0bP2TSHD8p3B0//MocPwnOHj96Qx0/yf4eP05OHj92Kh4/PvwePyJ3Hz+zqx8/HEYgP9tkID+LWx8/HgsfP+snHz++OCA/JjQiP6eDIT9QfiI/vDEiPwbjIj9J/CI/j7ohP2K4Ij8oGiQ/ok0jPzqZIz89rSQ/WGokP0vsJD+DnyM/RIYkPzbRJD978yU/uGAlPwZTJD82Nyc/4A4mP/ykJT8EUiY/jEImP4vaJj8SXyc/5l0nPwLtJj987yY/GQ0nPwdNKD+dHCg/OqwnPw0rKT+wPyg/fH4pP9hqKj9MJyk/XfApPyelKT8Pfiw/L3cqP8yMKj9b6yo/dBIrP2sGKj+mYCw/crwsP7NCLT/GSC0/Br4rPwdCLT9haC4/csEsPyUgLj+d4i4//5wuPyFJLj/jzi8/TBowP0upLz/QfS8/RlkwP8gqMD/1uDA/ki0vP1kwMj+/1jA/kXQwP4c8MD9tYjE/k+gwP8YRMT9VeDI/V8YyP7/mMT9EEjI/lYUyP2byMj/IEDM/a9AzP6DAMj9XETM/CGkzPwlnND8jbjM/uEozP/2tND+RCzU/aiM0Pww8NT8aYjU/iB42P+zQND9KMDc/JfE1P2h3NT+Hizc/MqA1P3c5Nz96NTc/NIE3P4XTOD+RnDg/ivM4PyArOT/i0zY/B0A5PzHlOT8qMjg/zN04Pw6qOj8MUzo/IBY5P2qZOT+Nrjs/qh06P+SyOj//4zo/fpM6P+rMOj8F7zk/vOc6P0kJOz/BBzw/9XM8PxN8Oz+HnT0/xI07P0QpPT+LvTw/CQc9PzXdPT9jRD0/dFo9P44nPT8vDD4/UgQ/P7qXPT84Gj4/1II/P06JPz911D4/w54/P5CCPz+jIUA/I5tAP3OXPz/8kEE/TXJBP2oKQj+Zo0I/r0ZDP2mJQT++2EE/AC9CPwBCQj+UAUM/bcJCP/BwQj9DsEI/LMRDP3IcRD9K50I/h9VDP+JpRD8w7kM/BuhDP8w8RD9sb0U/To1EP+LEQz+0+EQ//w1FP8iBRD9fVEU/LHJFPzU0RT+LNUY/B/dEPyarRT8q1Ec/y9ZGP34ARz8NQ0c/Be9GPw7FRj8toUY/1X5IP4clSD/muUY/AXRGPy5aSD/6fkg/o2pIPwMPSD/bokg/TexIP1pKST/j0Eg/hdVIPxu2ST82Dkk/aWFJP1EdSj80hko/S0hLP6Q3Sz+hb0o/0LZLP1IdTD8NiEw/kOBKP6iVSz8VZ0s/v7lLP2TASz8+7ko/4LFLP0TpSz+XwEs/znlMP1AXTD/USkw/CMRMP+7XTD/BRk0/o0pOP0g9TT+msk0/K09OP941Tz+NDE4/e2VPPy+FTj9kPk4/eDlQP9goTz8a5E8/0+ROP8/WTz/FX08/fnhOPwomUD9LcE8/6k1PP8SzUD8pdE8/ULhQP9BAUD8Y01A/YsNQP4LmUT/8qFA/xLNQP2PkUD9kJ1I/2/hQP/TvUD+BBVE/+dJRP1DaUj9IwVE/KuNRP95eUj/QjFI/ZJJSP+v/Uj8W9VM/LV1SPxXYUj8zXFM/gThTP2xKUz+lRlM/sHVTP8mvUz9nVVQ/DH1UPwiYVD+x/FQ/plVUP0/RVD/8M1U/FG1UPwMmVT8jyFU/eqRVPyunVD/PyFQ/qOZUP+SzVT8lIVY/k+1VP//fVT+6llU/5ThWP6apVT+FWFY/3WRWP4jYVj+EvlY/i+9WP48WVz8aa1c/hAVYP9J1Vz9xCVg/WbdYP0QdWD9f4Vc/pKNYP6OiWD+fz1g/XoZZPx3BWD+wwFg/xeFYPw6nWD8Udlk/eXVZPxGNWT+0Rlk/czBaP4xRWT8PRlo/vONaP+BbWj8gA1s/IrZaP900Wz9Jo1o/YsBaPx4FWz8Ma1s/VnxbP2y/Wj8iwls/03pbP9xsWz//zVs/2tZbPwj1XD/69Fo/NH1cP7YUXD+pa1w/MOZbP2E/XD9b6Fw/dF1cP9LPXD90F10/w41dP3suXT+f+10/V+9cP01ZXT/3h10/z9xdPzGmXj9yX14/Df5dP5FoXj/Rf14/fwtePzlZXj+qT14/vTxfPxN4Xj/DAl8/sAJfP9IgXz+HPV8/k8NfP+dGXz+za18/cJ1fPzLWXz/r+18/nKdfP8QmYD9MD2A/hzVgP71oYD9QYmA/yRZhPyZWYD/NC2E/bstgP9hwYT/YB2E/i7VgP4n+YD9z0mA/x1hhPxFRYj9YgGE/tTJiPx2uYT+6p2E/U8VhPzn/YT9OyWE/2LBhP4gbYj+Lz2I/0lRiP9NUYz+nVWM/lYZiP8BUYz8n9GI/Aj9jP/3MYj/XOmM/psNjPyANYz/fnGM/r1hjP8g2Yz/dcGM/EjljP+3UYz+cF2Q/9pJkP/1PZD+V6mM/Z/RkPxeQZD83tmQ/2A5lP984ZD+e1mQ/STZlP+LbZD8aXmU/Vb9kPwb9ZD/TJWY/4ZJlP8BwZT85iGU/bh1mP+xfZT/gbWU/YztmP9/GZT+iM2Y/tahmP4uUZj8HfmY/ZVpmP2lmZj/wPGc/xEBnPz6jZj8DnWY/QwNnP2qUZj8snWc/f/5mPx66Zz9O+2Y/tV1nP1pwZz+Rb2c/MrlmP+MPZz+h5mY/dONmP6d4Zz/oXGc/9jlnP2vOZz8jhmc/izloP0xxZz8PHWg/JAVoP4QzaD9w42c/ZyppPyx+aD8l2Gg/QERpP9MVaT+hqGg/a69oP31HaT87Kmk/wmxpP8w1aT8F2mg/sHtpP1dUaT+MiGk/UXhpP30faj8eomk/UvVpP/ARaj/+hWo/SFFqP/4Qaj+hi2o/62NqP+Fjaj8k6Go/XaVqP4Dsaj/WI2s/FW5rP1I/az9YP2s/BelqP1RSaz/VA2s/SRJrP+Raaz+eems/uvtrPx6daz9rdGs/ICZsP67kaz9aWWs/WAtsPyURbD9i12s/Pz1sP+UIbD8=");
\ No newline at end of file
@@ -0,0 +1 @@
+window.EMERGE_CHUNK("routine","Psi","AAAAP2IQAD+6IAA/BzEAP0pBAD+DUQA/sWEAP9VxAD/ugQA//ZEAPwKiAD/9sQA/7cEAP9TRAD+w4QA/gfEAP0kBAT8HEQE/uiABP2QwAT8DQAE/mU8BPyRfAT+mbgE/Hn4BP4uNAT/vnAE/SawBP5m7AT/gygE/HNoBP0/pAT94+AE/mAcCP64WAj+6JQI/vDQCP7VDAj+kUgI/imECP2ZwAj85fwI/Ao4CP8KcAj94qwI/JboCP8nIAj9j1wI/9OUCP3v0Aj/5AgM/bhEDP9ofAz88LgM/lTwDP+VKAz8sWQM/amcDP551Az/KgwM/7JEDPwagAz8WrgM/HrwDPxzKAz8R2AM//uUDP+HzAz+8AQQ/jg8EP1cdBD8XKwQ/zzgEP31GBD8jVAQ/wGEEP1RvBD/gfAQ/Y4oEP96XBD9PpQQ/uLIEPxnABD9xzQQ/wNoEPwfoBD9G9QQ/fAIFP6kPBT/OHAU/6ykFP/82BT8LRAU/D1EFPwpeBT/9agU/6HcFP8qEBT+kkQU/dp4FP0CrBT8BuAU/usQFP2zRBT8V3gU/tuoFP0/3BT/fAwY/aBAGP+kcBj9iKQY/0zUGPztCBj+cTgY/9VoGP0ZnBj+PcwY/0X8GPwqMBj88mAY/ZqQGP4iwBj+ivAY/tcgGP7/UBj/C4AY/vuwGP7L4Bj+eBAc/ghAHP18cBz80KAc/AjQHP8g/Bz+HSwc/PlcHP+1iBz+Wbgc/NnoHP8+FBz9hkQc/7JwHP2+oBz/qswc/Xr8HP8vKBz8x1gc/j+EHP+bsBz82+Ac/fwMIP8AOCD/6GQg/LSUIP1kwCD9+Owg/m0YIP7JRCD/BXAg/yWcIP8pyCD/EfQg/t4gIP6STCD+Jngg/Z6kIPz60CD8Ovwg/2MkIP5rUCD9V3wg/CuoIP7j0CD9f/wg//wkJP5gUCT8rHwk/tykJPzw0CT+6Pgk/MkkJP6NTCT8NXgk/cGgJP81yCT8jfQk/c4cJP7yRCT//mwk/O6YJP3CwCT+fugk/x8QJP+nOCT8E2Qk/GeMJPyftCT8v9wk/MQEKPywLCj8hFQo/Dx8KP/coCj/ZMgo/tDwKP4lGCj9YUAo/IVoKP+NjCj+fbQo/VXcKPwSBCj+tigo/UZQKP+6dCj+Epwo/FbEKP6C6Cj8kxAo/os0KPxvXCj+N4Ao/+ekKP1/zCj/A/Ao/GgYLP24PCz+8GAs/BCILP0crCz+DNAs/uT0LP+pGCz8VUAs/OVkLP1hiCz9yaws/hXQLP5J9Cz+ahgs/nI8LP5iYCz+OoQs/f6oLP2qzCz9PvAs/L8ULPwnOCz/d1gs/q98LP3ToCz848Qs/9fkLP60CDD9gCww/DRQMP7QcDD9WJQw/8y0MP4k2DD8bPww/pkcMPy1QDD+uWAw/KWEMP59pDD8Qcgw/e3oMP+GCDD9Biww/nZMMP/KbDD9DpAw/jqwMP9S0DD8UvQw/T8UMP4XNDD+21Qw/4d0MPwjmDD8p7gw/RPYMP1v+DD9sBg0/eQ4NP4AWDT+CHg0/fyYNP3YuDT9pNg0/Vz4NPz9GDT8jTg0/AVYNP9pdDT+vZQ0/fm0NP0h1DT8OfQ0/zoQNP4mMDT9AlA0/8ZsNP56jDT9Fqw0/6LINP4a6DT8fwg0/s8kNP0PRDT/N2A0/U+ANP9PnDT9Q7w0/x/YNPzn+DT+nBQ4/EA0OP3QUDj/TGw4/LiMOP4QqDj/WMQ4/IjkOP2pADj+tRw4/7E4OPyZWDj9cXQ4/jGQOP7lrDj/gcg4/A3oOPyKBDj88iA4/UY8OP2KWDj9unQ4/dqQOP3mrDj94sg4/crkOP2jADj9Zxw4/Rs4OPy/VDj8T3A4/8+IOP87pDj+l8A4/ePcOP0b+Dj8PBQ8/1QsPP5YSDz9TGQ8/CyAPP8AmDz9vLQ8/GzQPP8I6Dz9mQQ8/BEgPP59ODz81VQ8/yFsPP1ZiDz/faA8/ZW8PP+Z1Dz9kfA8/3YIPP1KJDz/Cjw8/L5YPP5icDz/8og8/XakPP7mvDz8Rtg8/ZbwPP7XCDz8CyQ8/Ss8PP47VDz/O2w8/CuIPP0LoDz927g8/pvQPP9L6Dz/6ABA/HgcQPz8NED9bExA/dBkQP4gfED+ZJRA/pisQP68xED+0NxA/tT0QP7JDED+sSRA/ok8QP5NVED+CWxA/bGEQP1JnED81bRA/FHMQP+94ED/HfhA/moQQP2qKED83kBA//5UQP8SbED+FoRA/Q6cQP/2sED+zshA/ZbgQPxS+ED+/wxA/Z8kQPwvPED+r1BA/SNoQP+HfED935RA/CesQP5fwED8i9hA/qfsQPy0BET+uBhE/KgwRP6MRET8ZFxE/ixwRP/ohET9mJxE/zSwRPzIyET+TNxE/8DwRP0pCET+hRxE/9EwRP0RSET+QVxE/2VwRPx9iET9hZxE/oGwRP9txET8TdxE/SHwRP3qBET+ohhE/04sRP/qQET8elhE/P5sRP12gET93pRE/j6oRP6KvET+ztBE/wLkRP8u+ET/RwxE/1cgRP9bNET/T0hE/zdcRP8TcET+44RE/qOYRP5brET+A8BE/Z/URP0v6ET8s/xE/CgQSP+QIEj+8DRI/kBISP2EXEj8wHBI/+yASP8MlEj+IKhI/Si8SPwk0Ej/FOBI/fT0SPzNCEj/mRhI/lksSP0NQEj/sVBI/k1kSPzdeEj/YYhI/dmcSPxFsEj+pcBI/PnUSP9B5Ej9ffhI/7IISP3WHEj/8ixI/f5ASPwCVEj9+mRI/+Z0SP3GiEj/mphI/WKsSP8ivEj81tBI/nrgSPwW9Ej9qwRI/y8USPyrKEj+FzhI/3tISPzXXEj+I2xI/2d8SPyfkEj9y6BI/uuwSPwDxEj9D9RI/g/kSP8H9Ej/7ARM/NAYTP2kKEz+cDhM/zBITP/kWEz8kGxM/TB8TP3EjEz+TJxM/sysTP9EvEz/sMxM/BDgTPxk8Ez8sQBM/PEQTP0pIEz9VTBM/XlATP2RUEz9nWBM/aFwTP2ZgEz9hZBM/W2gTP1FsEz9FcBM/N3QTPyZ4Ez8SfBM//H8TP+ODEz/IhxM/q4sTP4uPEz9okxM/Q5cTPxybEz/ynhM/xaITP5emEz9lqhM/Mq4TP/yxEz/DtRM/iLkTP0u9Ez8LwRM/ycQTP4TIEz89zBM/9M8TP6jTEz9a1xM/CdsTP7beEz9h4hM/CuYTP7DpEz9U7RM/9fATP5T0Ez8x+BM/zPsTP2T/Ez/6AhQ/jQYUPx8KFD+uDRQ/OhEUP8UUFD9NGBQ/0xsUP1cfFD/YIhQ/VyYUP9QpFD9PLRQ/yDAUPz40FD+yNxQ/JDsUP5M+FD8BQhQ/bEUUP9VIFD88TBQ/oU8UPwNTFD9kVhQ/wlkUPx5dFD94YBQ/0GMUPyVnFD95ahQ/ym0UPxlxFD9mdBQ/sXcUP/p6FD9BfhQ/hoEUP8iEFD8JiBQ/R4sUP4SOFD++kRQ/9pQUPy2YFD9hmxQ/k54UP8OhFD/xpBQ/HagUP0erFD9urhQ/lLEUP7i0FD/atxQ/+roUPxi+FD80wRQ/TcQUP2XHFD97yhQ/j80UP6HQFD+x0xQ/v9YUP8vZFD/V3BQ/3d8UP+TiFD/o5RQ/6ugUP+vrFD/p7hQ/5vEUP+D0FD/Z9xQ/0PoUP8X9FD+4ABU/qQMVP5kGFT+GCRU/cgwVP1sPFT9DEhU/KRUVPw0YFT/wGhU/0B0VP68gFT+LIxU/ZiYVPz8pFT8XLBU/7C4VP8AxFT+SNBU/YjcVPzA6FT/8PBU/xz8VP5BCFT9XRRU/HEgVP+BKFT+hTRU/YVAVPyBTFT/cVRU/l1gVP1BbFT8HXhU/vGAVP3BjFT8iZhU/0mgVP4FrFT8ubhU/2XAVP4NzFT8qdhU/0HgVP3V7FT8XfhU/uIAVP1iDFT/1hRU/kYgVPyuLFT/EjRU/W5AVP/CSFT+ElRU/FpgVP6aaFT81nRU/wp8VP02iFT/XpBU/X6cVP+apFT9rrBU/7q4VP3CxFT/wsxU/brYVP+u4FT9nuxU/4L0VP1jAFT/PwhU/RMUVP7fHFT8pyhU/mcwVPwjPFT910RU/4dMVP0vWFT+02BU/G9sVP4DdFT/k3xU/RuIVP6fkFT8G5xU/ZOkVP8HrFT8b7hU/dfAVP8zyFT8j9RU/d/cVP8v5FT8c/BU/bf4VP7wAFj8JAxY/VQUWP58HFj/oCRY/MAwWP3YOFj+6EBY//RIWPz8VFj9/FxY/vhkWP/sbFj83HhY/ciAWP6siFj/jJBY/GScWP04pFj+BKxY/sy0WP+QvFj8TMhY/QDQWP202Fj+YOBY/wToWP+o8Fj8RPxY/NkEWP1pDFj99RRY/nkcWP75JFj/dSxY/+k0WPxZQFj8xUhY/SlQWP2JWFj94WBY/jVoWP6FcFj+0XhY/xWAWP9ViFj/jZBY/8WYWP/1oFj8HaxY/EW0WPxlvFj8fcRY/JXMWPyl1Fj8sdxY/LXkWPy57Fj8tfRY/Kn8WPyeBFj8igxY/HIUWPxSHFj8MiRY/AosWP/eMFj/qjhY/3ZAWP86SFj++lBY/rJYWP5qYFj+GmhY/cZwWP1ueFj9DoBY/KqIWPxCkFj/1pRY/2acWP7upFj+cqxY/fK0WP1uvFj85sRY/FbMWP/C0Fj/KthY/o7gWP3u6Fj9RvBY/J74WP/u/Fj/OwRY/n8MWP3DFFj9AxxY/DskWP9vKFj+nzBY/cs4WPzzQFj8E0hY/zNMWP5LVFj9X1xY/G9kWP97aFj+g3BY/YN4WPyDgFj/e4RY/m+MWP1jlFj8T5xY/zegWP4XqFj897BY/9O0WP6nvFj9e8RY/EfMWP8P0Fj909hY/JfgWP9T5Fj+C+xY/Lv0WP9r+Fj+FABc/LwIXP9cDFz9/BRc/JQcXP8sIFz9vChc/EgwXP7QNFz9WDxc/9hAXP5USFz8zFBc/0BUXP2wXFz8HGRc/oRoXPzocFz/SHRc/aR8XP/8gFz+UIhc/JyQXP7olFz9MJxc/3SgXP20qFz/8Kxc/iS0XPxYvFz+iMBc/LTIXP7czFz9ANRc/yDYXP084Fz/VORc/WjsXP948Fz9hPhc/4z8XP2RBFz/kQhc/Y0QXP+FFFz9eRxc/20gXP1ZKFz/RSxc/Sk0XP8NOFz86UBc/sVEXPyZTFz+bVBc/D1YXP4JXFz/0WBc/ZVoXP9VbFz9EXRc/s14XPyBgFz+MYRc/+GIXP2NkFz/MZRc/NWcXP51oFz8Eahc/amsXP9BsFz80bhc/l28XP/pwFz9cchc/vHMXPxx1Fz97dhc/2ncXPzd5Fz+Tehc/73sXP0l9Fz+jfhc//H8XP1SBFz8=");
\ No newline at end of file
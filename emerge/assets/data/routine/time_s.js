@@ -0,0 +1 @@
+window.EMERGE_CHUNK("routine","time_s","AAAAAArXIzwK16M8j8L1PArXIz3NzEw9j8J1PSlcjz0K16M97FG4Pc3MzD2uR+E9j8L1PbgeBT4pXA8+mpkZPgrXIz57FC4+7FE4PlyPQj7NzEw+PQpXPq5HYT4fhWs+j8J1PgAAgD64HoU+cT2KPilcjz7hepQ+mpmZPlK4nj4K16M+w/WoPnsUrj4zM7M+7FG4PqRwvT5cj8I+FK7HPs3MzD6F69E+PQrXPvYo3D6uR+E+ZmbmPh+F6z7Xo/A+j8L1Pkjh+j4AAAA/XI8CP7geBT8Urgc/cT0KP83MDD8pXA8/hesRP+F6FD89Chc/mpkZP/YoHD9SuB4/rkchPwrXIz9mZiY/w/UoPx+FKz97FC4/16MwPzMzMz+PwjU/7FE4P0jhOj+kcD0/AABAP1yPQj+4HkU/FK5HP3E9Sj/NzEw/KVxPP4XrUT/helQ/PQpXP5qZWT/2KFw/UrheP65HYT8K12M/ZmZmP8P1aD8fhWs/exRuP9ejcD8zM3M/j8J1P+xReD9I4Xo/pHB9PwAAgD+uR4E/XI+CPwrXgz+4HoU/ZmaGPxSuhz/D9Yg/cT2KPx+Fiz/NzIw/exSOPylcjz/Xo5A/heuRPzMzkz/hepQ/j8KVPz0Klz/sUZg/mpmZP0jhmj/2KJw/pHCdP1K4nj8AAKA/rkehP1yPoj8K16M/uB6lP2Zmpj8Urqc/w/WoP3E9qj8fhas/zcysP3sUrj8pXK8/16OwP4XrsT8zM7M/4Xq0P4/CtT89Crc/7FG4P5qZuT9I4bo/9ii8P6RwvT9SuL4/AADAP65HwT9cj8I/CtfDP7gexT9mZsY/FK7HP8P1yD9xPco/H4XLP83MzD97FM4/KVzPP9ej0D+F69E/MzPTP+F61D+PwtU/PQrXP+xR2D+amdk/SOHaP/Yo3D+kcN0/UrjePwAA4D+uR+E/XI/iPwrX4z+4HuU/ZmbmPxSu5z/D9eg/cT3qPx+F6z/NzOw/exTuPylc7z/Xo/A/hevxPzMz8z/hevQ/j8L1Pz0K9z/sUfg/mpn5P0jh+j/2KPw/pHD9P1K4/j8AAABA16MAQK5HAUCF6wFAXI8CQDMzA0AK1wNA4XoEQLgeBUCPwgVAZmYGQD0KB0AUrgdA7FEIQMP1CECamQlAcT0KQEjhCkAfhQtA9igMQM3MDECkcA1AexQOQFK4DkApXA9AAAAQQNejEECuRxFAhesRQFyPEkAzMxNACtcTQOF6FEC4HhVAj8IVQGZmFkA9ChdAFK4XQOxRGEDD9RhAmpkZQHE9GkBI4RpAH4UbQPYoHEDNzBxApHAdQHsUHkBSuB5AKVwfQAAAIEDXoyBArkchQIXrIUBcjyJAMzMjQArXI0DheiRAuB4lQI/CJUBmZiZAPQonQBSuJ0DsUShAw/UoQJqZKUBxPSpASOEqQB+FK0D2KCxAzcwsQKRwLUB7FC5AUrguQClcL0AAADBA16MwQK5HMUCF6zFAXI8yQDMzM0AK1zNA4Xo0QLgeNUCPwjVAZmY2QD0KN0AUrjdA7FE4QMP1OECamTlAcT06QEjhOkAfhTtA9ig8QM3MPECkcD1AexQ+QFK4PkApXD9AAABAQNejQECuR0FAhetBQFyPQkAzM0NACtdDQOF6REC4HkVAj8JFQGZmRkA9CkdAFK5HQOxRSEDD9UhAmplJQHE9SkBI4UpAH4VLQPYoTEDNzExApHBNQHsUTkBSuE5AKVxPQAAAUEDXo1BArkdRQIXrUUBcj1JAMzNTQArXU0DhelRAuB5VQI/CVUBmZlZAPQpXQBSuV0DsUVhAw/VYQJqZWUBxPVpASOFaQB+FW0D2KFxAzcxcQKRwXUB7FF5AUrheQClcX0AAAGBA16NgQK5HYUCF62FAXI9iQDMzY0AK12NA4XpkQLgeZUCPwmVAZmZmQD0KZ0AUrmdA7FFoQMP1aECamWlAcT1qQEjhakAfhWtA9ihsQM3MbECkcG1AexRuQFK4bkApXG9AAABwQNejcECuR3FAhetxQFyPckAzM3NACtdzQOF6dEC4HnVAj8J1QGZmdkA9CndAFK53QOxReEDD9XhAmpl5QHE9ekBI4XpAH4V7QPYofEDNzHxApHB9QHsUfkBSuH5AKVx/QAAAgEDsUYBA16OAQMP1gECuR4FAmpmBQIXrgUBxPYJAXI+CQEjhgkAzM4NAH4WDQArXg0D2KIRA4XqEQM3MhEC4HoVApHCFQI/ChUB7FIZAZmaGQFK4hkA9CodAKVyHQBSuh0AAAIhA7FGIQNejiEDD9YhArkeJQJqZiUCF64lAcT2KQFyPikBI4YpAMzOLQB+Fi0AK14tA9iiMQOF6jEDNzIxAuB6NQKRwjUCPwo1AexSOQGZmjkBSuI5APQqPQClcj0AUro9AAACQQOxRkEDXo5BAw/WQQK5HkUCamZFAheuRQHE9kkBcj5JASOGSQDMzk0AfhZNACteTQPYolEDhepRAzcyUQLgelUCkcJVAj8KVQHsUlkBmZpZAUriWQD0Kl0ApXJdAFK6XQAAAmEDsUZhA16OYQMP1mECuR5lAmpmZQIXrmUBxPZpAXI+aQEjhmkAzM5tAH4WbQArXm0D2KJxA4XqcQM3MnEC4Hp1ApHCdQI/CnUB7FJ5AZmaeQFK4nkA9Cp9AKVyfQBSun0AAAKBA7FGgQNejoEDD9aBArkehQJqZoUCF66FAcT2iQFyPokBI4aJAMzOjQB+Fo0AK16NA9iikQOF6pEDNzKRAuB6lQKRwpUCPwqVAexSmQGZmpkBSuKZAPQqnQClcp0AUrqdAAACoQOxRqEDXo6hAw/WoQK5HqUCamalAheupQHE9qkBcj6pASOGqQDMzq0AfhatACterQPYorEDheqxAzcysQLgerUCkcK1Aj8KtQHsUrkBmZq5AUriuQD0Kr0ApXK9AFK6vQAAAsEDsUbBA16OwQMP1sECuR7FAmpmxQIXrsUBxPbJAXI+yQEjhskAzM7NAH4WzQArXs0D2KLRA4Xq0QM3MtEC4HrVApHC1QI/CtUB7FLZAZma2QFK4tkA9CrdAKVy3QBSut0AAALhA7FG4QNejuEDD9bhArke5QJqZuUCF67lAcT26QFyPukBI4bpAMzO7QB+Fu0AK17tA9ii8QOF6vEDNzLxAuB69QKRwvUCPwr1AexS+QGZmvkBSuL5APQq/QClcv0AUrr9AAADAQOxRwEDXo8BAw/XAQK5HwUCamcFAhevBQHE9wkBcj8JASOHCQDMzw0AfhcNACtfDQPYoxEDhesRAzczEQLgexUCkcMVAj8LFQHsUxkBmZsZAUrjGQD0Kx0ApXMdAFK7HQAAAyEDsUchA16PIQMP1yECuR8lAmpnJQIXryUBxPcpAXI/KQEjhykAzM8tAH4XLQArXy0D2KMxA4XrMQM3MzEC4Hs1ApHDNQI/CzUB7FM5AZmbOQFK4zkA9Cs9AKVzPQBSuz0AAANBA7FHQQNej0EDD9dBArkfRQJqZ0UCF69FAcT3SQFyP0kBI4dJAMzPTQB+F00AK19NA9ijUQOF61EDNzNRAuB7VQKRw1UCPwtVAexTWQGZm1kBSuNZAPQrXQClc10AUrtdAAADYQOxR2EDXo9hAw/XYQK5H2UCamdlAhevZQHE92kBcj9pASOHaQDMz20AfhdtACtfbQPYo3EDhetxAzczcQLge3UCkcN1Aj8LdQHsU3kBmZt5AUrjeQD0K30ApXN9AFK7fQAAA4EDsUeBA16PgQMP14ECuR+FAmpnhQIXr4UBxPeJAXI/iQEjh4kAzM+NAH4XjQArX40D2KORA4XrkQM3M5EC4HuVApHDlQI/C5UB7FOZAZmbmQFK45kA9CudAKVznQBSu50AAAOhA7FHoQNej6EDD9ehArkfpQJqZ6UCF6+lAcT3qQFyP6kBI4epAMzPrQB+F60AK1+tA9ijsQOF67EDNzOxAuB7tQKRw7UCPwu1AexTuQGZm7kBSuO5APQrvQClc70AUru9AAADwQOxR8EDXo/BAw/XwQK5H8UCamfFAhevxQHE98kBcj/JASOHyQDMz80AfhfNACtfzQPYo9EDhevRAzcz0QLge9UCkcPVAj8L1QHsU9kBmZvZAUrj2QD0K90ApXPdAFK73QAAA+EDsUfhA16P4QMP1+ECuR/lAmpn5QIXr+UBxPfpAXI/6QEjh+kAzM/tAH4X7QArX+0D2KPxA4Xr8QM3M/EC4Hv1ApHD9QI/C/UB7FP5AZmb+QFK4/kA9Cv9AKVz/QBSu/0AAAABB9igAQexRAEHhegBB16MAQc3MAEHD9QBBuB4BQa5HAUGkcAFBmpkBQY/CAUGF6wFBexQCQXE9AkFmZgJBXI8CQVK4AkFI4QJBPQoDQTMzA0EpXANBH4UDQRSuA0EK1wNBAAAEQfYoBEHsUQRB4XoEQdejBEHNzARBw/UEQbgeBUGuRwVBpHAFQZqZBUGPwgVBhesFQXsUBkFxPQZBZmYGQVyPBkFSuAZBSOEGQT0KB0EzMwdBKVwHQR+FB0EUrgdBCtcHQQAACEH2KAhB7FEIQeF6CEHXowhBzcwIQcP1CEG4HglBrkcJQaRwCUGamQlBj8IJQYXrCUF7FApBcT0KQWZmCkFcjwpBUrgKQUjhCkE9CgtBMzMLQSlcC0EfhQtBFK4LQQrXC0EAAAxB9igMQexRDEHhegxB16MMQc3MDEHD9QxBuB4NQa5HDUGkcA1BmpkNQY/CDUGF6w1BexQOQXE9DkFmZg5BXI8OQVK4DkFI4Q5BPQoPQTMzD0EpXA9BH4UPQRSuD0EK1w9BAAAQQfYoEEHsURBB4XoQQdejEEHNzBBBw/UQQbgeEUGuRxFBpHARQZqZEUGPwhFBhesRQXsUEkFxPRJBZmYSQVyPEkFSuBJBSOESQT0KE0EzMxNBKVwTQR+FE0EUrhNBCtcTQQAAFEH2KBRB7FEUQeF6FEHXoxRBzcwUQcP1FEG4HhVBrkcVQaRwFUGamRVBj8IVQYXrFUF7FBZBcT0WQWZmFkFcjxZBUrgWQUjhFkE9ChdBMzMXQSlcF0EfhRdBFK4XQQrXF0EAABhB9igYQexRGEHhehhB16MYQc3MGEHD9RhBuB4ZQa5HGUGkcBlBmpkZQY/CGUGF6xlBexQaQXE9GkFmZhpBXI8aQVK4GkFI4RpBPQobQTMzG0EpXBtBH4UbQRSuG0EK1xtBAAAcQfYoHEHsURxB4XocQdejHEHNzBxBw/UcQbgeHUGuRx1BpHAdQZqZHUGPwh1BhesdQXsUHkFxPR5BZmYeQVyPHkFSuB5BSOEeQT0KH0EzMx9BKVwfQR+FH0EUrh9BCtcfQQAAIEE=");
\ No newline at end of file
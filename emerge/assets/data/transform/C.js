@@ -0,0 +1 @@
+window.EMERGE_CHUNK("transform","C","jD9CP2wLPz9CfUY/IJ5AP8PpOT+RuEM/jq5DP+3gPj9BYT0/Gg9EP+eHSj+NNTQ/ShNEP4iWQD9lwEA//qM+P5l0PT9rl0U/KVRCPz+IQz+YFT8/Q71EP3fkNj9vD0U/eRk3Pz+8QT9enD0/YotAP4rQQz9RVjs/dEE3P/QHOj9TYDs/dgo6P5kzNj+/Wjs/HsA7P3BHNj8jVT8/fLw+PyysOT/HUTY/Z+Q6P5+GOT9mlTI/fR8yP4hUND9gRDc/coswP1m4Nz88PDg/GN8zP8YiMj/jrTc/KoY1P49YKz/hJzE/tC4vP/J1Mj9H8DI/QQcmP6AKOD9FiSA//TsoP9bpNj9crCw/qQwyP2OQJj+CVSU/t/cpP55oHz/bZiM/xx8oP+YNIj94iyc/iL4fP+JVJj+x9Sc/+xAaP61EHz+9Khs/eREfP2LRFz83GSE/u7ocP9ZmGT9MFho/s3MbP7KhDT82GBU/g9gQP4VWFj+8IRc/XvkdP7oSFD+7qQw/SuYYP2tkED/G8xI/v6sYP2v+Cz+63gk/c9oQP1TcED+Xfwo/atcEP2u+CD8DdxM/aO4HPzuBCD98WQQ/HTMNP8miAj9lMgM/k4AMP1q++j6msQY/yW0HP4x8Cz8SkgA/xWD+PsyCAT8ArAg/T2IGP9NF+j647/4+bCj0PtoZ7j56yAk/O0n1PoH6/j7XuPw+QqkCP9pv/j7gfQQ/zebpPlZw6j4ru+M+bUzoPqX06T7J8ts+xGfdPhMM8T7Q2eo+cqr2PkX02j75S+w+WRXfPrDy7D6rxdE+bwr5PpGh5D7Zwvs+FS/sPnve8T5EcPA++6roPp/85D7nVt0+D07rPity1D5aRtY+fJ7jPvY63T7wgdo+tIHcPsH95D6at9Q+zyvpPhUs2T5qvN8+1urnPnu22D7K2eQ+I1jfPpB11T5MKuE+zCTjPm8g4T5M3vE+4nXpPoS13T6qB9I+eGDQPgp51j50sMw+4rbQPuNE1D6WQNI+UlLdPkk61j6mJNM+NXHmPuus5D7oG80+FbLXPrFFzj6D+sM+FRXaPlpJ1D4KSeY+8QnXPiE63T6Fvtk+4TnVPno22D6vZ9Y+owTWPpbU2j5PCdw+RSjXPgJazD5elto+5HrWPvZo2T4dsO0+qlTYPukU1j5PPeM+lZblPjBb4D5i394+hSHoPmI83T6Rt9o+1j7rPrv4zD6Trtc+MWjePv6B2j4z2tA+H/raPmuH6D5wK9A+Efi7PtE94j7PXeA+JoHYPgxS0T7xBt4+LQbdPtOH7z4DiN4+FM/hPjAj5D4fNOg+c9TnPj7M6j6/K+g+537vPoSz8T5LTOw+vLzhPjzH6z6LL+U+1YcAP1+u3D7yyfo+XNr3Pveu7D4aJ/0+f2oAPx8o8z65swQ/UEz7PkaP3z5W7eY+nHz4Pr6N8j4g8/o+Ly7zPpRI7z7YUP4+orL+Pm3x/D658/c+obgDP3UT/j7g/P0+bKAPP21d4z6GKe8+m6nkPqMTAD8WVOo+XYn+PqW0CD/92QY/Sx79PoTA/D77+AE/qpgHP474Az/VLwc/isUJP7Iq/z6AEQg/LkUJP3R2Az9goAw/URwGP9CdCD/29QY/jyAKPz5bBD+vMwI/pEMHP2AkBT92FgY/Fe4KP5Z5Dj/r8gs/SyYEPyAQCz8opBA/qkENP+/3Cz8k4Ao/kNoRP6dxCj/79Qo/FX8QPzfyFD+uqgc/f9sQP71TFT9L6Qo/EuUMP2VREj8UOQ8/IqQKP5mHCj9GFQ8/H30RP8cREz9gtQ8/cLgLP8DdDj82bBc/x94TP2eqDT/PvBY/M1wRP/8WFz9g1RQ/76oSPzjRGz9cbxk/oKwfPyj8FT9PnRU/rVUdP7b0GT/VkRg/hI0cPzzuFD+TNB8/BkclP24yGD+qVBQ/THcVP+WXHz8jKxc/iPQjP/xjHD8JqSM/OnUaP1T9Hj/okCM/rH8gP7VsIz83txw/HBYpP5pOGD8N1Sc/Wi4eP1bsJz/pJCw/BcAeP44TID+HSCI/9WEbP4qBGz94fig/KjUfP1HUJD/p5SY/BSkiP+5mJD+gLiQ/0rYjPxXGIj9M6Sc/IZwpP1HjKT9LxiM/0GsiP3K6Iz8onSk/baonPzNkJj/nJCk/ADIsP98xKj9PByc/le0nP+t6Kz/ZXzE/b/ArPyVLJj/r6CM/+yopPx9iMD+5VyA/UI4yPwpBLj81BzI/P8oqP9lpLD+ImS4/FocoP+XpMz+N5yw/MXE2P2wxNz+oOSo/DxcuP3A5Lj/PmDE/XgssPyWALT/7WTA/9gAsP+XrLz8ZWzc/1QMwPypjLT+z+To/hEEyP7SJMz8CHjY/1RI0P2PZLT8BmC0/k2E3P1sXPj82gC4/VHw+P0voMj+5UTs/T7MzPysfNT9CUjA/HtIzP9FLOz9UKTs/5lQ2P505ND+9rjE/ARk7P+LIOj8zZjs/Slo3P5i4Pz8oNDQ/dMY0PzVXMT+8rDk/F5k6P1zsNz9iezo/3LBCP2eqQj8nij4/v20zP5ayOT+qCjk/Bfc8P1V4PT+iWzs/ltw5P1n/Mz8pdDo/Xeg/P+cDPT/l7EM/0Ng8P/jQOj+r9To/OBI3P/VYQT8T3Dc/nXVHP1tMOz+wkzw/Nro8P/YZQj8Tj0Q/0nlDP4kiST9iKDw/vXBFPz4RRz/ksj4/1zRDP18hRT9TNjU/kd5APzwzQj9/5z4/oFk7Pw0CPT+BKEQ/22hDPzU8RT+t30E/x/JBP+rqQj99I0g/UfdDP/svSj8J1jk/I6xCP+VkUT+Be0A/OtY8P+SoQD96zUE/v5xFP55fRz+Jjz0/Vi5BPw9bSj+rI0M/9887P4KfST/fpkE/b9dIP678Rz85AkM/MfFBP7/AQT/ef0U/p+w7P7jiQz9nkkQ/JSBHP1s3Rz9w+UQ/j6RLPzyUTT/LOUg/JXdIPzDWQz+79Uk/eD9JPz+1UT8Kz0U/IMpIP2AxRz8HUUQ/82tJP0K/SD8K01M/rYE8P/KfUz8emkc/7h9JP3uyQz8wykY/305EP/GwTz+oKE8/l0dLPxOnSz9TM0k/vy1KP3S6Sj9NhlI/X/FLP1tVTz9cfE0/tL1IP6JLTD+VwUg/oOlFP4ySTD/nik0/fRpLP5LKQz8ANVU/ffxFP9x9RT+qIEg/AC5IP10BUD/uK1U/9O5MPzkYTD9SbFI/UDNLP2FrTj9A000/8E5HP9SmSj/iiVU/5b9DPw05UD//WVM/o1tRP6RSST9UK1M/WFtTPz46TT9l8ks//z5RPx4kTD8X6Eo/3IlRP6Z8UD+HBUo/uf9LPyILUT8Hy0c/6XJOP+coTT+22E0/8KpWP6T+Uj/aUU8/ijxMP7pkUD+HeFM/sVZUPzcjUj9vTEk/+91SP3G9Vj8NUVg/myVWP9q6UT898U8/5HlQP8OkWj8BAk0/SKlOP/l1TT8wHUw/Is9OP3YVUT9/jEo/yARQP8XkUT/Zz0o/GK5SP/qTUj8BCVc/ho5SP+TYTz9vi1A/zFVVP8nIVj9D6VE/AMFPPyF0Uj8no0k/GvpMPwfTVD8NCVs/ZKFVP2SFVz+5b10/2uhWP+ISWj9pAFQ/V8ZWP59WVD8h4VI/091OP6sHXT8/rV8/z/RSP+/1SD+t9U8/EF5UPz15Wz84pVM/x1dUP6Q7WT9d2lA/EoZUP8ZbVD9M7ls/1ttVPxpHVz8U81A/dORRP0RnUD/O0U8/dhxXP8frVz8vzkw/OVJbP1vGTT9f11c/KWBUPyjLVz+RSVE/EtdYP9yTVz/XR1c/cmlUPyJ7VD+JlFE/WoFKP6uxUD9OxFo/L6BaP1WeUD80KE8/TBVPP7/EVT/wo0o/y59cP8QfUj83OFM/s0lWP2nnYD/6pls/dgxXP9zJWj93MF4/dqZRP0tgWD96AVg/WjxZP9d1Vj+Og1Q/NDJOPxYoVT+IA1g/1AJTP8ugWj/GD1o/N+FXPxj+Uj+kqVI/8rxbP/OKTz+ly1c/EWNVP9+MVD+qf1k/rlpbP9XVTj+MJU0/Y+ZZPyJ0WT9R8FQ/t/RKPw+DWT8Qglo/ZxtUPwFTYD+AHFg/ApdPP1hLXz80F04/IEdWPyZZVj+5ZlU/ssJiP8X2VT/M3GE/6nRaPx9rTD9AQVQ/zz9bPxfPUT9HFk8/JEtfPyMQWj8xAE8/b3hRP/ecYT9UKlU/k+ZXP02wUz9CxVY/rppWP9p2VT8a6lY/5PVgP+uNXD9z3lk/XJ9YPxx9bT+1X1w/2j5dP7RoWz+kyVw/");
\ No newline at end of file
@@ -0,0 +1 @@
+window.EMERGE_CHUNK("transform","D","d7NuE24tRzZLNsQ31BajOMRpPjmRLrc5sOkbOtTlczoIU7M6lob7OiHyKTuK1F47XX6OO4l4sjtPlts74gcFPOMLHzwa7js8FMNbPBKdfjwSRpI8Is+mPLTvvDzRrNQ8lAruPB+GBD0c2hI9EgIiPW/+MT1Iz0I9WXRUPQ3tZj2AOHo9wSqHPVChkT0Qf5w9B8OnPRtssz0Yeb89rujLPXe52D3y6eU9i3jzPc2xAD6x1Ac+CyQPPu2eFj5gRB4+ZxMmPv8KLj4fKjY+tm8+PrTaRj7/aU8+fBxYPg3xYD6P5mk+3/tyPtYvfD6lwII+i3eHPgU8jD5/DZE+YuuVPhnVmj4Oyp8+qsmkPlrTqT6H5q4+nQK0PgonuT46U74+nIbDPp/AyD6yAM4+SEbTPtSQ2D7J390+nDLjPsaI6D6/4e0+AD3zPgaa+D5O+P0+rKsBP1JbBD/bCgc/CboJP6BoDD9jFg8/GsMRP4luFD94GBc/sMAZP/pmHD8hCx8/8KwhPzRMJD+76CY/U4IpP8wYLD/3qy4/pzsxP67HMz/gTzY/FNQ4Px5UOz/Wzz0/FkdAP7a5Qj+RJ0U/g5BHP2n0ST8fU0w/haxOP3wAUT/jTlM/nJdVP4vaVz+TF1o/mU5cP4N/Xj84qmA/n85iP6LsZD8qBGc/IRVpP3Mfaz8NI20/3B9vP80VcT/RBHM/1+x0P8/Ndj+tp3g/YXp6P99FfD8bCn4/C8d/P1K+gD9tlYE/1GiCP4I4gz9zBIQ/pcyEPxORhT+8UYY/nQ6HP7THhz//fIg/fS6JPy7ciT8Qhoo/IyyLP2bOiz/bbIw/gQeNP1mejT9kMY4/pMCOPxlMjz/G048/rFeQP87XkD8vVJE/0MyRP7VBkj/hspI/WCCTPxyKkz8y8JM/nVKUP2KxlD+FDJU/C2SVP/e3lT9QCJY/GVWWP1ielj8T5JY/TiaXPxBllz9eoJc/PdiXP7UMmD/KPZg/hGuYP+iVmD/9vJg/yuCYP1UBmT+lHpk/wTiZP69PmT94Y5k/IXSZP7KBmT8yjJk/qpOZPx+YmT+amZk/IZiZP76TmT92jJk/U4KZP1t1mT+XZZk/DlOZP8c9mT/MJZk/JAuZP9ftmD/szZg/bKuYP1+GmD/NXpg/vTSYPzkImD9H2Zc/8aeXPz10lz81Ppc/4QWXP0fLlj9xjpY/Z0+WPzAOlj/VypU/XoWVP9I9lT869JQ/nqiUPwZblD95C5Q/AbqTP6Nmkz9pEZM/WrqSP39hkj/eBpI/gaqRP21MkT+s7JA/RIuQPz8okD+iw48/dV2PP8H1jj+NjI4/3yGOP8C1jT83SI0/S9mMPwNpjD9n94s/foSLP04Qiz/gmoo/OSSKP2GsiT9fM4k/OrmIP/g9iD+hwYc/OkSHP8zFhj9bRoY/78WFP49EhT9AwoQ/CT+EP/G6gz/9NYM/NLCCP50pgj88ooE/GRqBPziRgD+hB4A/sfp+P8rkfT+YzXw/JrV7P3+bej+vgHk/wWR4P79Hdz+0KXY/rAp1P7Dqcz/LyXI/B6hxP2+FcD8LYm8/6D1uPw0ZbT+G82s/W81qP5amaT9Af2g/Y1dnPwcvZj82BmU/+dxjP1izYj9biWE/DV9gP3Q0Xz+ZCV4/hd5cPz+zWz/Ph1o/PlxZP5MwWD/WBFc/DdlVP0GtVD95gVM/vFVSPxIqUT+A/k8/DtNOP8OnTT+lfEw/u1FLPwsnSj+c/Eg/dNJHP5moRj8Rf0U/4lVEPxItQz+nBEI/pdxAPxS1Pz/3jT4/VWc9PzJBPD+VGzs/gfY5P/zROD8Lrjc/s4o2P/dnNT/dRTQ/aiQzP6EDMj+I4zA/IsQvP3OlLj9/hy0/S2osP9pNKz8xMio/UxcpP0P9Jz8F5CY/ncslPw20JD9bnSM/iIciP5dyIT+NXiA/bEsfPzY5Hj/wJx0/mxccPzoIGz/R+Rk/YewYP+3fFz941BY/BMoVP5PAFD8ouBM/xbASP2yqET8fpRA/4KAPP7CdDj+Tmw0/ipoMP5aaCz+5mwo/9Z0JP0uhCD+9pQc/TasGP/yxBT/KuQQ/u8IDP87MAj8F2AE/YuQAP8nj/z4dAf4+wiD8PrlC+j4FZ/g+p432PqG29D714fI+ow/xPq0/7z4Wcu0+3KbrPgPe6T6KF+g+c1PmPr+R5D5u0uI+ghXhPvpa3z7Yot0+G+3bPsU52j7ViNg+TNrWPiku1T5uhNM+G93RPi440D6olc4+ivXMPtJXyz6BvMk+lSPIPhCNxj7w+MQ+NWfDPt7XwT7qSsA+WsC+Piw4vT5fsrs+8y66PuetuD45L7c+6rK1Pvc4tD5gwbI+JEyxPkLZrz63aK4+hPqsPqeOqz4eJao+6L2oPgRZpz5w9qU+K5akPjM4oz6H3KE+JYOgPgssnz45150+q4ScPmE0mz5Y5pk+kJqYPgVRlz63CZY+o8SUPseBkz4iQZI+sgKRPnTGjz5mjI4+iFSNPtYejD5O64o+77mJPraKiD6hXYc+rjKGPtsJhT4l44M+i76CPgqcgT6ge4A+lbp+Pg+CfD6pTXo+Xh14PivxdT4KyXM+9qRxPuuEbz7kaG0+3VBrPtA8aT64LGc+kiBlPlcYYz4EFGE+khNfPv4WXT5DHls+WylZPkE4Vz7xSlU+ZWFTPpl7UT6HmU8+K7tNPn/gSz5+CUo+JDZIPmxmRj5PmkQ+ytFCPtcMQT5xSz8+k409PjjTOz5bHDo+9mg4PgW5Nj6DDDU+amMzPrW9MT5gGzA+ZXwuPr/gLD5pSCs+XrMpPpkhKD4VkyY+zQclPrt/Iz7b+iE+KHkgPpz6Hj4yfx0+5wYcPrORGj6THxk+grAXPnpEFj532xQ+c3UTPmkSEj5WshA+M1UPPvv6DT6roww+PE8LPqv9CT7yrgg+DGMHPvQZBj6m0wQ+HZADPlRPAj5GEQE+3av/PZE6/T2fzvo9/Wf4PaIG9j2FqvM9m1PxPd0B7z1Atew9u23qPUUr6D3V7eU9YbXjPeGB4T1LU989lyndPbsE2z2u5Ng9Z8nWPd6y1D0KodI94ZPQPVyLzj1wh8w9FojKPUWNyD30lsY9G6XEPbG3wj2tzsA9B+q+PbcJvT21Lbs991W5PXWCtz0os7U9B+izPQohsj0pXrA9W5+uPZnkrD3aLas9F3upPUjMpz1kIaY9ZXqkPUHXoj3yN6E9b5yfPbEEnj2xcJw9ZuCaPcpTmT3Uypc9fUWWPb7DlD2PRZM96sqRPcZTkD0d4I4952+NPR0DjD25mYo9sjOJPQLRhz2icYY9ixWFPba8gz0dZ4I9uBSBPQCLfz3f8nw9/mB6PVDVdz3IT3U9WNByPfVWcD2Q4209HXZrPY8OaT3ZrGY98FBkPcX6YT1Nql89fF9dPUUaWz2b2lg9dKBWPcJrVD16PFI9jxJQPfftTT2lzks9jrRJPaefRz3jj0U9N4VDPZh/QT37fj89VYM9PZqMOz3Amjk9u603PYHFNT0H4jM9QwMyPSkpMD2wUy49zIIsPXS2Kj2d7ig9PSsnPUlsJT24sSM9gPshPZZJID3ymx49iPIcPVBNGz1ArBk9TQ8YPXB2Fj2e4RQ9zlATPfbDET0OOxA9DbYOPek0DT2Ztws9FD4KPVPICD1KVgc98+cFPUV9BD02FgM9v7IBPddSAD3p7P08Ijv7PEeQ+DxI7PU8E0/zPJu48DzNKO48m5/rPPUc6TzLoOY8DivkPK+74TydUt88y+/cPCmT2jypPNg8O+zVPNGh0zxdXdE80B7PPBzmzDwzs8o8B4bIPIpexjyvPMQ8ZiDCPKQJwDxb+L08fey7PP3luTzO5Lc84+i1PC/yszymALI8OhSwPOAsrjyLSqw8Lm2qPL2UqDwtwaY8cPKkPHwoozxEY6E8vaKfPNvmnTySL5w82HyaPKDOmDzhJJc8jX+VPJvekzwAQpI8samQPKMVjzzLhY08H/qLPJRyijwh74g8um+HPFb0hTzrfIQ8bgmDPNaZgTwZLoA8Wox9PBHEejxDA3g830l1PNGXcjwH7W88bkltPPOsajyGF2g8E4llPIoBYzzYgGA87AZePLWTWzwiJ1k8IcFWPKJhVDyVCFI86LVPPItpTTxvI0s8guNIPLapRjz6dUQ8PkhCPHQgQDyM/j08d+I7PCXMOTyIuzc8kbA1PDGrMzxbqzE8/rAvPA68LTx9zCs8O+IpPDz9JzxxHSY8zkIkPERtIjzGnCA8SNEePLwKHTwVSRs8");
\ No newline at end of file
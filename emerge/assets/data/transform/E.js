@@ -0,0 +1 @@
+window.EMERGE_CHUNK("transform","E","hKfPPqyq5j5r4uA+Q9naPiNszT4vSu4+m7XePuJF6T5hyu0+iq3pPj/C5D5Qp+0+rl/sPuNY7T4RfdY+DJjjPvbp4D69FgM/5pjhPt2Y9T4X2tc+YlnlPkUs2z6sQOw+3k79PrcZ4j7G1vM+lzz0PiVy8z5rL+s+sY7sPp018D7CpPE+EdzxPu/++D5FhPA+FTv4PnmZ9j753+g+N+TrPjkD/D4AIPw+U54BPyZI4j4iPwA/JpLiPkXK+z47FOQ+gDYGP7D89j7dnQs/hykCP3UEBj+iQgU/aCkMP0NzAz/B0fw+FLH9PojkAD+jiQY/OMAIP49SBj/4JQk/tAMRPy25AD/qrQc/anwQPwyCBj8JBRI/yUYLP+E0Cz/39g0/TpkQP566Dj8QBhk/ZSoQP//oGD/zLxk/ak0TP7pDHD9aWR8/SQwaP1YDHD8jXQ8/KCQcP6yZHz89HiQ/TDgZPx9lHT8AQCM/qFMaPyPoIT8RbxA/3EMjP9OTGD9yKxk/esEgP0mWID8B4SM/mLMXPwThHz/Xfy8/EeAmPzk0Ij/iCiw/9+snP2/eLT8azig/uQo1P4j/LD8Yfi4/8hUkPylBKT92KzQ/ciUrPwkJNT8p7Sc/6t8wPwaGNj8hRDM/+HUxP+SbOD9P3T0/7MY3P/v6PT/DqTs/tlQ0P24iOT+PDUA/pcsyP/eUMz/iJjc/wq8uPzVSOj+Jrj8/NqE8P+WIND9xwTE/ZOk+P5HiQT+o0kQ/lNk9PwC7Nj8jL0E/ZhI8P/MdOD9eg0c/ZeY4P/QGRz+pND0/YCVFP2XaRj+PbUc/35ZBP+NySD/CCzw/YrI6P1B+QD+PHEk/n1pIP+wcSD+WwUg/bR1CPwy9Sj9BmkI/aSNBPwmnST+tRkQ/emBBP6sQSD/gOkw/wARIP+3KRD/uwUk/nMxQP9fWRT/xgkw/m7RGPx8yST8YYk4/9mNJPzo2TT+FRUs/ZuhLP6PNTj/101M/qPNEP8ONRz8E700/EAtcP/2uTz/AtlU/mFBFP1B8Sz+gE1Y/xxBVPz0nTT+BBU4/EFZOP/kkUj88fVA/wVhOP9YbUj8FUl0/V/VHP+oeSj+xG0o/aZZMP6ouSj/zJUE/liVPP6kkST8kMUM/PLZFP9YXRj8VGEU/AKZJP1rpUT91p00/G6RJP05NUz/sY0g/ANxIP8XURj+v30k/U8VNP2jlQj9huUY/QqhVP1bnRD/mrks/jPhIP1e0ST/5akg/f91FPxYgSj8OzEk/74JNP+0JVT//xEY/t1tQP0BsUD/JAEk/Oq1BP68uSD8SZj8/APhFP6thQj/XTUo/N+pGPzWxOz/5+kc/fxJKPyWAOj81I0k/q0I5P6cKQT94mUM/wbhEP7rMQj9N4Ek/JjVHP9hHQz9lWEU/UYc8P2CUQT/xyz8/NHdIPyG5Pz8dLUQ/fEU+PzolOT9hXUI/vx1CP9e+PT/mvjE/8nY5P2rWRD8S5kE/fl5BP8NWQD/nbj0/DpI9P5flQj9GDzc/TkZCP/4pPj9zeDU/68c7Px34PD+hrTk/W2Y2P1WWMj8KnTM/m7s2P3zOMz8+mT0/xpg4P2jtLj83mjk/53Q4P2EDNz9tLzg/0po5PwkIOT9h0jk/bu84P6MAOD+6lDY/IMcxP9obNT9VlTQ/ZuYqP2YXLT8aVSo/0rItP8okNT/mTDI/IVcsP/v8Lz8+qy8/5EUtP2IEKz+a2S0/yEcxP3tdLj/DwzA/0bs1P62DMT9qxjE/yjEpP/OGND/A7is/EwYtP8b4Hj+oTCc/r1YrPwmXJT+yqyc/9ogmP+PTMD8oUSY/VXsjPwYZKj+YPCM/SOosP9vuIT+oDCg/9EkiP5juJj+zYSo/GBQjP9ytLD8+lSw/ARYkP9yrJT8F6x8/KvwsP8QNLT+rjiY/9yUqP1TiIz8AbiA/YY0nPwBmGD/Ekh0/InQgPy1FFj/ixSM/P4QjPz1CHj/fhx4/GiEbP86mHj9k3Bs/C74hP36tHD9M9CE/MZIPP8RsFj9VrRs/iL4rP/wTFT+GqyY/bqUdPzjkIT+dAxg/dvMcP/mxGj8xJxc/93cXP9tpGT8ovBs/gBAbP+juEz/dKRo/3VsXPxK4Dj8n2R4/2RIZP3opGT+rWBo/zGwVP0zpET/FWRY/ekETPw5WGT+kgRE/cREaP669DD/LKhc/A9ITPwuoFz/R1hc/0esSP+mPFj8GOhQ/NxMdP2ovED/3uRE/MRwVP40vFj/atAs/CYkJPy84Fz+GOg4/gkgNP9N4Dz97uws/4pQKP6IREz9QqAw/OTkPP7nqBz9pcww/frMQP/RdBz/lcww/K7QMP861ED9HkQ0/PWIJPytFEj/6/Qk/Ih4EP/49DD/9Wgo/cSEOP5ecCj+NUA0/EUIDP6T0CD95TQw/7xQHP7oIDz+raQI/Q1QLP0b7Bz/c4AY/UzALP3YVCD9fgQc/7aQPP/eOED9iKAQ/DlgHP7D9Aj9QKgI/obYKP9vABz/Mtwo/kuICP2FACz9TJwc//6ABP4rEAz+suA8/gHwIP1JsCz9PhQU/WZ/+PhPDCz83Vgg/vgQIP9A4Bj8r9QY/tG8HPxmj9z6CSg0/IioJP1bdAD+dbQQ/7d73PhzzAz9BpAU/1iQJPwWUAz+tJgI/iHoBPzEWAz/DSwE/+JcFP8AnBD8NhwM/p/0CP73cCz9a2vg+afYGP5RO9j6r/xE/ssH+PuhMAT/0fgI/LucDP3N49z52Xgk/YQ4AP9kWAz9HXwo/dN74PoLwBj95IAk/SSIDP+cg+z7GNQs/eZIGP1/w+j47h/8+IlUEP/G5Aj8mXvg+Vwv8PvCABT8vjAI/ZDvnPsIcDD9PZAA/gXb6Pkca/D4JDAI/zl/0Pgs0/D7YqQI/xMcCP4SY9T7jXf4+0/kBP96/+T6PrQc/j6ADP05K8z4Ic/c+3rrxPsXL/D6pXvw+0tj6Pp2u+j4/Nvw+fJvtPrd7Bz8XIvM+foH8PtKP6z76EwA/Rhr0PmZ8+D4KAwA/cDH2PtitAT8pp/8+fY7/Pnb5+z5PxQI/mPbyPpcoAD9qWuc+SqICP2MBAD/WY+w+dbD4PpMv/T7NHfo+vgDyPvQq9D4bWf0+j4jyPu1K9j4Zm/s+h1HtPsmv8D5vh90+SOzqPjOr3T7QB/g+QhQAP3FU7D5P3O0+GUjcPg009z5HIOw+H4HsPrlG8z7LSew+HhL2Puc28z50YPE+JNH6PjHg8T6/jeM+rkv9PkJ7+D6tZ/Q+aSjnPlw96T4Nj/E+LtX2PsO54T5kkAM/fA/qPm2q9T4UlfI+eUkAP+4Q6T6ex+Y+SpDqPs+u4D6zUf8+41j5PkrT7j7+q+k+TT79PpB7+z7syeY+X/X1PmOk8D5XbuU+Me3uPlry7z7BBPk++XvzPpPt3z69eOc+NU/wPvRo4D4kHvk+zAzmPr9m5T5/teo+M1zjPvOm5D6tmgA/EMjxPrbz9D7y6OY++2DmPgRP4D6Ccek+b5r0PuPW+j65Wd0+nAvWPqHl9T5W4+U+a9jwPjCI8z41ZPg+pjfqPkj87T7qp+I+khjjPl626T7NLNw+a/7YPgAi6D5ez/U+p/PwPiB8/D7jLec+FqjtPvGN9T54N/Y+KMrjPmML7D44Uuw+FzbkPpY+6T5P2+U+H/vhPkDo6z4zN+c+cq/zPt/Q7j6poO0+oSXtPvzU4z7CRvA+3DAAP1/M4D6xvOs+bI75PruN+j5gtPE+k6z/Pgpc6D43LeM+Qaj1PovZ7z6dfus+l0vdPu4K8D6Qa/U+QKfZPr2S8T6c1+g+iNryPsc98j6l8t8+JuH1PuiV4z56Ue8+yvDoPvu87z4ZEeg+BEHdPpoT4j646vM+7MzdPhZe2T5B+uI++nnnPgDH/j67Wdw+sQXhPqpl7j78hPA+/gnhPktt7D7f1e4+3aDjPo7W4T4zgO4+dKLhPtBw3T5O2eA+3VHlPrNP7T7MwOk+EF3sPhje/T48w/s+0fvnPlIu6j7CcfQ+EfXcPpcX7T4UDvw+JL/qPlYE3D6lQtc+mE/dPpnH6D4tvOA+SjTiPvwX4D7tb+I+8+TtPtAs2j7yddw+MXviPv+C6T4Jku8+APDfPqZF3j6h0Ok+GszpPuNF5T4vEus+Oa/uPkzI5j4IiOM+dsjhPnar6j5kC+M+xjnwPkgP5z5HeeM+1sbcPsPY3D6R0+Y+TsXnPnh76z42E+U+C3LuPkKi2T6CrOg+wLD2PpHW9D6e2vo+GLX3Phn98D51Hec+");
\ No newline at end of file
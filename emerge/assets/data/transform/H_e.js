@@ -0,0 +1 @@
+window.EMERGE_CHUNK("transform","H_e","AAAAAERnUzqJdZU6kwqZOoaaijqlzs86XyEAO3cs1jr3pvk6Bx0IOz0vGTvO/Qs7jBcyO2ROQzs+sFI7YDdqO6+LdTsNQnw7w/CTO2VGrjtxns47XP/tO2Uo+DtFVwU852EOPEZ3GzxfoCE8Dc8iPCNYJDxiaik81aEwPDMlOjz1/D08yRpDPLcvUTzRXV88dZVoPGhaczyeq4I8wamIPEuCjjz14Zc8B86ePPEypTyml6s8DJK1PGVxvzzRK8s8vMXRPBuy2TwFb+c8BmvwPE9i+TwOjQM9R1sJPXopDz3QihM9ljYcPfzcIj158Sg9l6IuPajiNT2kyD89V11HPYPSTD32LVQ9WmVdPbq1Zj2JiXA9O2p5Pa8wgj1aGIc9iMKMPb9ukj1v25c90VaePeDqoz2OWqk9CoCwPYP9tz0Ryb89OjLGPTZJzT2h5NM9yCXcPaWj4z2K+ek9bvbxPZvG+T2ZugA+OZ0EPi1tCD5UWww+8+UQPtiVFT6HZRo+ilYfPpVSJD4QHyk+Gc0tPtxPMz69/Dc+Pfw8PiA0Qj6Wakc+tmhNPgDKUj7I31g+faJePns7ZD6eXmk+DKhuPk3CdD7sano+TnB/PuXagj4boIU+bJ6IPiaeiz7qk44+lKCRPkgJlT4g7pc+5/iaPn8Qnj6YWaE+K3qkPou/pz6hyqo+LSCuPtGUsT7EJbU+HZa4PhUJvD5LZ78+jPTCPu53xj5Gcco+9trNPphw0T5QB9U+y7/YPkCQ3D6OVOA+XATkPlCr5z63qus+NYfvPlRC8z79Dvc+LfD6PgDi/j4UZAE/VlQDP9xJBT+PNgc/FEUJP7AvCz+pJg0/nQ0PP3gFET+bLhM/1j8VP05TFz9NQhk/MEAbP0pBHT+LWR8/cGQhP0V5Iz+eaCU/DH0nP0mgKT9MuSs/7OotP07tLz+oCDI/JTk0P+1WNj+ZZTg/35s6P72/PD//7z4/eCpBP0k+Qz/pVEU/Q3hHP7CMST/Mu0s/XdpNPxXjTz/h61E/kw1UP+wtVj/4YVg/JotaP6eSXD/7tl4/m8RgP1T+Yj8JHGU/ujRnPynPZD+WWGI/w/1fP/SeXT8nVFs/d+1YP1qRVj9wVVQ/FwVSP9rWTz91f00/KFRLP6sWST/j6UY/OpxEP89lQj98LUA/eNw9P2+dOz8Pdjk/OFc3P2NSNT9RPzM/FBcxP7XTLj/ktSw/xJsqP5uWKD9vrSY/yKkkP3W5Ij9vxSA/5KoeP/S2HD+YmBo/VbcYP46tFj8WlhQ/xIYSP/OJED/kog4/IdAMP1fbCj/U/Ag/OzQHP5FpBT8jnQM/gMUBPxXj/z4pLvw+VZX4PkMR9T6+ZPE+WRDuPpiq6j7nWec+S9/jPiWe4D7HFd0+lbDZPjza1T49tNI+AYHPPg9izD60/8g+d8zFPomLwj6+Vb8+eeG7PhLouD5cmbU+2vyxPjnOrj6206s+lMuoPkcPpj6pJ6M+lSegPu1xnT5VhJo+7JuXPlehlD7Te5E+A9yOPj67iz7E9Ig+SfKFPvU/gz6sYoA+//96Pu1+dT7zOHA+dfJqPpXQZT5QmGA+u5tbPqyGVj51cVE+2ilMPlqERj5mAEI+pUU9PmnbNz5CajM+pjguPkjpKD7OXCQ+CL8fPkPRGj6RORY+Yr0RPlnXDD6UyQc+FzIDPtea/T0xFvQ9Ir3rPbWH4j0DHto9mhfRPfq7xz0Tyr89suW3PVEarz3q6qU9fKKePXDklT0eiY09VV6FPQT+fT1LGmw9MjRbPXUcSz0YTjo9+K4oPX5+GD1ehAc91U/rPLyMzjzwmbE8lVqRPPszZjwg/SE8ptvPOwkKEDu8+L66y2qnu6CZE7wiME+8NmOBvPJynbxRRL68yInWvCoZ8rya4Qm9u5cZvbSEJr1ArjO9F25BvVbpTb1iB129qwtqvcXkd71m5oG9DtmIvRmbjr3qHJW9e5mcvW62or29xKe92nquvboztb2qU7u9YM/BvUj9x72MfM29AovUvcFE2r1bseC94hfmvU//6709a/C9z7L2vWz5+712BwG+MBsEvpz1Br45kwm+b7oLvm9nDr48ZxG+N9sTvrrEFr6KBBq+bY0cvqm9Hr6t4CC+iHgjvlhOJr49nii+bOgqvlzILb6z3S++/FkyvqUJNb47Qje+L4Y5vrfYO77XcT2+Zh1Avk8zQr50hkS+fL5GvqFCSb4wIEy+FQ5PvlR/Ub42ClS+gfRWvrs8Wb6gp1u+wLddvr7pX76dPWK+lnJkvi+LZr50FGm+jw1rvm44bb7VoW++vb9xvlxxc76oS3W+/Bl3vkDpeL6yQnq+jPN7viI0fb4+EH++RhWAvj3bgL6trIG+RV6CvtMlg7736IO+fKCEvk14hb7gI4a+sviGvtPJh75Dr4i+d2SJvvsVir4cGou+5/WLvtDnjL5kf42+TwyOvrrOjr4erY++dl+Qvkz0kL7QxpG+bmeSvipDk75bJZS+bc2UvluKlb7nN5a+LFKXvivWl763b5i+F+KYvst+mb7VAJq+mi+bvrblm77InJy+nIidvuAhnr4/0p6+8HmfvjTun77br6C+DX2hvpo5or6T1aK+LYajvt4cpL5Mx6S+3iylvgudpb40A6a+DlSmvmz0pr6Teqe+pAKovsq1qL6mUqm+lsypvkU8qr5X5aq+2lOrvhjlq76pdKy+3QWtvn9/rb5y5q2+3k2uvoGBrr6AJ6++BcivvnadsL4D77C+O2qxvpSysb67kbK+fxizviSVs76sALS+qHu0vu3HtL7DbbW+df61vuSDtr5Ty7a+Qj63vmiDt74i9Le+3VG4vu6buL6tI7m+dIO5vuTnub5Mdbq+MCm7vo2Gu76o+Lu+cUO8vkpevL5Lury+MBG9vn2Hvb7r7b2+GVy+vpvGvr61Dr++Mj6/vvh8v75Yz7++VSDAvqLHwL4G5cC++O7AvsJCwb6QlsG+nz3CvnuYwr5OJ8O+O5jDvpMDxL7kTcS+fYDEvrewxL7pB8W+V3LFvvjRxb4UEca+InHGvsILx76auce+OAPIvoM7yL6PsMi+Y9PIvlMYyb4JXMm+YI/JvrO1yb65Gcq+fCLKvmtmyr5Da8q+WJ7Kviniyr7308q+lTPLvnimy75q0su+gw3MvstSzL7qk8y+3LXMvvruzL5qKc2+6bLNvq2uzb4X6M2+TF7Ovhywzr40EM++RzXPvmekz76w1c++BQ7QvguX0L5V+tC+MQ3RvptB0b5MaNG+f7DRvrq60b7SGNK+rWzSvl9w0r4wm9K+nQfTvpto076MndO+mqvTvug51L7JWNS+QnDUvrZ81L55mtS+3cnUvi3x1L4u8dS+KfrUvis+1b6gm9W+gg/WvvUn1r6Zoda+S9TWvt7k1r4BIte+VXXXvq2n176sute+ZObXvqQl2L48+9e+IhbYvsF02L4Mqdi+LBvZvtMn2b4zYtm+Ua3ZvrXk2b4bF9q+QfzZvv3x2b5bHNq+SIvavtJv2r6hpdq+Fafavka32r4Z3dq+Kbzavi+z2r7r/dq+SRTbvmEu276+O9u+T3rbvvDf274x5du+Pgzcvjsv3L5LQdy+Ko/cvhfn3L4pFt2+uzHdvho83b7Nfd2+9aXdvnrZ3b5I6N2+UvjdvsHh3b5B8N2+ShDevlr13b6VKN6++0XevveI3r5rpN6+6AHfvplE374Ia9++pXLfvi2S375dwt++gOzfvpYl4L5nPeC+dmPgvp6r4L6J0uC+907gvm2Q4L6Sn+C+9s3gvsO04L4ExuC+yfXgvoPR4L4cEOG+iTLhvh0L4b5PUuG+U0fhviGY4b5Bi+G+J57hviLM4b63/+G+p0Xivjtv4r6mV+K+Jo7ivs2L4r7ZquK+KN/ivsIV475ZIOO+gwbjvpA74776UuO+2bHjvqiR477OieO+IrXjvo15476IuOO+uuzjvgjk4776S+S+I2Pkvoae5L7EouS+TMXkvt/t5L6ZQeW+6MLlvny/5b7RhuW+xwrmvn4G5r5cCua+JjXmvqE35r6bQua+bzLmvgpA5r79LOa+mzvmviwK5r4j/OW+sT/mvtlU5r4Xbea+JJXmvl/v5r6m8Oa+5hPnvvHy5r44Dee+L3DnvuHF576Pyue+n/bnvrJO6L7TT+i+WI/ovtak6L69jei+143ovhiE6L5yfei+BGnovkVO6L6VXui+54zovrqA6L7Bgui+lpHovuR16L7FFei+EUnovh+P6L5ASui+/abovsfX6L6Ayei+");
\ No newline at end of file
@@ -0,0 +1 @@
+window.EMERGE_CHUNK("transform","M_t","zYSMOlVsDTt9tVQ7VayNOy18sDtAX9Q7QNj3Owy6DTwLjx88PnAxPMJYQzzQB1U8p+5mPHrJeDw7LYU8xQWOPGrXljz99Z8848+oPLDKsTyUiro8JmjDPE0bzDyZAtU8BefdPP6z5jw0lO881Xr4PE2zAD3EGQU9v3wJPYXkDT1yThI9z7YWPZ4fGz0Rhh89NPIjPaZWKD0UuCw9ZBoxPT2DNT065zk9blQ+PQGmQj1JBkc9xU5LPVuqTz1r9VM9WlZYPcytXD0vHGE9F3ZlPWjSaT2WMW4985ZyPZjidj3cK3s9GnF/PVXdgT2MBYQ9VyeGPTlQiD2sbIo9lZGMPTiyjj1H0ZA9P/iSPW4QlT0aLpc9kEiZPYBbmz35cJ09MomfPQ2boT1EtaM9OsOlPQrZpz1p7qk9wvWrPX4Drj1PDrA9ZRayPUEZtD3wF7Y9jBm4PQsZuj3SGbw9sBK+PZQDwD0H+sE91ObDPfHYxT1/v8c9T7LJPZmWyz1sdM09qlrPPRI50T0gGNM9TPHUPbXE1j0fnNg9xnDaPTpA3D0YDt49dtPfPSib4T2VY+M9AijlPRfm5j3Bn+g9+lbqPYsH7D1ouu09HmzvPTAW8T1CvfI9ymX0PVgQ9j0QsPc9S0v5PY3n+j2gh/w9tyD+Peqz/z09ogA+FWYBPnYoAj5O8AI+mq8DPs5uBD7FLAU+t+gFPm+kBj4uYQc+bxcIPt7KCD5Mewk+Bi0KPvLdCj7niws+cTcMPsziDD6DjQ0+azcOPr/bDj4Ngw8+5SQQPivJED4TZxE+mAkSPjaoEj5kSBM+MuQTPkSAFD7UGBU+xq4VPrVDFj561xY+d2sXPkT7Fz7YiRg+qBcZPmqkGT5/Lho+RLcaPrdAGz5Gxhs+VEwcPhvQHD7ZUx0+ndYdPv9VHj7s1R4+tFQfPu7PHz7USyA+6cUgPso+IT7EuCE+8i8iPhqlIj6eFyM+wogjPpv5Iz7NaCQ+xNUkPilCJT7LrSU+vhomPqyEJj7M7SY+8lUnPnG9Jz6nIig+oocoPgrqKD6TSik+A6wpPjAMKj65bCo+wcoqPs8qKz7KjCs+oe0rPhdQLD6Nsyw+bhgtPrl+LT5r5S0+P04uPrC2Lj4UIS8+h4wvPoH5Lz50aTA+LtkwPspKMT6LvjE+cDMyPjaqMj7lIDM+2JkzPq0SND7ajDQ+kQo1PkyFNT7ZAjY+NYQ2PnQENz6phTc++Ag4PiaPOD7AEzk+QJc5Ps8gOj6Oqzo+JTc7PjPEOz5yUjw+SOM8PuF3PT61Cj4+QJ4+PmY0Pz4syz8+K2RAPln+QD66mkE+8zhCPh3XQj7wd0M+GRlEPo66RD7eXkU+iAVGPjCqRj6OVEc+JgBIPkGrSD5SW0k+3QxKPm29Sj7Xcks+ByZMPp7XTD5ii00+j0ROPrv8Tj5XuE8+SHNQPhUuUT457lE+BrBSPityUz6tMlQ+RfhUPgvAVT6WiFY+mFdXPnoeWD7751g+T7FZPleBWj44TVs+rx9cPsz1XD7Byl0+B6BePtd2Xz6CT2A+pSphPjMFYj5Q4mI+UcJjPsufZD6Sg2U+2mdmPl5JZz6tMWg+9xhpPjsCaj5w7Go+U9lrPpnFbD6Jsm0+YKJuPrmSbz5IhHA+g3dxPipucj4aZXM+Slh0PppPdT5mSXY+TER3PgBCeD7uP3k+xj96PnQ/ez5vQHw+7kN9PqRJfj7TTH8+oiqAPtuvgD5KNIE+TrqBPlhBgj5+yII+P06DPgjWgz4UXoQ+V+eEPmZvhT7C+IU+sIKGPvEMhz6hmYc+NiaIPsyziD72QYk+Zc+JPnFfij6u7oo+nX+LPhURjD67o4w+HTeNPjPKjT5eXo4+PPOOPqyJjz5/IJA+HreQPjJNkT7Q5JE+iICSPkoakz7LspM+qEyUPtjnlD6LgZU+YB+WPrm5lj6+Vpc+OPOXPi6PmD7zLpk+vM6ZPptumj7ADZs+Cq+bPoxOnD7b8Jw+D5OdPqE2nj5+3J4+Gn2fPq0foD4rxKA+yWqhPtoNoj4Et6I+Ol2jPsMFpD5JraQ+clWlPhX+pT50pqY+L0+nPpf4pz7to6g+4U+pPvb6qT7Cpqo+NlKrPpz8qz6sq6w+qlmtPvIHrj5mt64+z2avPqcVsD42xbA+wXSxPrEmsj5x2LI+cYuzPhk7tD637LQ+Gp+1PgRUtj5mBrc+hLu3PhpxuD5oJ7k+zd65PjSUuj7NSrs+jQG8Phi7vD6Bcb0+eCm+PiHlvj7VnL8+b1XAPu4OwT6syME+kIHCPvk8wz7w98M+FrPEPqRtxT7hKsY+GujGPiGjxz73Ycg+nR/JPqfeyT7Lnco+z1vLPgAbzD6f2Mw+3JbNPoRYzj47F88+/9nPPiaa0D64XNE+5RvSPvPc0j5DntM+RV/UPskj1T6a5dU+C6nWPrBr1z7cLdg+8vLYPoO32T5ifNo+xELbPi8L3D7Sztw+jJPdPv9W3j4DHN8+iePfPiWq4D40cuE+MDriPoYE4z5OzeM++5LkPnxa5T4AJeY+6+7mPvO55z5og+g+cEvpPq4V6j6M4Oo+lqzrPtN37D7MRO0+7xDuPh3a7j7pp+8+PXTwPopA8T5ZDPI+z9jyPnCl8z7hcvQ+XUH1PqIP9j4t3vY+kKz3Pqd8+D4/Svk+yxr6Pmvr+j6puvs+u4r8Pr5d/T41Kv4+lvv+Pk7K/z5FTwA/wrYAP6seAT9/hwE/kvABP+NYAj/HwgI/jCsDP9yUAz/Q/wM/nWgEP37TBD86PQU/FqcFP4gRBj90fAY/i+YGP+VPBz+0uQc/jiQIP2ePCD+e+Ag/dGIJPy7OCT/0OAo/P6EKPxgOCz+4eAs/sOMLP8VODD8Mugw/PyQNP/iODT+1+g0/rGUOP1/QDj/OOw8/7qcPP3QTED9PgBA/Qe0QPwNZET+txBE/BzASP+CbEj9ACBM/eHQTP3nhEz+fTRQ/JrkUP+smFT+lkhU/iv8VP0prFj+E2RY/7UQXP6ayFz/tHxg/vYwYPxD6GD91Zxk/tNQZP9NCGj+9sRo/Ch8bP12NGz/S+Rs/fWgcP+PWHD+ZRB0/r7IdP2whHj/bjx4/Uf0eP0hrHz+Z2R8/9UYgPzO1ID/mIyE/c5EhP7j+IT8PbCI/M9kiP3NFIz/JsyM/uSIkP/iQJD/N/yQ/zmwlP6jbJT9KSiY/crgmP20nJz/ulSc/nAQoP3dzKD8m4yg/BlIpP3TBKT8rMCo/oqAqPxUQKz8fgCs/QO8rPwteLD9nzSw/rD0tP/2rLT/oHC4/YowuP7X8Lj9LbC8/Ed0vP65MMD9ouzA/9ioxP7aZMT/CCjI/L3wyP4rsMj81XDM/Cc0zPyo+ND8ZrjQ/Vh81PwKQNT88/zU//G82PybhNj8yUzc/ssQ3P2o0OD+PpDg/bhU5P/6FOT869zk/PWc6Py/XOj9xRzs/fLc7P9AnPD+1mTw/Bws9P8l8PT/47D0/u10+PwbOPj9mPz8/VLE/P3YjQD+Gk0A/agNBP9l1QT+y5kE/JVhCPwXKQj+KO0M/WaxDPxweRD+Hj0Q/mABFP2dyRT+l40U/LFRGPyPGRj+lOEc/F6tHP0YeSD/Ej0g/bQFJP+t0ST/A6Ek/HVpKP03LSj8bPUs/r65LPzYhTD/Zkkw/RwRNP9d2TT9m6E0/OVtOP7jNTj/KQE8/Y7NPP3IlUD/zl1A/wAtRPxh9UT8971E/F2NSPyTXUj+SSVM/Yb5TP00wVD+volQ/FBZVP2GJVT/Q+1U/0m1WPybhVj/iVFc/TcZXP4E5WD/bq1g/Xx5ZP1mRWT/TA1o//ndaP/3pWj+4XFs//s5bP2BCXD9MtFw/6SZdPxiZXT+xDF4/6X5eP5zxXj+uZF8/xNdfPwpNYD/jv2A/FDJhP+OlYT/ZGWI/y4xiP1wAYz/wc2M/MeZjP9JYZD+2zGQ/QD9lPxGyZT8xJWY/gZhmPxEMZz9Xf2c/m/NnPyxoaD9n3Wg/AlFpP7XEaT+UOWo/36xqP14gaz/TlGs/HQlsPzl8bD+g7mw/sWBtP87UbT9bSG4/hLtuP3Uvbz/oom8/kxZwPwWKcD9R/HA/v29xP83jcT89WHI/lcxyP78/cz/RtHM/WCl0P3CcdD+eEHU/tYV1P3n5dT/FbHY/TeF2Px9Wdz9tyXc/7D14PxCzeD/jJnk/Z5p5P5ENej/CgXo/C/Z6P4Jqez+b3ns/TVR8P/LHfD95PH0/CbJ9P1wpfj+Xn34/uRV/PzOLfz8AAIA/");
\ No newline at end of file
@@ -0,0 +1,291 @@
+"""
+E.M.E.R.G.E+ Framework - Benchmark Suite
+Timings for data loading, dashboard pages, figures and simulation.
+
+Groups:
+
+    load        cold load of every dataset (the old ``load_data()``)
+    pages       every ``app.py`` page branch in Streamlit's headless AppTest
+                runner; the first run is reported separately from warm reruns
+    figures     figure construction + serialization, and the cached JSON path
+    simulation  integration at 1k / 100k / 10M steps
+    ensemble    Monte Carlo ensembles of 1 … 10k members
+    entropy     each entropy estimator on synthetic signals: one long window,
+                and a sliding-window pass over a memory-mapped recording
+
+The ``quick`` suite skips the largest sizes (10M steps, 10k members, the
+one-hour recording). Results
+are written as JSON; with ``--baseline`` every case is compared against a
+stored run and cases slower by more than ``--tolerance`` are reported as
+regressions (exit status 1 with ``--fail-on-regression``).
+
+Usage:
+    python bench.py --out bench.json
+    python bench.py --suite full --baseline benchmarks/baseline.json --fail-on-regression
+    python bench.py --groups load figures --save-baseline benchmarks/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+APP = os.path.join(BASE_DIR, "app.py")
+DEFAULT_TOLERANCE = 0.25
+# Differences below this are timer noise, never a regression
+NOISE_FLOOR_S = 0.005
+
+
+@dataclass
+class Case:
+    """One timed operation; ``setup`` runs untimed before every repeat."""
+    name: str
+    run: Callable
+    setup: Optional[Callable] = None
+    repeats: int = 5
+    params: dict = field(default_factory=dict)
+
+
+def time_case(case):
+    times = []
+    for _ in range(case.repeats):
+        state = case.setup() if case.setup else None
+        start = time.perf_counter()
+        case.run() if state is None else case.run(state)
+        times.append(time.perf_counter() - start)
+    return {
+        "repeats": case.repeats,
+        "first_s": times[0],
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+        "mean_s": statistics.fmean(times),
+        **({"params": case.params} if case.params else {}),
+    }
+
+
+# ============================================
+# CASES
+# ============================================
+def _load_cases(suite):
+    import datasets
+
+    def cold(name):
+        def run():
+            datasets.clear()
+            datasets.load(name)
+        return run
+
+    def cold_all():
+        datasets.clear()
+        datasets.load_all()
+
+    yield Case("load/all", cold_all)
+    for name in datasets.names():
+        yield Case(f"load/{name}", cold(name))
+
+
+def _page_cases(suite):
+    from streamlit.testing.v1 import AppTest
+
+    def setup():
+        at = AppTest.from_file(APP, default_timeout=600)
+        at.run()
+        return at
+
+    def visit(page):
+        def run(at):
+            at.sidebar.radio[0].set_value(page).run()
+            if at.exception:
+                raise RuntimeError(f"{page}: {at.exception[0].message}")
+        return run
+
+    pages = setup().sidebar.radio[0].options
+    for page in pages:
+        label = page.split(" ", 1)[-1].lower().replace(" & ", "_").replace(" ", "_")
+        yield Case(f"pages/{label}", visit(page), setup, repeats=3)
+
+
+def _figure_cases(suite):
+    import datasets
+    import figures
+
+    options = {"max_points": 1000, "line_method": "lttb"}
+    cache = figures.FigureCache(os.path.join(BASE_DIR, ".cache", "bench_figures"))
+    cache.clear()
+    for name in figures.names():
+        data = {s: datasets.load(s) for s in figures.sources(name)}
+        yield Case(f"figures/build/{name}",
+                   lambda name=name, data=data: figures.build(name, data, **options).to_json())
+        cache.spec(name, **options)
+        yield Case(f"figures/cached/{name}",
+                   lambda name=name: json.dumps(cache.serve(name, **options).to_dict()))
+
+
+def _simulation_cases(suite):
+    import simulation as sim
+
+    sizes = [1_000, 100_000] + ([10_000_000] if suite == "full" else [])
+    for steps in sizes:
+        dt = 10.0 / steps
+        repeats = 5 if steps <= 1_000 else (3 if steps <= 100_000 else 1)
+        yield Case(f"simulation/routine_outcomes/{steps}_steps",
+                   lambda dt=dt: sim.routine_outcomes(dt=dt), repeats=repeats, params={"steps": steps})
+        # Full trajectories and the second model up to 100k steps; 10M steps
+        # (minutes of per-step Python overhead) only on the O(N)-memory path
+        if steps <= 100_000:
+            yield Case(f"simulation/routine/{steps}_steps",
+                       lambda dt=dt: sim.simulate_routine(dt=dt), repeats=repeats, params={"steps": steps})
+            yield Case(f"simulation/transformative_outcomes/{steps}_steps",
+                       lambda steps=steps: sim.transform_outcomes(dt=8.0 / steps), repeats=repeats,
+                       params={"steps": steps})
+    for members in [1_000, 10_000]:
+        yield Case(f"simulation/routine_batch/{members}_members",
+                   lambda members=members: sim.simulate_routine(n=members), repeats=3,
+                   params={"members": members, "steps": 1_000})
+
+
+def _ensemble_cases(suite):
+    import ensemble
+
+    sizes = [1, 100, 1_000] + ([10_000] if suite == "full" else [])
+    for members in sizes:
+        yield Case(f"ensemble/transformative/{members}_members",
+                   lambda members=members: ensemble.run_ensemble("transformative", members),
+                   repeats=3 if members <= 1_000 else 1, params={"members": members})
+
+
+def _entropy_cases(suite):
+    import tempfile
+
+    import entropy
+
+    for n in [1_000, 10_000]:
+        x = entropy.synthetic("pink", n, seed=1)[0]
+        yield Case(f"entropy/sampen/{n}_samples", lambda x=x: entropy.sample_entropy(x), params={"samples": n})
+        yield Case(f"entropy/permen/{n}_samples", lambda x=x: entropy.permutation_entropy(x, order=4),
+                   params={"samples": n})
+        yield Case(f"entropy/lz/{n}_samples", lambda x=x: entropy.lempel_ziv(x), params={"samples": n})
+        yield Case(f"entropy/mse/{n}_samples", lambda x=x: entropy.multiscale_entropy(x),
+                   repeats=3, params={"samples": n})
+
+    # 4 channels at 256 Hz, 2 s windows every 0.5 s, read from a memory-mapped .npy
+    fs = 256
+    for minutes in [1, 10] + ([60] if suite == "full" else []):
+        path = os.path.join(tempfile.mkdtemp(prefix="emerge-bench-"), "recording.npy")
+        np.save(path, entropy.synthetic("pink", minutes * 60 * fs, channels=4, seed=2))
+        for name in ["sampen", "permen", "lz"]:
+            yield Case(f"entropy/series_{name}/{minutes}_min_4ch",
+                       lambda name=name, path=path: entropy.entropy_series(path, fs, [name]),
+                       repeats=3 if minutes <= 1 else 1, params={"minutes": minutes, "channels": 4, "fs": fs})
+
+
+GROUPS = {
+    "load": _load_cases,
+    "pages": _page_cases,
+    "figures": _figure_cases,
+    "simulation": _simulation_cases,
+    "ensemble": _ensemble_cases,
+    "entropy": _entropy_cases,
+}
+
+
+# ============================================
+# RUN / COMPARE
+# ============================================
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run(groups=None, suite="quick", match=None, log=print):
+    """Time every case of ``groups``; returns the JSON-ready result document."""
+    if BASE_DIR not in sys.path:
+        sys.path.insert(0, BASE_DIR)
+    results = {}
+    for group in groups or GROUPS:
+        for case in GROUPS[group](suite):
+            if match and match not in case.name:
+                continue
+            results[case.name] = time_case(case)
+            log(f"{case.name:<55} {results[case.name]['median_s'] * 1000:>10.1f} ms")
+    return {"environment": environment(), "suite": suite, "results": results}
+
+
+def compare(current, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Per-case median ratio against ``baseline``; flags regressions beyond ``tolerance``."""
+    rows = []
+    for name, now in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        ratio = now["median_s"] / before["median_s"] if before["median_s"] else float("inf")
+        slower = now["median_s"] - before["median_s"]
+        rows.append({
+            "name": name,
+            "baseline_s": before["median_s"],
+            "current_s": now["median_s"],
+            "ratio": ratio,
+            "regression": ratio > 1 + tolerance and slower > NOISE_FLOOR_S,
+            "improvement": ratio < 1 / (1 + tolerance) and -slower > NOISE_FLOOR_S,
+        })
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the E.M.E.R.G.E+ dashboard and simulator")
+    parser.add_argument("--groups", nargs="+", choices=sorted(GROUPS), default=None)
+    parser.add_argument("--suite", choices=["quick", "full"], default="quick")
+    parser.add_argument("--match", help="only cases whose name contains this string")
+    parser.add_argument("--out", help="write results JSON here")
+    parser.add_argument("--baseline", help="compare against this results JSON")
+    parser.add_argument("--save-baseline", help="also write the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args(argv)
+
+    doc = run(args.groups, args.suite, args.match)
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            rows = compare(doc, json.load(f), args.tolerance)
+        doc["comparison"] = {"baseline": args.baseline, "tolerance": args.tolerance, "cases": rows}
+        print(f"\n{'case':<55} {'baseline':>10} {'current':>10} {'ratio':>7}")
+        for row in rows:
+            flag = "  REGRESSION" if row["regression"] else ("  faster" if row["improvement"] else "")
+            print(f"{row['name']:<55} {row['baseline_s'] * 1000:>8.1f}ms {row['current_s'] * 1000:>8.1f}ms "
+                  f"{row['ratio']:>6.2f}x{flag}")
+        regressions = [row["name"] for row in rows if row["regression"]]
+        print(f"\n{len(regressions)} regression(s) out of {len(rows)} compared case(s)")
+
+    for path in filter(None, [args.out, args.save_baseline]):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(doc, f, indent=2)
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
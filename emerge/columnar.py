@@ -0,0 +1,175 @@
+"""
+E.M.E.R.G.E+ Framework - Columnar Data Store
+Binary, column-per-file storage for the dashboard time series and tables.
+
+Layout::
+
+    data/manifest.json            dataset → rows, columns, dtype, source CSV + hash
+    data/<dataset>/<column>.npy   one NumPy array per column
+
+Columns can be opened memory-mapped, so ensemble outputs with millions of rows
+are paged in on demand instead of parsed. The CSVs remain the hand-editable
+source; ``python columnar.py build`` regenerates the store (and, through
+site_data.py, the static site's data) from them, and ``python columnar.py
+export`` writes any stored dataset back out as CSV.
+
+Usage:
+    python columnar.py build [--float32]
+    python columnar.py export routine_full routine.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STORE_DIR = os.path.join(BASE_DIR, "data")
+
+# Dataset name → source CSV
+SOURCES = {
+    "routine_full": "routine_timeseries_full.csv",
+    "transformative_full": "transformative_timeseries_full.csv",
+    "culture": "table_demo3_culture.csv",
+    "sensitivity": "table_demo4_parameter_sensitivity.csv",
+    "transformative_meta": "transformative_metadata.csv",
+}
+
+
+def _sha256(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def read_manifest(store_dir=STORE_DIR):
+    try:
+        with open(os.path.join(store_dir, "manifest.json")) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _write_manifest(manifest, store_dir):
+    tmp = os.path.join(store_dir, "manifest.json.tmp")
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, os.path.join(store_dir, "manifest.json"))
+
+
+def write_dataset(name, columns, store_dir=STORE_DIR, dtype=None, **meta):
+    """Write a DataFrame or mapping of arrays as dataset ``name``.
+
+    ``dtype`` (e.g. "float32") downcasts float columns; integer columns keep
+    their type. Arrays may be N-D (e.g. an (members, steps) ensemble block).
+    """
+    if isinstance(columns, pd.DataFrame):
+        columns = {c: columns[c].to_numpy() for c in columns.columns}
+    path = os.path.join(store_dir, name)
+    os.makedirs(path, exist_ok=True)
+    entry = {"columns": {}, **meta}
+    for col, values in columns.items():
+        arr = np.asarray(values)
+        if dtype and arr.dtype.kind == "f":
+            arr = arr.astype(dtype)
+        # Replace, never rewrite in place: running servers may have the old file memory-mapped
+        target = os.path.join(path, f"{col}.npy")
+        with open(target + ".tmp", "wb") as f:
+            np.save(f, np.ascontiguousarray(arr), allow_pickle=False)
+        os.replace(target + ".tmp", target)
+        entry["columns"][col] = {"dtype": arr.dtype.str, "shape": list(arr.shape)}
+    entry["rows"] = int(next(iter(entry["columns"].values()))["shape"][0]) if entry["columns"] else 0
+    manifest = read_manifest(store_dir)
+    manifest[name] = entry
+    _write_manifest(manifest, store_dir)
+    return entry
+
+
+def has_dataset(name, store_dir=STORE_DIR):
+    return name in read_manifest(store_dir)
+
+
+def load_columns(name, store_dir=STORE_DIR, mmap=False, columns=None):
+    """Dict of column arrays for dataset ``name``; memory-mapped read-only if ``mmap``."""
+    entry = read_manifest(store_dir).get(name)
+    if entry is None:
+        raise KeyError(f"Dataset {name!r} is not in the columnar store at {store_dir}")
+    mode = "r" if mmap else None
+    return {
+        col: np.load(os.path.join(store_dir, name, f"{col}.npy"), mmap_mode=mode, allow_pickle=False)
+        for col in (columns or entry["columns"])
+    }
+
+
+def load_frame(name, store_dir=STORE_DIR, mmap=False, columns=None):
+    """Dataset ``name`` as a DataFrame (1-D columns only); with ``mmap`` its columns are the maps themselves."""
+    return pd.DataFrame(load_columns(name, store_dir, mmap, columns), copy=not mmap)
+
+
+def export_csv(name, path, store_dir=STORE_DIR):
+    """Write a stored dataset back out as CSV."""
+    load_frame(name, store_dir).to_csv(path, index=False)
+
+
+def read_csv(path):
+    """Read a source CSV exactly as ``build`` does, so the store and its fallback return the same values."""
+    return pd.read_csv(path, float_precision="round_trip")
+
+
+def is_stale(name, store_dir=STORE_DIR, source_dir=BASE_DIR):
+    """True if the source CSV changed since ``name`` was built (a store without its CSV is never stale).
+
+    An unchanged size and mtime settle it without reading the file; otherwise the content hash decides.
+    """
+    entry = read_manifest(store_dir).get(name)
+    source = os.path.join(source_dir, SOURCES[name])
+    if not os.path.exists(source):
+        return False
+    if entry is None:
+        return True
+    st = os.stat(source)
+    if entry.get("source_size") == st.st_size and entry.get("source_mtime_ns") == st.st_mtime_ns:
+        return False
+    return entry.get("source_sha256") != _sha256(source)
+
+
+def build(store_dir=STORE_DIR, source_dir=BASE_DIR, dtype=None):
+    """Convert every source CSV into the columnar store."""
+    built = {}
+    for name, filename in SOURCES.items():
+        source = os.path.join(source_dir, filename)
+        st = os.stat(source)
+        built[name] = write_dataset(name, read_csv(source), store_dir, dtype=dtype, source=filename,
+                                    source_sha256=_sha256(source), source_size=st.st_size,
+                                    source_mtime_ns=st.st_mtime_ns)
+    return built
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or export the E.M.E.R.G.E+ columnar data store")
+    sub = parser.add_subparsers(dest="command", required=True)
+    b = sub.add_parser("build", help="convert the CSVs into data/ and regenerate the static site data")
+    b.add_argument("--float32", action="store_true", help="store float columns as float32")
+    b.add_argument("--no-js", action="store_true", help="skip regenerating the static site data")
+    e = sub.add_parser("export", help="write a stored dataset as CSV")
+    e.add_argument("dataset", choices=sorted(SOURCES))
+    e.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        built = build(dtype="float32" if args.float32 else None)
+        for name, entry in built.items():
+            print(f"{name}: {entry['rows']} rows, {len(entry['columns'])} columns")
+        if not args.no_js:
+            import site_data  # imports datasets, which imports this module
+            site_data.main([])
+    else:
+        export_csv(args.dataset, args.path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+E.M.E.R.G.E+ Framework - Dataset Registry
+Named, lazily loaded datasets for the dashboard pages.
+
+Each page asks only for the datasets it uses. A dataset is read on first
+access, kept for the life of the process and its load time recorded in
+``LOAD_TIMES``. Datasets come from the binary columnar store (``data/``, see
+columnar.py) when it has been built from the current CSVs, and from the CSVs
+when it has not been built or a CSV was edited since (until the next build).
+Derived tables (the key-timepoint tables) are read from their CSV when present
+and otherwise computed from the full series.
+
+Every session of a server process shares one immutable copy of each dataset.
+Stored datasets are read-only memory maps, so several server processes on one
+host also share their pages; the others are frozen once when loaded. ``load``
+hands out shallow copies. Under pandas copy-on-write, a session that modifies
+one gets a private copy of the columns it touched. Writing into the shared
+arrays directly raises.
+"""
+
+from __future__ import annotations
+
+import itertools
+import mmap
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+import columnar
+import instrument
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Rows shown in the "Key Timepoints" tables
+ROUTINE_KEY_TIMES_S = [0.0, 1.0, 2.0, 3.0, 5.0, 7.5, 10.0]
+TRANSFORM_KEY_TIMES_H = [0.0, 1.0, 2.0, 3.0, 4.0, 6.0, 8.0]
+
+_LOADERS = {}
+_CACHE = {}
+_LOCK = threading.RLock()
+LOAD_TIMES = {}
+# Load generation per cached dataset: changes whenever the shared copy is replaced
+_GENERATIONS = {}
+_NEXT_GENERATION = itertools.count(1)
+
+
+def dataset(name):
+    """Register the decorated zero-argument function as the loader for ``name``."""
+    def register(fn):
+        _LOADERS[name] = fn
+        return fn
+    return register
+
+
+def names():
+    return list(_LOADERS)
+
+
+def load(name):
+    """Return a read-only view of dataset ``name``, loading (and timing) it on first access."""
+    try:
+        return _CACHE[name].copy(deep=False)
+    except KeyError:
+        pass
+    if name not in _LOADERS:
+        raise KeyError(f"Unknown dataset {name!r}; available: {', '.join(_LOADERS)}")
+    with _LOCK:
+        if name not in _CACHE:
+            start = time.perf_counter()
+            with instrument.span(f"load/{name}"):
+                _CACHE[name] = freeze(_LOADERS[name]())
+            _GENERATIONS[name] = next(_NEXT_GENERATION)
+            LOAD_TIMES[name] = time.perf_counter() - start
+    return _CACHE[name].copy(deep=False)
+
+
+def generation(name):
+    """Load generation of dataset ``name`` (None if not loaded); equal generations mean identical data."""
+    return _GENERATIONS.get(name)
+
+
+def _mapped(values):
+    """True if ``values`` is a view of a memory map."""
+    while values is not None:
+        if isinstance(values, (np.memmap, mmap.mmap)):
+            return True
+        values = getattr(values, "base", None)
+    return False
+
+
+def freeze(frame):
+    """``frame`` with every NumPy column backed by a read-only array (memory maps are kept as they are)."""
+    columns = {}
+    for c in frame.columns:
+        values = frame[c].to_numpy()
+        if values.dtype == object or _mapped(values):
+            columns[c] = frame[c]
+            continue
+        values = values.copy()
+        values.flags.writeable = False
+        columns[c] = values
+    return pd.DataFrame(columns, index=frame.index, copy=False)
+
+
+def memory_usage():
+    """Bytes per loaded dataset: private heap and memory-mapped pages (shared between processes)."""
+    out = {}
+    for name, frame in list(_CACHE.items()):
+        mapped = sum(frame[c].to_numpy().nbytes for c in frame.columns if _mapped(frame[c].to_numpy()))
+        out[name] = {"heap": int(frame.memory_usage(deep=True).sum()) - mapped, "mapped": mapped}
+    return out
+
+
+def load_all():
+    """Every registered dataset (what the old monolithic ``load_data()`` did)."""
+    return {name: load(name) for name in _LOADERS}
+
+
+def clear():
+    with _LOCK:
+        _CACHE.clear()
+        _GENERATIONS.clear()
+        LOAD_TIMES.clear()
+
+
+def _csv(filename):
+    return columnar.read_csv(os.path.join(DATA_DIR, filename))
+
+
+def _stored(name):
+    """Dataset ``name`` from the columnar store, or from its source CSV if not built or out of date."""
+    if columnar.has_dataset(name) and not columnar.is_stale(name):
+        return columnar.load_frame(name, mmap=True)
+    return _csv(columnar.SOURCES[name])
+
+
+def _exists(filename):
+    return os.path.exists(os.path.join(DATA_DIR, filename))
+
+
+def key_timepoints(full, time_column, times):
+    """Rows of ``full`` nearest to each of ``times``."""
+    t = full[time_column].to_numpy()
+    idx = np.unique(np.abs(t[None, :] - np.asarray(times)[:, None]).argmin(axis=1))
+    return full.iloc[idx].reset_index(drop=True)
+
+
+# ============================================
+# DATASETS
+# ============================================
+@dataset("routine_full")
+def _routine_full():
+    return _stored("routine_full")
+
+
+@dataset("transformative_full")
+def _transformative_full():
+    return _stored("transformative_full")
+
+
+@dataset("routine_timepoints")
+def _routine_timepoints():
+    if _exists("table_demo1_routine_timepoints.csv"):
+        return _csv("table_demo1_routine_timepoints.csv")
+    return key_timepoints(load("routine_full"), "time_s", ROUTINE_KEY_TIMES_S)
+
+
+@dataset("transformative_timepoints")
+def _transformative_timepoints():
+    if _exists("table_demo2_transformative_timepoints.csv"):
+        return _csv("table_demo2_transformative_timepoints.csv")
+    return key_timepoints(load("transformative_full"), "time_h", TRANSFORM_KEY_TIMES_H)
+
+
+@dataset("culture")
+def _culture():
+    return _stored("culture")
+
+
+@dataset("sensitivity")
+def _sensitivity():
+    return _stored("sensitivity")
+
+
+@dataset("transformative_meta")
+def _transformative_meta():
+    return _stored("transformative_meta")
@@ -0,0 +1,97 @@
+"""
+E.M.E.R.G.E+ Framework - Trace Downsampling
+Reduce long series to a fixed point budget before they are sent to Plotly.
+
+Two methods:
+    lttb    Largest-Triangle-Three-Buckets: keeps the visual shape of a line
+    minmax  per-bucket min and max: keeps the full envelope of noisy signals
+
+Both always keep the first and last points and the global maximum and
+minimum, so peaks such as the H_e maximum at t_peak survive exactly.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import plotly.graph_objects as go
+
+import instrument
+
+DEFAULT_MAX_POINTS = 1000
+METHODS = ("lttb", "minmax")
+
+
+def _extremes(y):
+    return [int(np.nanargmax(y)), int(np.nanargmin(y))] if len(y) else []
+
+
+def lttb_indices(x, y, n_out):
+    """Indices selected by Largest-Triangle-Three-Buckets."""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    # Interior points split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Average of the next bucket (or the last point) is the third vertex
+        nlo, nhi = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        cx = x[nlo:nhi].mean()
+        cy = y[nlo:nhi].mean()
+        bx = x[lo:hi]
+        by = y[lo:hi]
+        area = np.abs((x[a] - cx) * (by - y[a]) - (x[a] - bx) * (cy - y[a]))
+        a = lo + int(area.argmax())
+        out[i + 1] = a
+    return out
+
+
+def minmax_indices(x, y, n_out):
+    """Indices of the minimum and maximum of each of ``n_out // 2`` buckets."""
+    n = len(x)
+    buckets = max(1, n_out // 2)
+    if n_out >= n:
+        return np.arange(n)
+    edges = np.linspace(0, n, buckets + 1).astype(int)
+    starts = edges[:-1]
+    lengths = np.diff(edges)
+    # Pad every bucket to the longest one so min/max become row reductions
+    width = lengths.max()
+    idx = starts[:, None] + np.arange(width)[None, :]
+    valid = np.arange(width)[None, :] < lengths[:, None]
+    idx = np.where(valid, idx, starts[:, None])
+    vals = y[idx]
+    rows = np.arange(buckets)
+    lo = idx[rows, np.where(valid, vals, np.inf).argmin(axis=1)]
+    hi = idx[rows, np.where(valid, vals, -np.inf).argmax(axis=1)]
+    return np.unique(np.concatenate([[0, n - 1], lo, hi]))
+
+
+def downsample(x, y, max_points=DEFAULT_MAX_POINTS, method="lttb"):
+    """Return (x, y) reduced to about ``max_points`` points.
+
+    Series already within budget are returned unchanged.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=np.float64)
+    if max_points is None or len(x) <= max_points:
+        return x, y
+    if method == "lttb":
+        idx = lttb_indices(x.astype(np.float64), y, max_points)
+    elif method == "minmax":
+        idx = minmax_indices(x, y, max_points)
+    else:
+        raise ValueError(f"method must be one of {METHODS}, got {method!r}")
+    idx = np.unique(np.concatenate([idx, _extremes(y)]))
+    return x[idx], y[idx]
+
+
+@instrument.traced("downsample")
+def scatter(x, y, max_points=DEFAULT_MAX_POINTS, method="lttb", **kwargs):
+    """``go.Scatter`` whose data has been downsampled to ``max_points``."""
+    xs, ys = downsample(x, y, max_points, method)
+    return go.Scatter(x=xs, y=ys, **kwargs)
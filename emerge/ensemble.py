@@ -0,0 +1,191 @@
+"""
+E.M.E.R.G.E+ Framework - Monte Carlo Ensembles
+Thousands of noisy runs folded into streaming statistics.
+
+Members are simulated in batches; each batch updates per-time-point
+accumulators and is then discarded, so memory depends on the batch size and
+the series length, not on the number of members:
+
+    RunningStats   Welford / Chan mean and variance, merged batch by batch
+    P2Quantiles    Jain & Chlamtac P² marker estimates, vectorized over time
+
+Per-member scalars (time of the H_e peak, time to a meaning threshold, final
+meaning) are kept in full because they are one number per member. The
+noise-free skeleton (mean inputs, no diffusion) is solved once with an
+adaptive integrator for comparison with the ensemble median.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+import simulation as sim
+
+DEFAULT_QUANTILES = (0.05, 0.5, 0.95)
+
+
+class RunningStats:
+    """Streaming mean and variance of equally shaped observations."""
+
+    def __init__(self, shape):
+        self.count = 0
+        self.mean = np.zeros(shape)
+        self._m2 = np.zeros(shape)
+
+    def update(self, batch):
+        """Fold a batch of shape (n, *shape) into the running moments."""
+        batch = np.asarray(batch, dtype=np.float64)
+        n = batch.shape[0]
+        if n == 0:
+            return
+        b_mean = batch.mean(axis=0)
+        b_m2 = ((batch - b_mean) ** 2).sum(axis=0)
+        total = self.count + n
+        delta = b_mean - self.mean
+        self.mean = self.mean + delta * (n / total)
+        self._m2 = self._m2 + b_m2 + delta ** 2 * (self.count * n / total)
+        self.count = total
+
+    @property
+    def var(self):
+        return self._m2 / (self.count - 1) if self.count > 1 else np.zeros_like(self._m2)
+
+    @property
+    def std(self):
+        return np.sqrt(self.var)
+
+
+class P2Quantiles:
+    """P² streaming estimates of several quantiles, one estimator per element of ``shape``."""
+
+    def __init__(self, probs, shape):
+        self.probs = np.asarray(probs, dtype=np.float64)
+        p = self.probs[:, None, None]
+        self.count = 0
+        self._init = []
+        shape = (len(self.probs), 5) + tuple(np.atleast_1d(shape))
+        self.q = np.zeros(shape)
+        self.n = np.zeros(shape)
+        self.desired = np.broadcast_to(np.concatenate([0 * p, 2 * p, 4 * p, 2 + 2 * p, 4 + 0 * p], axis=1),
+                                       shape).copy()
+        self.step = np.concatenate([0 * p, p / 2, p, (1 + p) / 2, 1 + 0 * p], axis=1)
+
+    def update(self, batch):
+        for x in np.asarray(batch, dtype=np.float64):
+            self._add(x)
+
+    def _add(self, x):
+        self.count += 1
+        if self.count <= 5:
+            self._init.append(x)
+            if self.count == 5:
+                self.q[:] = np.sort(np.stack(self._init), axis=0)[None]
+                self.n[:] = np.arange(5, dtype=np.float64)[None, :, None]
+            return
+
+        q, n = self.q, self.n
+        q[:, 0] = np.minimum(q[:, 0], x)
+        q[:, 4] = np.maximum(q[:, 4], x)
+        k = (x >= q[:, 1]).astype(int) + (x >= q[:, 2]) + (x >= q[:, 3])
+        n += np.arange(5)[None, :, None] > k[:, None]
+        self.desired += self.step
+
+        for i in (1, 2, 3):
+            d = self.desired[:, i] - n[:, i]
+            move = ((d >= 1) & (n[:, i + 1] - n[:, i] > 1)) | ((d <= -1) & (n[:, i - 1] - n[:, i] < -1))
+            if not move.any():
+                continue
+            s = np.sign(d)
+            nl, ni, nr = n[:, i - 1], n[:, i], n[:, i + 1]
+            ql, qi, qr = q[:, i - 1], q[:, i], q[:, i + 1]
+            parabolic = qi + s / (nr - nl) * ((ni - nl + s) * (qr - qi) / (nr - ni)
+                                              + (nr - ni - s) * (qi - ql) / (ni - nl))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                neighbour_q = np.where(s > 0, qr, ql)
+                neighbour_n = np.where(s > 0, nr, nl)
+                linear = qi + s * (neighbour_q - qi) / (neighbour_n - ni)
+            ok = (ql < parabolic) & (parabolic < qr)
+            q[:, i] = np.where(move, np.where(ok, parabolic, linear), qi)
+            n[:, i] = np.where(move, ni + s, ni)
+
+    @property
+    def values(self):
+        """Current estimates, shape (len(probs), *shape)."""
+        if self.count < 5:
+            if not self._init:
+                return np.full((len(self.probs),) + self.q.shape[2:], np.nan)
+            return np.quantile(np.stack(self._init), self.probs, axis=0)
+        return self.q[:, 2]
+
+
+@dataclass
+class EnsembleSummary:
+    """Streaming summary of an ensemble: per-time-point stats plus per-member scalars."""
+    model: str
+    time: np.ndarray
+    members: int
+    mean: dict = field(default_factory=dict)
+    std: dict = field(default_factory=dict)
+    quantiles: dict = field(default_factory=dict)      # variable → {prob: (T,) array}
+    scalars: dict = field(default_factory=dict)        # name → (members,) array
+    skeleton: dict = field(default_factory=dict)       # variable → (T,) noise-free solution
+
+    def band(self, variable, low=0.05, high=0.95):
+        q = self.quantiles[variable]
+        return q[low], q[0.5], q[high]
+
+
+def run_ensemble(model="transformative", members=1000, *, params=None, batch_size=250, seed=2025,
+                 dt=0.01, duration=None, variables=None, threshold=None, probs=DEFAULT_QUANTILES,
+                 skeleton="auto"):
+    """Simulate ``members`` noisy runs in batches and return their streaming summary.
+
+    Parameters
+    ----------
+    model : "routine" or "transformative"
+    params : shared parameter set (scalars) for every member
+    batch_size : members simulated and folded in per batch; bounds memory
+    seed : root seed; each batch gets an independent child stream
+    variables : series to summarize (default H_e plus the meaning variable)
+    threshold : meaning threshold for the time-to-threshold distribution
+                (M_r > 0.35 for routine, M_t > 0.5 for transformative)
+    skeleton : integrators method for the noise-free solution, or None to skip it
+    """
+    routine = model == "routine"
+    simulate = sim.simulate_routine if routine else sim.simulate_transformative
+    duration = duration or (10.0 if routine else 8.0)
+    meaning = "M_r" if routine else "M_t"
+    variables = list(variables or ["H_e", meaning])
+    threshold = threshold if threshold is not None else (0.35 if routine else 0.5)
+    time = sim.time_grid(dt, duration)
+
+    stats = {v: RunningStats(len(time)) for v in variables}
+    quants = {v: P2Quantiles(probs, len(time)) for v in variables}
+    t_peak, t_threshold, final = [], [], []
+
+    n_batches = -(-members // batch_size)
+    for b, child in enumerate(np.random.SeedSequence(seed).spawn(n_batches)):
+        n = min(batch_size, members - b * batch_size)
+        traj = simulate(params, n=n, seed=child, dt=dt, duration=duration)
+        for v in variables:
+            stats[v].update(traj[v])
+            quants[v].update(traj[v])
+        t_peak.append(time[traj["H_e"].argmax(axis=1)])
+        t_threshold.append(sim.time_to_threshold(time, traj[meaning], threshold))
+        final.append(traj[meaning][:, -1])
+
+    summary = EnsembleSummary(model, time, members)
+    for v in variables:
+        summary.mean[v] = stats[v].mean
+        summary.std[v] = stats[v].std
+        summary.quantiles[v] = dict(zip(probs, quants[v].values))
+    summary.scalars["t_peak_H_e"] = np.concatenate(t_peak)
+    summary.scalars[f"time_to_{meaning}_gt_threshold"] = np.concatenate(t_threshold)
+    summary.scalars[f"{meaning}_final"] = np.concatenate(final)
+    summary.scalars["threshold"] = np.array([threshold])
+    if skeleton:
+        traj = simulate(params, n=1, dt=dt, duration=duration, method=skeleton)
+        summary.skeleton = {v: traj[v][0] for v in variables}
+    return summary
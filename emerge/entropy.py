@@ -0,0 +1,306 @@
+"""
+E.M.E.R.G.E+ Framework - Entropy Estimators
+Sample, permutation, Lempel-Ziv and multiscale entropy of recorded signals.
+
+H_e exists in the model as the uncertainty of affective predictions; to
+validate it (test-retest ICC, r(H_e, anxiety)) it has to be estimated from
+real multichannel recordings. ``entropy_series`` slides a window along every
+channel and returns the dashboard's time-series layout: a ``time_s`` column
+(window centres) and one column per measure and channel, plus ``H_e``, the
+channel mean of the primary measure.
+
+    sampen   sample entropy −ln(A/B), tolerance r·SD of the window
+             (Richman & Moorman 2000)
+    permen   permutation entropy of ordinal patterns, normalized to [0, 1]
+             (Bandt & Pompe 2002)
+    lz       Lempel-Ziv (1976) complexity of the median-binarized window,
+             normalized by n / log2 n
+    mse      multiscale entropy complexity index: the sum of sample entropy
+             over coarse-graining scales, tolerance fixed at scale 1 (Costa 2002)
+
+Sample entropy avoids the O(N²) all-pairs comparison: templates are sorted by
+their first value, so only pairs within r of each other on that coordinate
+are compared, one vectorized pass per offset within that band, covering every
+window of a chunk at once. Permutation entropy encodes every ordinal pattern
+of a chunk once (Lehmer codes) and histograms all windows of the chunk with a
+single ``bincount``.
+
+Sources can be arrays of shape (samples,) or (channels, samples), or ``.npy``
+files, which are memory-mapped; windows are processed ``chunk_windows`` at a
+time, so only one chunk of the recording is in memory.
+
+Usage:
+    python entropy.py recording.npy --fs 256 --window 2 --step 0.5 --out h_e.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+DEFAULT_SCALES = tuple(range(1, 11))
+DEFAULT_MEASURES = ("sampen", "permen", "lz")
+CHUNK_WINDOWS = 256
+
+
+# ============================================
+# ESTIMATORS (one 1-D signal)
+# ============================================
+def _match_counts(x, m, tolerance):
+    """(B, A) per row of ``x`` (rows, samples): template pairs i < j within the row's ``tolerance``
+    (Chebyshev distance) at lengths m and m + 1."""
+    templates = sliding_window_view(x, m + 1, axis=-1)
+    rows, n = templates.shape[:2]
+    B, A = np.zeros(rows, dtype=np.int64), np.zeros(rows, dtype=np.int64)
+    if n < 2:
+        return B, A
+    s = np.take_along_axis(templates, np.argsort(templates[..., 0], axis=1, kind="stable")[..., None], axis=1)
+    # Candidates for template i are i+1 … i+band[i] of the same row: the next ones within tolerance on the
+    # first value. Rows are flattened so each offset k is one vectorized pass over every row at once.
+    band = np.stack([np.searchsorted(f, f + tol, side="right") for f, tol in zip(s[..., 0], tolerance)])
+    band = (band - np.arange(n) - 1).ravel()
+    # One contiguous column per template coordinate: 1-D gathers are much cheaper than row gathers
+    cols = [np.ascontiguousarray(s[..., j]).ravel() for j in range(1, m + 1)]
+    order = np.argsort(-band, kind="stable")
+    neg_band = -band[order]
+    row_of = order // n
+    tol = np.asarray(tolerance, dtype=np.float64)[row_of]
+    for k in range(1, int(band.max()) + 1):
+        count = np.searchsorted(neg_band, -k, side="right")
+        i = order[:count]
+        close = np.ones(count, dtype=bool)
+        for col in cols[:-1]:
+            close &= np.abs(col[i + k] - col[i]) <= tol[:count]
+        hits = np.flatnonzero(close)
+        B += np.bincount(row_of[hits], minlength=rows)
+        i = i[hits]
+        A += np.bincount(row_of[hits[np.abs(cols[-1][i + k] - cols[-1][i]) <= tol[hits]]], minlength=rows)
+    return B, A
+
+
+def _sampen_from_counts(B, A):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where((A > 0) & (B > 0), -np.log(A / np.maximum(B, 1)), np.nan)
+
+
+def sample_entropy(x, m=2, r=0.2, tolerance=None):
+    """Sample entropy of ``x``; tolerance r·SD(x) unless given. NaN when undefined (no matches)."""
+    x = np.asarray(x, dtype=np.float64)
+    if tolerance is None:
+        tolerance = r * x.std()
+    B, A = _match_counts(x[None, :], m, [tolerance])
+    return float(_sampen_from_counts(B, A)[0])
+
+
+def _pattern_codes(x, order, delay):
+    """Lehmer code (0 … order!−1) of the ordinal pattern starting at every sample of ``x``."""
+    emb = sliding_window_view(x, (order - 1) * delay + 1, axis=-1)[..., ::delay]
+    ranks = np.argsort(emb, axis=-1, kind="stable")
+    smaller = (ranks[..., :, None] > ranks[..., None, :]) & np.triu(np.ones((order, order), dtype=bool), 1)
+    weights = np.array([math.factorial(order - 1 - i) for i in range(order)])
+    return smaller.sum(axis=-1) @ weights
+
+
+def _pattern_entropy(counts, order, normalize):
+    p = counts / counts.sum(axis=-1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        h = -np.where(p > 0, p * np.log2(p), 0.0).sum(axis=-1)
+    return h / math.log2(math.factorial(order)) if normalize else h
+
+
+def permutation_entropy(x, order=3, delay=1, normalize=True):
+    """Shannon entropy of the ordinal patterns of ``x`` (bits, or a fraction of log2(order!))."""
+    codes = _pattern_codes(np.asarray(x, dtype=np.float64), order, delay)
+    return float(_pattern_entropy(np.bincount(codes, minlength=math.factorial(order)), order, normalize))
+
+
+def lempel_ziv(x, normalize=True):
+    """LZ76 phrase count of ``x`` binarized at its median (Kaspar & Schuster parsing)."""
+    x = np.asarray(x, dtype=np.float64)
+    s = (x > np.median(x)).astype(np.uint8).tobytes()
+    n = len(s)
+    i = c = 0
+    while i < n:
+        # Extend the phrase while it can still be copied from what precedes it
+        k = 1
+        while i + k <= n and s[i:i + k] in s[:i + k - 1]:
+            k += 1
+        c += 1
+        i += k
+    return c * math.log2(n) / n if normalize and n > 1 else float(c)
+
+
+def coarse_grain(x, scale):
+    x = np.asarray(x, dtype=np.float64)
+    return x[:len(x) // scale * scale].reshape(-1, scale).mean(axis=1)
+
+
+def multiscale_entropy(x, scales=DEFAULT_SCALES, m=2, r=0.15):
+    """Sample entropy of the coarse-grained signal at each scale, tolerance fixed from scale 1."""
+    x = np.asarray(x, dtype=np.float64)
+    tolerance = r * x.std()
+    return np.array([sample_entropy(coarse_grain(x, s), m, tolerance=tolerance) for s in scales])
+
+
+# ============================================
+# WINDOWED MEASURES
+# ============================================
+_MEASURES = {}
+
+
+def measure(name):
+    """Register ``fn(block, starts, window, **options) → (windows, channels)`` as measure ``name``."""
+    def register(fn):
+        _MEASURES[name] = fn
+        return fn
+    return register
+
+
+def measures():
+    return list(_MEASURES)
+
+
+def _per_window(fn, block, starts, window, **options):
+    out = np.empty((len(starts), block.shape[0]))
+    for w, s in enumerate(starts):
+        for ch in range(block.shape[0]):
+            out[w, ch] = fn(block[ch, s:s + window], **options)
+    return out
+
+
+@measure("sampen")
+def _sampen(block, starts, window, m=2, r=0.2):
+    # (channels × windows, window) rows, all matched in one batch
+    x = sliding_window_view(block, window, axis=-1)[:, starts].reshape(-1, window)
+    B, A = _match_counts(x, m, r * x.std(axis=1))
+    return _sampen_from_counts(B, A).reshape(block.shape[0], len(starts)).T
+
+
+@measure("permen")
+def _permen(block, starts, window, order=3, delay=1, normalize=True):
+    codes = _pattern_codes(block, order, delay)
+    patterns = window - (order - 1) * delay
+    k = math.factorial(order)
+    # Every window's codes as one strided view, offset per window, histogrammed in one call
+    windows = sliding_window_view(codes, patterns, axis=-1)[:, starts]
+    offsets = np.arange(windows.shape[0] * windows.shape[1]).reshape(windows.shape[:2])[..., None] * k
+    counts = np.bincount((windows + offsets).ravel(), minlength=windows.shape[0] * windows.shape[1] * k)
+    return _pattern_entropy(counts.reshape(*windows.shape[:2], k), order, normalize).T
+
+
+@measure("lz")
+def _lz(block, starts, window, normalize=True):
+    return _per_window(lempel_ziv, block, starts, window, normalize=normalize)
+
+
+@measure("mse")
+def _mse(block, starts, window, scales=DEFAULT_SCALES, m=2, r=0.15):
+    def complexity(x):
+        return np.nansum(multiscale_entropy(x, scales, m, r))
+    return _per_window(complexity, block, starts, window)
+
+
+def as_channels(source):
+    """(channels, samples) view of an array, or a read-only memory map of a ``.npy`` path."""
+    if isinstance(source, str):
+        source = np.load(source, mmap_mode="r")
+    return source[None, :] if source.ndim == 1 else source
+
+
+def windowed(source, name, window, step, chunk_windows=CHUNK_WINDOWS, **options):
+    """Measure ``name`` over every window (in samples) of every channel; returns (windows, channels).
+
+    Only the samples spanned by ``chunk_windows`` consecutive windows are read at a time.
+    """
+    x = as_channels(source)
+    starts = np.arange(0, x.shape[-1] - window + 1, step)
+    out = np.empty((len(starts), x.shape[0]))
+    fn = _MEASURES[name]
+    for lo in range(0, len(starts), chunk_windows):
+        batch = starts[lo:lo + chunk_windows]
+        block = np.asarray(x[:, batch[0]:batch[-1] + window], dtype=np.float64)
+        out[lo:lo + len(batch)] = fn(block, batch - batch[0], window, **options)
+    return out
+
+
+def entropy_series(source, fs, measures=DEFAULT_MEASURES, *, window_s=2.0, step_s=0.5, channels=None,
+                   primary=None, options=None, chunk_windows=CHUNK_WINDOWS):
+    """Windowed entropy of every channel of ``source`` sampled at ``fs`` Hz, as a dashboard time series.
+
+    Columns: ``time_s`` (window centre), ``<measure>_<channel>`` for each measure and
+    channel, and ``H_e``, the channel mean of ``primary`` (default: the first measure).
+    ``options`` maps measure names to keyword arguments, e.g. {"sampen": {"m": 3}}.
+    """
+    measures = list(measures)
+    primary = primary or measures[0]
+    if primary not in measures:
+        raise ValueError(f"primary measure {primary!r} is not among the measures computed: {', '.join(measures)}")
+    x = as_channels(source)
+    channels = list(channels or [f"ch{i}" for i in range(x.shape[0])])
+    window, step = int(round(window_s * fs)), max(1, int(round(step_s * fs)))
+    starts = np.arange(0, x.shape[-1] - window + 1, step)
+    columns = {"time_s": (starts + window / 2) / fs}
+    for name in measures:
+        values = windowed(x, name, window, step, chunk_windows, **(options or {}).get(name, {}))
+        for ch, label in enumerate(channels):
+            columns[f"{name}_{label}"] = values[:, ch]
+        if name == primary:
+            H_e = values.mean(axis=1)
+    return pd.DataFrame(dict(columns, H_e=H_e))
+
+
+# ============================================
+# SYNTHETIC SIGNALS
+# ============================================
+def synthetic(kind="pink", n=10_000, channels=1, seed=0):
+    """Test signals of shape (channels, n): "white", "pink" (1/f), "sine" (+ noise) or "logistic" (chaotic)."""
+    rng = np.random.default_rng(seed)
+    if kind == "white":
+        return rng.standard_normal((channels, n))
+    if kind == "pink":
+        spectrum = np.fft.rfft(rng.standard_normal((channels, n)))
+        spectrum[:, 1:] /= np.sqrt(np.arange(1, spectrum.shape[1]))
+        x = np.fft.irfft(spectrum, n)
+        return x / x.std(axis=1, keepdims=True)
+    if kind == "sine":
+        t = np.arange(n)
+        return np.sin(2 * np.pi * t / 50 + rng.uniform(0, 2 * np.pi, (channels, 1))) \
+            + 0.1 * rng.standard_normal((channels, n))
+    if kind == "logistic":
+        x = np.empty((channels, n))
+        x[:, 0] = rng.uniform(0.1, 0.9, channels)
+        for i in range(1, n):
+            x[:, i] = 4.0 * x[:, i - 1] * (1.0 - x[:, i - 1])
+        return x
+    raise ValueError(f"Unknown signal kind {kind!r}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Windowed entropy of a multichannel recording")
+    parser.add_argument("source", help=".npy array (channels × samples, memory-mapped) or CSV, one column "
+                                       "per channel")
+    parser.add_argument("--fs", type=float, required=True, help="sampling rate in Hz")
+    parser.add_argument("--window", type=float, default=2.0, help="window length in seconds")
+    parser.add_argument("--step", type=float, default=0.5, help="window step in seconds")
+    parser.add_argument("--measures", nargs="+", choices=measures(), default=list(DEFAULT_MEASURES))
+    parser.add_argument("--out", help="write the time series as CSV")
+    args = parser.parse_args(argv)
+
+    channels = None
+    source = args.source
+    if source.endswith(".csv"):
+        table = pd.read_csv(source)
+        channels, source = list(table.columns), table.to_numpy(dtype=np.float64).T
+    frame = entropy_series(source, args.fs, args.measures, window_s=args.window, step_s=args.step,
+                           channels=channels)
+    print(frame.describe().T.to_string())
+    if args.out:
+        frame.to_csv(args.out, index=False)
+
+
+if __name__ == "__main__":
+    main()
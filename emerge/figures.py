@@ -0,0 +1,496 @@
+"""
+E.M.E.R.G.E+ Framework - Figure Cache
+Pre-built, pre-serialized Plotly figures for the static dataset pages.
+
+Every static chart is a registered builder. Its fully built spec is stored as
+Plotly JSON under a SHA-256 of (figure name, content hash of the datasets it
+reads, theme, options, hash of this file), in memory and on disk, so a page
+rerun costs a lookup instead of figure construction and serialization.
+``serve`` hands the JSON to ``st.plotly_chart`` through a ``go.Figure``
+subclass whose ``to_dict`` only decodes it, skipping Plotly's validation.
+
+Usage:
+    python figures.py build [--theme plotly_white] [--max-points 1000] [--method lttb]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+import datasets
+import downsample
+import instrument
+
+FIGURE_DIR = os.environ.get(
+    "EMERGE_FIGURE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "figures")
+)
+DEFAULT_THEME = "plotly_white"
+# In-memory specs beyond this are evicted least-recently-used first (they stay on disk)
+DEFAULT_MEMORY_BYTES = 64 * 1024 * 1024
+LINE_OPTIONS = ("max_points", "line_method")
+
+_BUILDERS = {}
+
+
+def figure(name, *sources, options=()):
+    """Register a builder ``fn(data, theme, **options) -> go.Figure`` reading ``sources``."""
+    def register(fn):
+        _BUILDERS[name] = (fn, sources, options)
+        return fn
+    return register
+
+
+def names():
+    return list(_BUILDERS)
+
+
+def sources(name):
+    """Datasets a figure reads."""
+    return _BUILDERS[name][1]
+
+
+def build(name, data, theme=DEFAULT_THEME, **options):
+    """Build figure ``name`` from ``data`` (dataset name → frame) without caching."""
+    fn, _, accepted = _BUILDERS[name]
+    return fn(data, theme, **{k: options[k] for k in accepted if k in options})
+
+
+def _source_version():
+    with open(os.path.abspath(__file__), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+
+SOURCE_VERSION = _source_version()
+
+_HASHES = {}
+
+
+def dataset_hash(name):
+    """Content hash of a loaded dataset, memoized per load generation of the shared copy.
+
+    ``datasets.load`` hands out a new shallow view on every call, so the memo is
+    keyed on ``datasets.generation`` rather than on the returned frame.
+    """
+    cached = _HASHES.get(name)
+    if cached is None or cached[0] != datasets.generation(name):
+        frame = datasets.load(name)
+        digest = hashlib.sha256(pd.util.hash_pandas_object(frame, index=False).values.tobytes())
+        digest.update(json.dumps(list(frame.columns)).encode())
+        cached = (datasets.generation(name), digest.hexdigest()[:16])
+        _HASHES[name] = cached
+    return cached[1]
+
+
+def figure_key(name, theme=DEFAULT_THEME, **options):
+    """Cache key of a figure; options the builder does not declare are ignored."""
+    _, sources, accepted = _BUILDERS[name]
+    header = {
+        "figure": name,
+        "data": {s: dataset_hash(s) for s in sources},
+        "theme": theme,
+        "options": {k: options[k] for k in accepted if k in options},
+        "code": SOURCE_VERSION,
+    }
+    return hashlib.sha256(json.dumps(header, sort_keys=True).encode()).hexdigest()
+
+
+class SerializedFigure(go.Figure):
+    """A figure backed by pre-serialized Plotly JSON.
+
+    ``st.plotly_chart`` calls ``to_dict`` on figure objects without validating
+    them again, so serving this class skips building and validating traces.
+    """
+
+    def __init__(self, spec):
+        super().__init__()
+        self._spec = spec
+
+    def to_dict(self):
+        return json.loads(self._spec)
+
+    def to_json(self, *args, **kwargs):
+        return self._spec
+
+    def to_figure(self):
+        """A regular, editable ``go.Figure`` (pays the validation cost)."""
+        return go.Figure(json.loads(self._spec))
+
+
+class FigureCache:
+    """Two-level (memory, disk) store of figure JSON specs; the memory level is an LRU bounded by ``max_bytes``."""
+
+    def __init__(self, directory=FIGURE_DIR, max_bytes=DEFAULT_MEMORY_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.build_ms = {}
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def spec(self, name, theme=DEFAULT_THEME, **options):
+        """JSON spec of ``name``, built on first use."""
+        key = figure_key(name, theme, **options)
+        with self._lock:
+            spec = self._memory.get(key)
+            if spec is not None:
+                self._memory.move_to_end(key)
+        if spec is None:
+            try:
+                with open(self._path(key), encoding="utf-8") as f:
+                    spec = f.read()
+            except OSError:
+                spec = self._build(name, key, theme, options)
+            else:
+                self._count(hit=True)
+            self._remember(key, spec)
+        else:
+            self._count(hit=True)
+        return spec
+
+    def _remember(self, key, spec):
+        with self._lock:
+            if key in self._memory:
+                return
+            self._memory[key] = spec
+            self._memory_bytes += len(spec)
+            while self._memory_bytes > self.max_bytes and len(self._memory) > 1:
+                _, old = self._memory.popitem(last=False)
+                self._memory_bytes -= len(old)
+
+    @property
+    def memory_bytes(self):
+        return self._memory_bytes
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _build(self, name, key, theme, options):
+        start = time.perf_counter()
+        with instrument.span(f"figure/{name}"):
+            fig = build(name, {s: datasets.load(s) for s in sources(name)}, theme, **options)
+            with instrument.span("to_json"):
+                spec = fig.to_json()
+        self.build_ms[name] = (time.perf_counter() - start) * 1000
+        self._count(hit=False)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(spec)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        return spec
+
+    def serve(self, name, theme=DEFAULT_THEME, **options):
+        """The figure as a ``SerializedFigure`` ready for ``st.plotly_chart``."""
+        return SerializedFigure(self.spec(name, theme, **options))
+
+    def warm(self, theme=DEFAULT_THEME, **options):
+        """Precompute every registered figure for one theme and option set."""
+        for name in _BUILDERS:
+            self.spec(name, theme, **options)
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                os.remove(entry.path)
+
+
+_DEFAULT = None
+
+
+def default_cache():
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = FigureCache()
+    return _DEFAULT
+
+
+# ============================================
+# ROUTINE PROCESS
+# ============================================
+@figure("routine_entropy", "routine_full", options=LINE_OPTIONS)
+def _routine_entropy(data, theme, max_points=downsample.DEFAULT_MAX_POINTS, line_method="lttb"):
+    routine_full = data["routine_full"]
+    fig = go.Figure()
+    fig.add_trace(downsample.scatter(
+        routine_full['time_s'], routine_full['H_e'], max_points, line_method,
+        mode='lines', name='H_e (Emotional Entropy)',
+        line=dict(color='#EF4444', width=2)
+    ))
+    fig.add_trace(downsample.scatter(
+        routine_full['time_s'], routine_full['H_c'], max_points, line_method,
+        mode='lines', name='H_c (Cognitive Entropy)',
+        line=dict(color='#3B82F6', width=2)
+    ))
+    fig.update_layout(
+        title="Routine Entropy Trajectories",
+        xaxis_title="Time (seconds)",
+        yaxis_title="Arbitrary Units",
+        height=400,
+        template=theme
+    )
+    return fig
+
+
+@figure("routine_meaning", "routine_full", options=LINE_OPTIONS)
+def _routine_meaning(data, theme, max_points=downsample.DEFAULT_MAX_POINTS, line_method="lttb"):
+    routine_full = data["routine_full"]
+    fig = go.Figure()
+    fig.add_trace(downsample.scatter(
+        routine_full['time_s'], routine_full['M_r'], max_points, line_method,
+        mode='lines', name='M_r (Routine Meaning)',
+        line=dict(color='#10B981', width=3),
+        fill='tozeroy'
+    ))
+    fig.update_layout(
+        title="Routine Meaning Emergence",
+        xaxis_title="Time (seconds)",
+        yaxis_title="Meaning (0-1)",
+        height=400,
+        template=theme
+    )
+    return fig
+
+
+@figure("routine_inputs", "routine_full", options=("max_points",))
+def _routine_inputs(data, theme, max_points=downsample.DEFAULT_MAX_POINTS):
+    routine_full = data["routine_full"]
+    fig = make_subplots(rows=2, cols=1, shared_xaxes=True,
+                        subplot_titles=("Emotional Energy (E)", "Cognitive Structure (C)"))
+    fig.add_trace(downsample.scatter(routine_full['time_s'], routine_full['E'], max_points, "minmax",
+                                     mode='lines', name='E', line=dict(color='#F59E0B')),
+                  row=1, col=1)
+    fig.add_trace(downsample.scatter(routine_full['time_s'], routine_full['C'], max_points, "minmax",
+                                     mode='lines', name='C', line=dict(color='#8B5CF6')),
+                  row=2, col=1)
+    fig.update_layout(height=500, template=theme, showlegend=False)
+    return fig
+
+
+@figure("routine_culture", "routine_full", options=LINE_OPTIONS)
+def _routine_culture(data, theme, max_points=downsample.DEFAULT_MAX_POINTS, line_method="lttb"):
+    routine_full = data["routine_full"]
+    fig = go.Figure()
+    fig.add_trace(downsample.scatter(
+        routine_full['time_s'], routine_full['Psi'], max_points, line_method,
+        mode='lines', name='Ψ (Cultural Factor)',
+        line=dict(color='#F59E0B', width=2)
+    ))
+    fig.update_layout(
+        title="Cultural Adaptation in Routine Dynamics",
+        xaxis_title="Time (seconds)",
+        yaxis_title="Ψ (0-1)",
+        height=400,
+        template=theme
+    )
+    return fig
+
+
+# ============================================
+# CULTURAL MODULATION
+# ============================================
+@figure("cultural_comparison", "culture", options=("agents",))
+def _cultural_comparison(data, theme, agents=None):
+    """Final meaning and time to threshold per culture: the demo runs, plus the population median and
+    5–95% agent band when ``data`` also holds a ``population`` summary (``Population.summary``)."""
+    culture, summary = data["culture"], data.get("population")
+    fig = make_subplots(rows=1, cols=2, subplot_titles=("Final Meaning (M_r)", "Time to M > 0.35 (s)"))
+    for col, (demo, q) in enumerate([("M_r_final", "M_r_final_q"), ("time_to_M_gt_0p35_s", "time_q")], start=1):
+        if summary is not None and f"{q}50" in summary:
+            x = summary["S_group"]
+            fig.add_trace(go.Scatter(x=pd.concat([x, x[::-1]]),
+                                     y=pd.concat([summary[f"{q}95"], summary[f"{q}05"][::-1]]),
+                                     fill='toself', fillcolor='rgba(59,130,246,0.2)', line=dict(width=0),
+                                     name="5–95% of agents", showlegend=col == 1), row=1, col=col)
+            fig.add_trace(go.Scatter(x=x, y=summary[f"{q}50"],
+                                     mode='lines+markers', line=dict(color='#3B82F6', width=3),
+                                     name="Population median", showlegend=col == 1), row=1, col=col)
+        fig.add_trace(go.Scatter(x=culture["S_group"], y=culture[demo], mode='markers',
+                                 marker=dict(color='#EF4444', size=12, symbol='diamond'),
+                                 name="Demo runs (restrained / expressive)", showlegend=col == 1),
+                      row=1, col=col)
+        fig.update_xaxes(title_text="Group norm S_group (Ψ)", row=1, col=col)
+    fig.update_layout(
+        title="Cultural Modulation Effects" + (f" ({agents:,} agents)" if agents else ""),
+        height=450,
+        template=theme
+    )
+    return fig
+
+
+# ============================================
+# TRANSFORMATIVE PROCESS
+# ============================================
+def _t_peak(data):
+    return data["transformative_meta"]['t_peak_h'].values[0]
+
+
+@figure("transform_profile", "transformative_full", "transformative_meta", options=LINE_OPTIONS)
+def _transform_profile(data, theme, max_points=downsample.DEFAULT_MAX_POINTS, line_method="lttb"):
+    transformative_full = data["transformative_full"]
+    t_peak = _t_peak(data)
+    fig = go.Figure()
+    fig.add_trace(downsample.scatter(
+        transformative_full['time_h'], transformative_full['D'], max_points, line_method,
+        mode='lines', name='D(t) Perturbation',
+        line=dict(color='#DC2626', width=2),
+        fill='tozeroy'
+    ))
+    fig.add_vline(x=t_peak, line_dash="dash", line_color="gray",
+                  annotation_text=f"Peak at {t_peak}h")
+    fig.update_layout(
+        title="Stylized Perturbation Profile (Gamma-shaped)",
+        xaxis_title="Time (hours)",
+        yaxis_title="Perturbation (arb.u.)",
+        height=350,
+        template=theme
+    )
+    return fig
+
+
+@figure("transform_entropy", "transformative_full", "transformative_meta", options=LINE_OPTIONS)
+def _transform_entropy(data, theme, max_points=downsample.DEFAULT_MAX_POINTS, line_method="lttb"):
+    transformative_full = data["transformative_full"]
+    t_peak = _t_peak(data)
+    fig = go.Figure()
+    fig.add_trace(downsample.scatter(
+        transformative_full['time_h'], transformative_full['H_e'], max_points, line_method,
+        mode='lines', name='H_e (Emotional Entropy)',
+        line=dict(color='#7C3AED', width=3)
+    ))
+    fig.add_hline(y=0, line_dash="dot", line_color="gray", annotation_text="Baseline")
+    fig.add_vline(x=t_peak, line_dash="dash", line_color="red",
+                  annotation_text="Phase 1 → Phase 2")
+
+    # Add phase annotations
+    fig.add_annotation(x=1, y=0.7, text="Phase 1:<br>Entropy Elevation",
+                       showarrow=False, bgcolor="#FEF3C7", bordercolor="#F59E0B")
+    fig.add_annotation(x=5, y=-0.3, text="Phase 2:<br>Deep Reduction",
+                       showarrow=False, bgcolor="#DBEAFE", bordercolor="#3B82F6")
+
+    fig.update_layout(
+        title="Biphasic Entropy Dynamics",
+        xaxis_title="Time (hours)",
+        yaxis_title="Arbitrary Units",
+        height=400,
+        template=theme
+    )
+    return fig
+
+
+@figure("transform_meaning", "transformative_full", "transformative_meta", options=LINE_OPTIONS)
+def _transform_meaning(data, theme, max_points=downsample.DEFAULT_MAX_POINTS, line_method="lttb"):
+    transformative_full = data["transformative_full"]
+    fig = go.Figure()
+    fig.add_trace(downsample.scatter(
+        transformative_full['time_h'], transformative_full['M_t'], max_points, line_method,
+        mode='lines', name='M_t (Cumulative Meaning)',
+        line=dict(color='#059669', width=3),
+        fill='tozeroy'
+    ))
+    fig.add_vline(x=_t_peak(data), line_dash="dash", line_color="red")
+    fig.update_layout(
+        title="Transformative Meaning Accumulation",
+        xaxis_title="Time (hours)",
+        yaxis_title="Cumulative Meaning (0-1)",
+        height=400,
+        template=theme
+    )
+    return fig
+
+
+@figure("transform_combined", "transformative_full", "transformative_meta", options=LINE_OPTIONS)
+def _transform_combined(data, theme, max_points=downsample.DEFAULT_MAX_POINTS, line_method="lttb"):
+    transformative_full = data["transformative_full"]
+    fig = make_subplots(rows=2, cols=1, shared_xaxes=True,
+                        subplot_titles=("Entropy (H_e)", "Meaning (M_t)"))
+    fig.add_trace(downsample.scatter(transformative_full['time_h'], transformative_full['H_e'], max_points,
+                                     line_method, mode='lines', name='H_e', line=dict(color='#7C3AED')),
+                  row=1, col=1)
+    fig.add_trace(downsample.scatter(transformative_full['time_h'], transformative_full['M_t'], max_points,
+                                     line_method, mode='lines', name='M_t', line=dict(color='#059669')),
+                  row=2, col=1)
+    fig.add_vline(x=_t_peak(data), line_dash="dash", line_color="red", row="all", col=1)
+    fig.update_layout(height=600, template=theme, showlegend=False)
+    return fig
+
+
+# ============================================
+# PARAMETER SENSITIVITY
+# ============================================
+def _sensitivity_line(table, y, title, color, theme):
+    fig = px.line(table, x='alpha_E', y=y, markers=True, title=title)
+    fig.update_traces(line_color=color, marker_size=10)
+    fig.update_layout(height=350, template=theme)
+    return fig
+
+
+@figure("sensitivity_meaning", "sensitivity")
+def _sensitivity_meaning(data, theme):
+    return _sensitivity_line(data["sensitivity"], 'M_r_final', "Final Meaning vs α_E", '#10B981', theme)
+
+
+@figure("sensitivity_time", "sensitivity")
+def _sensitivity_time(data, theme):
+    return _sensitivity_line(data["sensitivity"], 'time_to_M_gt_0p40_s', "Time to Reach M > 0.40", '#F59E0B',
+                             theme)
+
+
+@figure("sensitivity_entropy", "sensitivity")
+def _sensitivity_entropy(data, theme):
+    return _sensitivity_line(data["sensitivity"], 'H_e_final', "Final Entropy vs α_E", '#EF4444', theme)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute the dashboard's static figures")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="build and store every figure spec")
+    build.add_argument("--theme", action="append", help="Plotly template (repeatable)")
+    build.add_argument("--max-points", type=int, action="append", help="trace resolution (repeatable)")
+    build.add_argument("--method", choices=downsample.METHODS, action="append")
+    sub.add_parser("clear", help="delete stored figure specs")
+    args = parser.parse_args(argv)
+
+    cache = default_cache()
+    if args.command == "clear":
+        cache.clear()
+        return
+    start = time.perf_counter()
+    for theme in args.theme or [DEFAULT_THEME]:
+        for max_points in args.max_points or [downsample.DEFAULT_MAX_POINTS]:
+            for method in args.method or ["lttb"]:
+                cache.warm(theme, max_points=max_points, line_method=method)
+    print(f"{cache.misses} figures built, {cache.hits} already stored, "
+          f"{(time.perf_counter() - start) * 1000:.0f} ms -> {cache.directory}")
+
+
+if __name__ == "__main__":
+    main()
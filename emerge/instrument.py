@@ -0,0 +1,222 @@
+"""
+E.M.E.R.G.E+ Framework - Instrumentation
+Span timings for dashboard reruns.
+
+A rerun is recorded only when ``begin_rerun(True)`` was called on the current
+thread (Streamlit runs each session's script on its own thread). Otherwise
+``span`` returns a shared no-op context and ``traced`` calls straight through,
+so instrumented code costs one thread-local lookup when profiling is off.
+
+    with span("load/routine_full"): ...       nested context-manager span
+    @traced("figures/build")                  decorator span
+    section("Entropy Trajectories")           flat marker: closes the previous
+                                              section of the same or deeper level
+
+Finished spans form a tree (``last_tree``) and are also folded into
+process-wide aggregates per span path (``stats`` / ``export``).
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+
+ENABLED_BY_DEFAULT = os.environ.get("EMERGE_PROFILE", "") not in ("", "0", "false")
+
+_local = threading.local()
+_STATS = {}
+_STATS_LOCK = threading.Lock()
+
+
+class Span:
+    __slots__ = ("name", "start", "end", "children", "level")
+
+    def __init__(self, name, level=None):
+        self.name = name
+        self.start = time.perf_counter()
+        self.end = None
+        self.children = []
+        self.level = level
+
+    @property
+    def ms(self):
+        return ((self.end or time.perf_counter()) - self.start) * 1000
+
+    @property
+    def self_ms(self):
+        return self.ms - sum(c.ms for c in self.children)
+
+
+class _Noop:
+    __slots__ = ()
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP = _Noop()
+
+
+class _Recorder:
+    def __init__(self):
+        self.root = Span("rerun")
+        self.stack = [self.root]
+
+    def push(self, name, level=None):
+        span = Span(name, level)
+        self.stack[-1].children.append(span)
+        self.stack.append(span)
+        return span
+
+    def pop(self, span):
+        # Close anything left open inside ``span`` (sections are never exited explicitly)
+        while len(self.stack) > 1:
+            top = self.stack.pop()
+            top.end = time.perf_counter()
+            _record(self._path(top), top.ms)
+            if top is span:
+                break
+
+    def _path(self, span):
+        names = [s.name for s in self.stack[1:]] + [span.name]
+        return "/".join(names)
+
+    def open_section(self, name, level):
+        outermost = None
+        for s in reversed(self.stack[1:]):
+            if s.level is None or s.level < level:
+                break
+            outermost = s
+        if outermost is not None:
+            self.pop(outermost)
+        return self.push(name, level)
+
+
+class _Context:
+    __slots__ = ("recorder", "name", "span")
+
+    def __init__(self, recorder, name):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        self.span = self.recorder.push(self.name)
+        return self.span
+
+    def __exit__(self, *exc):
+        self.recorder.pop(self.span)
+        return False
+
+
+def _record(path, ms):
+    with _STATS_LOCK:
+        entry = _STATS.get(path)
+        if entry is None:
+            _STATS[path] = [1, ms, ms, ms]
+        else:
+            entry[0] += 1
+            entry[1] += ms
+            entry[2] = min(entry[2], ms)
+            entry[3] = max(entry[3], ms)
+
+
+# ============================================
+# API
+# ============================================
+def begin_rerun(enabled=ENABLED_BY_DEFAULT):
+    """Start recording this thread's rerun (or switch recording off)."""
+    _local.recorder = _Recorder() if enabled else None
+    _local.last = None
+
+
+def end_rerun():
+    """Close every open span; returns the finished tree (None if not recording)."""
+    rec = getattr(_local, "recorder", None)
+    if rec is None:
+        return None
+    while len(rec.stack) > 1:
+        rec.pop(rec.stack[-1])
+    rec.root.end = time.perf_counter()
+    _record("rerun", rec.root.ms)
+    _local.recorder = None
+    _local.last = rec.root
+    return rec.root
+
+
+def enabled():
+    return getattr(_local, "recorder", None) is not None
+
+
+def span(name):
+    """Context manager timing the enclosed block as a child of the current span."""
+    rec = getattr(_local, "recorder", None)
+    return _NOOP if rec is None else _Context(rec, name)
+
+
+def section(name, level=1):
+    """Start a flat section span, closing the open section of the same or a deeper level."""
+    rec = getattr(_local, "recorder", None)
+    if rec is not None:
+        rec.open_section(name, level)
+
+
+def traced(name=None):
+    """Decorator form of ``span``; the span defaults to the function's qualified name."""
+    def wrap(fn):
+        label = name or f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            rec = getattr(_local, "recorder", None)
+            if rec is None:
+                return fn(*args, **kwargs)
+            with _Context(rec, label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return wrap
+
+
+def last_tree():
+    """Root span of the last finished rerun on this thread."""
+    return getattr(_local, "last", None)
+
+
+def flatten(root):
+    """(depth, name, ms, self_ms) rows of a span tree in depth-first order."""
+    rows = []
+
+    def walk(s, depth):
+        rows.append((depth, s.name, s.ms, s.self_ms))
+        for c in s.children:
+            walk(c, depth + 1)
+    if root is not None:
+        walk(root, 0)
+    return rows
+
+
+def stats():
+    """Aggregated span stats per path: count, total, mean, min and max in ms."""
+    with _STATS_LOCK:
+        items = sorted(_STATS.items(), key=lambda kv: -kv[1][1])
+    return [{"span": path, "count": c, "total_ms": total, "mean_ms": total / c, "min_ms": lo, "max_ms": hi}
+            for path, (c, total, lo, hi) in items]
+
+
+def export(path=None):
+    """Aggregated stats as JSON; written to ``path`` when given."""
+    text = json.dumps({"exported": time.strftime("%Y-%m-%dT%H:%M:%S"), "spans": stats()}, indent=2)
+    if path:
+        with open(path, "w") as f:
+            f.write(text)
+    return text
+
+
+def reset():
+    with _STATS_LOCK:
+        _STATS.clear()
@@ -0,0 +1,398 @@
+"""
+E.M.E.R.G.E+ Framework - Integrator Backends
+Pluggable fixed-step, adaptive and stiff-aware solvers for the model equations.
+
+Systems describe the mean-input form of the equations (E and C at their
+expected values), batched over N parameter sets:
+
+    RoutineSystem     state (H_e, H_c, Ψ), event "M_r > threshold"
+    TransformSystem   state (H_e, S = ∫exp(-H_e) dt), events "phase_switch"
+                      and "below_baseline"; Phase 2 decay -β_transform·H_e is
+                      exposed as the stiff linear part
+
+Methods:
+    euler_maruyama    fixed step, adds the ν_E / ν_C diffusion
+    dopri5            adaptive Dormand-Prince RK5(4) with rtol/atol control
+    imex              adaptive IMEX Euler (stiff linear part implicit) with
+                      step-doubling error control
+    auto              dopri5 or imex, whichever has the lower predicted cost:
+                      dopri5's stability-limited step count against imex's
+                      tolerance-limited one (constants measured on this system)
+
+Steps never straddle a breakpoint (the Phase 1 → Phase 2 switch), and event
+crossings are located per member by linear interpolation inside the step.
+Points of an output grid (``t_eval``) are filled as steps are accepted, with
+dopri5's fourth-order dense output or, for the other methods, linear
+interpolation; a step whose error estimate is not finite is rejected.
+simulation.py remains the reference for the full model with noisy inputs;
+its ``simulate_*(…, method=…)`` and ensemble.py's noise-free skeleton go
+through ``trajectories`` here.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+import simulation as sim
+
+
+# ============================================
+# SYSTEMS
+# ============================================
+class RoutineSystem:
+    names = ("H_e", "H_c", "Psi")
+
+    def __init__(self, params=None, n=None, threshold=0.35):
+        self.p, self.n = sim.broadcast_params(sim._coerce(params, sim.ROUTINE_DEFAULTS), n)
+        self.threshold = threshold
+        self.breakpoints = []
+        self.events = {"M_r_gt_threshold": self._meaning_event}
+
+    def y0(self):
+        return np.stack([np.zeros(self.n), np.zeros(self.n), self.p["psi0"].copy()])
+
+    def rhs(self, t, y):
+        p = self.p
+        dH_e, dH_c = sim.routine_drift(p["E_mean"], p["C_mean"], y[2], p)
+        dPsi = p["kappa_psi"] * (p["S_group"] - y[2])
+        return np.stack([dH_e, dH_c, dPsi])
+
+    def stiff(self, t):
+        p = self.p
+        return np.stack([np.zeros(self.n), np.zeros(self.n), -p["kappa_psi"]])
+
+    def diffusion(self, t, y):
+        return np.stack([self.p["sigma_E"], self.p["sigma_C"], np.zeros(self.n)])
+
+    def meaning(self, y):
+        p = self.p
+        return sim.routine_meaning(p["E_mean"], p["C_mean"], y[0], y[1], p)
+
+    def _meaning_event(self, t, y):
+        return self.meaning(y) - self.threshold
+
+
+class TransformSystem:
+    names = ("H_e", "S")
+
+    def __init__(self, params=None, n=None):
+        self.p, self.n = sim.broadcast_params(sim._coerce(params, sim.TRANSFORM_DEFAULTS), n)
+        self.breakpoints = sorted(set(self.p["t_peak"].tolist()))
+        self.events = {"phase_switch": lambda t, y: t - self.p["t_peak"],
+                       "below_baseline": lambda t, y: -y[0]}
+
+    def y0(self):
+        return np.zeros((2, self.n))
+
+    def rhs(self, t, y):
+        D = sim.perturbation(t, self.p)
+        E = self.p["E_base"] + self.p["kappa_DE"] * D
+        return np.stack([sim.transform_drift(t, y[0], E, D, self.p), np.exp(-y[0])])
+
+    def stiff(self, t):
+        # Phase 2 linear decay rate on H_e; zero in Phase 1 and for S
+        lam = np.where(t < self.p["t_peak"], 0.0, -self.p["beta_transform"])
+        return np.stack([lam, np.zeros(self.n)])
+
+    def diffusion(self, t, y):
+        return np.stack([self.p["sigma_E"], np.zeros(self.n)])
+
+
+# ============================================
+# RESULTS
+# ============================================
+@dataclass
+class Solution:
+    """Accepted steps, per-member event times and solver statistics."""
+    method: str
+    t: np.ndarray                       # (T,)
+    y: np.ndarray                       # (n_state, N, T)
+    names: tuple
+    events: dict = field(default_factory=dict)   # name → (N,) first crossing time, NaN if none
+    stats: dict = field(default_factory=dict)
+    t_eval: np.ndarray = None           # output grid filled during integration, if one was requested
+    y_eval: np.ndarray = None           # (n_state, N, len(t_eval))
+
+    def __getitem__(self, name):
+        return self.y[self.names.index(name)]
+
+    def sample(self, t_grid):
+        """Every state on ``t_grid``; returns (n_state, N, len(t_grid)).
+
+        The ``t_eval`` grid comes from the method's own interpolant; any other grid is linearly
+        interpolated between accepted steps.
+        """
+        t_grid = np.asarray(t_grid, dtype=np.float64)
+        if self.t_eval is not None and np.array_equal(t_grid, self.t_eval):
+            return self.y_eval
+        idx = np.clip(np.searchsorted(self.t, t_grid, side="right") - 1, 0, len(self.t) - 2)
+        t0, t1 = self.t[idx], self.t[idx + 1]
+        w = np.where(t1 > t0, (t_grid - t0) / np.where(t1 > t0, t1 - t0, 1.0), 0.0)
+        return self.y[..., idx] * (1 - w) + self.y[..., idx + 1] * w
+
+
+class _Recorder:
+    """Collects accepted steps, first event crossings and the ``t_eval`` output grid."""
+
+    def __init__(self, system, t0, y0, t_eval=None):
+        self.system = system
+        self.ts = [t0]
+        self.ys = [y0]
+        self.g = {name: fn(t0, y0) for name, fn in system.events.items()}
+        self.events = {name: np.full(system.n, np.nan) for name in system.events}
+        self.t_eval = None if t_eval is None else np.asarray(t_eval, dtype=np.float64)
+        if self.t_eval is not None:
+            self.y_eval = np.empty(y0.shape + self.t_eval.shape)
+            self.filled = int(np.searchsorted(self.t_eval, t0, side="right"))
+            self.y_eval[..., :self.filled] = y0[..., None]
+
+    def accept(self, t, y, dense=None):
+        """Record the step ending at (t, y); ``dense(θ)`` evaluates it at t_prev + θ·h (default linear)."""
+        t_prev, y_prev = self.ts[-1], self.ys[-1]
+        if self.t_eval is not None:
+            end = int(np.searchsorted(self.t_eval, t, side="right"))
+            if end > self.filled:
+                theta = (self.t_eval[self.filled:end] - t_prev) / (t - t_prev)
+                self.y_eval[..., self.filled:end] = (
+                    dense(theta) if dense is not None
+                    else y_prev[..., None] + (y - y_prev)[..., None] * theta)
+                self.filled = end
+        for name, fn in self.system.events.items():
+            g_prev, g_new = self.g[name], np.broadcast_to(fn(t, y), (self.system.n,))
+            crossed = (g_prev < 0) & (g_new >= 0) & np.isnan(self.events[name])
+            if crossed.any():
+                frac = g_prev[crossed] / (g_prev[crossed] - g_new[crossed])
+                self.events[name][crossed] = t_prev + frac * (t - t_prev)
+            self.g[name] = g_new
+        self.ts.append(t)
+        self.ys.append(y)
+
+    def solution(self, method, stats):
+        y_eval = None
+        if self.t_eval is not None:
+            y_eval = self.y_eval
+            y_eval[..., self.filled:] = self.ys[-1][..., None]  # grid points past t_end by rounding
+        return Solution(method, np.array(self.ts), np.stack(self.ys, axis=-1), self.system.names,
+                        self.events, stats, self.t_eval, y_eval)
+
+
+def _next_stop(t, t_end, breakpoints):
+    later = [b for b in breakpoints if b > t + 1e-12]
+    return min([t_end] + later)
+
+
+# ============================================
+# METHODS
+# ============================================
+def euler_maruyama(system, t_end, dt=0.01, seed=0, t0=0.0, t_eval=None):
+    """Fixed-step Euler-Maruyama including the state diffusion terms."""
+    rng = np.random.default_rng(seed)
+    y = system.y0()
+    rec = _Recorder(system, t0, y, t_eval)
+    steps = sim.n_steps_for(dt, t_end - t0)
+    sqdt = np.sqrt(dt)
+    for k in range(steps):
+        t = t0 + k * dt
+        y = y + system.rhs(t, y) * dt + system.diffusion(t, y) * sqdt * rng.standard_normal(y.shape)
+        rec.accept(t0 + (k + 1) * dt, y)
+    return rec.solution("euler_maruyama", {"steps": steps, "rejected": 0, "nfev": steps})
+
+
+# Dormand-Prince 5(4) tableau
+_C = np.array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1, 1])
+_A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+    [35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84],
+]
+_B = np.array([35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0])
+_E = _B - np.array([5179 / 57600, 0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40])
+# Dense output (Hairer, Nørsett & Wanner; as in SciPy's RK45): over a step of h from y,
+# y(t + θh) = y + h · Σ_i k_i · Σ_j _P[i, j] θ^(j+1), fourth order in θ
+_P = np.array([
+    [1, -8048581381 / 2820520608, 8663915743 / 2820520608, -12715105075 / 11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200 / 32700410799, -68118460800 / 10900136933, 87487479700 / 32700410799],
+    [0, -1754552775 / 470086768, 14199869525 / 1410260304, -10690763975 / 1880347072],
+    [0, 127303824393 / 49829197408, -318862633887 / 49829197408, 701980252875 / 199316789632],
+    [0, -282668133 / 205662961, 2019193451 / 616988883, -1453857185 / 822651844],
+    [0, 40617522 / 29380423, -110615467 / 29380423, 69997945 / 29380423],
+])
+
+
+def _error_norm(err, y, y_new, rtol, atol):
+    """Scaled RMS error over states, worst member deciding the shared step; inf when a trial step
+    overflowed, so the caller rejects it and shrinks h instead of feeding NaN to the controller."""
+    scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+    norm = float(np.sqrt(np.mean((err / scale) ** 2, axis=0)).max())
+    return norm if np.isfinite(norm) else np.inf
+
+
+def _dense(y, h, ks):
+    coeffs = h * np.tensordot(_P.T, np.stack(ks), axes=1)     # (4, n_state, N)
+
+    def at(theta):
+        powers = theta[None, :] ** np.arange(1, 5)[:, None]  # (4, len(θ))
+        return y[..., None] + np.tensordot(coeffs, powers, axes=(0, 0))
+    return at
+
+
+def dopri5(system, t_end, rtol=1e-6, atol=1e-8, h0=0.01, max_step=np.inf, t0=0.0, max_steps=1_000_000,
+           t_eval=None):
+    """Adaptive Dormand-Prince RK5(4) on the deterministic part of the system."""
+    t, y, h = t0, system.y0(), h0
+    rec = _Recorder(system, t, y, t_eval)
+    stats = {"steps": 0, "rejected": 0, "nfev": 1}
+    k1 = system.rhs(t, y)
+    while t < t_end - 1e-12:
+        if stats["steps"] + stats["rejected"] >= max_steps:
+            raise RuntimeError(f"dopri5 exceeded {max_steps} steps at t={t:.6g}")
+        stop = _next_stop(t, t_end, system.breakpoints)
+        h = min(h, max_step, stop - t)
+        ks = [k1]
+        # A trial step beyond the stability limit can overflow; _error_norm rejects it
+        with np.errstate(over="ignore", invalid="ignore"):
+            for i in range(1, 7):
+                yi = y + h * sum(a * k for a, k in zip(_A[i], ks))
+                ks.append(system.rhs(t + _C[i] * h, yi))
+            y_new = y + h * sum(b * k for b, k in zip(_B, ks) if b)
+            err = _error_norm(h * sum(e * k for e, k in zip(_E, ks) if e), y, y_new, rtol, atol)
+        stats["nfev"] += 6
+        if err <= 1.0:
+            t_prev = t
+            t = stop if abs(t + h - stop) < 1e-12 else t + h
+            rec.accept(t, y_new, _dense(y, t - t_prev, ks) if rec.t_eval is not None else None)
+            y = y_new
+            stats["steps"] += 1
+            # FSAL: the last stage is the next step's first; re-evaluate across a breakpoint
+            k1 = ks[6] if t != stop else system.rhs(t, y)
+            stats["nfev"] += t == stop
+        else:
+            stats["rejected"] += 1
+        h *= min(5.0, max(0.2, 0.9 * (err if err > 0 else 1e-10) ** -0.2))
+    return rec.solution("dopri5", stats)
+
+
+def _imex_step(system, t, y, h):
+    # Steps never straddle a breakpoint, so the phase at t holds for the whole step
+    lam = system.stiff(t)
+    explicit = system.rhs(t, y) - lam * y
+    return (y + h * explicit) / (1 - h * lam)
+
+
+def imex(system, t_end, rtol=1e-4, atol=1e-6, h0=0.01, max_step=np.inf, t0=0.0, max_steps=1_000_000,
+         t_eval=None):
+    """Adaptive IMEX Euler: stiff linear part implicit, remainder explicit.
+
+    The local error is estimated by step doubling (one step of h vs two of h/2).
+    """
+    t, y, h = t0, system.y0(), h0
+    rec = _Recorder(system, t, y, t_eval)
+    stats = {"steps": 0, "rejected": 0, "nfev": 0}
+    while t < t_end - 1e-12:
+        if stats["steps"] + stats["rejected"] >= max_steps:
+            raise RuntimeError(f"imex exceeded {max_steps} steps at t={t:.6g}")
+        stop = _next_stop(t, t_end, system.breakpoints)
+        h = min(h, max_step, stop - t)
+        with np.errstate(over="ignore", invalid="ignore"):
+            full = _imex_step(system, t, y, h)
+            half = _imex_step(system, t, y, h / 2)
+            fine = _imex_step(system, t + h / 2, half, h / 2)
+            err = _error_norm(fine - full, y, fine, rtol, atol)
+        stats["nfev"] += 3
+        if err <= 1.0:
+            t = stop if abs(t + h - stop) < 1e-12 else t + h
+            # Richardson extrapolation of the two first-order estimates
+            y = 2 * fine - full
+            rec.accept(t, y)
+            stats["steps"] += 1
+        else:
+            stats["rejected"] += 1
+        h *= min(4.0, max(0.2, 0.9 * (err if err > 0 else 1e-10) ** -0.5))
+    return rec.solution("imex", stats)
+
+
+# Explicit RK stability on the negative real axis is roughly |h·λ| < 3.3 for dopri5
+EXPLICIT_STABILITY = 3.3
+# Measured on TransformSystem (N = 1 and 1000, β_transform 0.6 to 5000): an imex
+# step (three sub-steps) costs about half a dopri5 step, and imex takes about
+# IMEX_STEPS_PER_UNIT / √rtol accepted steps per unit of time
+IMEX_STEP_COST = 0.5
+IMEX_STEPS_PER_UNIT = 0.6
+
+METHODS = {
+    "euler_maruyama": euler_maruyama,
+    "dopri5": dopri5,
+    "imex": imex,
+}
+
+
+def stiffness(system, t_end, t0=0.0, samples=64):
+    """Largest stiff decay rate the system reaches over [t0, t_end]."""
+    return max(float(np.abs(system.stiff(t)).max()) for t in np.linspace(t0, t_end, samples))
+
+
+def predicted_cost(system, t_end, t0=0.0, samples=64, **options):
+    """Predicted cost of dopri5 and imex in dopri5 steps: {"dopri5": …, "imex": …}.
+
+    dopri5 is bounded below by its stability limit, ∫ max|λ(t)| dt / EXPLICIT_STABILITY
+    steps; imex needs about IMEX_STEPS_PER_UNIT / √rtol steps per unit time
+    whatever the stiffness.
+    """
+    span = t_end - t0
+    rates = [float(np.abs(system.stiff(t)).max()) for t in np.linspace(t0, t_end, samples)]
+    rtol = options.get("rtol", imex.__defaults__[0])
+    return {"dopri5": np.mean(rates) * span / EXPLICIT_STABILITY,
+            "imex": IMEX_STEP_COST * IMEX_STEPS_PER_UNIT * span / np.sqrt(rtol)}
+
+
+def integrate(system, t_end, method="auto", **options):
+    """Integrate ``system`` to ``t_end`` with the named method.
+
+    ``auto`` (with ``max_step`` defaulting to 0.1) picks whichever of dopri5 and
+    imex ``predicted_cost`` expects to be cheaper at the requested tolerance.
+    """
+    if method == "auto":
+        options.setdefault("max_step", 0.1)
+        cost = predicted_cost(system, t_end, options.get("t0", 0.0), **options)
+        method = "imex" if cost["imex"] < cost["dopri5"] else "dopri5"
+    if method not in METHODS:
+        raise ValueError(f"Unknown method {method!r}; choose from {', '.join(METHODS)} or auto")
+    return METHODS[method](system, t_end, **options)
+
+
+# ============================================
+# TRAJECTORIES
+# ============================================
+def trajectories(model, params=None, *, n=None, method="auto", dt=0.01, duration=None, seed=0, **options):
+    """Solve the mean-input equations of ``model`` and sample them onto the dt grid.
+
+    Returns ``sim.Trajectories`` with the simulator's columns: inputs at their
+    expected values, M_r from the sampled state (routine) and M_t = S / S(T)
+    (transformative). ``seed`` is used by euler_maruyama only; ``options`` go
+    to the method (rtol, atol, max_step, …).
+    """
+    routine = model == "routine"
+    duration = duration or (10.0 if routine else 8.0)
+    system = RoutineSystem(params, n) if routine else TransformSystem(params, n)
+    if method == "euler_maruyama":
+        options.update(dt=dt, seed=seed)
+    time = sim.time_grid(dt, duration)
+    y = integrate(system, duration, method, t_eval=time, **options).sample(time)
+    p = sim._col(system.p)
+    if routine:
+        E = np.broadcast_to(p["E_mean"], y[0].shape)
+        C = np.broadcast_to(p["C_mean"], y[0].shape)
+        series = {"E": E, "C": C, "Psi": y[2], "H_e": y[0], "H_c": y[1],
+                  "M_r": sim.routine_meaning(E, C, y[0], y[1], p)}
+        return sim.Trajectories("routine", time, series, "time_s")
+    D = sim.perturbation(time, p)
+    series = {"D": D, "E": p["E_base"] + p["kappa_DE"] * D, "C": p["C_base"] - p["kappa_DC"] * D,
+              "H_e": y[0], "M_t": y[1] / y[1][:, -1:]}
+    return sim.Trajectories("transformative", time, series, "time_h")
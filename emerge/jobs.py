@@ -0,0 +1,618 @@
+"""
+E.M.E.R.G.E+ Framework - Job Queue
+Local SQLite-backed queue for sweeps and population runs that outlive reruns.
+
+A job is split into tasks when it is submitted (sweep chunks, one task per
+culture, …), so a single large job spreads over every worker process. Workers
+are plain processes that claim one queued task at a time inside an IMMEDIATE
+transaction, write its results straight into the job's directory and report
+progress and a heartbeat back to the database:
+
+    jobs(id, key, kind, spec, path, status, tasks, error, created, finished)
+    tasks(job_id, idx, payload, status, progress, worker, heartbeat, attempts)
+
+Results are checkpointed per task on disk (a sweep ResultStore's done flags,
+one file per finished culture, a long run's checkpoint), so partial results
+can be read while the job runs. A side thread refreshes the heartbeat of a
+running task every HEARTBEAT_S. A task whose worker died (its process on this
+host is gone, or a remote worker's heartbeat is older than STALE_AFTER_S) is
+requeued and resumes from that checkpoint; a task that raises fails its job
+until ``retry`` requeues its unfinished tasks. Resubmitting an identical spec returns the existing job,
+resuming it if it was cancelled. Workers take the newest job's tasks first,
+and ``cancel`` stops a superseded job from starting more tasks.
+Only one of several concurrent identical submissions plans the job, into a
+temporary directory that is renamed into place. Finished jobs beyond the
+KEEP_FINISHED most recent are pruned with their directories after RETAIN_S.
+
+Usage:
+    python jobs.py work [--idle-exit 300]
+    python jobs.py submit sweep '{"axes": [["alpha_E", 0.1, 0.8, 64], ["psi0", 0.2, 0.8, 64]]}'
+    python jobs.py list
+    python jobs.py cancel 3
+    python jobs.py prune
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import socket
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+import longrun
+import population
+import result_cache
+import sobol
+import sweep
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+JOB_DIR = os.environ.get("EMERGE_JOB_DIR", os.path.join(BASE_DIR, ".cache", "jobs"))
+JOBS_DB = os.path.join(JOB_DIR, "jobs.sqlite")
+
+STALE_AFTER_S = 120.0
+MAX_ATTEMPTS = 3
+IDLE_EXIT_S = 300.0
+# Progress/heartbeat writes from inside a task are throttled to this interval
+REPORT_EVERY_S = 0.5
+# A side thread refreshes a running task's heartbeat this often, whatever the task reports
+HEARTBEAT_S = 10.0
+# Retention of finished jobs: the most recent KEEP_FINISHED, plus any finished within RETAIN_S
+KEEP_FINISHED = 64
+RETAIN_S = 24 * 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    key TEXT UNIQUE NOT NULL,
+    kind TEXT NOT NULL,
+    spec TEXT NOT NULL,
+    path TEXT NOT NULL,
+    status TEXT NOT NULL,
+    tasks INTEGER NOT NULL,
+    error TEXT,
+    created REAL NOT NULL,
+    finished REAL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    job_id INTEGER NOT NULL REFERENCES jobs(id),
+    idx INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    progress REAL NOT NULL DEFAULT 0,
+    worker TEXT,
+    heartbeat REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (job_id, idx)
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks(status, job_id, idx);
+"""
+
+
+@contextmanager
+def _connect(db=None):
+    db = db or JOBS_DB
+    os.makedirs(os.path.dirname(db), exist_ok=True)
+    conn = sqlite3.connect(db, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        yield conn
+    finally:
+        conn.close()
+
+
+@contextmanager
+def _transaction(conn):
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+# ============================================
+# JOB KINDS
+# ============================================
+_KINDS = {}
+
+
+def job_kind(name):
+    """Register a class with ``plan``, ``run`` and ``result`` methods (static or class) as job kind ``name``.
+
+    plan(spec, path)                    → list of JSON task payloads; prepares ``path``
+    run(spec, path, payload, report)    executes one task, calling report(fraction)
+    result(spec, path)                  → whatever has finished so far
+    """
+    def register(cls):
+        _KINDS[name] = cls
+        return cls
+    return register
+
+
+def kinds():
+    return list(_KINDS)
+
+
+@job_kind("sweep")
+class SweepJob:
+    """Dense grid sweep. spec: axes [[name, low, high, n], …] (first slowest), model, threshold, seed."""
+
+    @staticmethod
+    def samples(spec):
+        return sweep.grid(**{name: np.linspace(lo, hi, int(n)) for name, lo, hi, n in spec["axes"]})
+
+    @classmethod
+    def _definition(cls, spec):
+        samples = cls.samples(spec)
+        model = spec.get("model") or sweep.model_for(samples)
+        settings = sweep.sweep_settings(model, spec.get("seed", 0), spec.get("dt", 0.01), spec.get("duration"),
+                                        spec.get("threshold", 0.35))
+        return samples, model, settings
+
+    @classmethod
+    def plan(cls, spec, path):
+        samples, model, settings = cls._definition(spec)
+        store = sweep.open_store(samples, model, settings, path)
+        chunk = spec.get("chunk_size", 2048)
+        return [{"start": s, "stop": min(s + chunk, len(store))} for s in range(0, len(store), chunk)]
+
+    @classmethod
+    def run(cls, spec, path, payload, report):
+        samples, model, settings = cls._definition(spec)
+        store = sweep.ResultStore(path)
+        start, stop = payload["start"], payload["stop"]
+        step = spec.get("report_size", 256)
+        for lo in range(start, stop, step):
+            hi = min(lo + step, stop)
+            if not np.asarray(store.column("_done")[lo:hi]).all():
+                rows = {k: v[lo:hi] for k, v in samples.items()}
+                store.write(lo, sweep.evaluate_chunk(model, rows, settings))
+            report((hi - start) / (stop - start))
+
+    @staticmethod
+    def result(spec, path):
+        return sweep.ResultStore(path)
+
+
+@job_kind("sobol")
+class SobolJob(SweepJob):
+    """Saltelli sample sweep for Sobol indices. spec: model, n, seed, method; see ``sobol.from_store``."""
+
+    @staticmethod
+    def samples(spec):
+        return sobol.saltelli(sobol.BOUNDS[spec["model"]], spec["n"], spec.get("seed", 0),
+                              spec.get("method", "auto"))
+
+
+@job_kind("population")
+class PopulationJob:
+    """Cultural population, one task per culture. spec: n_groups, agents, conformity, psi0, seed.
+
+    Every culture is simulated with the same seed, so cultures see common random
+    numbers and differ only through their norm.
+    """
+
+    @staticmethod
+    def plan(spec, path):
+        os.makedirs(path, exist_ok=True)
+        return [{"group": g, "norm": float(norm)} for g, norm in enumerate(population.norm_grid(spec["n_groups"]))]
+
+    @staticmethod
+    def run(spec, path, payload, report):
+        out = os.path.join(path, f"group_{payload['group']:03d}.npz")
+        if os.path.exists(out):
+            return
+        run = population.simulate_population([payload["norm"]], spec["agents"] // spec["n_groups"],
+                                             conformity=spec["conformity"], psi0=spec.get("psi0"),
+                                             seed=spec.get("seed", 0))
+        summary = run.summary()
+        tmp = out + ".tmp.npz"
+        np.savez(tmp, time=run.time, psi_mean=run.psi_mean[:, 0],
+                 summary=summary.iloc[:1].to_json(orient="records"))
+        os.replace(tmp, out)
+
+    @staticmethod
+    def result(spec, path):
+        """(summary of the finished cultures, time, (T, G_done) mean Ψ paths)."""
+        files = sorted(f for f in os.listdir(path) if f.startswith("group_") and f.endswith(".npz")
+                       and ".tmp" not in f)
+        rows, paths, t = [], [], None
+        for name in files:
+            with np.load(os.path.join(path, name)) as data:
+                rows.extend(json.loads(str(data["summary"])))
+                paths.append(data["psi_mean"])
+                t = data["time"]
+        summary = pd.DataFrame(rows)
+        psi_mean = np.column_stack(paths) if paths else np.empty((0, 0))
+        return summary, t, psi_mean
+
+
+@job_kind("longrun")
+class LongRunJob:
+    """Multi-dose long-horizon run (one sequential task). spec: doses, duration, dt, seed, n."""
+
+    @staticmethod
+    def _kwargs(spec):
+        return {"doses": spec["doses"], "duration": spec["duration"], "dt": spec.get("dt", 0.01),
+                "seed": spec.get("seed", 2025), "n": spec.get("n")}
+
+    @staticmethod
+    def plan(spec, path):
+        longrun.open_run(path=path, **LongRunJob._kwargs(spec))
+        return [{}]
+
+    @staticmethod
+    def run(spec, path, payload, report):
+        longrun.run_long(path=path, on_chunk=lambda store: report(store.progress), **LongRunJob._kwargs(spec))
+
+    @staticmethod
+    def result(spec, path):
+        return longrun.StreamStore(path)
+
+
+# ============================================
+# QUEUE
+# ============================================
+def job_key(kind, spec):
+    """Content hash of a job definition and the simulation code; an equation edit starts fresh jobs."""
+    definition = [result_cache.CODE_VERSION, kind, spec]
+    return hashlib.sha256(json.dumps(definition, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def _plan(kind, spec, path):
+    """Plan a job into a temporary directory, then rename it to ``path``; returns the task payloads."""
+    tmp = f"{path}.planning-{os.getpid()}-{threading.get_ident()}"
+    shutil.rmtree(tmp, ignore_errors=True)
+    try:
+        payloads = _KINDS[kind].plan(spec, tmp)
+        os.makedirs(tmp, exist_ok=True)
+        if os.path.exists(path):
+            shutil.rmtree(path)  # left behind by a planner that died or a pruned job
+        os.rename(tmp, path)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return payloads
+
+
+def find(kind, spec, db=None):
+    """Id of the job already submitted with this spec, or None."""
+    with _connect(db) as conn:
+        row = conn.execute("SELECT id FROM jobs WHERE key = ? AND status != 'planning'",
+                           (job_key(kind, spec),)).fetchone()
+    return None if row is None else row["id"]
+
+
+def submit(kind, spec, db=None, poll=0.05):
+    """Queue a job (or find the identical one already queued) and return its id.
+
+    The lookup and insert share one IMMEDIATE transaction, so of several
+    identical concurrent submissions exactly one inserts the job (status
+    "planning") and plans it; the others wait for planning to finish and
+    return the same id. A job left in "planning" for STALE_AFTER_S (its
+    planner died) is taken over.
+    """
+    if kind not in _KINDS:
+        raise KeyError(f"Unknown job kind {kind!r}; available: {', '.join(_KINDS)}")
+    key = job_key(kind, spec)
+    path = os.path.join(os.path.dirname(db or JOBS_DB), key)
+    with _connect(db) as conn:
+        while True:
+            with _transaction(conn):
+                row = conn.execute("SELECT id, status, created FROM jobs WHERE key = ?", (key,)).fetchone()
+                if row is not None and row["status"] == "planning" and time.time() - row["created"] > STALE_AFTER_S:
+                    conn.execute("DELETE FROM jobs WHERE id = ?", (row["id"],))
+                    row = None
+                elif row is not None and row["status"] == "cancelled":
+                    _requeue(conn, row["id"])
+                    return row["id"]
+                if row is None:
+                    cursor = conn.execute(
+                        "INSERT INTO jobs (key, kind, spec, path, status, tasks, created) "
+                        "VALUES (?, ?, ?, ?, 'planning', 0, ?) ON CONFLICT(key) DO NOTHING",
+                        (key, kind, json.dumps(spec), path, time.time()))
+                    if cursor.rowcount:
+                        job_id = cursor.lastrowid
+                        break
+                    row = conn.execute("SELECT id, status, created FROM jobs WHERE key = ?", (key,)).fetchone()
+            if row["status"] != "planning":
+                return row["id"]
+            time.sleep(poll)
+
+        try:
+            payloads = _plan(kind, spec, path)
+        except BaseException:
+            with _transaction(conn):
+                conn.execute("DELETE FROM jobs WHERE id = ? AND status = 'planning'", (job_id,))
+            raise
+        with _transaction(conn):
+            planned = conn.execute("UPDATE jobs SET status = 'queued', tasks = ? WHERE id = ? AND status = 'planning'",
+                                   (len(payloads), job_id)).rowcount
+            if planned:
+                conn.executemany("INSERT INTO tasks (job_id, idx, payload, status) VALUES (?, ?, ?, 'queued')",
+                                 [(job_id, i, json.dumps(p)) for i, p in enumerate(payloads)])
+    prune(db)
+    return job_id
+
+
+def prune(db=None, keep=KEEP_FINISHED, max_age=RETAIN_S):
+    """Delete finished (done, failed or cancelled) jobs and their directories, keeping the ``keep`` most
+    recently finished and any that finished less than ``max_age`` seconds ago; returns the ids removed."""
+    with _connect(db) as conn:
+        with _transaction(conn):
+            old = conn.execute(
+                "SELECT id, path FROM jobs WHERE status IN ('done', 'failed', 'cancelled') AND finished < ? "
+                "AND id NOT IN (SELECT id FROM jobs WHERE status IN ('done', 'failed', 'cancelled') "
+                "ORDER BY finished DESC LIMIT ?)", (time.time() - max_age, keep)).fetchall()
+            for job in old:
+                conn.execute("DELETE FROM tasks WHERE job_id = ?", (job["id"],))
+                conn.execute("DELETE FROM jobs WHERE id = ?", (job["id"],))
+    for job in old:
+        shutil.rmtree(job["path"], ignore_errors=True)
+    return [job["id"] for job in old]
+
+
+def _requeue(conn, job_id):
+    conn.execute("UPDATE tasks SET status = 'queued', attempts = 0 WHERE job_id = ? "
+                 "AND status NOT IN ('done', 'running')", (job_id,))
+    conn.execute("UPDATE jobs SET status = 'queued', error = NULL, finished = NULL WHERE id = ? "
+                 "AND status IN ('failed', 'cancelled')", (job_id,))
+
+
+def retry(job_id, db=None):
+    """Requeue every unfinished task of a failed or cancelled job (running tasks carry on)."""
+    with _connect(db) as conn, _transaction(conn):
+        _requeue(conn, job_id)
+
+
+def cancel(job_id, db=None):
+    """Stop a queued or running job from starting more tasks; tasks already running finish.
+
+    Submitting the same spec again (or ``retry``) resumes it from its finished tasks.
+    """
+    with _connect(db) as conn, _transaction(conn):
+        conn.execute("UPDATE tasks SET status = 'cancelled' WHERE job_id = ? AND status = 'queued'", (job_id,))
+        conn.execute("UPDATE jobs SET status = 'cancelled', finished = ? WHERE id = ? "
+                     "AND status IN ('queued', 'running')", (time.time(), job_id))
+
+
+def _alive(worker):
+    """True/False for a worker on this host, None for one on another host (only its heartbeat tells)."""
+    host, _, pid = worker.rpartition(":")
+    if host != socket.gethostname():
+        return None
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, ValueError):
+        return True
+    return True
+
+
+def recover(conn):
+    """Requeue running tasks whose worker died; fail those that died too often.
+
+    A worker on this host is dead when its process is gone; one on another host
+    when its heartbeat (refreshed every HEARTBEAT_S while a task runs) is older
+    than STALE_AFTER_S.
+    """
+    now = time.time()
+    for task in conn.execute("SELECT job_id, idx, worker, heartbeat, attempts FROM tasks "
+                             "WHERE status = 'running'").fetchall():
+        alive = _alive(task["worker"])
+        if alive or (alive is None and now - task["heartbeat"] < STALE_AFTER_S):
+            continue
+        if task["attempts"] >= MAX_ATTEMPTS:
+            conn.execute("UPDATE tasks SET status = 'failed' WHERE job_id = ? AND idx = ?",
+                         (task["job_id"], task["idx"]))
+            conn.execute("UPDATE jobs SET status = 'failed', error = ?, finished = ? WHERE id = ?",
+                         (f"task {task['idx']}: worker died {task['attempts']} times", now, task["job_id"]))
+        else:
+            conn.execute("UPDATE tasks SET status = 'queued' WHERE job_id = ? AND idx = ?",
+                         (task["job_id"], task["idx"]))
+
+
+def claim(worker, db=None):
+    """Atomically take the first queued task of the newest job; returns (job row, task row) or None.
+
+    Newest first: the job a dashboard viewer just asked for runs before older ones.
+    """
+    with _connect(db) as conn:
+        with _transaction(conn):
+            recover(conn)
+            task = conn.execute(
+                "SELECT t.job_id, t.idx, t.payload FROM tasks t JOIN jobs j ON j.id = t.job_id "
+                "WHERE t.status = 'queued' AND j.status IN ('queued', 'running') "
+                "ORDER BY t.job_id DESC, t.idx LIMIT 1").fetchone()
+            if task is None:
+                return None
+            conn.execute("UPDATE tasks SET status = 'running', worker = ?, heartbeat = ?, progress = 0, "
+                         "attempts = attempts + 1 WHERE job_id = ? AND idx = ?",
+                         (worker, time.time(), task["job_id"], task["idx"]))
+            conn.execute("UPDATE jobs SET status = 'running' WHERE id = ? AND status = 'queued'",
+                         (task["job_id"],))
+            job = conn.execute("SELECT * FROM jobs WHERE id = ?", (task["job_id"],)).fetchone()
+    return job, task
+
+
+def execute(job, task, db=None):
+    """Run one claimed task and record its outcome."""
+    last = [0.0]
+
+    def report(fraction):
+        now = time.time()
+        if now - last[0] >= REPORT_EVERY_S:
+            last[0] = now
+            with _connect(db) as conn:
+                conn.execute("UPDATE tasks SET progress = ?, heartbeat = ? WHERE job_id = ? AND idx = ?",
+                             (float(fraction), now, job["id"], task["idx"]))
+
+    def heartbeat():
+        while not done.wait(HEARTBEAT_S):
+            try:
+                with _connect(db) as conn:
+                    conn.execute("UPDATE tasks SET heartbeat = ? WHERE job_id = ? AND idx = ? AND status = 'running'",
+                                 (time.time(), job["id"], task["idx"]))
+            except sqlite3.OperationalError:
+                pass  # database busy; the next beat retries
+
+    kind = _KINDS[job["kind"]]
+    done = threading.Event()
+    beat = threading.Thread(target=heartbeat, name="emerge-job-heartbeat", daemon=True)
+    beat.start()
+    try:
+        kind.run(json.loads(job["spec"]), job["path"], json.loads(task["payload"]), report)
+    except Exception:
+        error = traceback.format_exc(limit=3)
+        with _connect(db) as conn, _transaction(conn):
+            conn.execute("UPDATE tasks SET status = 'failed' WHERE job_id = ? AND idx = ?", (job["id"], task["idx"]))
+            conn.execute("UPDATE jobs SET status = 'failed', error = ?, finished = ? WHERE id = ?",
+                         (error, time.time(), job["id"]))
+        return False
+    finally:
+        done.set()
+        beat.join()
+    with _connect(db) as conn, _transaction(conn):
+        conn.execute("UPDATE tasks SET status = 'done', progress = 1 WHERE job_id = ? AND idx = ?",
+                     (job["id"], task["idx"]))
+        left = conn.execute("SELECT COUNT(*) FROM tasks WHERE job_id = ? AND status != 'done'",
+                            (job["id"],)).fetchone()[0]
+        if left == 0:
+            conn.execute("UPDATE jobs SET status = 'done', finished = ? WHERE id = ?", (time.time(), job["id"]))
+    return True
+
+
+def work(db=None, idle_exit=None, poll=0.5):
+    """Worker loop: run tasks until none has been queued for ``idle_exit`` seconds (None = forever)."""
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+    idle_since = time.monotonic()
+    while True:
+        claimed = claim(worker, db)
+        if claimed is None:
+            if idle_exit is not None and time.monotonic() - idle_since > idle_exit:
+                return
+            time.sleep(poll)
+            continue
+        execute(*claimed, db=db)
+        idle_since = time.monotonic()
+
+
+# ============================================
+# STATUS / RESULTS
+# ============================================
+def status(job_id, db=None):
+    """kind, status, progress (0–1 over tasks, counting partial progress), task counts and error."""
+    with _connect(db) as conn:
+        job = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if job is None:
+            raise KeyError(f"No job {job_id}")
+        counts = dict(conn.execute("SELECT status, COUNT(*) FROM tasks WHERE job_id = ? GROUP BY status",
+                                   (job_id,)).fetchall())
+        running = conn.execute("SELECT COALESCE(SUM(progress), 0) FROM tasks WHERE job_id = ? AND status = 'running'",
+                               (job_id,)).fetchone()[0]
+    done = counts.get("done", 0)
+    return {
+        "id": job_id,
+        "kind": job["kind"],
+        "status": job["status"],
+        "progress": (done + running) / job["tasks"] if job["tasks"] else float(job["status"] == "done"),
+        "tasks": job["tasks"],
+        "tasks_done": done,
+        "tasks_running": counts.get("running", 0),
+        "error": job["error"],
+        "path": job["path"],
+    }
+
+
+def result(job_id, db=None):
+    """The job kind's view of whatever has finished so far."""
+    with _connect(db) as conn:
+        job = conn.execute("SELECT kind, spec, path FROM jobs WHERE id = ?", (job_id,)).fetchone()
+    return _KINDS[job["kind"]].result(json.loads(job["spec"]), job["path"])
+
+
+def list_jobs(db=None):
+    with _connect(db) as conn:
+        return pd.read_sql_query("SELECT id, kind, status, tasks, error, created, finished FROM jobs ORDER BY id",
+                                 conn)
+
+
+# ============================================
+# WORKER PROCESSES
+# ============================================
+class WorkerPool:
+    """Worker processes for one queue. They exit after ``idle_exit`` s without work; ``ensure`` restarts them."""
+
+    def __init__(self, workers=None, db=None, idle_exit=IDLE_EXIT_S):
+        self.workers = workers or os.cpu_count() or 1
+        self.db = db or JOBS_DB
+        self.idle_exit = idle_exit
+        self.procs = []
+
+    def ensure(self):
+        """Top the pool up to ``workers`` live processes."""
+        self.procs = [p for p in self.procs if p.poll() is None]
+        if len(self.procs) < self.workers:
+            os.makedirs(os.path.dirname(self.db), exist_ok=True)
+            with open(os.path.join(os.path.dirname(self.db), "workers.log"), "a") as log:
+                while len(self.procs) < self.workers:
+                    self.procs.append(subprocess.Popen(
+                        [sys.executable, os.path.abspath(__file__), "--db", self.db, "work",
+                         "--idle-exit", str(self.idle_exit)],
+                        stdout=subprocess.DEVNULL, stderr=log, start_new_session=True))
+        return len(self.procs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="E.M.E.R.G.E+ local job queue")
+    parser.add_argument("--db", default=JOBS_DB)
+    commands = parser.add_subparsers(dest="command", required=True)
+    worker = commands.add_parser("work", help="run queued tasks")
+    worker.add_argument("--idle-exit", type=float, default=None, help="exit after this many idle seconds")
+    new = commands.add_parser("submit", help="queue a job")
+    new.add_argument("kind", choices=kinds())
+    new.add_argument("spec", help="job spec as JSON")
+    show = commands.add_parser("status", help="progress of one job")
+    show.add_argument("job_id", type=int)
+    again = commands.add_parser("retry", help="requeue a failed or cancelled job")
+    again.add_argument("job_id", type=int)
+    stop = commands.add_parser("cancel", help="stop a job from starting more tasks")
+    stop.add_argument("job_id", type=int)
+    commands.add_parser("list", help="every job")
+    commands.add_parser("prune", help="delete old finished jobs and their results")
+    args = parser.parse_args(argv)
+
+    if args.command == "work":
+        work(args.db, args.idle_exit)
+    elif args.command == "submit":
+        print(submit(args.kind, json.loads(args.spec), args.db))
+    elif args.command == "retry":
+        retry(args.job_id, args.db)
+    elif args.command == "cancel":
+        cancel(args.job_id, args.db)
+    elif args.command == "prune":
+        print(f"removed {len(prune(args.db))} job(s)")
+    elif args.command == "status":
+        print(json.dumps(status(args.job_id, args.db), indent=2))
+    else:
+        print(list_jobs(args.db).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
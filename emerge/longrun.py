@@ -0,0 +1,372 @@
+"""
+E.M.E.R.G.E+ Framework - Long-Horizon Transformative Runs
+Streaming, resumable integration of multi-dose schedules over days or weeks.
+
+D(t) is a sum of the gamma-shaped pulses of ``simulation.perturbation``, one per
+dose (time, relative amount). Each dose restarts the biphasic dynamics: Phase 1
+lasts until t_peak after the most recent dose, Phase 2 until the next dose. A
+single dose at t = 0 reproduces ``simulate_transformative`` exactly.
+
+``stream_transformative`` yields fixed-size blocks of rows, so memory does not
+grow with the horizon. ``run_long`` appends the blocks to a StreamStore:
+
+    manifest.json            run definition, rows, members, columns
+    <column>.npy             (rows, N) memory-mapped series, written in place
+    <column>.min/.max.npy    per-BLOCK-rows extremes for zoomed-out windows
+    checkpoint.json          rows written + integrator state (H_e, ∫exp(-H_e), RNG)
+
+A store is built in a temporary directory and renamed into place, and the
+checkpoint is replaced atomically after each block's data is flushed, so an
+interrupted run resumes from its last finished block and produces the same
+series as an uninterrupted one. Runs of one store within a process are
+serialized by a per-path lock; a session that waits finds the run finished. ``StreamStore.window`` reads only the rows (or
+block extremes) inside the requested time range.
+
+Usage:
+    python longrun.py --days 7 --doses 3 --interval 24
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from dataclasses import asdict
+
+import numpy as np
+import pandas as pd
+
+import simulation as sim
+
+LONGRUN_DIR = os.environ.get(
+    "EMERGE_LONGRUN_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "longrun")
+)
+
+COLUMNS = ["D", "E", "C", "H_e", "M_cum"]
+# Rows per min/max summary entry; chunk sizes must be a multiple of it
+BLOCK = 16
+DEFAULT_CHUNK_STEPS = 4096
+
+# One lock per store path: sessions sharing a run integrate it one at a time
+_RUN_LOCKS = {}
+_RUN_LOCKS_GUARD = threading.Lock()
+
+
+def _write_json(path, obj, **kwargs):
+    """Write JSON to a private temporary file and rename it over ``path``."""
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(obj, f, **kwargs)
+    os.replace(tmp, path)
+
+
+# ============================================
+# DOSING SCHEDULE
+# ============================================
+def repeated_doses(count, interval, amount=1.0, start=0.0):
+    """``count`` equal doses ``interval`` hours apart, as (time_h, amount) pairs."""
+    return [(start + i * interval, amount) for i in range(count)]
+
+
+def _schedule(doses):
+    doses = sorted((float(t), float(a)) for t, a in doses)
+    if not doses:
+        raise ValueError("At least one dose is required")
+    return np.array([t for t, _ in doses]), np.array([a for _, a in doses])
+
+
+def schedule_inputs(t, p, doses):
+    """D(t) summed over every dose so far, and the time since the most recent dose.
+
+    ``t`` has shape (T,); D has shape (T, N). Before the first dose D = 0 and the
+    time since dosing is 0 (Phase 1 with no drive: regulation only).
+    """
+    t = np.asarray(t, dtype=np.float64)
+    times, amounts = _schedule(doses)
+    D = np.zeros((len(t), len(p["t_peak"])))
+    for t_dose, amount in zip(times, amounts):
+        given = t >= t_dose
+        if given.any():
+            D[given] += amount * sim.perturbation((t[given] - t_dose)[:, None], p)
+    last = np.searchsorted(times, t, side="right") - 1
+    since = np.where(last >= 0, t - times[np.maximum(last, 0)], 0.0)
+    return D, since
+
+
+# ============================================
+# STREAMING INTEGRATOR
+# ============================================
+def stream_transformative(p, size, doses, *, dt, steps, rng, chunk_steps=DEFAULT_CHUNK_STEPS,
+                          common_noise=False, start=0, H_e0=None, M_cum0=None):
+    """Yield (lo, block, state) for consecutive blocks of rows ``start``..``steps``.
+
+    ``block`` maps "time" to a (rows,) array and every COLUMNS name to (rows, N).
+    ``state`` is what resuming at row ``lo + rows`` needs: that row's H_e, the
+    running ∫exp(-H_e)dt up to it and the generator paused before its draw.
+    """
+    sqdt = np.sqrt(dt)
+    width = 1 if common_noise else size
+    H_e = np.zeros(size) if H_e0 is None else np.array(H_e0, dtype=np.float64)
+    M_cum = np.zeros(size) if M_cum0 is None else np.array(M_cum0, dtype=np.float64)
+    for lo in range(start, steps + 1, chunk_steps):
+        rows = min(chunk_steps, steps + 1 - lo)
+        t = np.round(np.arange(lo, lo + rows) * dt, 10)
+        z = rng.standard_normal((rows, 3, width))
+        D, since = schedule_inputs(t, p, doses)
+        E = p["E_base"] + p["kappa_DE"] * D + p["input_noise"] * z[:, 0]
+        C = p["C_base"] - p["kappa_DC"] * D + p["input_noise"] * z[:, 1]
+        H = np.empty((rows, size))
+        for j in range(rows):
+            H[j] = H_e
+            H_e = H_e + sim.transform_drift(since[j], H_e, E[j], D[j], p) * dt + p["sigma_E"] * sqdt * z[j, 2]
+        M = M_cum + np.cumsum(np.exp(-H), axis=0) * dt
+        M_cum = M[-1]
+        block = {"time": t, "D": D, "E": np.broadcast_to(E, (rows, size)),
+                 "C": np.broadcast_to(C, (rows, size)), "H_e": H, "M_cum": M}
+        yield lo, block, {"H_e": H_e, "M_cum": M_cum, "rng": rng.bit_generator.state}
+
+
+# ============================================
+# STREAM STORE
+# ============================================
+class StreamStore:
+    """On-disk (rows, N) columns of one long run, filled block by block."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "manifest.json")) as f:
+            self.manifest = json.load(f)
+        self._columns = {}
+
+    @classmethod
+    def create(cls, path, rows, size, **meta):
+        """Build an empty store in a temporary directory and rename it to ``path``.
+
+        Concurrent creators of the same store race on the rename; the losers
+        discard their copy and open the winner's.
+        """
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        tmp = tempfile.mkdtemp(prefix=f"{os.path.basename(path)}.", suffix=".tmp", dir=parent)
+        try:
+            blocks = -(-rows // BLOCK)
+            for name in COLUMNS:
+                for suffix, shape in (("", (rows, size)), (".min", (blocks, size)), (".max", (blocks, size))):
+                    col = np.lib.format.open_memmap(os.path.join(tmp, f"{name}{suffix}.npy"), mode="w+",
+                                                    dtype=np.float64, shape=shape)
+                    del col
+            _write_json(os.path.join(tmp, "manifest.json"), dict(meta, rows=rows, n=size, columns=COLUMNS,
+                                                                 block=BLOCK), indent=2)
+            try:
+                os.rename(tmp, path)
+            except OSError:
+                if not os.path.exists(os.path.join(path, "manifest.json")):
+                    shutil.rmtree(path)  # half-built by an older, non-atomic create
+                    os.rename(tmp, path)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        return cls(path)
+
+    def __len__(self):
+        return self.manifest["rows"]
+
+    @property
+    def dt(self):
+        return self.manifest["dt"]
+
+    def column(self, name, mode="r"):
+        key = (name, mode)
+        if key not in self._columns:
+            self._columns[key] = np.load(os.path.join(self.path, f"{name}.npy"), mmap_mode=mode)
+        return self._columns[key]
+
+    # Checkpoint ------------------------------------------------------------
+    def checkpoint(self):
+        """The last saved integrator state, or None before the first block."""
+        try:
+            with open(os.path.join(self.path, "checkpoint.json")) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    @property
+    def rows_done(self):
+        state = self.checkpoint()
+        return state["rows"] if state else 0
+
+    @property
+    def progress(self):
+        return self.rows_done / len(self)
+
+    @property
+    def complete(self):
+        return self.rows_done >= len(self)
+
+    def append(self, lo, block, state):
+        """Write one block of rows, then checkpoint the state that follows it."""
+        rows = len(block["time"])
+        b0 = lo // BLOCK
+        for name in COLUMNS:
+            values = block[name]
+            col = self.column(name, "r+")
+            col[lo:lo + rows] = values
+            col.flush()
+            pad = -rows % BLOCK
+            if pad:
+                values = np.concatenate([values, np.repeat(values[-1:], pad, axis=0)])
+            grouped = values.reshape(-1, BLOCK, values.shape[1])
+            for suffix, extreme in ((".min", grouped.min(axis=1)), (".max", grouped.max(axis=1))):
+                summary = self.column(name + suffix, "r+")
+                summary[b0:b0 + len(extreme)] = extreme
+                summary.flush()
+        checkpoint = {"rows": lo + rows, "H_e": state["H_e"].tolist(), "M_cum": state["M_cum"].tolist(),
+                      "rng": state["rng"]}
+        _write_json(os.path.join(self.path, "checkpoint.json"), checkpoint)
+
+    # Windowed reads ----------------------------------------------------------
+    def window(self, t0=0.0, t1=None, member=0, max_points=1000):
+        """Series of ``member`` between t0 and t1 hours, reading only that range.
+
+        Up to ``max_points`` rows are returned as stored; wider windows are read
+        from the per-block extremes as a min/max envelope (two rows per group of
+        blocks), so peaks survive at any zoom level. M_t is ∫exp(-H_e) normalized
+        by its value at the last finished row.
+        """
+        done = self.rows_done
+        if done == 0:
+            return pd.DataFrame(columns=["time_h"] + COLUMNS + ["M_t"])
+        lo = max(0, int(np.floor(t0 / self.dt)))
+        hi = done if t1 is None else min(done, int(np.ceil(t1 / self.dt)) + 1)
+        hi = max(hi, lo + 1)
+        if hi - lo <= max_points:
+            frame = pd.DataFrame({name: np.asarray(self.column(name)[lo:hi, member]) for name in COLUMNS})
+            frame.insert(0, "time_h", np.round(np.arange(lo, hi) * self.dt, 10))
+        else:
+            b0, b1 = lo // BLOCK, -(-hi // BLOCK)
+            group = -(-(b1 - b0) // max(1, max_points // 2))
+            b1 = b0 + -(-(b1 - b0) // group) * group
+            cols = {}
+            for name in COLUMNS:
+                lows = self._grouped(name + ".min", b0, b1, group, member, done, np.minimum)
+                highs = self._grouped(name + ".max", b0, b1, group, member, done, np.maximum)
+                cols[name] = np.column_stack([lows, highs]).ravel()
+            starts = (b0 + np.arange(len(lows)) * group) * BLOCK
+            centers = np.minimum(starts + group * BLOCK / 2, done - 1) * self.dt
+            frame = pd.DataFrame({"time_h": np.repeat(centers, 2), **cols})
+        final = float(self.column("M_cum")[done - 1, member])
+        frame["M_t"] = frame["M_cum"] / final
+        return frame.reset_index(drop=True)
+
+    def _grouped(self, name, b0, b1, group, member, done, reduce):
+        # Blocks past the last finished row are unwritten; pad with the last written one
+        stop = min(b1, -(-done // BLOCK))
+        col = self.column(name)
+        values = np.asarray(col[b0:stop, member])
+        pad = (b1 - b0) - len(values)
+        if pad:
+            values = np.concatenate([values, np.repeat(values[-1:], pad)])
+        return reduce.reduce(values.reshape(-1, group), axis=1)
+
+    def to_trajectories(self):
+        """Load the whole run as ``Trajectories`` (only sensible for short horizons)."""
+        done = self.rows_done
+        series = {name: np.asarray(self.column(name)[:done]).T for name in COLUMNS if name != "M_cum"}
+        M = np.asarray(self.column("M_cum")[:done]).T
+        series["M_t"] = M / M[:, -1:]
+        return sim.Trajectories("transformative", np.round(np.arange(done) * self.dt, 10), series, "time_h")
+
+
+# ============================================
+# RUNNER
+# ============================================
+def run_key(params, doses, n, seed, dt, duration, common_noise):
+    """Content hash of a long-run definition, used as its store directory name."""
+    p, size = sim.broadcast_params(sim._coerce(params, sim.TRANSFORM_DEFAULTS), n)
+    h = hashlib.sha256(json.dumps([sorted(map(list, doses)), size, seed, dt, duration, common_noise]).encode())
+    for name in sorted(p):
+        h.update(np.ascontiguousarray(p[name]).tobytes())
+    return h.hexdigest()[:16]
+
+
+def open_run(params=None, *, doses, n=None, seed=2025, dt=0.01, duration, common_noise=False, path=None):
+    """Open the store of a long run, creating it empty if needed."""
+    doses = [(float(t), float(a)) for t, a in doses]
+    path = path or os.path.join(LONGRUN_DIR, run_key(params, doses, n, seed, dt, duration, common_noise))
+    if os.path.exists(os.path.join(path, "manifest.json")):
+        return StreamStore(path)
+    coerced = sim._coerce(params, sim.TRANSFORM_DEFAULTS)
+    _, size = sim.broadcast_params(coerced, n)
+    overrides = {k: np.asarray(v).tolist() for k, v in asdict(coerced).items()
+                 if np.any(np.asarray(v) != getattr(sim.TRANSFORM_DEFAULTS, k))}
+    return StreamStore.create(path, sim.n_steps_for(dt, duration) + 1, size, params=overrides, doses=doses,
+                              seed=seed, dt=dt, duration=duration, common_noise=common_noise)
+
+
+def run_long(params=None, *, doses, n=None, seed=2025, dt=0.01, duration, common_noise=False, path=None,
+             chunk_steps=DEFAULT_CHUNK_STEPS, on_chunk=None):
+    """Integrate a dosing schedule into its StreamStore, resuming from the last checkpoint.
+
+    Parameters
+    ----------
+    params : TransformParams or mapping of overrides, fields scalar or length-N arrays
+    doses : (time_h, amount) pairs; amount scales D_peak for that dose
+    n : batch size, only needed when every parameter is a scalar
+    dt, duration : step and horizon in hours
+    path : store directory; defaults to a content-hashed directory under LONGRUN_DIR
+    chunk_steps : rows per block (a multiple of BLOCK); peak memory is O(chunk_steps × N)
+    on_chunk : optional callback(store) after each block lands
+    """
+    if chunk_steps % BLOCK:
+        raise ValueError(f"chunk_steps must be a multiple of {BLOCK}")
+    store = open_run(params, doses=doses, n=n, seed=seed, dt=dt, duration=duration, common_noise=common_noise,
+                     path=path)
+    with _RUN_LOCKS_GUARD:
+        lock = _RUN_LOCKS.setdefault(os.path.abspath(store.path), threading.Lock())
+    with lock:
+        if store.complete:
+            return store
+        p, size = sim.broadcast_params(sim._coerce(params, sim.TRANSFORM_DEFAULTS), n)
+        rng = np.random.default_rng(seed)
+        state = store.checkpoint()
+        kwargs = {}
+        if state:
+            rng.bit_generator.state = state["rng"]
+            kwargs = {"start": state["rows"], "H_e0": state["H_e"], "M_cum0": state["M_cum"]}
+        for lo, block, after in stream_transformative(p, size, store.manifest["doses"], dt=dt,
+                                                      steps=len(store) - 1, rng=rng, chunk_steps=chunk_steps,
+                                                      common_noise=common_noise, **kwargs):
+            store.append(lo, block, after)
+            if on_chunk:
+                on_chunk(store)
+    return store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Integrate a multi-dose transformative schedule to disk")
+    parser.add_argument("--days", type=float, default=7.0)
+    parser.add_argument("--doses", type=int, default=3)
+    parser.add_argument("--interval", type=float, default=24.0, help="hours between doses")
+    parser.add_argument("--amount", type=float, default=1.0, help="dose size relative to D_peak")
+    parser.add_argument("--dt", type=float, default=0.01)
+    parser.add_argument("--members", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--chunk-steps", type=int, default=DEFAULT_CHUNK_STEPS)
+    parser.add_argument("--path", help="store directory (default: content-hashed under LONGRUN_DIR)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    store = run_long(doses=repeated_doses(args.doses, args.interval, args.amount), n=args.members,
+                     seed=args.seed, dt=args.dt, duration=args.days * 24, chunk_steps=args.chunk_steps,
+                     path=args.path,
+                     on_chunk=lambda s: print(f"\r{s.rows_done}/{len(s)} rows", end="", flush=True))
+    print(f"\n{len(store)} rows × {store.manifest['n']} member(s) in {time.perf_counter() - start:.1f}s "
+          f"-> {store.path}")
+
+
+if __name__ == "__main__":
+    main()
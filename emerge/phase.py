@@ -0,0 +1,265 @@
+"""
+E.M.E.R.G.E+ Framework - Phase Space Analysis
+Vector fields, equilibria and undershoot continuation of the noise-free model.
+
+Everything here uses the deterministic skeleton of each process: noise off and
+inputs at their means (routine: E = E_mean, C = C_mean; transformative: E and
+C driven by D(t) only). Fields, Jacobians and skeleton runs are vectorized
+over grids and parameter batches.
+
+Routine, (H_e, H_c) plane: the entropy drifts depend on the inputs and Ψ but
+not on H_e or H_c, so the flow is a uniform translation with Jacobian 0. Ψ has
+the stable equilibrium S_group (eigenvalue −κ_Ψ). The entropies have none
+unless both drifts vanish there, in which case every point is a (neutral)
+equilibrium. Meaning M_r rises along the flow when dH_e + dH_c < 0.
+
+Transformative, (H_e, M) plane, with M = ∫ exp(−H_e) dt the unnormalized
+cumulative meaning (the dashboard's M_t is M / M(T)). The system is driven by
+D(t), so fields are frozen at a time t. M only grows, so the plane has no fixed
+points. The H_e nullcline is the frozen equilibrium of the H_e subsystem:
+
+    Phase 1  none: dH_e/dt = γ·D(t) − α_E·tanh(E − E_opt) does not depend on H_e
+    Phase 2  H_e^eq(t) = H_e* − (α_E / β_transform)·tanh(E(t) − E_opt),
+             stable with eigenvalue −β_transform; as D → 0 it tends to H_e^∞
+
+The biphasic "entropy detour" is an undershoot of baseline (H_e = 0) after the
+Phase 1 rise. Its margin is the minimum of H_e in Phase 2 within the run: it is
+negative when the detour happens. The undershoot disappears where the margin
+crosses 0. ``continuation`` traces that boundary β_c(γ) for many γ at once by
+multisection. Each step is one batched skeleton run over every (γ, β) candidate.
+
+Usage:
+    python phase.py --gamma 0.2 2.0 --points 50
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+
+import simulation as sim
+
+PLANES = {"routine": ("H_e", "H_c"), "transformative": ("H_e", "M")}
+NOISE_FREE = {"routine": {"input_noise": 0.0, "sigma_E": 0.0, "sigma_C": 0.0},
+              "transformative": {"input_noise": 0.0, "sigma_E": 0.0}}
+
+
+def _params(model, params=None):
+    """Broadcast (N,) parameter arrays of ``model`` with the noise switched off."""
+    defaults = sim.ROUTINE_DEFAULTS if model == "routine" else sim.TRANSFORM_DEFAULTS
+    return sim.broadcast_params(replace(sim._coerce(params, defaults), **NOISE_FREE[model]))
+
+
+def _scalars(model, params=None):
+    p, size = _params(model, params)
+    if size != 1:
+        raise ValueError("Fields and equilibria take one parameter set; use the skeleton functions for batches")
+    return {k: float(v[0]) for k, v in p.items()}
+
+
+# ============================================
+# FIELDS
+# ============================================
+def transform_inputs(t, p):
+    """Noise-free D(t), E(t) and C(t) of the transformative process."""
+    D = sim.perturbation(t, p)
+    return D, p["E_base"] + p["kappa_DE"] * D, p["C_base"] - p["kappa_DC"] * D
+
+
+def field(model, x, y, params=None, t=0.0, Psi=None):
+    """Velocity (U, V) on the model's plane at points (x, y), any broadcastable shapes.
+
+    routine: (dH_e/dt, dH_c/dt) at Ψ (default S_group); transformative: (dH_e/dt, dM/dt) at time t.
+    """
+    p = _scalars(model, params)
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64))
+    if model == "routine":
+        dH_e, dH_c = sim.routine_drift(p["E_mean"], p["C_mean"], p["S_group"] if Psi is None else Psi, p)
+        return np.full(x.shape, dH_e), np.full(x.shape, dH_c)
+    D, E, _ = transform_inputs(t, p)
+    return sim.transform_drift(t, x, E, D, p), np.exp(-x)
+
+
+def grid_field(model, xlim, ylim, n=25, params=None, t=0.0):
+    """(X, Y, U, V) on an n × n grid over ``xlim`` × ``ylim``."""
+    X, Y = np.meshgrid(np.linspace(*xlim, n), np.linspace(*ylim, n))
+    return (X, Y) + field(model, X, Y, params, t)
+
+
+def jacobian(model, x, y, params=None, t=0.0, h=1e-6):
+    """Central-difference Jacobian of the plane field at (x, y)."""
+    J = np.empty((2, 2))
+    for j, (dx, dy) in enumerate([(h, 0.0), (0.0, h)]):
+        hi = field(model, x + dx, y + dy, params, t)
+        lo = field(model, x - dx, y - dy, params, t)
+        J[:, j] = [(a - b) / (2 * h) for a, b in zip(hi, lo)]
+    return J
+
+
+def classify(eigenvalues, tol=1e-9):
+    """Stability of an equilibrium from its eigenvalues."""
+    ev = np.asarray(eigenvalues)
+    re = ev.real
+    if np.all(np.abs(ev) < tol):
+        return "neutral"
+    if np.any(np.abs(re) < tol):
+        return "stable (non-isolated)" if np.all(re < tol) else "unstable (non-isolated)"
+    if np.all(re < 0):
+        return "stable focus" if np.any(np.abs(ev.imag) > tol) else "stable node"
+    if np.all(re > 0):
+        return "unstable focus" if np.any(np.abs(ev.imag) > tol) else "unstable node"
+    return "saddle"
+
+
+def equilibria(model, params=None, t=None, tol=1e-9):
+    """Equilibria of the skeleton as rows (state, value, eigenvalue, stability, note).
+
+    ``t`` freezes the transformative system (default: after the perturbation has decayed).
+    """
+    p = _scalars(model, params)
+    rows = []
+    if model == "routine":
+        rows.append(("Ψ", p["S_group"], -p["kappa_psi"], classify([-p["kappa_psi"]]), "Ψ → S_group"))
+        dH_e, dH_c = field(model, 0.0, 0.0, params)
+        ev = np.linalg.eigvals(jacobian(model, 0.0, 0.0, params))
+        if abs(dH_e) < tol and abs(dH_c) < tol:
+            rows.append(("(H_e, H_c)", np.nan, ev.real.max(), classify(ev), "every point is an equilibrium"))
+        else:
+            trend = "rises" if dH_e + dH_c < 0 else "falls"
+            rows.append(("(H_e, H_c)", np.nan, np.nan, "none",
+                         f"uniform drift ({float(dH_e):+.3f}, {float(dH_c):+.3f}) per s; M_r {trend}"))
+        return pd.DataFrame(rows, columns=["state", "value", "eigenvalue", "stability", "note"])
+
+    t_frozen = 10 * p["t_peak"] if t is None else t
+    _, E, _ = transform_inputs(t_frozen, p)
+    if t_frozen < p["t_peak"]:
+        rate = float(field(model, 0.0, 0.0, params, t_frozen)[0])
+        rows.append(("H_e", np.nan, 0.0, "none", f"Phase 1: H_e changes at {rate:+.3f} per h"))
+    else:
+        H_eq = p["H_e_star"] - p["alpha_E"] / p["beta_transform"] * np.tanh(E - p["E_opt"])
+        lam = jacobian(model, H_eq, 0.0, params, t_frozen)[0, 0]
+        rows.append(("H_e", float(H_eq), lam, classify([lam]), f"Phase 2 nullcline at t = {t_frozen:g} h"))
+    rows.append(("M", np.nan, 0.0, "none", "M grows at exp(−H_e) > 0"))
+    H_inf = p["H_e_star"] - p["alpha_E"] / p["beta_transform"] * np.tanh(p["E_base"] - p["E_opt"])
+    rows.append(("H_e^∞", float(H_inf), -p["beta_transform"], classify([-p["beta_transform"]]),
+                 "equilibrium once D(t) has decayed"))
+    return pd.DataFrame(rows, columns=["state", "value", "eigenvalue", "stability", "note"])
+
+
+# ============================================
+# SKELETON RUNS
+# ============================================
+def routine_skeleton(params=None, dt=0.01, duration=10.0):
+    """Noise-free routine trajectory (``sim.Trajectories``)."""
+    return sim.simulate_routine(replace(sim._coerce(params, sim.ROUTINE_DEFAULTS), **NOISE_FREE["routine"]),
+                                dt=dt, duration=duration)
+
+
+def transform_skeleton(params=None, dt=0.01, duration=8.0):
+    """Noise-free transformative trajectory with the unnormalized meaning column ``M``."""
+    traj = sim.simulate_transformative(
+        replace(sim._coerce(params, sim.TRANSFORM_DEFAULTS), **NOISE_FREE["transformative"]), dt=dt,
+        duration=duration)
+    traj.series["M"] = np.cumsum(np.exp(-traj["H_e"]), axis=-1) * dt
+    return traj
+
+
+def undershoot(params=None, dt=0.01, duration=8.0):
+    """Per-member skeleton summary for a batch of transformative parameter sets.
+
+    H_e_peak, margin (minimum of H_e in Phase 2; < 0 means the undershoot occurs),
+    t_cross_h (first Phase 2 time below baseline, NaN if none), H_e_final and H_e_inf.
+    Memory is O(N); every member advances in the same vectorized step.
+    """
+    p, size = _params("transformative", params)
+    time = sim.time_grid(dt, duration)
+    H_e = np.zeros(size)
+    peak = np.zeros(size)
+    margin = np.full(size, np.inf)
+    t_cross = np.full(size, np.nan)
+    for k, t in enumerate(time):
+        if k:
+            D, E, _ = transform_inputs(time[k - 1], p)
+            H_e = H_e + sim.transform_drift(time[k - 1], H_e, E, D, p) * dt
+        phase2 = t >= p["t_peak"]
+        peak = np.maximum(peak, H_e)
+        margin = np.where(phase2, np.minimum(margin, H_e), margin)
+        t_cross = np.where(phase2 & np.isnan(t_cross) & (H_e < 0), t, t_cross)
+    return {
+        "H_e_peak": peak,
+        "margin": margin,
+        "t_cross_h": t_cross,
+        "H_e_final": H_e,
+        "H_e_inf": p["H_e_star"] - p["alpha_E"] / p["beta_transform"] * np.tanh(p["E_base"] - p["E_opt"]),
+    }
+
+
+def undershoot_map(gammas, betas, params=None, dt=0.01, duration=8.0):
+    """``undershoot`` over the γ × β_transform grid; every value has shape (len(betas), len(gammas))."""
+    G, B = np.meshgrid(np.asarray(gammas, dtype=np.float64), np.asarray(betas, dtype=np.float64))
+    base = dict(params or {})
+    out = undershoot({**base, "gamma": G.ravel(), "beta_transform": B.ravel()}, dt, duration)
+    return {k: np.broadcast_to(v, G.size).reshape(G.shape) for k, v in out.items()}
+
+
+def bifurcation(name, values, params=None, dt=0.01, duration=8.0):
+    """One-parameter diagram: skeleton summary per value of parameter ``name``."""
+    values = np.asarray(values, dtype=np.float64)
+    out = undershoot({**dict(params or {}), name: values}, dt, duration)
+    return pd.DataFrame({name: values, **{k: np.broadcast_to(v, values.shape) for k, v in out.items()}})
+
+
+def continuation(gammas, beta_range=(0.05, 2.0), params=None, dt=0.01, duration=8.0, tol=1e-4, points=8):
+    """β_c(γ): the β_transform at which the undershoot appears, for every γ at once.
+
+    The margin falls with β_transform, so each γ's bracket is cut into ``points`` + 1
+    parts per step and narrowed to the part where the margin changes sign. Every
+    step is one skeleton run over all len(gammas) × points candidates. β_c is NaN
+    where the margin has one sign over the whole range.
+    """
+    gammas = np.asarray(gammas, dtype=np.float64)
+    lo = np.full(gammas.shape, float(beta_range[0]))
+    hi = np.full(gammas.shape, float(beta_range[1]))
+    base = dict(params or {})
+
+    def margin(g, b):
+        return undershoot({**base, "gamma": g, "beta_transform": b}, dt, duration)["margin"]
+
+    ends = margin(np.concatenate([gammas, gammas]), np.concatenate([lo, hi])).reshape(2, -1)
+    found = (ends[0] >= 0) & (ends[1] < 0)
+    steps = 0
+    while np.any(hi - lo > tol) and steps < 64:
+        cuts = lo[:, None] + (hi - lo)[:, None] * np.arange(1, points + 1) / (points + 1)
+        m = margin(np.repeat(gammas, points), cuts.ravel()).reshape(cuts.shape)
+        below = m < 0
+        # First candidate with an undershoot bounds the bracket from above, the one before it from below
+        first = np.where(below.any(axis=1), below.argmax(axis=1), points)
+        rows = np.arange(len(gammas))
+        new_hi = np.where(first < points, cuts[rows, np.minimum(first, points - 1)], hi)
+        new_lo = np.where(first > 0, cuts[rows, np.maximum(first - 1, 0)], lo)
+        lo, hi = new_lo, new_hi
+        steps += 1
+    return pd.DataFrame({"gamma": gammas, "beta_critical": np.where(found, (lo + hi) / 2, np.nan)})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Undershoot continuation of the transformative skeleton")
+    parser.add_argument("--gamma", type=float, nargs=2, default=[0.2, 2.0], metavar=("LOW", "HIGH"))
+    parser.add_argument("--beta", type=float, nargs=2, default=[0.05, 2.0], metavar=("LOW", "HIGH"))
+    parser.add_argument("--points", type=int, default=40)
+    parser.add_argument("--out", help="write β_c(γ) as CSV")
+    args = parser.parse_args(argv)
+
+    print(equilibria("routine").to_string(index=False))
+    print(equilibria("transformative").to_string(index=False))
+    curve = continuation(np.linspace(*args.gamma, args.points), tuple(args.beta))
+    print(curve.to_string(index=False))
+    if args.out:
+        curve.to_csv(args.out, index=False)
+
+
+if __name__ == "__main__":
+    main()
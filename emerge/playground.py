@@ -0,0 +1,112 @@
+"""
+E.M.E.R.G.E+ Framework - Live Parameter Playground
+Incremental re-simulation for the interactive playground page.
+
+A TransformSession keeps the last trajectory together with the random
+generator state captured at the Phase 1 → Phase 2 switch. When a slider
+change only touches late-phase parameters (β_transform, H_e*), Phase 1 is
+unaffected, so the run resumes from t_peak instead of starting over.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import fields
+
+import numpy as np
+
+import result_cache
+import simulation as sim
+
+# Parameters that only enter the Phase 2 drift
+LATE_PHASE_PARAMS = {"beta_transform", "H_e_star"}
+
+
+def changed_params(old, new):
+    """Names of the fields that differ between two params dataclasses."""
+    return {f.name for f in fields(new) if getattr(old, f.name) != getattr(new, f.name)}
+
+
+class TransformSession:
+    """One user's transformative run, recomputed incrementally as parameters change."""
+
+    def __init__(self, seed=2025, dt=0.01, duration=8.0):
+        self.seed = seed
+        self.dt = dt
+        self.time = sim.time_grid(dt, duration)
+        self.params = None
+        self.traj = None
+        self._switch = None          # (step, rng state before that step's draw)
+        self.last_kind = None        # "cached", "resumed" or "full"
+        self.last_ms = 0.0
+
+    def _switch_step(self, p):
+        return int(np.searchsorted(self.time, p["t_peak"][0], side="left"))
+
+    def _integrate(self, params, start, rng, H_e0, buf):
+        p, size = sim.broadcast_params(params)
+        switch = self._switch_step(p)
+        steps = len(self.time) - 1
+        for k, D, E, C, H_e in sim.transform_steps(p, size, steps, self.dt, rng, self.time,
+                                                    start=start, H_e0=H_e0):
+            buf["D"][k] = D[0] if np.ndim(D) else D
+            buf["E"][k] = E[0]
+            buf["C"][k] = C[0]
+            buf["H_e"][k] = H_e[0]
+            if k == switch - 1:
+                # Generator is paused before step `switch` draws its noise
+                self._switch = (switch, rng.bit_generator.state)
+
+    def update(self, params):
+        """Return trajectories for ``params``, reusing the Phase 1 prefix when possible."""
+        t0 = time.perf_counter()
+        if self.traj is not None and params == self.params:
+            kind = "cached"
+        else:
+            late_only = (self.traj is not None and self._switch is not None
+                         and changed_params(self.params, params) <= LATE_PHASE_PARAMS)
+            if late_only:
+                start, state = self._switch
+                buf = {name: self.traj[name][0].copy() for name in sim.TRANSFORM_COLUMNS[:-1]}
+                rng = np.random.default_rng()
+                rng.bit_generator.state = state
+                self._integrate(params, start, rng, [buf["H_e"][start]], buf)
+                kind = "resumed"
+            else:
+                buf = {name: np.empty(len(self.time)) for name in sim.TRANSFORM_COLUMNS[:-1]}
+                self._switch = None
+                self._integrate(params, 0, np.random.default_rng(self.seed), None, buf)
+                kind = "full"
+            series = {name: v[None, :] for name, v in buf.items()}
+            series["M_t"] = sim.cumulative_meaning(series["H_e"])
+            self.traj = sim.Trajectories("transformative", self.time, series, "time_h")
+            self.params = params
+        self.last_kind = kind
+        self.last_ms = (time.perf_counter() - t0) * 1000
+        return self.traj
+
+
+class RoutineSession:
+    """One user's routine run; every parameter acts from t = 0, so changes go through the disk cache."""
+
+    def __init__(self, seed=0, dt=0.01, duration=10.0):
+        self.seed = seed
+        self.dt = dt
+        self.duration = duration
+        self.params = None
+        self.traj = None
+        self.last_kind = None
+        self.last_ms = 0.0
+
+    def update(self, params):
+        t0 = time.perf_counter()
+        if self.traj is not None and params == self.params:
+            self.last_kind = "cached"
+        else:
+            cache = result_cache.default_cache()
+            hits = cache.hits
+            self.traj = cache.simulate("routine", params, seed=self.seed, dt=self.dt, duration=self.duration)
+            self.params = params
+            self.last_kind = "disk" if cache.hits > hits else "full"
+        self.last_ms = (time.perf_counter() - t0) * 1000
+        return self.traj
@@ -0,0 +1,142 @@
+"""
+E.M.E.R.G.E+ Framework - Cultural Population Simulator
+Many interacting agents per culture across a continuum of group norms.
+
+Every agent runs the routine process. Its emotion regulation factor Ψ
+relaxes toward a social target that mixes the culture's norm S_group with
+the current mean Ψ of its own group (peer influence, weight ``conformity``):
+
+    dΨ_i/dt = κ_Ψ · ((1 - c)·S_g + c·mean_{j∈g} Ψ_j - Ψ_i)
+
+Agents start from an initial Ψ_0 (the routine ``psi0`` by default, as in the
+single-agent runs) spread around it, not at their norm, so each group drifts
+from Ψ_0 toward S_g. Conformity anchors agents to where their group currently
+is, which slows that drift.
+
+Agent state is held as flat (N,) float32 arrays with an integer group index,
+and the group means are one ``np.bincount`` per step, so 100k agents × 1000
+steps needs only a few MB and no per-agent Python loop. By default the inputs
+E(t), C(t) follow one common path for every agent (common random numbers, as
+with ``common_noise`` in the simulator), so cultures differ only through Ψ,
+while the H_e / H_c diffusion stays individual. This halves the normal
+draws, which dominate the run time.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+import simulation as sim
+
+
+def norm_grid(n_groups=9, low=0.2, high=0.8):
+    """Evenly spaced group norms S_group."""
+    return np.linspace(low, high, n_groups)
+
+
+@dataclass
+class Population:
+    """Final agent states plus the mean Ψ path of every group."""
+    norms: np.ndarray           # (G,)
+    group: np.ndarray           # (N,) group index per agent
+    time: np.ndarray            # (T,)
+    psi_mean: np.ndarray        # (T, G)
+    outcomes: dict              # name → (N,) array
+    threshold: float
+
+    @property
+    def n_agents(self):
+        return len(self.group)
+
+    def agents(self):
+        """One row per agent."""
+        out = pd.DataFrame(self.outcomes)
+        out.insert(0, "S_group", self.norms[self.group])
+        return out
+
+    def summary(self, probs=(0.05, 0.5, 0.95)):
+        """Distribution of M_r_final and time-to-threshold per culture."""
+        rows = []
+        for g, norm in enumerate(self.norms):
+            mask = self.group == g
+            m = self.outcomes["M_r_final"][mask]
+            t = self.outcomes["time_to_M_gt_threshold"][mask]
+            reached = ~np.isnan(t)
+            row = {"S_group": norm, "agents": int(mask.sum()),
+                   "Psi_final": self.outcomes["Psi_final"][mask].mean(),
+                   "H_e_final": self.outcomes["H_e_final"][mask].mean(),
+                   "M_r_final": m.mean(), "M_r_final_sd": m.std(),
+                   "time_to_threshold_s": np.median(t[reached]) if reached.any() else np.nan,
+                   "share_reached": reached.mean()}
+            for q, v in zip(probs, np.quantile(m, probs)):
+                row[f"M_r_final_q{int(q * 100):02d}"] = v
+            if reached.any():
+                for q, v in zip(probs, np.quantile(t[reached], probs)):
+                    row[f"time_q{int(q * 100):02d}"] = v
+            rows.append(row)
+        return pd.DataFrame(rows)
+
+
+def simulate_population(norms=None, agents_per_group=10000, *, conformity=0.5, psi0=None, psi_spread=0.1,
+                        params=None, shared_inputs=True, seed=0, dt=0.01, duration=10.0, threshold=0.35,
+                        dtype=np.float32):
+    """Simulate ``agents_per_group`` agents for each norm in ``norms``.
+
+    Parameters
+    ----------
+    norms : group norms S_group, one culture each (default ``norm_grid()``)
+    conformity : weight of the group's current mean Ψ in each agent's target
+    psi0 : mean initial Ψ: a scalar, one value per culture (G,) or per agent
+           (N,); default the routine ``psi0`` of ``params``
+    psi_spread : SD of the initial Ψ around ``psi0``
+    params : routine parameters shared by all agents; array fields of
+             length N give per-agent values
+    shared_inputs : one E, C draw per step for all agents instead of per agent
+    """
+    norms = norm_grid() if norms is None else np.asarray(norms, dtype=np.float64)
+    G = len(norms)
+    N = G * agents_per_group
+    p, _ = sim.broadcast_params(sim._coerce(params, sim.ROUTINE_DEFAULTS), N)
+    # Parameters shared by every agent stay scalars
+    p = {k: dtype(v[0]) if v.strides == (0,) else v.astype(dtype) for k, v in p.items()}
+    time = sim.time_grid(dt, duration)
+    steps = len(time) - 1
+    rng = np.random.default_rng(seed)
+
+    group = np.repeat(np.arange(G), agents_per_group)
+    counts = np.bincount(group, minlength=G)
+    norm = norms[group].astype(dtype)
+    start = p["psi0"] if psi0 is None else np.asarray(psi0, dtype=dtype)
+    if np.ndim(start) and len(start) == G:
+        start = start[group]
+    Psi = np.clip(start + psi_spread * rng.standard_normal(N, dtype=dtype), 0.0, 1.0).astype(dtype)
+    H_e = np.zeros(N, dtype)
+    H_c = np.zeros(N, dtype)
+    hit_time = np.full(N, np.nan)
+    psi_mean = np.empty((len(time), G))
+    sqdt = dtype(np.sqrt(dt))
+    dt = dtype(dt)
+    z_diff = np.empty((2, N), dtype)
+
+    for k in range(steps + 1):
+        z_in = rng.standard_normal((2, 1 if shared_inputs else N), dtype=dtype)
+        E = p["E_mean"] + p["input_noise"] * z_in[0]
+        C = p["C_mean"] + p["input_noise"] * z_in[1]
+        M_r = sim.routine_meaning(E, C, H_e, H_c, p)
+        hit_time[np.isnan(hit_time) & (M_r > threshold)] = time[k]
+        psi_mean[k] = np.bincount(group, weights=Psi, minlength=G) / counts
+        if k == steps:
+            break
+        rng.standard_normal(dtype=dtype, out=z_diff)
+        dH_e, dH_c = sim.routine_drift(E, C, Psi, p)
+        H_e += dH_e * dt + p["sigma_E"] * sqdt * z_diff[0]
+        H_c += dH_c * dt + p["sigma_C"] * sqdt * z_diff[1]
+        target = (1 - conformity) * norm + (conformity * psi_mean[k]).astype(dtype)[group]
+        Psi += p["kappa_psi"] * (target - Psi) * dt
+
+    outcomes = {"Psi_final": Psi.astype(np.float64), "H_e_final": H_e.astype(np.float64),
+                "M_r_final": M_r.astype(np.float64), "time_to_M_gt_threshold": hit_time}
+    return Population(norms, group, time, psi_mean, outcomes, threshold)
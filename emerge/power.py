@@ -0,0 +1,200 @@
+"""
+E.M.E.R.G.E+ Framework - Power Analysis
+Simulated power of the three falsifiable predictions.
+
+A pool of model subjects (individual α_E, Ψ, γ, β_transform) is simulated
+once; replicate cohorts are drawn from it and the stated tests are run on all
+replicates at once as array operations:
+
+    Prediction 1   Pearson r(H_e, MLQ) < -0.3 with one-sided p < α
+    Prediction 2   paired t-test H_e(8h) < H_e(0h), one-sided p < α
+    Prediction 3   OLS MLQ ~ H_e + Ψ + H_e×Ψ, β₃ > 0.10 with one-sided p < α
+
+The effect-size axis sets the measurement noise (P1, P2) or the moderation
+coefficient (P3), so each curve shows power versus n for one assumed
+population effect. For P3 the pool's own H_e×Ψ interaction (the model already
+has one through χ_E·Ψ·E) is removed from MLQ before the effect is added, so
+the population β₃ equals the effect and power at β₃ = 0 is the false-positive
+rate.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+
+import simulation as sim
+
+
+# ============================================
+# t DISTRIBUTION (no SciPy dependency)
+# ============================================
+def _betacf(a, b, x, iterations=200):
+    """Continued fraction for the regularized incomplete beta (Numerical Recipes betacf)."""
+    tiny = 1e-300
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c, d = 1.0, 1.0 - qab * x / qap
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, iterations + 1):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c if abs(1.0 + aa / c) > tiny else tiny
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c if abs(1.0 + aa / c) > tiny else tiny
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 1e-12:
+            break
+    return h
+
+
+def _betainc(a, b, x):
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                     + a * math.log(x) + b * math.log(1.0 - x))
+    if x < (a + 1.0) / (a + b + 2.0):
+        return front * _betacf(a, b, x) / a
+    return 1.0 - front * _betacf(b, a, 1.0 - x) / b
+
+
+def t_sf(t, df):
+    """Upper tail P(T > t) of Student's t with ``df`` degrees of freedom."""
+    tail = 0.5 * _betainc(df / 2.0, 0.5, df / (df + t * t))
+    return tail if t > 0 else 1.0 - tail
+
+
+def t_critical(df, alpha=0.05):
+    """One-sided critical value c with P(T > c) = alpha."""
+    lo, hi = 0.0, 100.0
+    for _ in range(80):
+        mid = (lo + hi) / 2
+        if t_sf(mid, df) > alpha:
+            lo = mid
+        else:
+            hi = mid
+    return (lo + hi) / 2
+
+
+# ============================================
+# SUBJECT POOL
+# ============================================
+def subject_pool(n=20000, seed=0):
+    """Per-subject model quantities used to build synthetic cohorts."""
+    rng = np.random.default_rng(seed)
+    psi = rng.uniform(0.2, 0.8, n)
+    routine = sim.routine_outcomes({"alpha_E": rng.uniform(0.1, 0.8, n), "psi0": psi, "S_group": psi},
+                                   seed=seed)
+    transform = sim.transform_outcomes({"gamma": rng.uniform(0.4, 1.6, n),
+                                        "beta_transform": rng.uniform(0.2, 1.2, n),
+                                        "alpha_E": rng.uniform(0.1, 0.8, n)}, seed=seed + 1)
+    return {
+        "H_e": routine["H_e_final"],
+        "M_r": routine["M_r_final"],
+        "Psi": psi,
+        # H_e starts at the 0 baseline, so the 8 h value is the within-subject change
+        "dH_e_8h": transform["H_e_final"],
+    }
+
+
+def _z(x):
+    return (x - x.mean()) / x.std()
+
+
+def _draw(pool_size, reps, n, rng):
+    return rng.integers(0, pool_size, (reps, n))
+
+
+# ============================================
+# PREDICTION TESTS
+# ============================================
+def power_correlation(pool, n_values, effects, reps=2000, alpha=0.05, r_max=-0.3, seed=0):
+    """Prediction 1: power of r(H_e, MLQ) < r_max with p < alpha, per (n, ρ)."""
+    rng = np.random.default_rng(seed)
+    H = _z(pool["H_e"])
+    M = _z(pool["M_r"])
+    r0 = float(np.mean(H * M))
+    rows = []
+    for rho in effects:
+        # MLQ = z(M_r) + s·ε gives corr(H_e, MLQ) = r0 / sqrt(1 + s²)
+        s = math.sqrt(max((r0 / rho) ** 2 - 1.0, 0.0)) if rho else 1e6
+        for n in n_values:
+            idx = _draw(len(H), reps, n, rng)
+            h = H[idx]
+            mlq = M[idx] + s * rng.standard_normal((reps, n))
+            hc = h - h.mean(axis=1, keepdims=True)
+            mc = mlq - mlq.mean(axis=1, keepdims=True)
+            r = (hc * mc).sum(axis=1) / np.sqrt((hc ** 2).sum(axis=1) * (mc ** 2).sum(axis=1))
+            t = r * np.sqrt((n - 2) / np.maximum(1 - r ** 2, 1e-12))
+            reject = (t < -t_critical(n - 2, alpha)) & (r < r_max)
+            rows.append({"n": n, "effect": rho, "power": reject.mean()})
+    return pd.DataFrame(rows)
+
+
+def power_paired(pool, n_values, effects, reps=2000, alpha=0.05, seed=0):
+    """Prediction 2: power of the one-sided paired test H_e(8h) < H_e(0h), per (n, d_z)."""
+    rng = np.random.default_rng(seed)
+    d_model = pool["dH_e_8h"]
+    mean, sd = float(d_model.mean()), float(d_model.std())
+    rows = []
+    for dz in effects:
+        # Measurement noise on the difference brings the standardized effect down to d_z
+        noise = math.sqrt(max((mean / dz) ** 2 - sd ** 2, 0.0))
+        for n in n_values:
+            d = d_model[_draw(len(d_model), reps, n, rng)] + noise * rng.standard_normal((reps, n))
+            t = d.mean(axis=1) / (d.std(axis=1, ddof=1) / math.sqrt(n))
+            reject = t < -t_critical(n - 1, alpha)
+            rows.append({"n": n, "effect": dz, "power": reject.mean(),
+                         "share_not_below": (d >= 0).mean()})
+    return pd.DataFrame(rows)
+
+
+def _ols(X, y):
+    return np.linalg.lstsq(X, y, rcond=None)[0]
+
+
+def pool_interaction(pool):
+    """β₃ of z(M_r) ~ z(H_e) + z(Ψ) + z(H_e)·z(Ψ) over the whole pool."""
+    H, Psi = _z(pool["H_e"]), _z(pool["Psi"])
+    return float(_ols(np.column_stack([np.ones_like(H), H, Psi, H * Psi]), _z(pool["M_r"]))[3])
+
+
+def power_moderation(pool, n_values, effects, reps=2000, alpha=0.05, min_beta=0.10, seed=0):
+    """Prediction 3: power of β₃ > min_beta with p < alpha in MLQ ~ H_e·Ψ, per (n, population β₃)."""
+    rng = np.random.default_rng(seed)
+    H = _z(pool["H_e"])
+    Psi = _z(pool["Psi"])
+    # Remove the pool's own interaction so that the injected β₃ is the population value
+    M = _z(pool["M_r"]) - pool_interaction(pool) * H * Psi
+    rows = []
+    for beta3 in effects:
+        for n in n_values:
+            idx = _draw(len(H), reps, n, rng)
+            h, psi = H[idx], Psi[idx]
+            y = M[idx] + beta3 * h * psi + rng.standard_normal((reps, n))
+            X = np.stack([np.ones_like(h), h, psi, h * psi], axis=2)          # (R, n, 4)
+            XtX = X.transpose(0, 2, 1) @ X
+            coef = np.linalg.solve(XtX, (X.transpose(0, 2, 1) @ y[..., None]))[..., 0]
+            resid = y - (X @ coef[..., None])[..., 0]
+            s2 = (resid ** 2).sum(axis=1) / (n - 4)
+            se = np.sqrt(s2 * np.linalg.inv(XtX)[:, 3, 3])
+            t = coef[:, 3] / se
+            reject = (t > t_critical(n - 4, alpha)) & (coef[:, 3] > min_beta)
+            rows.append({"n": n, "effect": beta3, "power": reject.mean()})
+    return pd.DataFrame(rows)
+
+
+def required_n(curve, effect, target=0.80):
+    """Smallest n on ``curve`` reaching ``target`` power for ``effect`` (None if never)."""
+    rows = curve[(curve["effect"] == effect) & (curve["power"] >= target)]
+    return int(rows["n"].min()) if len(rows) else None
@@ -0,0 +1,268 @@
+"""
+E.M.E.R.G.E+ Framework - Batch Renderer
+Headless export of the dashboard figures and tables for many parameter sets.
+
+Figures come from the registered builders in ``figures.py``, the same
+definitions the dashboard serves. Parameter sets are split into chunks that
+worker processes simulate as one batch (common noise, so every set matches its
+single run) and then render. PNG/SVG export needs the optional ``kaleido``
+package. With plotly ≥ 6.1 and Kaleido ≥ 1, each worker starts one headless
+browser when it starts and exports every image through it in batches, instead
+of launching a renderer per image; older versions export one image at a time.
+HTML output needs no renderer: reports load a single shared ``plotly.min.js``
+from the output root.
+
+Output layout:
+    <out>/index.html                   links to every report
+    <out>/plotly.min.js
+    <out>/<set>/report.html            all figures and tables of one set
+    <out>/<set>/<figure>.<png|svg|html>
+    <out>/<set>/<table>.csv, params.json
+
+Usage:
+    python render.py --out report                          # shipped datasets
+    python render.py --params sets.csv --format png html --workers 4
+    python render.py --sweep .cache/sweeps/<key> --out sweep_report
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import html
+import importlib.util
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+
+import datasets
+import figures
+import simulation as sim
+import sweep
+
+FORMATS = ("png", "svg", "html")
+IMAGE_FORMATS = ("png", "svg")
+# The shipped PNGs are 1000 × 600 layout pixels at scale 2
+IMAGE_WIDTH, IMAGE_HEIGHT, IMAGE_SCALE = 1000, 600, 2
+BASELINE = "baseline"
+
+_RENDERER_STARTED = False
+
+
+# ============================================
+# WARM RENDERER
+# ============================================
+def start_renderer():
+    """Start one persistent headless browser for this process (Kaleido ≥ 1)."""
+    global _RENDERER_STARTED
+    if _RENDERER_STARTED:
+        return
+    try:
+        import kaleido
+    except ImportError:
+        raise RuntimeError("PNG/SVG export needs Kaleido: pip install kaleido") from None
+    start = getattr(kaleido, "start_sync_server", None)
+    if start is not None:
+        start(silence_warnings=True)
+        atexit.register(kaleido.stop_sync_server, silence_warnings=True)
+    _RENDERER_STARTED = True
+
+
+def _init_worker(formats):
+    if set(formats) & set(IMAGE_FORMATS):
+        start_renderer()
+
+
+# ============================================
+# DATA PER PARAMETER SET
+# ============================================
+def read_parameter_sets(path=None, sweep_dir=None):
+    """Parameter sets as a DataFrame (one row per set); empty for the shipped datasets."""
+    if sweep_dir:
+        store = sweep.ResultStore(sweep_dir)
+        outputs = sweep.OUTPUTS[store.manifest["model"]]
+        return store.to_frame([c for c in store.columns if c not in outputs])
+    if path is None:
+        return pd.DataFrame()
+    if path.endswith(".json"):
+        with open(path) as f:
+            return pd.DataFrame(json.load(f))
+    return pd.read_csv(path)
+
+
+def simulate_sets(sets, *, dt=0.01):
+    """Dataset frames per parameter set, keyed like ``datasets.load`` names.
+
+    Columns naming a routine parameter go to the routine model, transformative
+    ones to the transformative model; shared names (α_E, E_opt, …) go to both.
+    """
+    columns = {
+        "routine": [c for c in sets.columns if c in sweep.ROUTINE_PARAMETERS],
+        "transformative": [c for c in sets.columns if c in sweep.TRANSFORM_PARAMETERS],
+    }
+    n = len(sets)
+    routine = sim.simulate_routine({c: sets[c].to_numpy(float) for c in columns["routine"]}, n=n,
+                                   dt=dt, common_noise=True)
+    transform = sim.simulate_transformative({c: sets[c].to_numpy(float) for c in columns["transformative"]},
+                                            n=n, dt=dt, common_noise=True)
+    t_peak = sets["t_peak"].to_numpy(float) if "t_peak" in sets else np.full(n, sim.TRANSFORM_DEFAULTS.t_peak)
+
+    out = []
+    for i in range(n):
+        routine_full = routine.to_frame(i)
+        transformative_full = transform.to_frame(i)
+        out.append({
+            "routine_full": routine_full,
+            "transformative_full": transformative_full,
+            "routine_timepoints": datasets.key_timepoints(routine_full, "time_s", datasets.ROUTINE_KEY_TIMES_S),
+            "transformative_timepoints": datasets.key_timepoints(transformative_full, "time_h",
+                                                                 datasets.TRANSFORM_KEY_TIMES_H),
+            "transformative_meta": pd.DataFrame({"t_peak_h": [t_peak[i]], "dt_h": [dt],
+                                                 "duration_h": [transform.time[-1]], "seed": [2025]}),
+        })
+    return out
+
+
+def baseline_data():
+    return {name: datasets.load(name) for name in datasets.names()}
+
+
+# ============================================
+# RENDERING
+# ============================================
+TABLES = ("routine_timepoints", "transformative_timepoints", "culture", "sensitivity")
+
+
+def render_set(label, data, out_dir, formats, *, params=None, theme=figures.DEFAULT_THEME, max_points=1000,
+               line_method="lttb"):
+    """Write every figure that ``data`` supports plus its tables and an HTML report."""
+    set_dir = os.path.join(out_dir, label)
+    os.makedirs(set_dir, exist_ok=True)
+    built = {name: figures.build(name, data, theme, max_points=max_points, line_method=line_method)
+             for name in figures.names() if all(s in data for s in figures.sources(name))}
+
+    images = [(fig, os.path.join(set_dir, f"{name}.{fmt}"), fmt)
+              for name, fig in built.items() for fmt in formats if fmt in IMAGE_FORMATS]
+    if images:
+        start_renderer()
+        if hasattr(pio, "write_images"):
+            figs, paths, fmts = zip(*images)
+            pio.write_images(list(figs), list(paths), format=list(fmts), width=IMAGE_WIDTH, height=IMAGE_HEIGHT,
+                             scale=IMAGE_SCALE, validate=False)
+        else:
+            # plotly < 6.1 has no batch API
+            for fig, path, fmt in images:
+                pio.write_image(fig, path, format=fmt, width=IMAGE_WIDTH, height=IMAGE_HEIGHT, scale=IMAGE_SCALE,
+                                validate=False)
+    if "html" in formats:
+        for name, fig in built.items():
+            fig.write_html(os.path.join(set_dir, f"{name}.html"), include_plotlyjs="../plotly.min.js")
+
+    tables = {name: data[name] for name in TABLES if name in data}
+    for name, table in tables.items():
+        table.to_csv(os.path.join(set_dir, f"{name}.csv"), index=False)
+    if params is not None:
+        with open(os.path.join(set_dir, "params.json"), "w") as f:
+            json.dump(params, f, indent=2)
+
+    _write_report(os.path.join(set_dir, "report.html"), label, built, tables, params)
+    return label, len(built)
+
+
+def _write_report(path, label, built, tables, params):
+    parts = [f"<h1>E.M.E.R.G.E+ report: {html.escape(label)}</h1>"]
+    if params:
+        parts.append("<h2>Parameters</h2>" + pd.DataFrame([params]).to_html(index=False))
+    for fig in built.values():
+        parts.append(pio.to_html(fig, full_html=False, include_plotlyjs=False))
+    for name, table in tables.items():
+        parts.append(f"<h2>{html.escape(name)}</h2>" + table.to_html(index=False, float_format="%.4f"))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("<!DOCTYPE html><html><head><meta charset='utf-8'>"
+                f"<title>{html.escape(label)}</title><script src='../plotly.min.js'></script></head>"
+                "<body style='font-family:sans-serif;max-width:1100px;margin:auto'>"
+                + "\n".join(parts) + "</body></html>")
+
+
+def _render_chunk(args):
+    labels, rows, out_dir, formats, options = args
+    sets = pd.DataFrame(rows)
+    done = []
+    for label, row, data in zip(labels, rows, simulate_sets(sets)):
+        done.append(render_set(label, data, out_dir, formats, params=row, **options))
+    return done
+
+
+def render(sets, out_dir, formats=("html",), *, workers=None, chunk_size=25, **options):
+    """Render the shipped datasets (``sets`` empty) or every parameter set in ``sets``.
+
+    ``workers=0`` renders in this process.
+    """
+    if set(formats) & set(IMAGE_FORMATS) and importlib.util.find_spec("kaleido") is None:
+        raise RuntimeError("PNG/SVG export needs Kaleido: pip install kaleido")
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, "plotly.min.js"), "w", encoding="utf-8") as f:
+        f.write(get_plotlyjs())
+
+    if sets is None or sets.empty:
+        results = [render_set(BASELINE, baseline_data(), out_dir, formats, **options)]
+        labels = [BASELINE]
+    else:
+        width = len(str(len(sets) - 1))
+        labels = [f"set_{i:0{width}d}" for i in range(len(sets))]
+        rows = sets.to_dict("records")
+        chunks = [(labels[lo:lo + chunk_size], rows[lo:lo + chunk_size], out_dir, formats, options)
+                  for lo in range(0, len(sets), chunk_size)]
+        if workers == 0:
+            _init_worker(formats)
+            results = [r for c in chunks for r in _render_chunk(c)]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(formats,)) as pool:
+                results = [r for chunk in pool.map(_render_chunk, chunks) for r in chunk]
+
+    _write_index(out_dir, labels, sets)
+    return results
+
+
+def _write_index(out_dir, labels, sets):
+    table = pd.DataFrame({"report": [f"<a href='{label}/report.html'>{label}</a>" for label in labels]})
+    if sets is not None and not sets.empty:
+        table = pd.concat([table, sets.reset_index(drop=True)], axis=1)
+    with open(os.path.join(out_dir, "index.html"), "w", encoding="utf-8") as f:
+        f.write("<!DOCTYPE html><html><head><meta charset='utf-8'><title>E.M.E.R.G.E+ reports</title></head>"
+                "<body style='font-family:sans-serif'><h1>E.M.E.R.G.E+ reports</h1>"
+                + table.to_html(index=False, escape=False) + "</body></html>")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render E.M.E.R.G.E+ figures and tables headlessly")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--params", help="CSV or JSON file with one parameter set per row")
+    source.add_argument("--sweep", help="sweep result directory; renders every sampled point")
+    parser.add_argument("--out", default="report")
+    parser.add_argument("--format", nargs="+", choices=FORMATS, default=["html"])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=25)
+    parser.add_argument("--theme", default=figures.DEFAULT_THEME)
+    parser.add_argument("--max-points", type=int, default=1000)
+    parser.add_argument("--method", dest="line_method", default="lttb")
+    args = parser.parse_args(argv)
+
+    sets = read_parameter_sets(args.params, args.sweep)
+    start = time.perf_counter()
+    results = render(sets, args.out, tuple(args.format), workers=args.workers, chunk_size=args.chunk_size,
+                     theme=args.theme, max_points=args.max_points, line_method=args.line_method)
+    n_figures = sum(n for _, n in results)
+    print(f"Rendered {len(results)} report(s), {n_figures} figures × {len(args.format)} format(s) "
+          f"in {time.perf_counter() - start:.1f}s -> {os.path.abspath(args.out)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+E.M.E.R.G.E+ Framework - Simulation Result Cache
+Content-hashed, disk-persistent cache of simulated trajectories.
+
+Entries are uncompressed ``.npz`` files named by a SHA-256 of
+(model, parameters, seed, dt, duration, code version), where the code version
+is a hash of ``simulation.py`` so editing the equations invalidates old runs.
+Files are written atomically, so several Streamlit worker processes can share
+one directory. Reads refresh the file's mtime; when the directory grows past
+``max_bytes`` the least recently used entries are deleted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from dataclasses import fields
+
+import numpy as np
+
+import simulation as sim
+
+CACHE_DIR = os.environ.get(
+    "EMERGE_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "results")
+)
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def code_version():
+    """Hash of the simulation source, part of every cache key."""
+    with open(sim.__file__, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+
+CODE_VERSION = code_version()
+
+SIMULATORS = {
+    "routine": (sim.simulate_routine, sim.ROUTINE_DEFAULTS),
+    "transformative": (sim.simulate_transformative, sim.TRANSFORM_DEFAULTS),
+}
+
+
+def cache_key(model, params=None, *, n=None, seed, dt, duration, common_noise=False):
+    """Canonical hash of a simulation request.
+
+    Parameters are coerced onto the model defaults and broadcast first, so a
+    mapping of overrides, the equivalent dataclass and an explicit array of
+    identical values all hash the same.
+    """
+    _, defaults = SIMULATORS[model]
+    p, size = sim.broadcast_params(sim._coerce(params, defaults), n)
+    h = hashlib.sha256()
+    header = [model, CODE_VERSION, size, int(seed), float(dt), float(duration), bool(common_noise)]
+    h.update(json.dumps(header).encode())
+    for f in fields(defaults):
+        h.update(f.name.encode())
+        h.update(np.ascontiguousarray(p[f.name]).tobytes())
+    return h.hexdigest()
+
+
+class ResultCache:
+    """Size-bounded LRU cache of ``simulation.Trajectories`` on local disk."""
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def get(self, key):
+        """Return the cached Trajectories for ``key`` or None."""
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                traj = sim.Trajectories(
+                    model=str(data["__model"]),
+                    time=data["__time"],
+                    series={k: data[k] for k in data.files if not k.startswith("__")},
+                    time_column=str(data["__time_column"]),
+                )
+            os.utime(path)
+        except (FileNotFoundError, OSError, ValueError, KeyError):
+            # Missing, evicted by another process mid-read, or a torn file
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return traj
+
+    def put(self, key, traj):
+        """Store ``traj`` atomically under ``key`` and evict down to ``max_bytes``."""
+        arrays = {
+            "__model": np.array(traj.model),
+            "__time": traj.time,
+            "__time_column": np.array(traj.time_column),
+        }
+        arrays.update({k: np.ascontiguousarray(v) for k, v in traj.series.items()})
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        self.evict()
+
+    def entries(self):
+        """(path, size, mtime) for every entry, oldest first."""
+        out = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".npz"):
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                out.append((entry.path, st.st_size, st.st_mtime))
+        return sorted(out, key=lambda e: e[2])
+
+    def evict(self):
+        """Delete least recently used entries until the directory fits in ``max_bytes``."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        for path, _, _ in self.entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def stats(self):
+        entries = self.entries()
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+        }
+
+    def simulate(self, model, params=None, *, n=None, seed=None, dt=0.01, duration=None,
+                 common_noise=False):
+        """Return the cached trajectories for this request, integrating them on a miss."""
+        simulate, _ = SIMULATORS[model]
+        if seed is None:
+            seed = 0 if model == "routine" else 2025
+        if duration is None:
+            duration = 10.0 if model == "routine" else 8.0
+        key = cache_key(model, params, n=n, seed=seed, dt=dt, duration=duration,
+                        common_noise=common_noise)
+        traj = self.get(key)
+        if traj is None:
+            traj = simulate(params, n=n, seed=seed, dt=dt, duration=duration, common_noise=common_noise)
+            self.put(key, traj)
+        return traj
+
+
+_default = None
+
+
+def default_cache():
+    """Process-wide cache on CACHE_DIR."""
+    global _default
+    if _default is None:
+        _default = ResultCache()
+    return _default
+
+
+def simulate_routine(params=None, **kwargs):
+    """Cached ``simulation.simulate_routine``."""
+    return default_cache().simulate("routine", params, **kwargs)
+
+
+def simulate_transformative(params=None, **kwargs):
+    """Cached ``simulation.simulate_transformative``."""
+    return default_cache().simulate("transformative", params, **kwargs)
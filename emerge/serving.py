@@ -0,0 +1,253 @@
+"""
+E.M.E.R.G.E+ Framework - Multi-User Serving
+Memory model of one dashboard server process, and a load test against it.
+
+Streamlit runs every browser session as a thread of one server process, so
+anything held at module level or in ``st.cache_resource`` exists once per
+process, while ``st.cache_data`` unpickles a private copy on every call. The
+dashboard keeps all heavy, read-only state in the shared kind:
+
+    datasets        datasets.load: read-only memory maps of data/*.npy (pages
+                    shared by every process on the host) or frozen arrays;
+                    sessions get copy-on-write views, never copies
+    figure JSON     figures.FigureCache: one LRU of serialized specs per
+                    process, bounded by DEFAULT_MEMORY_BYTES (64 MB); evicted
+                    specs are re-read from .cache/figures on demand
+    ensembles       st.cache_resource, one entry per (model, members) option
+    power curves    st.cache_resource, one entry per (prediction, reps) option
+    jobs            sweeps and population runs live in worker processes and
+                    are read back from disk, not held by the server
+
+Memory ceiling per process (measured with ``python serving.py --sessions 1 16``
+on one core, CPython 3.11.7, NumPy 2.4, pandas 3.0, Streamlit 1.65; the
+per-session figure is the RSS slope between 1 and 16 concurrent sessions):
+
+    interpreter + libraries, every page served once        ~ 230 MB
+      (transient peak while the first session fills the caches ~ 300 MB)
+    datasets (all seven, memory-mapped)                    < 0.2 MB
+    figure specs (~0.3 MB per resolution setting)          ≤ 64 MB
+    ensembles, every option of both models                 < 2 MB
+    power subject pool and curves                          < 1 MB
+    per concurrent session (widget state, playground runs) < 1 MB
+
+so a process serving N sessions stays under roughly 300 MB + 1 MB × N. Reruns
+are CPU-bound and share the GIL: on one core throughput stays near 2–3 reruns/s
+whatever the concurrency, so latency grows linearly with the number of active
+sessions. Scale out with more processes (behind a sticky load balancer), each
+paying the fixed part again except for the memory-mapped dataset pages.
+
+The load test starts ``streamlit run app.py`` (or targets ``--url``), opens
+N concurrent sessions for each N in ``--sessions`` over Streamlit's websocket
+protocol and has every session walk through the pages, timing each rerun from
+request to ``script_finished``. The server's resident memory is sampled
+throughout. It needs the ``websockets`` package (a Streamlit ≥ 1.50 dependency).
+
+Usage:
+    python serving.py --sessions 1 2 4 8 16 --out loadtest.json
+    python serving.py --url ws://localhost:8501 --pid 12345 --pages "📊 Routine Process"
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+APP = os.path.join(BASE_DIR, "app.py")
+PAGE_WIDGET_LABEL = "Select Page:"
+
+
+# ============================================
+# SERVER
+# ============================================
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port, timeout=60):
+    """Launch a headless ``streamlit run app.py`` on ``port`` and wait until it is healthy."""
+    proc = subprocess.Popen([sys.executable, "-m", "streamlit", "run", APP, "--server.headless", "true",
+                             "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as r:
+                if r.status == 200:
+                    return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError(f"Streamlit did not become healthy on port {port} within {timeout}s")
+
+
+def rss_mb(pid):
+    """Resident set size of ``pid`` in MB (Linux /proc), or None where unavailable."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+# ============================================
+# SESSIONS
+# ============================================
+class Session:
+    """One simulated browser tab speaking Streamlit's BackMsg / ForwardMsg protocol."""
+
+    def __init__(self, url):
+        self.url = url.rstrip("/") + "/_stcore/stream"
+        self.ws = None
+        self.page_widget = None
+        self.pages = []
+        self.errors = []
+        self.string_state = False
+
+    async def __aenter__(self):
+        import websockets
+
+        self.ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.ws.close()
+
+    async def rerun(self, page=None):
+        """Request a rerun (switching to ``page``); returns seconds until the script finished."""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        if page is not None:
+            widget = msg.rerun_script.widget_states.widgets.add()
+            widget.id = self.page_widget
+            if self.string_state:
+                widget.string_value = page
+            else:
+                widget.int_value = self.pages.index(page)
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await self.ws.recv())
+            kind = forward.WhichOneof("type")
+            if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                element = forward.delta.new_element
+                if element.WhichOneof("type") == "radio" and element.radio.label == PAGE_WIDGET_LABEL:
+                    self.page_widget = element.radio.id
+                    self.pages = list(element.radio.options)
+                    # Radios whose proto carries ``raw_value`` take their state as the option string
+                    self.string_state = "raw_value" in element.radio.DESCRIPTOR.fields_by_name
+                elif element.WhichOneof("type") == "exception":
+                    self.errors.append(element.exception.message)
+            elif kind == "script_finished":
+                return time.perf_counter() - start
+
+
+async def _sample_rss(pid, samples, stop, every=0.05):
+    while not stop.is_set():
+        value = rss_mb(pid)
+        if value is not None:
+            samples.append(value)
+        await asyncio.sleep(every)
+
+
+async def _session_walk(url, pages, rounds, offset, latencies, errors):
+    async with Session(url) as session:
+        latencies.append(("first", await session.rerun()))
+        visit = [p for p in session.pages if not pages or p in pages]
+        for i in range(rounds * len(visit)):
+            page = visit[(offset + i) % len(visit)]
+            latencies.append((page, await session.rerun(page)))
+        errors.extend(session.errors)
+
+
+async def load_level(url, pid, sessions, pages=None, rounds=1):
+    """Run ``sessions`` concurrent sessions once through ``pages``; returns latency and memory stats."""
+    samples, stop = [], asyncio.Event()
+    sampler = asyncio.create_task(_sample_rss(pid, samples, stop)) if pid else None
+    before = rss_mb(pid) if pid else None
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(_session_walk(url, pages, rounds, i, latencies, errors) for i in range(sessions)))
+    wall = time.perf_counter() - start
+    stop.set()
+    if sampler:
+        await sampler
+    times = sorted(t for _, t in latencies)
+    per_page = {}
+    for page, t in latencies:
+        per_page.setdefault(page, []).append(t)
+    return {
+        "sessions": sessions,
+        "reruns": len(times),
+        "reruns_per_s": len(times) / wall,
+        "p50_ms": statistics.median(times) * 1000,
+        "p95_ms": times[min(len(times) - 1, int(0.95 * len(times)))] * 1000,
+        "max_ms": times[-1] * 1000,
+        "rss_before_mb": before,
+        "rss_peak_mb": max(samples) if samples else None,
+        "rss_after_mb": rss_mb(pid) if pid else None,
+        "page_p50_ms": {page: statistics.median(ts) * 1000 for page, ts in per_page.items()},
+        "errors": errors,
+    }
+
+
+def run(levels=(1, 2, 4, 8), url=None, pid=None, pages=None, rounds=1, log=print):
+    """Load-test a server (started here unless ``url`` is given) at each concurrency level."""
+    proc = None
+    if url is None:
+        port = free_port()
+        proc = start_server(port)
+        url, pid = f"ws://127.0.0.1:{port}", proc.pid
+    try:
+        # One untimed pass so imports, dataset loads and figure warming are not charged to level 1
+        asyncio.run(load_level(url, None, 1, pages, 1))
+        results = []
+        for n in levels:
+            row = asyncio.run(load_level(url, pid, n, pages, rounds))
+            results.append(row)
+            log(f"{n:>4} sessions  {row['reruns']:>4} reruns  p50 {row['p50_ms']:>7.0f} ms  "
+                f"p95 {row['p95_ms']:>7.0f} ms  {row['reruns_per_s']:>5.1f}/s  "
+                f"RSS peak {row['rss_peak_mb'] or float('nan'):>6.0f} MB"
+                + (f"  {len(row['errors'])} error(s)" if row["errors"] else ""))
+        return results
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=30)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the dashboard with concurrent sessions")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--rounds", type=int, default=1, help="passes over the pages per session")
+    parser.add_argument("--pages", nargs="+", help="page labels to visit (default: every page)")
+    parser.add_argument("--url", help="websocket base URL of a running server, e.g. ws://localhost:8501")
+    parser.add_argument("--pid", type=int, help="PID of that server, for memory sampling")
+    parser.add_argument("--out", help="write results JSON here")
+    args = parser.parse_args(argv)
+
+    results = run(args.sessions, args.url, args.pid, args.pages, args.rounds)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "levels": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
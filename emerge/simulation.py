@@ -0,0 +1,383 @@
+"""
+E.M.E.R.G.E+ Framework - Simulation Engine
+Batched NumPy integration of the routine and transformative entropy equations.
+
+Every parameter may be a scalar or a 1-D array; arrays are broadcast to a
+common batch size N and all N trajectories are advanced together, one
+vectorized Euler-Maruyama step at a time. ``method=`` hands the noise-free,
+mean-input equations to an adaptive or stiff-aware backend (integrators.py).
+
+Routine process:
+    dH_e/dt = -α_E·tanh(E - E_opt) - β_E·Φ - χ_E·Θ + ν_E
+    dH_c/dt = -α_C·C - β_C·Φ - χ_C·Θ + ν_C
+    dΨ/dt   =  κ_Ψ·(S_group - Ψ)
+    with Φ = E·C (emotional-cognitive synergy) and Θ = Ψ·E (cultural expression)
+    M_r     =  σ(κ_M·(Φ - H_e - H_c) - θ_M)
+
+Transformative process:
+    Phase 1 (t < t_peak):  dH_e/dt = +γ·D(t) - α_E·tanh(E - E_opt) + ν_E
+    Phase 2 (t ≥ t_peak):  dH_e/dt = -α_E·tanh(E - E_opt) - β_transform·(H_e - H_e*) + ν_E
+    with D(t) a gamma-shaped pulse peaking at t_peak, and M_t the normalized
+    cumulative integral of exp(-H_e).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields, replace
+from typing import Mapping
+
+import numpy as np
+import pandas as pd
+
+
+# ============================================
+# PARAMETERS
+# ============================================
+@dataclass(frozen=True)
+class RoutineParams:
+    """Routine-process parameters. Any field may be a scalar or a length-N array."""
+    alpha_E: float = 0.4        # emotional regulation capacity
+    beta_E: float = 0.05        # synergy coupling on H_e
+    chi_E: float = 0.02         # cultural coupling on H_e
+    alpha_C: float = 0.3        # cognitive structure strength
+    beta_C: float = 0.05        # synergy coupling on H_c
+    chi_C: float = 0.02         # cultural coupling on H_c
+    E_opt: float = 0.5          # optimal emotional energy
+    E_mean: float = 0.6         # mean emotional energy input
+    C_mean: float = 0.7         # mean cognitive structure input
+    input_noise: float = 0.03   # s.d. of the E and C input fluctuations
+    sigma_E: float = 0.01       # ν_E diffusion
+    sigma_C: float = 0.01       # ν_C diffusion
+    psi0: float = 0.5           # initial cultural factor Ψ
+    S_group: float = 0.6        # group norm Ψ drifts toward
+    kappa_psi: float = 0.25     # Ψ drift rate
+    kappa_M: float = 1.2        # meaning gain
+    theta_M: float = 1.82       # meaning offset
+
+
+@dataclass(frozen=True)
+class TransformParams:
+    """Transformative-process parameters. Any field may be a scalar or a length-N array."""
+    gamma: float = 0.8          # perturbation gain (Phase 1)
+    alpha_E: float = 0.4        # emotional regulation capacity
+    beta_transform: float = 0.6 # reconstruction rate (Phase 2)
+    H_e_star: float = -0.5      # reconstructed entropy set point H_e*
+    E_opt: float = 0.5          # optimal emotional energy
+    E_base: float = 0.45        # baseline emotional energy
+    C_base: float = 0.8         # baseline cognitive structure
+    kappa_DE: float = 0.3       # perturbation drive on E
+    kappa_DC: float = 0.3       # perturbation suppression of C
+    D_peak: float = 1.2         # peak perturbation level
+    D_shape: float = 3.0        # gamma shape of D(t)
+    t_peak: float = 2.0         # time of peak perturbation (h), Phase 1 → Phase 2
+    input_noise: float = 0.03   # s.d. of the E and C input fluctuations
+    sigma_E: float = 0.01       # ν_E diffusion
+
+
+ROUTINE_DEFAULTS = RoutineParams()
+TRANSFORM_DEFAULTS = TransformParams()
+
+ROUTINE_COLUMNS = ["E", "C", "Psi", "H_e", "H_c", "M_r"]
+TRANSFORM_COLUMNS = ["D", "E", "C", "H_e", "M_t"]
+
+
+def _coerce(params, defaults):
+    """Return a params dataclass from None, a dataclass or a mapping of overrides."""
+    if params is None:
+        return defaults
+    if isinstance(params, type(defaults)):
+        return params
+    if isinstance(params, Mapping):
+        unknown = set(params) - {f.name for f in fields(defaults)}
+        if unknown:
+            raise ValueError(f"Unknown parameters: {sorted(unknown)}")
+        return replace(defaults, **params)
+    raise TypeError(f"Expected {type(defaults).__name__} or mapping, got {type(params).__name__}")
+
+
+def broadcast_params(params, n=None):
+    """Broadcast every field of a params dataclass to float64 arrays of shape (N,).
+
+    Returns (arrays, N) where arrays maps field name → ndarray.
+    """
+    raw = {f.name: np.asarray(getattr(params, f.name), dtype=np.float64) for f in fields(params)}
+    for name, v in raw.items():
+        if v.ndim > 1:
+            raise ValueError(f"Parameter {name!r} must be a scalar or 1-D array")
+    shape = np.broadcast_shapes(*(v.shape for v in raw.values()), (n,) if n else ())
+    size = shape[0] if shape else 1
+    return {k: np.broadcast_to(v, (size,)) for k, v in raw.items()}, size
+
+
+def n_steps_for(dt, duration):
+    """Number of integration steps for a run (the series has n_steps + 1 rows)."""
+    if dt <= 0 or duration <= 0:
+        raise ValueError("dt and duration must be positive")
+    return int(round(duration / dt))
+
+
+# ============================================
+# MODEL TERMS
+# ============================================
+def sigmoid(x):
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+def routine_meaning(E, C, H_e, H_c, p):
+    return sigmoid(p["kappa_M"] * (E * C - H_e - H_c) - p["theta_M"])
+
+
+def routine_drift(E, C, Psi, p):
+    """Deterministic parts of dH_e/dt and dH_c/dt (state-independent for the routine system)."""
+    phi = E * C
+    theta = Psi * E
+    dH_e = -p["alpha_E"] * np.tanh(E - p["E_opt"]) - p["beta_E"] * phi - p["chi_E"] * theta
+    dH_c = -p["alpha_C"] * C - p["beta_C"] * phi - p["chi_C"] * theta
+    return dH_e, dH_c
+
+
+def perturbation(t, p):
+    """Gamma-shaped perturbation D(t) = D_peak·(t/t_peak)^k·exp(k·(1 - t/t_peak))."""
+    x = np.asarray(t, dtype=np.float64) / p["t_peak"] + 1e-9
+    k = p["D_shape"]
+    return p["D_peak"] * x ** k * np.exp(k * (1.0 - x))
+
+
+def transform_drift(t, H_e, E, D, p):
+    """Deterministic part of dH_e/dt for the two-phase transformative system."""
+    regulation = -p["alpha_E"] * np.tanh(E - p["E_opt"])
+    phase1 = p["gamma"] * D
+    phase2 = -p["beta_transform"] * (H_e - p["H_e_star"])
+    return regulation + np.where(t < p["t_peak"], phase1, phase2)
+
+
+# ============================================
+# RESULTS
+# ============================================
+@dataclass
+class Trajectories:
+    """Batched simulation output: ``series[name]`` has shape (N, n_steps + 1)."""
+    model: str
+    time: np.ndarray
+    series: dict
+    time_column: str
+
+    @property
+    def n(self):
+        return next(iter(self.series.values())).shape[0]
+
+    def __getitem__(self, name):
+        return self.series[name]
+
+    def to_frame(self, member=0):
+        """One trajectory as a DataFrame laid out like the ``*_timeseries_full.csv`` files."""
+        df = pd.DataFrame({self.time_column: self.time})
+        for name, values in self.series.items():
+            df[name] = values[member]
+        return df
+
+
+def time_to_threshold(time, values, threshold):
+    """First time each row of ``values`` exceeds ``threshold`` (NaN if it never does)."""
+    above = values > threshold
+    idx = above.argmax(axis=-1)
+    hit = np.take_along_axis(above, idx[..., None], axis=-1)[..., 0]
+    return np.where(hit, np.asarray(time)[idx], np.nan)
+
+
+# ============================================
+# INTEGRATORS
+# ============================================
+def routine_steps(p, size, steps, dt, rng, common_noise=False):
+    """Yield (k, E, C, Psi, H_e, H_c) for k = 0..steps, advancing all N members per step.
+
+    With ``common_noise`` every member sees the same noise path (common random
+    numbers), so results do not depend on how a batch is split into chunks.
+    """
+    sqdt = np.sqrt(dt)
+    width = 1 if common_noise else size
+    H_e = np.zeros(size)
+    H_c = np.zeros(size)
+    Psi = p["psi0"].copy()
+    for k in range(steps + 1):
+        z = rng.standard_normal((4, width))
+        E = p["E_mean"] + p["input_noise"] * z[0]
+        C = p["C_mean"] + p["input_noise"] * z[1]
+        yield k, E, C, Psi, H_e, H_c
+        dH_e, dH_c = routine_drift(E, C, Psi, p)
+        H_e = H_e + dH_e * dt + p["sigma_E"] * sqdt * z[2]
+        H_c = H_c + dH_c * dt + p["sigma_C"] * sqdt * z[3]
+        Psi = Psi + p["kappa_psi"] * (p["S_group"] - Psi) * dt
+
+
+def transform_steps(p, size, steps, dt, rng, time, common_noise=False, start=0, H_e0=None):
+    """Yield (k, D, E, C, H_e) for k = start..steps, advancing all N members per step.
+
+    To resume a run part-way, pass the step ``start``, the state ``H_e0`` at that
+    step and ``rng`` restored to its state just before step ``start`` was drawn.
+    """
+    sqdt = np.sqrt(dt)
+    width = 1 if common_noise else size
+    H_e = np.zeros(size) if H_e0 is None else np.array(H_e0, dtype=np.float64)
+    for k in range(start, steps + 1):
+        z = rng.standard_normal((3, width))
+        D = perturbation(time[k], p)
+        E = p["E_base"] + p["kappa_DE"] * D + p["input_noise"] * z[0]
+        C = p["C_base"] - p["kappa_DC"] * D + p["input_noise"] * z[1]
+        yield k, D, E, C, H_e
+        H_e = H_e + transform_drift(time[k], H_e, E, D, p) * dt + p["sigma_E"] * sqdt * z[2]
+
+
+def time_grid(dt, duration):
+    return np.round(np.arange(n_steps_for(dt, duration) + 1) * dt, 10)
+
+
+def simulate_routine(params=None, *, n=None, seed=0, dt=0.01, duration=10.0, common_noise=False, method=None,
+                     **solver):
+    """Integrate the routine system for a batch of parameter sets.
+
+    Parameters
+    ----------
+    params : RoutineParams or mapping of overrides, fields scalar or length-N arrays
+    n : batch size, only needed when every parameter is a scalar (e.g. a noise ensemble)
+    seed : seed for the batch random stream
+    dt, duration : step and horizon in seconds
+    common_noise : share one noise path across all members
+    method : None for this Euler-Maruyama scheme with noisy inputs; an
+             ``integrators`` method ("dopri5", "imex", "auto", …) solves the
+             mean-input equations instead, with ``solver`` options, sampled every dt
+    """
+    if method is not None:
+        import integrators  # imports this module
+        return integrators.trajectories("routine", params, n=n, method=method, dt=dt, duration=duration,
+                                        seed=seed, **solver)
+    p, size = broadcast_params(_coerce(params, ROUTINE_DEFAULTS), n)
+    time = time_grid(dt, duration)
+    steps = len(time) - 1
+    rng = np.random.default_rng(seed)
+
+    # Buffers are (time, N) so each step writes one contiguous row
+    buf = {name: np.empty((steps + 1, size)) for name in ROUTINE_COLUMNS[:-1]}
+    for k, E, C, Psi, H_e, H_c in routine_steps(p, size, steps, dt, rng, common_noise):
+        buf["E"][k] = E
+        buf["C"][k] = C
+        buf["Psi"][k] = Psi
+        buf["H_e"][k] = H_e
+        buf["H_c"][k] = H_c
+
+    out = {name: v.T for name, v in buf.items()}
+    out["M_r"] = routine_meaning(out["E"], out["C"], out["H_e"], out["H_c"], _col(p))
+    return Trajectories("routine", time, out, "time_s")
+
+
+def simulate_transformative(params=None, *, n=None, seed=2025, dt=0.01, duration=8.0,
+                            common_noise=False, method=None, **solver):
+    """Integrate the two-phase transformative system for a batch of parameter sets.
+
+    Parameters
+    ----------
+    params : TransformParams or mapping of overrides, fields scalar or length-N arrays
+    n : batch size, only needed when every parameter is a scalar (e.g. a noise ensemble)
+    seed : seed for the batch random stream
+    dt, duration : step and horizon in hours
+    common_noise : share one noise path across all members
+    method : as for ``simulate_routine``; "auto" switches to the stiff-aware
+             IMEX scheme for large β_transform
+    """
+    if method is not None:
+        import integrators  # imports this module
+        return integrators.trajectories("transformative", params, n=n, method=method, dt=dt,
+                                        duration=duration, seed=seed, **solver)
+    p, size = broadcast_params(_coerce(params, TRANSFORM_DEFAULTS), n)
+    time = time_grid(dt, duration)
+    steps = len(time) - 1
+    rng = np.random.default_rng(seed)
+
+    buf = {name: np.empty((steps + 1, size)) for name in TRANSFORM_COLUMNS[:-1]}
+    for k, D, E, C, H_e in transform_steps(p, size, steps, dt, rng, time, common_noise):
+        buf["D"][k] = D
+        buf["E"][k] = E
+        buf["C"][k] = C
+        buf["H_e"][k] = H_e
+
+    out = {name: v.T for name, v in buf.items()}
+    out["M_t"] = cumulative_meaning(out["H_e"])
+    return Trajectories("transformative", time, out, "time_h")
+
+
+def routine_outcomes(params=None, *, n=None, seed=0, dt=0.01, duration=10.0, threshold=0.35,
+                     common_noise=False):
+    """Final M_r, H_e and first time M_r > threshold per member, without storing trajectories.
+
+    Memory is O(N) regardless of the number of steps.
+    """
+    p, size = broadcast_params(_coerce(params, ROUTINE_DEFAULTS), n)
+    time = time_grid(dt, duration)
+    rng = np.random.default_rng(seed)
+    hit_time = np.full(size, np.nan)
+    for k, E, C, Psi, H_e, H_c in routine_steps(p, size, len(time) - 1, dt, rng, common_noise):
+        M_r = routine_meaning(E, C, H_e, H_c, p)
+        hit_time[np.isnan(hit_time) & (M_r > threshold)] = time[k]
+    return {
+        "M_r_final": M_r,
+        "H_e_final": H_e,
+        "time_to_M_gt_threshold": hit_time,
+    }
+
+
+def transform_outcomes(params=None, *, n=None, seed=2025, dt=0.01, duration=8.0, common_noise=False):
+    """Peak, final and undershoot of H_e per member, without storing trajectories."""
+    p, size = broadcast_params(_coerce(params, TRANSFORM_DEFAULTS), n)
+    time = time_grid(dt, duration)
+    rng = np.random.default_rng(seed)
+    peak = np.full(size, -np.inf)
+    t_at_peak = np.zeros(size)
+    low = np.zeros(size)
+    for k, D, E, C, H_e in transform_steps(p, size, len(time) - 1, dt, rng, time, common_noise):
+        higher = H_e > peak
+        peak = np.where(higher, H_e, peak)
+        t_at_peak = np.where(higher, time[k], t_at_peak)
+        low = np.minimum(low, H_e)
+    return {
+        "H_e_peak": peak,
+        "t_peak_H_e_h": t_at_peak,
+        "H_e_final": H_e,
+        "undershoot_depth": -low,
+    }
+
+
+def cumulative_meaning(H_e):
+    """Normalized cumulative meaning M_t: running sum of exp(-H_e), scaled to end at 1."""
+    m = np.cumsum(np.exp(-H_e), axis=-1)
+    return m / m[..., -1:]
+
+
+def _col(p):
+    """View every (N,) parameter array as an (N, 1) column for broadcasting over time."""
+    return {k: v[:, None] for k, v in p.items()}
+
+
+# ============================================
+# SUMMARIES
+# ============================================
+def routine_summary(traj, threshold=0.35):
+    """Per-member outcome table matching ``table_demo3`` / ``table_demo4`` columns."""
+    suffix = f"{threshold:.2f}".replace(".", "p")
+    return pd.DataFrame({
+        "Psi_final": traj["Psi"][:, -1],
+        "H_e_final": traj["H_e"][:, -1],
+        "M_r_final": traj["M_r"][:, -1],
+        f"time_to_M_gt_{suffix}_s": time_to_threshold(traj.time, traj["M_r"], threshold),
+    })
+
+
+def transform_summary(traj):
+    """Per-member peak, undershoot and final values of the transformative run."""
+    H_e = traj["H_e"]
+    peak_idx = H_e.argmax(axis=1)
+    return pd.DataFrame({
+        "H_e_peak": H_e.max(axis=1),
+        "t_peak_H_e_h": traj.time[peak_idx],
+        "H_e_final": H_e[:, -1],
+        "undershoot_depth": np.maximum(0.0, -H_e.min(axis=1)),
+    })
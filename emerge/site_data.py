@@ -0,0 +1,118 @@
+"""
+E.M.E.R.G.E+ Framework - Static Site Data Build
+Generates the static site's data from the same datasets the dashboard reads.
+
+Time series are shipped as little-endian float32 arrays in base64:
+
+    assets/data.js                      window.EMERGE_DATA: a downsampled preview
+                                        of every series plus the small tables
+    assets/data/<key>/<column>.js       one full-resolution series per file
+
+``assets/app.js`` draws the preview on first paint and then loads the chunk
+files with ``<script>`` tags (which, unlike fetch, also work from file://),
+swapping in full resolution when they arrive. Every chunk URL carries the
+build's content hash, so browsers never mix chunks from different builds.
+
+Usage:
+    python site_data.py [--preview-points 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+
+import datasets
+import downsample
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_JS = os.path.join(BASE_DIR, "assets", "data.js")
+CHUNK_DIR = os.path.join(BASE_DIR, "assets", "data")
+
+# Dataset → key of window.EMERGE_DATA used by assets/app.js
+SERIES = {
+    "routine_full": ("routine", "time_s"),
+    "transformative_full": ("transform", "time_h"),
+}
+TABLES = {
+    "culture": "culture",
+    "sensitivity": "sensitivity",
+    "transformative_meta": "meta",
+}
+DEFAULT_PREVIEW_POINTS = 200
+
+
+def encode(values):
+    """Base64 of ``values`` as little-endian float32."""
+    return base64.b64encode(np.ascontiguousarray(values, dtype="<f4").tobytes()).decode("ascii")
+
+
+def preview_indices(frame, time_column, n_points):
+    """Shared row subset keeping every column's LTTB shape (union across columns)."""
+    t = frame[time_column].to_numpy(np.float64)
+    per_column = max(3, n_points // max(1, len(frame.columns) - 1))
+    idx = [downsample.lttb_indices(t, frame[c].to_numpy(np.float64), per_column)
+           for c in frame.columns if c != time_column]
+    return np.unique(np.concatenate(idx)) if idx else np.arange(len(t))
+
+
+def _round(values):
+    return [float(f"{v:.6g}") if isinstance(v, float) else v for v in values]
+
+
+def build(preview_points=DEFAULT_PREVIEW_POINTS, data_js=DATA_JS, chunk_dir=CHUNK_DIR):
+    """Regenerate ``assets/data.js`` and the per-series chunks; returns the manifest."""
+    datasets.clear()
+    shutil.rmtree(chunk_dir, ignore_errors=True)
+    series, chunks = {}, {}
+    for name, (key, time_column) in SERIES.items():
+        frame = datasets.load(name)
+        idx = preview_indices(frame, time_column, preview_points)
+        series[key] = {
+            "rows": len(frame),
+            "preview_rows": len(idx),
+            "preview": {c: encode(frame[c].to_numpy()[idx]) for c in frame.columns},
+            "chunks": {},
+        }
+        os.makedirs(os.path.join(chunk_dir, key), exist_ok=True)
+        for c in frame.columns:
+            payload = encode(frame[c].to_numpy())
+            chunks[(key, c)] = payload
+            with open(os.path.join(chunk_dir, key, f"{c}.js"), "w") as f:
+                f.write(f"window.EMERGE_CHUNK({json.dumps(key)},{json.dumps(c)},\"{payload}\");")
+
+    version = hashlib.sha256(json.dumps(sorted((k, v) for k, v in chunks.items())).encode()).hexdigest()[:12]
+    for key, entry in series.items():
+        entry["chunks"] = {c: f"./assets/data/{key}/{c}.js?v={version}" for (k, c) in chunks if k == key}
+
+    tables = {}
+    for name, key in TABLES.items():
+        frame = datasets.load(name)
+        tables[key] = {c: _round(frame[c].tolist()) for c in frame.columns}
+
+    data = {"version": version, "encoding": "float32-le-base64", "series": series, "tables": tables}
+    with open(data_js, "w") as f:
+        f.write("window.EMERGE_DATA = " + json.dumps(data) + ";")
+    return data
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regenerate the static site's data files")
+    parser.add_argument("--preview-points", type=int, default=DEFAULT_PREVIEW_POINTS)
+    args = parser.parse_args(argv)
+    data = build(args.preview_points)
+    size = os.path.getsize(DATA_JS)
+    for key, entry in data["series"].items():
+        print(f"{key}: {entry['preview_rows']} of {entry['rows']} rows in the preview, "
+              f"{len(entry['chunks'])} chunks")
+    print(f"wrote {os.path.relpath(DATA_JS, BASE_DIR)} ({size / 1024:.1f} KB), version {data['version']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+E.M.E.R.G.E+ Framework - Global Sensitivity Analysis
+Variance-based (Sobol) first- and total-order indices over every model parameter.
+
+Saltelli's scheme draws two independent N × k sample matrices A and B over the
+parameter ranges and builds k more, AB_i = A with column i taken from B. The
+N·(k + 2) rows are evaluated as one parameter sweep (``sweep.run_sweep``: large
+vectorized chunks across a process pool, stored on disk and resumable), with
+common noise so that every row sees the same noise path and the indices
+measure parameter effects only. Then, per parameter i and output f:
+
+    S1_i = mean(f_B · (f_ABi − f_A)) / V          (Saltelli et al. 2010)
+    ST_i = mean((f_A − f_ABi)²) / (2V)            (Jansen 1999)
+
+with V the variance of f over A and B. Confidence intervals come from a
+bootstrap over the N base rows. ST_i − S1_i is the share of variance from
+interactions involving parameter i (e.g. α_E × Ψ, γ × β_transform).
+
+A and B come from a scrambled Sobol sequence when SciPy is installed and
+from Latin hypercubes otherwise. Time to threshold is censored at the run
+duration for rows that never reach it.
+
+Usage:
+    python sobol.py --model routine --n 1024 --out routine_sobol.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+import sweep
+
+# Ranges for every parameter; the dashboard's sweep bounds where it has them
+BOUNDS = {
+    "routine": {
+        "alpha_E": (0.1, 0.8), "beta_E": (0.0, 0.2), "chi_E": (0.0, 0.05),
+        "alpha_C": (0.1, 0.6), "beta_C": (0.0, 0.2), "chi_C": (0.0, 0.05),
+        "E_opt": (0.3, 0.7), "E_mean": (0.4, 0.8), "C_mean": (0.5, 0.9),
+        "input_noise": (0.01, 0.05), "sigma_E": (0.005, 0.02), "sigma_C": (0.005, 0.02),
+        "psi0": (0.2, 0.8), "S_group": (0.2, 0.8), "kappa_psi": (0.1, 0.5),
+        "kappa_M": (0.8, 1.6), "theta_M": (1.5, 2.1),
+    },
+    "transformative": {
+        "gamma": (0.4, 1.6), "alpha_E": (0.1, 0.8), "beta_transform": (0.2, 1.2),
+        "H_e_star": (-1.0, 0.0), "E_opt": (0.3, 0.7), "E_base": (0.3, 0.6), "C_base": (0.6, 1.0),
+        "kappa_DE": (0.1, 0.5), "kappa_DC": (0.1, 0.5), "D_peak": (0.8, 1.6), "D_shape": (2.0, 4.0),
+        "t_peak": (1.0, 3.0), "input_noise": (0.01, 0.05), "sigma_E": (0.005, 0.02),
+    },
+}
+OUTPUTS = {
+    "routine": ["M_r_final", "H_e_final", "time_to_M_gt_threshold"],
+    "transformative": ["undershoot_depth", "H_e_peak", "H_e_final"],
+}
+DEFAULT_N = 1024
+BOOT_BATCH_BYTES = 32 * 2**20
+
+
+# ============================================
+# SAMPLING
+# ============================================
+def unit_samples(n, d, seed=0, method="auto"):
+    """``n`` points in [0, 1)^d: scrambled Sobol ("sobol", needs SciPy), Latin hypercube ("lhs")."""
+    if method in ("auto", "sobol"):
+        try:
+            from scipy.stats import qmc
+        except ImportError:
+            if method == "sobol":
+                raise RuntimeError("Sobol sampling needs SciPy: pip install scipy") from None
+        else:
+            return qmc.Sobol(d, scramble=True, seed=seed).random(n)
+    rng = np.random.default_rng(seed)
+    return (np.argsort(rng.random((d, n)), axis=1).T + rng.random((n, d))) / n
+
+
+def saltelli(bounds, n=DEFAULT_N, seed=0, method="auto"):
+    """Sweep samples in blocks [A, B, AB_1 … AB_k], each ``n`` rows; returns {name: (n·(k+2),) array}."""
+    names = list(bounds)
+    k = len(names)
+    u = unit_samples(n, 2 * k, seed, method)
+    low = np.array([bounds[p][0] for p in names])
+    high = np.array([bounds[p][1] for p in names])
+    A = low + (high - low) * u[:, :k]
+    B = low + (high - low) * u[:, k:]
+    blocks = [A, B]
+    for i in range(k):
+        AB = A.copy()
+        AB[:, i] = B[:, i]
+        blocks.append(AB)
+    X = np.vstack(blocks)
+    return {name: X[:, j] for j, name in enumerate(names)}
+
+
+# ============================================
+# INDICES
+# ============================================
+def indices(f, names, n, n_boot=1000, confidence=0.95, seed=0):
+    """First- and total-order indices with bootstrap intervals from outputs in ``saltelli`` block order."""
+    k = len(names)
+    f = np.asarray(f, dtype=np.float64).reshape(k + 2, n)
+    f_A, f_B, f_AB = f[0], f[1], f[2:]
+
+    def estimate(rows):
+        # rows: (R, n) indices into the base samples; returns S1, ST of shape (R, k)
+        A, B, AB = f_A[rows], f_B[rows], f_AB[:, rows]
+        V = np.concatenate([A, B], axis=1).var(axis=1)[None, :]
+        V = np.where(V > 0, V, np.nan)
+        S1 = (B[None] * (AB - A[None])).mean(axis=2) / V
+        ST = 0.5 * ((A[None] - AB) ** 2).mean(axis=2) / V
+        return S1.T, ST.T
+
+    S1, ST = estimate(np.arange(n)[None, :])
+    rng = np.random.default_rng(seed)
+    # Resample in batches so the (batch, k, n) temporaries stay around BOOT_BATCH_BYTES
+    batch = max(1, BOOT_BATCH_BYTES // (8 * (k + 2) * n))
+    boot = [estimate(rng.integers(0, n, (min(batch, n_boot - b), n))) for b in range(0, n_boot, batch)]
+    S1_b = np.concatenate([b[0] for b in boot])
+    ST_b = np.concatenate([b[1] for b in boot])
+    lo, hi = 100 * (1 - confidence) / 2, 100 * (1 + confidence) / 2
+    return pd.DataFrame({
+        "parameter": names,
+        "S1": S1[0], "S1_lo": np.nanpercentile(S1_b, lo, axis=0), "S1_hi": np.nanpercentile(S1_b, hi, axis=0),
+        "ST": ST[0], "ST_lo": np.nanpercentile(ST_b, lo, axis=0), "ST_hi": np.nanpercentile(ST_b, hi, axis=0),
+    }).assign(interaction=lambda d: d["ST"] - d["S1"])
+
+
+def from_store(store, names, n, outputs=None, **kwargs):
+    """Indices for every output of a finished Saltelli sweep, one row per (output, parameter)."""
+    model = store.manifest["model"]
+    tables = []
+    for output in outputs or OUTPUTS[model]:
+        f = np.asarray(store.column(output), dtype=np.float64)
+        if output.startswith("time_to"):
+            f = np.where(np.isnan(f), store.manifest["duration"], f)
+        tables.append(indices(f, names, n, **kwargs).assign(output=output))
+    return pd.concat(tables, ignore_index=True)
+
+
+def analyze(model="routine", n=DEFAULT_N, *, bounds=None, outputs=None, seed=0, method="auto", workers=None,
+            path=None, n_boot=1000, on_chunk=None):
+    """Sample, evaluate (N·(k+2) runs) and return the indices of ``model``'s outputs."""
+    bounds = bounds or BOUNDS[model]
+    samples = saltelli(bounds, n, seed, method)
+    store = sweep.run_sweep(samples, model, path=path, workers=workers, seed=seed, on_chunk=on_chunk)
+    return from_store(store, list(bounds), n, outputs, n_boot=n_boot, seed=seed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sobol sensitivity indices of the E.M.E.R.G.E+ models")
+    parser.add_argument("--model", choices=sorted(BOUNDS), default="routine")
+    parser.add_argument("--n", type=int, default=DEFAULT_N, help="base samples (runs = n × (parameters + 2))")
+    parser.add_argument("--method", choices=["auto", "sobol", "lhs"], default="auto")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--bootstrap", type=int, default=1000)
+    parser.add_argument("--out", help="write the indices as CSV")
+    args = parser.parse_args(argv)
+
+    table = analyze(args.model, args.n, seed=args.seed, method=args.method, workers=args.workers,
+                    n_boot=args.bootstrap)
+    runs = args.n * (len(BOUNDS[args.model]) + 2)
+    print(f"{args.model}: {runs:,} model runs")
+    with pd.option_context("display.width", 140, "display.float_format", "{:.3f}".format):
+        for output, rows in table.groupby("output", sort=False):
+            print(f"\n{output}")
+            print(rows.drop(columns="output").sort_values("ST", ascending=False).to_string(index=False))
+    if args.out:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        table.to_csv(args.out, index=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""
+E.M.E.R.G.E+ Framework - Parameter Sweeps
+Dense grid / Latin-hypercube sweeps evaluated in chunks across a process pool.
+
+Results stream into a ResultStore: one memory-mapped ``.npy`` file per column
+plus a ``manifest.json``. Each finished chunk is written in place, so memory
+stays bounded by the chunk size and a partially finished sweep can be read
+(unfinished rows are NaN) while the rest is still running.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import fields
+
+import numpy as np
+import pandas as pd
+
+import result_cache
+import simulation as sim
+
+SWEEP_DIR = os.environ.get(
+    "EMERGE_SWEEP_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "sweeps")
+)
+
+ROUTINE_PARAMETERS = [f.name for f in fields(sim.RoutineParams)]
+TRANSFORM_PARAMETERS = [f.name for f in fields(sim.TransformParams)]
+
+OUTPUTS = {
+    "routine": ["M_r_final", "H_e_final", "time_to_M_gt_threshold"],
+    "transformative": ["H_e_peak", "t_peak_H_e_h", "H_e_final", "undershoot_depth"],
+}
+
+# Sensible ranges for the parameters the dashboard sweeps over
+DEFAULT_BOUNDS = {
+    "alpha_E": (0.1, 0.8),
+    "beta_E": (0.0, 0.2),
+    "psi0": (0.2, 0.8),
+    "S_group": (0.2, 0.8),
+    "gamma": (0.4, 1.6),
+    "beta_transform": (0.2, 1.2),
+}
+
+
+# ============================================
+# SAMPLERS
+# ============================================
+def grid(**axes):
+    """Cartesian product of 1-D axes as flat columns, e.g. ``grid(alpha_E=a, psi0=b)``.
+
+    The first axis varies slowest, so ``column.reshape(len(a), len(b))`` recovers the grid.
+    """
+    names = list(axes)
+    mesh = np.meshgrid(*(np.asarray(axes[k], dtype=np.float64) for k in names), indexing="ij")
+    return {name: m.ravel() for name, m in zip(names, mesh)}
+
+
+def latin_hypercube(n, bounds, seed=0):
+    """``n`` Latin-hypercube samples over ``bounds`` = {name: (low, high)}."""
+    rng = np.random.default_rng(seed)
+    samples = {}
+    for name, (low, high) in bounds.items():
+        u = (rng.permutation(n) + rng.random(n)) / n
+        samples[name] = low + (high - low) * u
+    return samples
+
+
+def model_for(names):
+    """The model a set of swept parameter names belongs to."""
+    names = set(names)
+    if names <= set(ROUTINE_PARAMETERS):
+        return "routine"
+    if names <= set(TRANSFORM_PARAMETERS):
+        return "transformative"
+    raise ValueError(f"Parameters {sorted(names)} do not all belong to one model")
+
+
+# ============================================
+# RESULT STORE
+# ============================================
+class ResultStore:
+    """Columnar on-disk store of sweep inputs and outputs, one memory-mapped column per file."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "manifest.json")) as f:
+            self.manifest = json.load(f)
+        self._columns = {}
+
+    @classmethod
+    def create(cls, path, n, columns, inputs=None, **meta):
+        """Build a store in a temporary directory, ``inputs`` = {column: values} filled and every other
+        column NaN, and rename it to ``path``.
+
+        The manifest is written last, so a crash never leaves a store that looks complete; concurrent
+        creators of the same store race on the rename and the losers open the winner's.
+        """
+        inputs = inputs or {}
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        tmp = tempfile.mkdtemp(prefix=f"{os.path.basename(path)}.", suffix=".tmp", dir=parent)
+        try:
+            for name in list(columns) + ["_done"]:
+                dtype = np.bool_ if name == "_done" else np.float64
+                col = np.lib.format.open_memmap(os.path.join(tmp, f"{name}.npy"), mode="w+",
+                                                dtype=dtype, shape=(n,))
+                col[:] = inputs.get(name, False if name == "_done" else np.nan)
+                col.flush()
+                del col
+            with open(os.path.join(tmp, "manifest.json"), "w") as f:
+                json.dump(dict(meta, n=n, columns=list(columns)), f, indent=2)
+            try:
+                os.rename(tmp, path)
+            except OSError:
+                if not os.path.exists(os.path.join(path, "manifest.json")):
+                    shutil.rmtree(path)  # half-built by an older, non-atomic create
+                    os.rename(tmp, path)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        return cls(path)
+
+    @property
+    def columns(self):
+        return self.manifest["columns"]
+
+    def __len__(self):
+        return self.manifest["n"]
+
+    def column(self, name, mode="r"):
+        key = (name, mode)
+        if key not in self._columns:
+            self._columns[key] = np.load(os.path.join(self.path, f"{name}.npy"), mmap_mode=mode)
+        return self._columns[key]
+
+    def write(self, start, values):
+        """Write one chunk of columns starting at row ``start`` and mark it done."""
+        stop = start + len(next(iter(values.values())))
+        for name, v in values.items():
+            col = self.column(name, "r+")
+            col[start:stop] = v
+            col.flush()
+        done = self.column("_done", "r+")
+        done[start:stop] = True
+        done.flush()
+
+    @property
+    def progress(self):
+        return float(np.asarray(self.column("_done")).mean()) if len(self) else 1.0
+
+    def to_frame(self, columns=None):
+        cols = columns or self.columns
+        return pd.DataFrame({c: np.asarray(self.column(c)) for c in cols})
+
+
+# ============================================
+# RUNNER
+# ============================================
+def evaluate_chunk(model, params, settings):
+    """Evaluate one chunk of parameter rows; top-level so worker processes can unpickle it."""
+    if model == "routine":
+        return sim.routine_outcomes(params, **settings)
+    return sim.transform_outcomes(params, **settings)
+
+
+def sweep_key(samples, model, settings):
+    """Content hash of a sweep definition and the simulation code, used as its store directory name."""
+    definition = [result_cache.CODE_VERSION, model, settings, sorted(samples)]
+    h = hashlib.sha256(json.dumps(definition, sort_keys=True).encode())
+    for name in sorted(samples):
+        h.update(np.ascontiguousarray(samples[name], dtype=np.float64).tobytes())
+    return h.hexdigest()[:16]
+
+
+def sweep_settings(model, seed=0, dt=0.01, duration=None, threshold=0.35):
+    """Integration settings shared by every chunk of a sweep."""
+    settings = {"seed": seed, "dt": dt, "common_noise": True,
+                "duration": duration or (10.0 if model == "routine" else 8.0)}
+    if model == "routine":
+        settings["threshold"] = threshold
+    return settings
+
+
+def open_store(samples, model, settings, path=None):
+    """Open the store for a sweep, creating it (inputs filled, outputs NaN) if needed."""
+    path = path or os.path.join(SWEEP_DIR, sweep_key(samples, model, settings))
+    if os.path.exists(os.path.join(path, "manifest.json")):
+        return ResultStore(path)
+    n = len(next(iter(samples.values())))
+    return ResultStore.create(path, n, list(samples) + OUTPUTS[model], inputs=samples, model=model, **settings)
+
+
+def run_sweep(samples, model=None, *, path=None, chunk_size=4096, workers=None, seed=0,
+              dt=0.01, duration=None, threshold=0.35, on_chunk=None):
+    """Evaluate every row of ``samples`` and stream the outcomes into a ResultStore.
+
+    Chunks already marked done (from an earlier, interrupted run) are skipped.
+
+    Parameters
+    ----------
+    samples : dict of equal-length 1-D arrays, from ``grid`` or ``latin_hypercube``
+    model : "routine" or "transformative"; inferred from the parameter names if omitted
+    path : store directory; defaults to a content-hashed directory under SWEEP_DIR
+    chunk_size : rows per worker task
+    workers : process count (None = CPU count); 0 evaluates in-process
+    on_chunk : optional callback(store) after each chunk lands
+    """
+    model = model or model_for(samples)
+    settings = sweep_settings(model, seed, dt, duration, threshold)
+    store = open_store(samples, model, settings, path)
+
+    done = np.asarray(store.column("_done"))
+    starts = [s for s in range(0, len(store), chunk_size) if not done[s:s + chunk_size].all()]
+
+    def chunk(start):
+        return {k: np.asarray(v[start:start + chunk_size]) for k, v in samples.items()}
+
+    if workers == 0:
+        for start in starts:
+            store.write(start, evaluate_chunk(model, chunk(start), settings))
+            if on_chunk:
+                on_chunk(store)
+        return store
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(evaluate_chunk, model, chunk(s), settings): s for s in starts}
+        for future in as_completed(futures):
+            store.write(futures[future], future.result())
+            if on_chunk:
+                on_chunk(store)
+    return store
+
+
+_background = ThreadPoolExecutor(max_workers=1, thread_name_prefix="emerge-sweep")
+
+
+def start_sweep(samples, model=None, *, seed=0, dt=0.01, duration=None, threshold=0.35, **kwargs):
+    """Run ``run_sweep`` on a background thread and return (ResultStore, Future).
+
+    The store exists before this returns, so callers (e.g. a Streamlit page) can
+    render partial results from it on every rerun while the sweep keeps going.
+    """
+    model = model or model_for(samples)
+    store = open_store(samples, model, sweep_settings(model, seed, dt, duration, threshold),
+                       kwargs.pop("path", None))
+    future = _background.submit(run_sweep, samples, model, path=store.path, seed=seed, dt=dt,
+                                duration=duration, threshold=threshold, **kwargs)
+    return store, future
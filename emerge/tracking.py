@@ -0,0 +1,393 @@
+"""
+E.M.E.R.G.E+ Framework - Online State Estimation
+Ensemble Kalman filter tracking H_e, M and parameters from streaming observations.
+
+A session streams timestamped observations ``time_h, H_e`` (e.g. the ``H_e``
+column of entropy.entropy_series) from a file being appended to or from a
+TCP socket. ``EnsembleFilter`` holds an ensemble of model states, augmented
+with the parameters being learned (γ, β_transform, H_e*):
+
+    forecast   every member is advanced from the last observation time with
+               the transformative equations (Euler-Maruyama, steps of at
+               most DT_H); M accumulates ∫ exp(−H_e) dt
+    analysis   stochastic EnKF update with perturbed observations: the
+               observed H_e's cross-covariance with every state and parameter
+               gives the gain, so the parameters are corrected too
+    jitter     a small random walk on the parameters keeps the ensemble
+               from collapsing
+
+Cost per observation depends only on the ensemble size and the sampling
+interval, never on how much of the session has been seen. Memory is the
+ensemble plus a bounded history of estimates. The dashboard's M_t is
+M / M(T), which needs the full session; the filter reports M.
+
+``monitor`` shares one background ``Tracker`` per source across every
+dashboard session, so a participant watched by many sessions is filtered once.
+It accepts only files under STREAM_DIR, and TCP addresses only when the server
+sets EMERGE_TRACK_ALLOW_TCP=1; finished trackers are evicted after
+FINISHED_TTL_S and at most MAX_TRACKERS run at once.
+Viewers poll ``Tracker.since(cursor)`` and append only the new estimates.
+
+Usage:
+    python tracking.py demo session.csv --speed 600        # simulated participant, 600× real time
+    python tracking.py track session.csv                   # tail the file and print estimates
+    python tracking.py track tcp://127.0.0.1:9000          # newline-delimited "t,H_e" over TCP
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import os
+import socket
+import threading
+import time
+from dataclasses import asdict
+
+import numpy as np
+
+import simulation as sim
+
+STREAM_DIR = os.environ.get(
+    "EMERGE_STREAM_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "streams")
+)
+DEFAULT_MEMBERS = 200
+DT_H = 0.01
+OBS_NOISE = 0.05
+HISTORY = 5000
+IDLE_EXIT_S = 600.0
+# Shared trackers: finished ones are evicted after FINISHED_TTL_S, and at most MAX_TRACKERS run at once
+FINISHED_TTL_S = 600.0
+MAX_TRACKERS = 16
+# TCP sources open outbound connections from the server, so ``monitor`` only accepts them when enabled
+ALLOW_TCP = os.environ.get("EMERGE_TRACK_ALLOW_TCP", "") == "1"
+STATES = ["H_e", "M"]
+# Learned parameters: prior mean, prior s.d. and random-walk s.d. per √h
+LEARNED = {
+    "gamma": (0.8, 0.3, 0.05),
+    "beta_transform": (0.6, 0.25, 0.05),
+    "H_e_star": (-0.5, 0.3, 0.05),
+}
+LOWER_BOUNDS = {"gamma": 0.0, "beta_transform": 0.01}
+
+
+# ============================================
+# FILTER
+# ============================================
+class EnsembleFilter:
+    """Stochastic ensemble Kalman filter on the transformative model, one observation at a time."""
+
+    def __init__(self, params=None, members=DEFAULT_MEMBERS, obs_noise=OBS_NOISE, seed=0, learned=LEARNED):
+        base = sim._coerce(params, sim.TRANSFORM_DEFAULTS)
+        self.fixed = {k: v for k, v in asdict(base).items() if k not in learned}
+        self.learned = learned
+        self.rng = np.random.default_rng(seed)
+        self.obs_noise = obs_noise
+        self.t = 0.0
+        self.n = members
+        # Rows: states, then learned parameters
+        self.names = STATES + list(learned)
+        self.X = np.zeros((len(self.names), members))
+        for i, (name, (mean, sd, _)) in enumerate(learned.items(), start=len(STATES)):
+            self.X[i] = mean + sd * self.rng.standard_normal(members)
+        self._clip()
+
+    def _clip(self):
+        for name, low in LOWER_BOUNDS.items():
+            if name in self.learned:
+                i = self.names.index(name)
+                np.maximum(self.X[i], low, out=self.X[i])
+
+    def params(self):
+        """Per-member model parameters: fixed scalars plus the learned rows."""
+        p = dict(self.fixed)
+        for i, name in enumerate(self.learned, start=len(STATES)):
+            p[name] = self.X[i]
+        return p
+
+    def forecast(self, t):
+        """Advance every member from ``self.t`` to ``t``."""
+        span = t - self.t
+        if span <= 0:
+            return
+        steps = int(np.ceil(span / DT_H - 1e-9))
+        dt = span / steps
+        sqdt = np.sqrt(dt)
+        p = self.params()
+        H_e, M = self.X[0], self.X[1]
+        for k in range(steps):
+            now = self.t + k * dt
+            z = self.rng.standard_normal((2, self.n))
+            D = sim.perturbation(now, p)
+            E = p["E_base"] + p["kappa_DE"] * D + p["input_noise"] * z[0]
+            M += np.exp(-H_e) * dt
+            H_e += sim.transform_drift(now, H_e, E, D, p) * dt + p["sigma_E"] * sqdt * z[1]
+        # Parameter random walk, scaled to the elapsed time
+        for i, (_, (_, _, walk)) in enumerate(self.learned.items(), start=len(STATES)):
+            self.X[i] += walk * np.sqrt(span) * self.rng.standard_normal(self.n)
+        self._clip()
+        self.t = t
+
+    def analyze(self, y):
+        """EnKF update with observation ``y`` of H_e; returns the innovation against the forecast mean."""
+        h = self.X[0]
+        innovation = y - h.mean()
+        anomalies = self.X - self.X.mean(axis=1, keepdims=True)
+        h_anom = anomalies[0]
+        R = self.obs_noise ** 2
+        gain = anomalies @ h_anom / (self.n - 1) / (h_anom @ h_anom / (self.n - 1) + R)
+        perturbed = y + self.obs_noise * self.rng.standard_normal(self.n)
+        self.X += gain[:, None] * (perturbed - h)[None, :]
+        self._clip()
+        return innovation
+
+    def update(self, t, y):
+        """Forecast to time ``t`` (hours) and assimilate ``y``; returns the estimate row."""
+        self.forecast(t)
+        innovation = self.analyze(y)
+        return self.estimate(observed=y, innovation=innovation)
+
+    def estimate(self, **extra):
+        mean, sd = self.X.mean(axis=1), self.X.std(axis=1, ddof=1)
+        row = {"time_h": self.t, **extra}
+        for name, m, s in zip(self.names, mean, sd):
+            row[name] = float(m)
+            row[f"{name}_sd"] = float(s)
+        return row
+
+
+# ============================================
+# SOURCES
+# ============================================
+def parse(line):
+    """(time_h, H_e) from a ``t,y`` line, or None for headers, blanks and malformed lines."""
+    parts = line.strip().split(",")
+    if len(parts) < 2:
+        return None
+    try:
+        return float(parts[0]), float(parts[1])
+    except ValueError:
+        return None
+
+
+def tail(path, stop, poll=0.2, idle_exit=IDLE_EXIT_S):
+    """Yield observations from ``path`` as lines are appended (from the start of the file).
+
+    Returns after ``idle_exit`` seconds without new data, including while waiting for the file to appear.
+    """
+    idle = 0.0
+    while not os.path.exists(path):
+        if idle >= idle_exit or stop.wait(poll):
+            return
+        idle += poll
+    idle = 0.0
+    with open(path) as f:
+        buffer = ""
+        while not stop.is_set():
+            chunk = f.readline()
+            if not chunk:
+                if idle >= idle_exit or stop.wait(poll):
+                    return
+                idle += poll
+                continue
+            idle = 0.0
+            buffer += chunk
+            if not buffer.endswith("\n"):
+                continue  # a line still being written
+            obs, buffer = parse(buffer), ""
+            if obs is not None:
+                yield obs
+
+
+def receive(address, stop, timeout=1.0):
+    """Yield observations from newline-delimited ``t,y`` text on ``tcp://host:port``."""
+    host, port = address[len("tcp://"):].rsplit(":", 1)
+    with socket.create_connection((host, int(port)), timeout=timeout) as conn:
+        conn.settimeout(timeout)
+        buffer = b""
+        while not stop.is_set():
+            try:
+                data = conn.recv(65536)
+            except socket.timeout:
+                continue
+            if not data:
+                return
+            buffer += data
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                obs = parse(line.decode(errors="replace"))
+                if obs is not None:
+                    yield obs
+
+
+def open_source(source, stop, idle_exit=IDLE_EXIT_S):
+    return receive(source, stop) if source.startswith("tcp://") else tail(source, stop, idle_exit=idle_exit)
+
+
+# ============================================
+# TRACKERS
+# ============================================
+class Tracker:
+    """Filters one source on a background thread, keeping the last ``history`` estimates."""
+
+    def __init__(self, source, history=HISTORY, idle_exit=IDLE_EXIT_S, **filter_kwargs):
+        self.source = source
+        self.idle_exit = idle_exit
+        self.filter = EnsembleFilter(**filter_kwargs)
+        self.rows = collections.deque(maxlen=history)
+        self.seq = 0
+        self.error = None
+        self.skipped = 0
+        self.finished = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"emerge-track-{source}", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    @property
+    def running(self):
+        return self._thread.is_alive()
+
+    def _run(self):
+        try:
+            for t, y in open_source(self.source, self._stop, self.idle_exit):
+                if t <= self.filter.t and self.seq:
+                    self.skipped += 1  # out of order or duplicate timestamp
+                    continue
+                row = self.filter.update(t, y)
+                with self._lock:
+                    self.seq += 1
+                    self.rows.append((self.seq, row))
+        except Exception as exc:  # surfaced to viewers instead of killing the process
+            self.error = f"{type(exc).__name__}: {exc}"
+        finally:
+            self.finished = time.time()
+
+    def since(self, cursor=0):
+        """(rows newer than ``cursor``, new cursor); rows older than the history are gone."""
+        with self._lock:
+            if not self.rows or self.rows[-1][0] <= cursor:
+                return [], cursor
+            start = max(0, len(self.rows) - (self.rows[-1][0] - cursor))
+            return [row for _, row in list(self.rows)[start:]], self.rows[-1][0]
+
+
+_TRACKERS = {}
+_TRACKERS_LOCK = threading.Lock()
+
+
+def resolve(source, allow_tcp=None):
+    """Validate a source for the shared trackers: a file inside STREAM_DIR, or tcp:// when enabled.
+
+    Relative paths are taken relative to STREAM_DIR. Returns the normalized source.
+    """
+    if source.startswith("tcp://"):
+        if not (ALLOW_TCP if allow_tcp is None else allow_tcp):
+            raise PermissionError("TCP sources are disabled; set EMERGE_TRACK_ALLOW_TCP=1 on the server")
+        return source
+    root = os.path.realpath(STREAM_DIR)
+    path = os.path.realpath(os.path.join(root, source))
+    if os.path.commonpath([root, path]) != root:
+        raise PermissionError(f"Session files must be inside {STREAM_DIR}")
+    return path
+
+
+def _evict(now):
+    for source, tracker in list(_TRACKERS.items()):
+        if tracker.finished is not None and now - tracker.finished > FINISHED_TTL_S:
+            del _TRACKERS[source]
+
+
+def monitor(source, restart=False, **filter_kwargs):
+    """The process-wide tracker of ``source``, started on first use; ``restart`` replaces a finished one.
+
+    ``source`` must pass ``resolve``. Finished trackers are dropped FINISHED_TTL_S after they end.
+    """
+    source = resolve(source)
+    with _TRACKERS_LOCK:
+        _evict(time.time())
+        tracker = _TRACKERS.get(source)
+        if tracker is None or (restart and not tracker.running):
+            if tracker is None and sum(t.running for t in _TRACKERS.values()) >= MAX_TRACKERS:
+                raise RuntimeError(f"Already tracking {MAX_TRACKERS} sessions; try again when one ends")
+            tracker = _TRACKERS[source] = Tracker(source, **filter_kwargs).start()
+        return tracker
+
+
+def trackers():
+    with _TRACKERS_LOCK:
+        _evict(time.time())
+        return dict(_TRACKERS)
+
+
+# ============================================
+# DEMO PARTICIPANT
+# ============================================
+def demo_observations(params=None, seed=0, every_h=1 / 60, duration=8.0, obs_noise=OBS_NOISE):
+    """(time_h, noisy H_e) of one simulated participant, one sample every ``every_h`` hours."""
+    traj = sim.simulate_transformative(params, seed=seed, dt=DT_H, duration=duration)
+    stride = max(1, int(round(every_h / DT_H)))
+    t = traj.time[::stride]
+    y = traj["H_e"][0, ::stride] + obs_noise * np.random.default_rng(seed + 1).standard_normal(len(t))
+    return t, y
+
+
+def write_demo(path, params=None, seed=0, speed=600.0, stop=None, **kwargs):
+    """Append a simulated participant's observations to ``path`` as they would arrive, ``speed``× real time."""
+    t, y = demo_observations(params, seed, **kwargs)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    start = time.monotonic()
+    with open(path, "w") as f:
+        f.write("time_h,H_e\n")
+        for ti, yi in zip(t, y):
+            wait = start + ti * 3600.0 / speed - time.monotonic()
+            if wait > 0 and (stop.wait(wait) if stop else time.sleep(wait)):
+                return
+            f.write(f"{ti:.4f},{yi:.6f}\n")
+            f.flush()
+
+
+def start_demo(name="demo", seed=0, speed=600.0, **kwargs):
+    """Write a demo participant to STREAM_DIR/<name>.csv on a background thread; returns its path."""
+    path = os.path.join(STREAM_DIR, f"{name}.csv")
+    threading.Thread(target=write_demo, args=(path,), kwargs=dict(seed=seed, speed=speed, **kwargs),
+                     name=f"emerge-demo-{name}", daemon=True).start()
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Online H_e tracking of streaming observations")
+    commands = parser.add_subparsers(dest="command", required=True)
+    demo = commands.add_parser("demo", help="write a simulated participant's observations as they arrive")
+    demo.add_argument("path")
+    demo.add_argument("--speed", type=float, default=600.0, help="session hours per real hour")
+    demo.add_argument("--seed", type=int, default=0)
+    track = commands.add_parser("track", help="filter a file being appended to, or tcp://host:port")
+    track.add_argument("source")
+    track.add_argument("--members", type=int, default=DEFAULT_MEMBERS)
+    track.add_argument("--idle-exit", type=float, default=IDLE_EXIT_S, help="stop after this many idle seconds")
+    args = parser.parse_args(argv)
+
+    if args.command == "demo":
+        write_demo(args.path, seed=args.seed, speed=args.speed)
+        return
+    tracker = Tracker(args.source, idle_exit=args.idle_exit, members=args.members).start()
+    cursor = 0
+    while tracker.running or tracker.since(cursor)[0]:
+        rows, cursor = tracker.since(cursor)
+        for row in rows:
+            print(f"t={row['time_h']:6.3f} h  H_e obs {row['observed']:+.3f}  est {row['H_e']:+.3f} "
+                  f"± {row['H_e_sd']:.3f}  M {row['M']:.3f}  γ {row['gamma']:.2f}  β {row['beta_transform']:.2f}")
+        time.sleep(0.2)
+    if tracker.error:
+        raise SystemExit(tracker.error)
+
+
+if __name__ == "__main__":
+    main()